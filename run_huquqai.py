@@ -7,7 +7,7 @@ Simple working CLI interface
 
 import sys
 import os
-from pathlib import Path1
+from pathlib import Path
 
 
 # Fix Windows console encoding for UTF-8
@@ -27,6 +27,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from rdflib import Graph, RDF, OWL
 
+from src.core.bulk_loader import discover_files, load_files
+
 
 def load_knowledge_base():
     """Load ontology and data into RDF graph"""
@@ -34,23 +36,19 @@ def load_knowledge_base():
 
     graph = Graph()
 
-    # Load ontology
-    ontology_file = Path("data/ontologies/legal_ontology.owl")
-    if ontology_file.exists():
-        graph.parse(str(ontology_file), format='xml')
-        print(f"✅ Ontologiya júklendi: {ontology_file}")
-    else:
-        print(f"⚠️  Ontologiya tabılmadı: {ontology_file}")
-
-    # Load criminal code data
-    data_file = Path("data/knowledge/criminal_code.ttl")
-    if data_file.exists():
-        graph.parse(str(data_file), format='turtle')
-        print(f"✅ Ma'limler júklendi: {data_file}")
-    else:
-        print(f"⚠️  Ma'limler tabılmadı: {data_file}")
-
-    print(f"✅ Jámi {len(graph)} triple júklendi\n")
+    # Load every ontology and code file, in parallel
+    files = discover_files([Path("data/ontologies"), Path("data/knowledge")])
+    if not files:
+        print("⚠️  Ma'limler tabılmadı / No data files found")
+
+    report = load_files(files, graph)
+    for item in report.files:
+        if item.ok:
+            print(f"✅ Júklendi: {item.path} ({item.triples} triple, {item.parse_seconds:.2f}s)")
+        else:
+            print(f"⚠️  Júklenbedi: {item.path} ({item.error})")
+
+    print(f"✅ Jámi {len(graph)} triple júklendi ({report.total_seconds:.2f}s)\n")
     return graph
 
 
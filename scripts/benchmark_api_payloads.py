@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark JSON serialization and compression of typical API payloads
+Ádettegi API juwaplarınıń JSON serializaciyası ha'm qısılıwın ólshew
+
+Builds /search and /articles responses from the knowledge base articles and
+reports serialization time (standard json vs. the API's fast encoder) and
+bytes on the wire (identity, gzip, brotli when installed).
+
+Usage / Qollanıw:
+    python scripts/benchmark_api_payloads.py [--repeat 2000] [--content-scale 20]
+"""
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from rdflib import Graph, Namespace, RDF
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.api.middleware import CompressionMiddleware, brotli  # noqa: E402
+from src.api.responses import dumps, orjson  # noqa: E402
+
+
+BASE_PATH = Path(__file__).parent.parent
+KNOWLEDGE_FILE = BASE_PATH / "data" / "knowledge" / "criminal_code.ttl"
+KK = Namespace("http://karakalpak.law/ontology#")
+
+
+def load_articles(content_scale: int) -> List[Dict[str, Any]]:
+    """
+    Article rows shaped like SPARQLService results.
+    ``content_scale`` repeats the text, since real articles are far longer
+    than the sample knowledge base.
+    """
+    graph = Graph()
+    graph.parse(str(KNOWLEDGE_FILE), format="turtle")
+    rows = []
+    for article in graph.subjects(RDF.type, KK.Statiya):
+        text = str(graph.value(article, KK["tekstı"]) or "")
+        rows.append({
+            "article": str(article),
+            "number": str(graph.value(article, KK["statiya_nómiri"]) or ""),
+            "title": str(graph.value(article, KK["sárelaw"]) or ""),
+            "content": " ".join([text] * content_scale),
+        })
+    return rows
+
+
+def standard_dumps(content: Any) -> bytes:
+    """Starlette's JSONResponse encoding, for comparison"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def measure(name: str, func: Callable[[Any], bytes], payload: Any, repeat: int) -> None:
+    """Time one encoder and print microseconds per response"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(payload)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<24} {elapsed / repeat * 1e6:>10.1f} µs/response")
+
+
+def report(name: str, payload: Any, repeat: int) -> None:
+    """Serialization and wire-size report for one payload"""
+    body = dumps(payload)
+    compressor = CompressionMiddleware(app=None)
+
+    print(f"{name}")
+    measure("json (standard)", standard_dumps, payload, repeat)
+    if orjson is not None:
+        measure("orjson (fast_json)", dumps, payload, repeat)
+    else:
+        print("  orjson not installed - fast_json falls back to json")
+
+    print(f"  {'identity':<24} {len(body):>10,} bytes")
+    sizes = [("gzip", lambda b: gzip.compress(b, compresslevel=6, mtime=0))]
+    if brotli is not None:
+        sizes.append(("br", lambda b: compressor.compress(b, "br")))
+    for encoding, compress in sizes:
+        start = time.perf_counter()
+        compressed = compress(body)
+        elapsed = (time.perf_counter() - start) * 1e6
+        print(f"  {encoding:<24} {len(compressed):>10,} bytes "
+              f"({len(compressed) / len(body):.0%}, {elapsed:.0f} µs)")
+    print()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--content-scale", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = load_articles(args.content_scale)
+
+    print("=" * 60)
+    print("API payload benchmark")
+    print("=" * 60)
+    print(f"Articles: {len(rows)}, content scale: {args.content_scale}")
+    print()
+
+    report("/api/v1/articles/{number}", rows[0], args.repeat)
+    report("/api/v1/search (10 results)", {
+        "query": "jaza", "language": "kaa", "count": 10,
+        "results": (rows * 10)[:10],
+    }, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark OntologyManager.add_many against a triple-by-triple add loop
+OntologyManager.add_many metodın triple-lardı birim-birim qosıw menen salıstırıw
+
+Builds a synthetic corpus of articles (five triples each), loads the ontology
+on each store, and merges the corpus once with ``graph.add`` per triple (the
+loop ``test_huquqai.py`` used to run) and once with ``add_many``.
+
+Usage / Qollanıw:
+    python scripts/benchmark_graph_merge.py [--triples 1000000] [--stores default,Compact,SQLite]
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from rdflib import Literal, Namespace, RDF
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.ontology_manager import OntologyManager  # noqa: E402
+
+
+BASE_PATH = Path(__file__).parent.parent
+ONTOLOGY_FILE = BASE_PATH / "data" / "ontologies" / "legal_ontology.owl"
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+CODES = ("criminal", "civil", "administrative")
+
+
+def synthetic_triples(count: int) -> List[Tuple]:
+    """Articles with five triples each / Hár birinde bes triple bar statiyalar"""
+    triples = []
+    for i in range(count // 5):
+        article = HUQUQ[f"Statiya_{i}"]
+        triples.extend((
+            (article, RDF.type, HUQUQ.Statiya),
+            (article, HUQUQ.articleNumber, Literal(str(i))),
+            (article, HUQUQ.title, Literal(f"Statiya {i}", lang="kaa")),
+            (article, HUQUQ.codeType, Literal(CODES[i % len(CODES)])),
+            (article, HUQUQ.content, Literal(f"Statiya {i} teksti", lang="kaa")),
+        ))
+    return triples
+
+
+def fresh_manager(store: str, directory: Path, run: str) -> OntologyManager:
+    """Manager with only the ontology loaded on a store / Tek ontologiya júklengen menedžer"""
+    manager = OntologyManager()
+    manager.clear()
+    settings = manager.config.ontology
+    settings.store = store
+    settings.store_path = str(directory / f"{run}.sqlite") if store == "SQLite" else None
+    manager.load_ontology(ONTOLOGY_FILE)
+    return manager
+
+
+def timed(func: Callable[[], object]) -> float:
+    """Seconds taken by one call / Bir shaqırıwdıń sekundları"""
+    gc.collect()
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--triples", type=int, default=1_000_000)
+    parser.add_argument("--stores", default="default,Compact,SQLite")
+    args = parser.parse_args()
+
+    triples = synthetic_triples(args.triples)
+
+    print("=" * 60)
+    print("Graph merge benchmark")
+    print("=" * 60)
+    print(f"Triples: {len(triples):,}")
+    print()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for store in args.stores.split(","):
+            manager = fresh_manager(store, Path(directory), f"{store}-loop")
+
+            def loop() -> None:
+                for triple in triples:
+                    manager.graph.add(triple)
+                len(manager.graph.query("ASK { ?s ?p ?o }"))  # merge buffered writes
+
+            loop_seconds = timed(loop)
+
+            manager = fresh_manager(store, Path(directory), f"{store}-bulk")
+
+            def bulk() -> None:
+                manager.add_many(triples)
+                len(manager.graph.query("ASK { ?s ?p ?o }"))
+
+            bulk_seconds = timed(bulk)
+            manager.clear()
+
+            print(f"{store}")
+            for name, seconds in (("add loop", loop_seconds), ("add_many", bulk_seconds)):
+                print(f"  {name:<12} {seconds:>8.2f} s  {len(triples) / seconds:>12,.0f} triples/s")
+            print(f"  {'speedup':<12} {loop_seconds / bulk_seconds:>8.1f}x")
+            print()
+
+
+if __name__ == "__main__":
+    main()
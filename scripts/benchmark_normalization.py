@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark search normalization throughput on the knowledge base corpus
+Bilimler bazası korpusında izlew normalizaciyasınıń ónimdarlıǵın ólshew
+
+Usage / Qollanıw:
+    python scripts/benchmark_normalization.py [--repeat 20] [files ...]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from rdflib import Graph, Literal
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.normalization import fold_text, search_key  # noqa: E402
+
+
+BASE_PATH = Path(__file__).parent.parent
+DEFAULT_FILES = [
+    BASE_PATH / "data" / "ontologies" / "legal_ontology.owl",
+    BASE_PATH / "data" / "knowledge" / "criminal_code.ttl",
+]
+
+
+def legacy_normalize(text: str) -> str:
+    """Previous chained-replace normalization, for comparison"""
+    replacements = {'ń': 'n', 'ǵ': 'g', 'ı': 'i', 'ú': 'u', 'ó': 'o'}
+    normalized = text.lower()
+    for old, new in replacements.items():
+        normalized = normalized.replace(old, new)
+    return normalized
+
+
+def load_corpus(files: List[Path]) -> List[str]:
+    """Collect every literal in the given RDF files"""
+    graph = Graph()
+    for file_path in files:
+        fmt = "xml" if file_path.suffix in (".owl", ".rdf") else None
+        graph.parse(str(file_path), format=fmt)
+    return [str(o) for o in graph.objects() if isinstance(o, Literal)]
+
+
+def measure(name: str, func: Callable[[str], str], corpus: List[str], repeat: int) -> None:
+    """Time one normalizer over the corpus and print its throughput"""
+    chars = sum(len(text) for text in corpus) * repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            func(text)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<28} {len(corpus) * repeat / elapsed:>12,.0f} strings/s "
+          f"{chars / elapsed / 1e6:>8.2f} Mchar/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("files", nargs="*", type=Path, default=DEFAULT_FILES)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.files)
+
+    print("=" * 60)
+    print("Normalization benchmark")
+    print("=" * 60)
+    print(f"Literals: {len(corpus)}, characters: {sum(map(len, corpus))}")
+    print()
+
+    measure("legacy replace chain", legacy_normalize, corpus, args.repeat)
+    measure("fold_text (translate)", fold_text, corpus, args.repeat)
+    measure("search_key (uncached)", search_key.__wrapped__, corpus, args.repeat)
+    search_key.cache_clear()
+    measure("search_key (cached)", search_key, corpus, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
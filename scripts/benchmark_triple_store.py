@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark the compact triple store against rdflib's default Memory store
+Kompakt triple saqlaǵıshtı rdflib Memory saqlaǵıshı menen salıstırıw
+
+Loads the knowledge base (replicated ``--scale`` times under fresh subject
+URIs, since the sample data is small), then reports memory per triple and the
+time of triple-pattern lookups and a SPARQL query on each store.
+
+Usage / Qollanıw:
+    python scripts/benchmark_triple_store.py [--scale 50] [--repeat 200]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from rdflib import Graph, Namespace, RDF, URIRef
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import src.core.compact_store  # noqa: E402,F401  registers "Compact"
+
+
+BASE_PATH = Path(__file__).parent.parent
+KNOWLEDGE_FILE = BASE_PATH / "data" / "knowledge" / "criminal_code.ttl"
+ONTOLOGY_FILE = BASE_PATH / "data" / "ontologies" / "legal_ontology.owl"
+KK = Namespace("http://karakalpak.law/ontology#")
+
+QUERY = """
+PREFIX kk: <http://karakalpak.law/ontology#>
+SELECT ?statiya ?sarelaw WHERE {
+    ?statiya a kk:Statiya ;
+             kk:awırlıq_dárejesi "Awır" ;
+             kk:sárelaw ?sarelaw .
+}
+"""
+
+
+def source_triples(scale: int) -> List[Tuple]:
+    """Knowledge base triples, subjects copied ``scale`` times / Kóbeytilgen triple-lar"""
+    graph = Graph()
+    graph.parse(str(KNOWLEDGE_FILE), format="turtle")
+    graph.parse(str(ONTOLOGY_FILE), format="xml")
+    triples = []
+    for copy in range(scale):
+        for s, p, o in graph:
+            if isinstance(s, URIRef) and s.startswith(str(KK)) and copy:
+                s = URIRef(f"{s}_{copy}")
+            triples.append((s, p, o))
+    return triples
+
+
+def load(store: str, triples: List[Tuple]) -> Tuple[Graph, int]:
+    """Build a graph on a store and measure the memory it holds / Yad ólshew"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    graph = Graph(store=store)
+    for triple in triples:
+        graph.add(triple)
+    len(graph.query("ASK { ?s ?p ?o }"))  # merge buffered writes / jazıwlardı birlestiriw
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return graph, used
+
+
+def measure(name: str, func: Callable[[], object], repeat: int) -> None:
+    """Time one lookup and print microseconds per call"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<28} {elapsed / repeat * 1e6:>10.1f} µs")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    triples = source_triples(args.scale)
+
+    print("=" * 60)
+    print("Triple store benchmark")
+    print("=" * 60)
+    print(f"Triples: {len(triples):,}")
+    print()
+
+    for store in ("default", "Compact"):
+        graph, used = load(store, triples)
+        subject = KK.Statiya_169
+        print(f"{store}")
+        print(f"  {'memory':<28} {used / 1024:>10.0f} KiB ({used / len(graph):.0f} B/triple)")
+        measure("(s, ?, ?)", lambda: list(graph.triples((subject, None, None))), args.repeat)
+        measure("(?, rdf:type, ?)", lambda: list(graph.triples((None, RDF.type, None))), args.repeat)
+        measure("(?, rdf:type, kk:Statiya)",
+                lambda: list(graph.triples((None, RDF.type, KK.Statiya))), args.repeat)
+        measure("(?, ?, o)", lambda: list(graph.triples((None, None, KK.JinayatKodeksi_2023))),
+                args.repeat)
+        measure("SPARQL by severity", lambda: list(graph.query(QUERY)), max(1, args.repeat // 10))
+        print()
+        del graph
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Stream an N-Triples / N-Quads dump into the knowledge base
+N-Triples / N-Quads faylın bilimler bazasına aǵım menen júklew
+
+Loads the configured knowledge files, then imports the dump batch by batch
+through ``OntologyManager.import_stream``, printing progress and throughput
+after every batch and the bad lines at the end. Use a persistent store
+(``ontology.store: SQLite``) to keep the result. That store has no named
+graphs, so N-Quads statements naming a graph are reported as bad lines
+unless ``--code`` puts the whole file into one code's graph.
+
+Usage / Qollanıw:
+    python scripts/import_dump.py dump.nt.gz [--code jinayat] [--batch-size 50000]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.ontology_manager import get_ontology_manager  # noqa: E402
+from src.core.stream_import import ImportReport  # noqa: E402
+
+
+def show_progress(report: ImportReport) -> None:
+    """One updating status line / Jańalanıp turatuǵın bir qatar"""
+    print(f"\r{report.lines:>12,} lines  {report.statements:>12,} statements  "
+          f"{report.throughput:>10,.0f}/s  {report.error_count:>6} bad",
+          end="", flush=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("dump", type=Path)
+    parser.add_argument("--code", default=None, help="legal code named graph, e.g. jinayat")
+    parser.add_argument("--batch-size", type=int, default=None)
+    args = parser.parse_args()
+
+    manager = get_ontology_manager()
+    manager.load_knowledge()
+    report = manager.import_stream(args.dump, code=args.code,
+                                   batch_size=args.batch_size, progress=show_progress)
+    print()
+    print(report.summary())
+    return 1 if report.error_count and not report.statements else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -60,6 +60,11 @@ setup(
             "langdetect==1.0.9",
             "torch==2.1.2",
         ],
+        "performance": [
+            "orjson==3.9.15",
+            "brotli==1.1.0",
+            "pyroaring==0.4.5",
+        ],
         "db": [
             "sqlalchemy==2.0.25",
             "pymongo==4.6.1",
@@ -0,0 +1,134 @@
+"""
+Admin API routes for huquqAI system
+Administrator API jolları
+
+The routes expose raw query text, bindings and traces and can reset stats or
+clear caches, so they are mounted only when ``api.admin.enabled`` is set and
+every request must carry the key from the ``api.admin.api_key_env`` variable.
+
+Jollar tek ``api.admin.enabled`` qosılǵanda ornatıladı ha'm hár soraw
+``api.admin.api_key_env`` ózgeriwshisindegi kilti talap etedi.
+"""
+
+import os
+import secrets
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query as QueryParam, Request
+
+from src.core.config import get_config
+from src.core.query_stats import get_query_stats
+from src.utils.cache import cache_stats, get_cache
+from src.utils.tracing import get_tracer
+
+
+async def require_admin_key(request: Request) -> None:
+    """
+    Reject requests without the configured admin API key.
+    Sazlanǵan administrator API kilti joq sorawlardı qaytarıw.
+
+    Raises:
+        HTTPException: 503 if no key is configured, 401 if the key is wrong
+                       Kilt sazlanbaǵan bolsa 503, kilt qáte bolsa 401
+    """
+    settings = get_config().api.admin
+    expected = os.getenv(settings.api_key_env)
+    if not expected:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Admin API key not configured ({settings.api_key_env})"
+        )
+    provided = request.headers.get(settings.api_key_header, "")
+    if not secrets.compare_digest(provided.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin API key")
+
+
+router = APIRouter(dependencies=[Depends(require_admin_key)])
+
+
+@router.get("/queries/templates")
+async def get_query_templates(
+    sort_by: Literal["total", "count", "p50", "p95", "p99"] = QueryParam(
+        "total", description="Sort key / Sortlaw gilti"
+    ),
+    limit: int = QueryParam(50, ge=1, le=1000)
+):
+    """
+    Per-template query latency and row statistics
+    Úlgi boyınsha soraw keshigiwi ha'm qatar statistikası
+    """
+    templates = get_query_stats().templates(sort_by=sort_by, limit=limit)
+    return {"count": len(templates), "templates": templates}
+
+
+@router.get("/queries/slow")
+async def get_slow_queries(limit: int = QueryParam(50, ge=1, le=1000)):
+    """
+    Most recent slow queries with bindings and plan
+    Baylanısları ha'm jobası menen eń sońǵı áste sorawlar
+    """
+    stats = get_query_stats()
+    entries = stats.slow_queries(limit=limit)
+    return {
+        "threshold": stats.slow_threshold,
+        "count": len(entries),
+        "queries": entries
+    }
+
+
+@router.delete("/queries/stats")
+async def reset_query_stats():
+    """
+    Reset query statistics and slow-query log
+    Soraw statistikası ha'm áste sorawlar jurnalın tazalaw
+    """
+    get_query_stats().reset()
+    return {"status": "reset"}
+
+
+@router.get("/traces")
+async def get_traces(
+    limit: int = QueryParam(20, ge=1, le=500),
+    min_duration_ms: float = QueryParam(0.0, ge=0, description="Slower than / Bunnan áste")
+):
+    """
+    Most recent request traces with per-stage span timings
+    Basqısh waqıtları menen eń sońǵı soraw izleri
+    """
+    traces = get_tracer().traces(limit=limit, min_duration_ms=min_duration_ms)
+    return {"count": len(traces), "traces": traces}
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """
+    Single trace by id (see the X-Trace-Id response header)
+    Identifikator boyınsha bir iz (X-Trace-Id juwap basın qarań)
+    """
+    trace = get_tracer().get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"Trace {trace_id} not found")
+    return trace
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """
+    Size and hit rate of every in-memory cache
+    Hár bir yadtaǵı keshtiń ólshemi ha'm tabıs úlesi
+    """
+    caches = cache_stats()
+    return {"count": len(caches), "caches": caches}
+
+
+@router.delete("/cache/{name}")
+async def clear_cache(name: str):
+    """
+    Drop every entry of one cache
+    Bir keshtiń barlıq jazıwların óshiriw
+    """
+    cache = get_cache(name)
+    if cache is None:
+        raise HTTPException(status_code=404, detail=f"Cache {name} not found")
+    cache.clear()
+    return {"status": "cleared", "cache": name}
@@ -5,7 +5,9 @@ Uses aiogram 3.x framework with direct RDF graph access
 
 import asyncio
 import os
-from typing import Dict
+import time
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict
 from pathlib import Path
 
 # Load environment variables
@@ -15,7 +17,7 @@ load_dotenv(Path(__file__).parent.parent.parent / ".env")
 from loguru import logger
 from rdflib import Graph
 
-from aiogram import Bot, Dispatcher, Router, F
+from aiogram import BaseMiddleware, Bot, Dispatcher, Router, F
 from aiogram.filters import Command, CommandStart
 from aiogram.types import (
     Message,
@@ -27,6 +29,15 @@ from aiogram.types import (
 )
 from aiogram.enums import ParseMode
 from aiogram.client.default import DefaultBotProperties
+from aiohttp import web
+
+from src.core.bulk_loader import discover_files, load_files
+from src.core.graph_index import (
+    KK_FACETS, KK_PUNISHMENT_RANGE, KK_SCHEMA, get_article_index, get_facet_index,
+    get_range_index, values_clause,
+)
+from src.utils.metrics import CONTENT_TYPE, get_metrics_registry
+from src.utils.normalization import FUNCTION_NS, register_sparql_functions, search_key
 
 
 # User language preferences storage
@@ -207,8 +218,46 @@ LANGUAGES = {
 user_states: Dict[int, str] = {}
 user_data: Dict[int, dict] = {}
 
+# Metrics / Metrikalar
+_metrics = get_metrics_registry()
+BOT_HANDLER_DURATION = _metrics.histogram(
+    "huquqai_bot_handler_duration_seconds", "Telegram handler latency", ["handler"]
+)
+BOT_UPDATES = _metrics.counter(
+    "huquqai_bot_updates_total", "Telegram updates handled", ["handler", "status"]
+)
+_metrics.gauge(
+    "huquqai_graph_triples", "Triples in the knowledge graph", ["graph"]
+).labels(graph="bot").set_function(lambda: len(graph) if graph is not None else 0)
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    """Record latency and outcome of every handler call"""
+
+    async def __call__(
+        self,
+        handler: Callable[[Any, Dict[str, Any]], Awaitable[Any]],
+        event: Any,
+        data: Dict[str, Any]
+    ) -> Any:
+        handler_object = data.get("handler")
+        name = getattr(getattr(handler_object, "callback", None), "__name__", "unknown")
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            return await handler(event, data)
+        except Exception:
+            status = "error"
+            raise
+        finally:
+            BOT_HANDLER_DURATION.labels(handler=name).observe(time.perf_counter() - start)
+            BOT_UPDATES.labels(handler=name, status=status).inc()
+
+
 # Initialize router
 router = Router()
+router.message.middleware(HandlerMetricsMiddleware())
+router.callback_query.middleware(HandlerMetricsMiddleware())
 
 
 def load_knowledge_base() -> Graph:
@@ -218,19 +267,16 @@ def load_knowledge_base() -> Graph:
     g = Graph()
     base_path = Path(__file__).parent.parent.parent
 
-    # Load ontology
-    ontology_file = base_path / "data" / "ontologies" / "legal_ontology.owl"
-    if ontology_file.exists():
-        g.parse(str(ontology_file), format='xml')
-        logger.info(f"Loaded ontology: {ontology_file}")
-
-    # Load criminal code data
-    data_file = base_path / "data" / "knowledge" / "criminal_code.ttl"
-    if data_file.exists():
-        g.parse(str(data_file), format='turtle')
-        logger.info(f"Loaded data: {data_file}")
+    # Every ontology and code file, parsed in parallel
+    files = discover_files([base_path / "data" / "ontologies", base_path / "data" / "knowledge"])
+    report = load_files(files, g)
+    for item in report.files:
+        if item.ok:
+            logger.info(f"Loaded {item.path} ({item.triples} triples, {item.parse_seconds:.2f}s)")
+        else:
+            logger.error(f"Failed to load {item.path}: {item.error}")
 
-    logger.info(f"Total triples loaded: {len(g)}")
+    logger.info(f"Total triples loaded: {len(g)} in {report.total_seconds:.2f}s")
     return g
 
 
@@ -372,11 +418,20 @@ def query_all_crimes() -> list:
 
 def query_by_keyword(keyword: str) -> list:
     """Search by keyword"""
+    # Same folding and stemming on both sides / Eki tárepte de birdey normalizaciya
+    key = search_key(keyword)
+    # Candidates from the keyword trigram bitsets / Gilt sóz trigram bitsetlerinen kandidatlar
+    statiyalar = get_facet_index(graph, KK_FACETS).subjects(keyword=keyword)
+    if not statiyalar:
+        return []
+
     query = f"""
     PREFIX kk: <http://karakalpak.law/ontology#>
+    PREFIX hf: <{FUNCTION_NS}>
 
     SELECT ?nomiri ?sarelaw ?jinayat_turi ?awirliq ?jaza_min ?jaza_max
     WHERE {{
+        {values_clause("statiya", statiyalar)}
         ?statiya a kk:Statiya ;
                  kk:nómiri ?nomiri ;
                  kk:sárelaw ?sarelaw ;
@@ -388,8 +443,8 @@ def query_by_keyword(keyword: str) -> list:
         OPTIONAL {{ ?statiya kk:tekstı ?teksti }}
 
         FILTER (
-            CONTAINS(LCASE(?sarelaw), LCASE("{keyword}")) ||
-            CONTAINS(LCASE(COALESCE(?teksti, "")), LCASE("{keyword}"))
+            CONTAINS(hf:searchKey(?sarelaw), "{key}") ||
+            CONTAINS(hf:searchKey(COALESCE(?teksti, "")), "{key}")
         )
     }}
     ORDER BY ?nomiri
@@ -410,12 +465,17 @@ def query_by_keyword(keyword: str) -> list:
 
 
 def query_by_article_number(article_num: str) -> list:
-    """Search by article number"""
+    """Search by article number through the article index"""
+    subjects = get_article_index(graph, KK_SCHEMA).lookup(article_num)
+    if not subjects:
+        return []
+
     query = f"""
     PREFIX kk: <http://karakalpak.law/ontology#>
 
     SELECT ?nomiri ?sarelaw ?teksti ?jinayat_turi ?awirliq ?jaza_min ?jaza_max
     WHERE {{
+        {values_clause("statiya", subjects)}
         ?statiya a kk:Statiya ;
                  kk:nómiri ?nomiri ;
                  kk:sárelaw ?sarelaw ;
@@ -425,8 +485,6 @@ def query_by_article_number(article_num: str) -> list:
                  kk:jaza_max ?jaza_max .
 
         OPTIONAL {{ ?statiya kk:tekstı ?teksti }}
-
-        FILTER (STR(?nomiri) = "{article_num}")
     }}
     """
 
@@ -448,11 +506,19 @@ def query_by_article_number(article_num: str) -> list:
 
 def query_by_severity(severity: str) -> list:
     """Search by severity"""
+    # Severity values containing the text, then their postings from the facet index
+    index = get_facet_index(graph, KK_FACETS)
+    levels = [v for v in index.search().facets["severity"] if severity.lower() in v.lower()]
+    statiyalar = index.subjects({"severity": levels}) if levels else []
+    if not statiyalar:
+        return []
+
     query = f"""
     PREFIX kk: <http://karakalpak.law/ontology#>
 
     SELECT ?nomiri ?sarelaw ?jinayat_turi ?awirliq ?jaza_min ?jaza_max
     WHERE {{
+        {values_clause("statiya", statiyalar)}
         ?statiya a kk:Statiya ;
                  kk:nómiri ?nomiri ;
                  kk:sárelaw ?sarelaw ;
@@ -480,37 +546,55 @@ def query_by_severity(severity: str) -> list:
     return results
 
 
-def query_by_punishment_range(min_years: int, max_years: int) -> list:
-    """Search by punishment range"""
-    query = f"""
-    PREFIX kk: <http://karakalpak.law/ontology#>
-
-    SELECT ?nomiri ?sarelaw ?jinayat_turi ?awirliq ?jaza_min ?jaza_max
-    WHERE {{
-        ?statiya a kk:Statiya ;
-                 kk:nómiri ?nomiri ;
-                 kk:sárelaw ?sarelaw ;
-                 kk:jinayat_turi ?jinayat_turi ;
-                 kk:awırlıq_dárejesi ?awirliq ;
-                 kk:jaza_min ?jaza_min ;
-                 kk:jaza_max ?jaza_max .
-
-        FILTER (?jaza_min >= {min_years} && ?jaza_max <= {max_years})
-    }}
-    ORDER BY DESC(?jaza_max)
-    LIMIT 15
-    """
+def query_by_punishment_range(min_years: int, max_years: int, limit: int = 15) -> list:
+    """Search by punishment range, longest sentence first"""
+    # The range index already yields articles longest sentence first, so only
+    # the first ``limit`` are fetched; an article missing a field drops out of
+    # the query and the next candidates take its place
+    candidates = get_range_index(graph, KK_PUNISHMENT_RANGE).within(
+        min_years, max_years, order="max", descending=True)
 
     results = []
-    for row in graph.query(query):
-        results.append({
-            'nomiri': str(row.nomiri),
-            'sarelaw': str(row.sarelaw),
-            'jinayat_turi': str(row.jinayat_turi),
-            'awirliq': str(row.awirliq),
-            'jaza_min': str(row.jaza_min),
-            'jaza_max': str(row.jaza_max),
-        })
+    while len(results) < limit:
+        statiyalar = list(islice(candidates, limit - len(results)))
+        if not statiyalar:
+            break
+
+        query = f"""
+        PREFIX kk: <http://karakalpak.law/ontology#>
+
+        SELECT ?statiya ?nomiri ?sarelaw ?jinayat_turi ?awirliq ?jaza_min ?jaza_max
+        WHERE {{
+            {values_clause("statiya", statiyalar)}
+            ?statiya a kk:Statiya ;
+                     kk:nómiri ?nomiri ;
+                     kk:sárelaw ?sarelaw ;
+                     kk:jinayat_turi ?jinayat_turi ;
+                     kk:awırlıq_dárejesi ?awirliq ;
+                     kk:jaza_min ?jaza_min ;
+                     kk:jaza_max ?jaza_max .
+
+            FILTER (?jaza_min >= {min_years} && ?jaza_max <= {max_years})
+        }}
+        """
+
+        rows = {}
+        for row in graph.query(query):
+            rows.setdefault(row.statiya, row)
+
+        # Keep the index order / Indeks tártibin saqlaw
+        for statiya in statiyalar:
+            row = rows.get(statiya)
+            if row is None:
+                continue
+            results.append({
+                'nomiri': str(row.nomiri),
+                'sarelaw': str(row.sarelaw),
+                'jinayat_turi': str(row.jinayat_turi),
+                'awirliq': str(row.awirliq),
+                'jaza_min': str(row.jaza_min),
+                'jaza_max': str(row.jaza_max),
+            })
     return results
 
 
@@ -526,19 +610,10 @@ def get_statistics() -> dict:
     result = list(graph.query(query_count))
     stats['articles'] = int(result[0][0]) if result else 0
 
-    # Count by severity
-    query_severity = """
-    PREFIX kk: <http://karakalpak.law/ontology#>
-    SELECT ?awirliq (COUNT(?s) as ?count)
-    WHERE {
-        ?s a kk:Statiya ;
-           kk:awırlıq_dárejesi ?awirliq .
-    }
-    GROUP BY ?awirliq
-    """
-    stats['by_severity'] = {}
-    for row in graph.query(query_severity):
-        stats['by_severity'][str(row.awirliq)] = int(row['count'])
+    # Counts by severity and crime type come from the facet index
+    facets = get_facet_index(graph, KK_FACETS).search().facets
+    stats['by_severity'] = facets['severity']
+    stats['by_crime_type'] = facets['crime_type']
 
     return stats
 
@@ -608,6 +683,10 @@ async def cmd_stats(message: Message):
         for severity, count in stats.get('by_severity', {}).items():
             text += f"  • {severity}: {count}\n"
 
+        text += "\n<b>Jinayat túri boyınsha:</b>\n"
+        for crime_type, count in stats.get('by_crime_type', {}).items():
+            text += f"  • {crime_type}: {count}\n"
+
         await message.answer(text, parse_mode=ParseMode.HTML)
     except Exception as e:
         logger.error(f"Stats error: {e}")
@@ -808,6 +887,23 @@ async def handle_text(message: Message):
         await searching_msg.edit_text(get_text(user_id, "error"), parse_mode=ParseMode.HTML)
 
 
+async def start_metrics_server(port: int) -> web.AppRunner:
+    """Serve Prometheus metrics for the bot process on /metrics"""
+    async def metrics(request: web.Request) -> web.Response:
+        return web.Response(
+            body=get_metrics_registry().render().encode("utf-8"),
+            headers={"Content-Type": CONTENT_TYPE}
+        )
+
+    app = web.Application()
+    app.router.add_get("/metrics", metrics)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
+    logger.info(f"Metrics served on :{port}/metrics")
+    return runner
+
+
 async def main():
     """Main function"""
     global graph
@@ -820,6 +916,7 @@ async def main():
 
     # Load knowledge base
     graph = load_knowledge_base()
+    register_sparql_functions()
 
     if len(graph) == 0:
         logger.error("Knowledge base is empty!")
@@ -838,10 +935,18 @@ async def main():
     logger.info(f"Knowledge base loaded: {len(graph)} triples")
     logger.info("Bot is ready!")
 
+    # Optional metrics endpoint / Opsional metrikalar endpoint
+    metrics_runner = None
+    metrics_port = os.getenv("BOT_METRICS_PORT")
+    if metrics_port:
+        metrics_runner = await start_metrics_server(int(metrics_port))
+
     try:
         await dp.start_polling(bot)
     finally:
         await bot.session.close()
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
 
 
 def run_bot():
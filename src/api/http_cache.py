@@ -0,0 +1,114 @@
+"""
+HTTP validation caching for read-only API routes
+Tek oqıw ushın API jolları ushın HTTP keshlew
+
+Article, crime and terminology responses only change when the knowledge base
+does, so their ETag is a hash of the knowledge-base version (see
+``src.utils.cache``). A request whose ``If-None-Match`` carries the current tag
+is answered with ``304 Not Modified`` before any SPARQL query runs.
+
+Statiya, jinayat ha'm terminologiya juwapları tek bilimler bazası ózgergende
+ózgeredi, sonlıqtan ETag bilimler bazası versiyasınıń hash-i boladı. Házirgi
+teg penen kelgen soraw SPARQL sorawısız ``304`` aladı.
+"""
+
+import hashlib
+import uuid
+from typing import Optional
+
+from fastapi import Request, Response
+
+from src.core.config import get_config
+from src.utils.cache import knowledge_version
+from src.utils.metrics import get_metrics_registry
+
+
+_metrics = get_metrics_registry()
+HTTP_NOT_MODIFIED = _metrics.counter(
+    "huquqai_http_not_modified_total", "Requests answered with 304 Not Modified",
+    ["route"]
+)
+
+# Versions restart at zero in every process, so the tag also carries a
+# per-process id; a restart or another worker simply revalidates once
+# Versiyalar hár processte nolden baslanadı, sonlıqtan tegke process id qosıladı
+_INSTANCE_ID = uuid.uuid4().hex
+
+
+def knowledge_etag() -> str:
+    """
+    Strong ETag for the current knowledge-base version.
+    Házirgi bilimler bazası versiyası ushın ETag.
+
+    Returns:
+        Quoted entity tag / Qoshtırnaqlı teg
+    """
+    digest = hashlib.sha1(f"{_INSTANCE_ID}:{knowledge_version()}".encode()).hexdigest()
+    return f'"kb-{digest[:20]}"'
+
+
+def cache_control() -> str:
+    """
+    Cache-Control value from ``api.http_cache``.
+    ``api.http_cache`` boyınsha Cache-Control mánisi.
+    """
+    settings = get_config().api.http_cache
+    directives = ["public" if settings.get("public", True) else "private",
+                  f"max-age={settings.get('max_age', 300)}"]
+    stale = settings.get("stale_while_revalidate", 0)
+    if stale:
+        directives.append(f"stale-while-revalidate={stale}")
+    return ", ".join(directives)
+
+
+def _matches(header: str, etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against a tag (RFC 9110).
+    If-None-Match basınıń teg penen álsiz salıstırıwı.
+    """
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def check_not_modified(request: Request, response: Response) -> Optional[Response]:
+    """
+    Answer a conditional GET or attach validators to the coming response.
+    Shártli GET-ke juwap beriw yamasa keyingi juwapqa validatorlar qosıw.
+
+    Call it first in a route and return its result when it is not None.
+    Jol basında shaqırıń ha'm None bolmasa nátiyjesin qaytarıń.
+
+    Args:
+        request: Incoming request / Kiris soraw
+        response: Response FastAPI merges headers from / Baslar qosılatuǵın juwap
+
+    Returns:
+        304 response when the client copy is current, else None
+        Klient nusqası jańa bolsa 304 juwap, bolmasa None
+
+    Examples / Misallar:
+        >>> not_modified = check_not_modified(request, response)
+        >>> if not_modified is not None:
+        ...     return not_modified
+    """
+    if not get_config().api.http_cache.get("enabled", True):
+        return None
+
+    etag = knowledge_etag()
+    headers = {"ETag": etag, "Cache-Control": cache_control()}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _matches(if_none_match, etag):
+        route = getattr(request.scope.get("route"), "path", request.url.path)
+        HTTP_NOT_MODIFIED.labels(route=route).inc()
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -5,12 +5,17 @@ FastAPI REST API endpoints
 
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from contextlib import asynccontextmanager
 from loguru import logger
 
 from src.core.config import get_config
 from src.api.routes import router
+from src.api.admin import router as admin_router
+from src.api.middleware import CompressionMiddleware, MetricsMiddleware, TracingMiddleware
+from src.api.responses import FastJSONResponse
 from src.utils.logger import setup_logging
+from src.utils.metrics import CONTENT_TYPE, get_metrics_registry
 
 
 @asynccontextmanager
@@ -35,9 +40,22 @@ def create_app() -> FastAPI:
         title="huquqAI API",
         description="Legal Knowledge Base System for Karakalpak Language",
         version=config.application.get("version", "0.1.0"),
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=(
+            FastJSONResponse if config.api.fast_json else JSONResponse
+        ),
     )
 
+    # Response compression / Juwaptı qısıw
+    compression = config.api.compression
+    if compression.get("enabled", True):
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=compression.get("minimum_size", 1024),
+            gzip_level=compression.get("gzip_level", 6),
+            brotli_quality=compression.get("brotli_quality", 4),
+        )
+
     # CORS middleware
     if config.api.cors.get("enabled", True):
         app.add_middleware(
@@ -48,8 +66,24 @@ def create_app() -> FastAPI:
             allow_headers=["*"],
         )
 
+    # Request tracing / Soraw izlew
+    monitoring = config.monitoring
+    if monitoring.get("tracing", {}).get("enabled", True):
+        app.add_middleware(TracingMiddleware)
+
+    # Metrics middleware and endpoint / Metrikalar middleware ha'm endpoint
+    if monitoring.get("enabled", True):
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get(monitoring.get("metrics_path", "/metrics"), include_in_schema=False)
+        async def metrics():
+            """Prometheus metrics / Prometheus metrikaları"""
+            return Response(get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
     # Include routers
     app.include_router(router, prefix="/api/v1")
+    if config.api.admin.enabled:
+        app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
 
     return app
 
@@ -0,0 +1,234 @@
+"""
+ASGI middleware for huquqAI API
+huquqAI API ushın ASGI middleware
+"""
+
+import gzip
+import time
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from src.utils.metrics import get_metrics_registry
+from src.utils.tracing import span
+
+
+_metrics = get_metrics_registry()
+HTTP_REQUESTS = _metrics.counter(
+    "huquqai_http_requests_total", "HTTP requests by route and status",
+    ["method", "route", "status"]
+)
+HTTP_DURATION = _metrics.histogram(
+    "huquqai_http_request_duration_seconds", "HTTP request latency by route",
+    ["method", "route"]
+)
+HTTP_RESPONSE_BYTES = _metrics.counter(
+    "huquqai_http_response_bytes_total", "Response body bytes before and after compression",
+    ["encoding", "stage"]
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+# Content types worth compressing / Qısıwǵa turarlı mazmun túrleri
+_COMPRESSIBLE = ("application/json", "application/sparql-results", "text/", "application/xml",
+                 "application/rdf+xml", "application/n-triples", "text/turtle")
+
+
+def route_template(scope) -> str:
+    """
+    Return the matched route template, e.g. ``/api/v1/articles/{article_number}``.
+    Sáykes kelgen jol úlgisin qaytarıw.
+    """
+    # Newer FastAPI keeps the prefixed path on the effective route context
+    # FastAPI jańa versiyaları prefiksli joldı effective route context-te saqlaydı
+    context = (scope.get("fastapi") or {}).get("effective_route_context")
+    path = getattr(context, "path", None)
+    if path:
+        return path
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Record request count and latency per route template.
+    Hár bir jol úlgisi ushın soraw sanı ha'm keshigiwin jazıw.
+
+    Routes are labelled by their template (``/api/v1/articles/{article_number}``),
+    not the raw path, so label cardinality stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = route_template(scope)
+            method = scope.get("method", "GET")
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status)).inc()
+            HTTP_DURATION.labels(method=method, route=route).observe(
+                time.perf_counter() - start
+            )
+
+
+class TracingMiddleware:
+    """
+    Open a root span per request and return its id in ``X-Trace-Id``.
+    Hár bir soraw ushın túbir span ashıw ha'm onıń identifikatorın qaytarıw.
+
+    Spans opened by services and the SPARQL engine while handling the request
+    become children of this span.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "GET")
+        with span("http.request", method=method, path=scope.get("path")) as root:
+            async def send_with_trace_id(message):
+                if message["type"] == "http.response.start":
+                    root.set_attribute("status", message["status"])
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-trace-id", root.trace_id.encode("ascii")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_trace_id)
+            finally:
+                root.name = f"{method} {route_template(scope)}"
+
+
+def negotiate_encoding(accept_encoding: str, brotli_available: bool = True) -> Optional[str]:
+    """
+    Pick ``br`` or ``gzip`` from an Accept-Encoding header.
+    Accept-Encoding basınan ``br`` yamasa ``gzip`` tańlaw.
+
+    Brotli wins when both are acceptable and the module is installed.
+    Ekewi de qabıl etilse ha'm modul ornatılǵan bolsa brotli tańlanadı.
+
+    Examples / Misallar:
+        >>> negotiate_encoding("gzip, deflate, br")
+        'br'
+        >>> negotiate_encoding("br;q=0, gzip")
+        'gzip'
+    """
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    if brotli_available and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compress large responses with brotli or gzip as the client accepts.
+    Úlken juwaplardı klient qabıl etkenindey brotli yamasa gzip penen qısıw.
+
+    Only complete bodies above ``minimum_size`` with a text or JSON media type
+    are compressed; streamed bodies, ``304`` responses and bodies that already
+    carry a Content-Encoding pass through untouched. Brotli is used only when
+    the optional ``brotli`` module is installed.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6,
+                 brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress a body with the negotiated encoding / Tańlanǵan usıl menen qısıw"""
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), brotli is not None
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=list(start_message["headers"]))
+            content_type = headers.get("content-type", "")
+            if (message.get("more_body", False)
+                    or len(body) < self.minimum_size
+                    or "content-encoding" in headers
+                    or not content_type.startswith(_COMPRESSIBLE)):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self.compress(body, encoding)
+            HTTP_RESPONSE_BYTES.labels(encoding=encoding, stage="original").inc(len(body))
+            HTTP_RESPONSE_BYTES.labels(encoding=encoding, stage="sent").inc(len(compressed))
+
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            # The encoded bytes differ, so the validator becomes weak (RFC 9110)
+            etag = headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                headers["ETag"] = f"W/{etag}"
+            await send({**start_message, "headers": headers.raw})
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,50 @@
+"""
+Fast JSON responses for huquqAI API
+huquqAI API ushın tez JSON juwapları
+
+``orjson`` is optional (``pip install huquqai[performance]``). When present it
+serializes article texts several times faster than the standard ``json``
+module; without it the response falls back to the same compact, non-ASCII
+escaped output Starlette produces, so clients see identical bytes either way.
+
+``orjson`` qosımsha. Bar bolsa statiya tekstlerin standart ``json``-nan bir neshe
+ese tez serializaciyalaydı; bolmasa Starlette-tiń sol formatına qaytadı.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON.
+    Mazmundı qısqa UTF-8 JSON-ǵa aylandırıw.
+
+    Args:
+        content: JSON-compatible data / JSON-ǵa sáykes maǵlıwmat
+
+    Returns:
+        UTF-8 bytes / UTF-8 baytlar
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson when available.
+    orjson bar bolsa sol arqalı jasalatuǵın JSONResponse.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -2,11 +2,14 @@
 API routes for huquqAI system
 """
 
-from fastapi import APIRouter, HTTPException, Query as QueryParam
+from fastapi import APIRouter, HTTPException, Path, Query as QueryParam, Request, Response
 from typing import Optional, List
 from loguru import logger
+from rdflib import RDF, RDFS
 
-from src.models.legal_entities import Query, Answer, Article
+from src.api.http_cache import check_not_modified
+from src.core.graph_index import KK_FACETS, KK_PUNISHMENT_RANGE, get_facet_index, get_range_index
+from src.models.legal_entities import Query, Answer, Article, ArticleBatchRequest
 from src.services.query_service import QueryService
 from src.services.sparql_service import SPARQLService
 
@@ -62,12 +65,105 @@ async def search_articles(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/facets")
+async def faceted_search(
+    request: Request,
+    response: Response,
+    severity: Optional[List[str]] = QueryParam(None, description="Awırlıq dárejesi"),
+    crime_type: Optional[List[str]] = QueryParam(None, description="Jinayat túri"),
+    code: Optional[List[str]] = QueryParam(None, description="Nızam / code"),
+    punishment_type: Optional[List[str]] = QueryParam(None, description="Jaza túri"),
+    q: Optional[str] = QueryParam(None, description="Keyword / Gilt sóz"),
+    min_years: Optional[int] = QueryParam(None, ge=0, description="Eń az jaza (jıl)"),
+    max_years: Optional[int] = QueryParam(None, ge=0, description="Eń kóp jaza (jıl)"),
+    limit: int = QueryParam(20, ge=1, le=100)
+):
+    """
+    Faceted article search: matching articles plus counts per facet value
+    Facet boyınsha izlew: sáykes statiyalar ha'm hár facet mánisiniń sanı
+
+    Keyword, facet and punishment-range criteria are combined by bitset
+    intersection / Shártler bitset kesilisiwi arqalı biriktiriledi
+    """
+    from src.core.ontology_manager import get_ontology_manager
+
+    manager = get_ontology_manager()
+    if not manager.is_loaded():
+        raise HTTPException(status_code=503, detail="Knowledge base not loaded")
+
+    not_modified = check_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
+    filters = {
+        name: values
+        for name, values in (
+            ("severity", severity), ("crime_type", crime_type),
+            ("code", code), ("punishment_type", punishment_type),
+        )
+        if values
+    }
+    within = None
+    if min_years is not None or max_years is not None:
+        within = get_range_index(manager.graph, KK_PUNISHMENT_RANGE).within(min_years, max_years)
+
+    index = get_facet_index(manager.graph, KK_FACETS)
+    result = index.search(filters, within=within, keyword=q)
+
+    return {
+        "filters": filters,
+        "total": result.total,
+        "facets": result.facets,
+        "articles": [
+            {
+                "uri": str(subject),
+                "label": str(manager.graph.value(subject, RDFS.label) or ""),
+                **index.values(subject),
+            }
+            for subject in result.subjects[:limit]
+        ],
+    }
+
+
+@router.post("/articles/batch")
+async def get_articles_batch(request: ArticleBatchRequest):
+    """
+    Get many articles by number in one call, in request order
+    Kóp statiyanı nomeri boyınsha bir shaqırıwda sorawdaǵı tártipte alıw
+    """
+    try:
+        refs = [
+            (ref.number, ref.code_type.value if ref.code_type else None)
+            for ref in request.articles
+        ]
+        result = await sparql_service.get_articles_by_numbers(refs)
+
+        if not result.success:
+            raise HTTPException(status_code=500, detail=result.message)
+
+        return {
+            "count": len(refs),
+            "found": result.metadata["found"],
+            "missing": [number for (number, _), row in zip(refs, result.data) if row is None],
+            "articles": result.data
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch article retrieval error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/articles/{article_number}")
-async def get_article(article_number: str):
+async def get_article(article_number: str, request: Request, response: Response):
     """
     Get article by number
     Statiyani nomeri boyınsha tabıw
     """
+    not_modified = check_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     try:
         result = await sparql_service.get_article_by_number(article_number)
 
@@ -90,7 +186,9 @@ async def get_article(article_number: str):
 
 @router.get("/crimes/{crime_type}")
 async def get_crimes_by_type(
-    crime_type: str = QueryParam(..., description="Crime type: light, medium, heavy, very_heavy")
+    request: Request,
+    response: Response,
+    crime_type: str = Path(..., description="Crime type: light, medium, heavy, very_heavy")
 ):
     """
     Get crimes by type
@@ -104,6 +202,10 @@ async def get_crimes_by_type(
                 detail=f"Invalid crime type. Must be one of: {', '.join(valid_types)}"
             )
 
+        not_modified = check_not_modified(request, response)
+        if not_modified is not None:
+            return not_modified
+
         result = await sparql_service.get_crimes_by_type(crime_type)
 
         if not result.success:
@@ -122,11 +224,16 @@ async def get_crimes_by_type(
 
 
 @router.get("/terminology")
-async def get_terminology(lang: Optional[str] = None):
+async def get_terminology(request: Request, response: Response,
+                          lang: Optional[str] = None):
     """
     Get legal terminology
     Huqıqlıq terminologiyani алиw
     """
+    not_modified = check_not_modified(request, response)
+    if not_modified is not None:
+        return not_modified
+
     from src.core.config import get_config
     config = get_config()
 
@@ -150,10 +257,35 @@ async def get_statistics():
     Get system statistics
     Sistema statistikası
     """
-    # This is a placeholder - implement actual statistics
+    from src.core.config import get_config
+    from src.core.ontology_manager import get_ontology_manager
+    from src.utils.metrics import get_metrics_registry
+
+    config = get_config()
+    manager = get_ontology_manager()
+    registry = get_metrics_registry()
+
+    total_articles = 0
+    total_crimes = 0
+    if manager.is_loaded():
+        for class_name in ("Statiya", "Jinayat"):
+            class_uri = manager.get_class(class_name)
+            if class_uri is None:
+                continue
+            count = sum(1 for _ in manager.graph.subjects(RDF.type, class_uri))
+            if class_name == "Statiya":
+                total_articles = count
+            else:
+                total_crimes = count
+
+    sparql_queries = registry.get("huquqai_sparql_queries_total")
+    http_requests = registry.get("huquqai_http_requests_total")
+
     return {
-        "total_articles": 0,
-        "total_crimes": 0,
-        "total_queries": 0,
-        "supported_languages": ["kaa", "uz", "ru", "en"]
+        "total_articles": total_articles,
+        "total_crimes": total_crimes,
+        "total_queries": int(sparql_queries.total()) if sparql_queries else 0,
+        "total_requests": int(http_requests.total()) if http_requests else 0,
+        "ontology": manager.get_statistics(),
+        "supported_languages": config.language.supported
     }
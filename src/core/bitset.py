@@ -0,0 +1,146 @@
+"""
+Compressed sets of small integer ids
+Kishi pútin san id-lardıń qısılǵan toplamları
+
+Secondary indexes number their subjects densely and store every posting (one
+facet value, one keyword trigram) as a set of those ids. Multi-criteria
+searches then become set intersections instead of row-by-row SPARQL filters.
+
+``BitSet`` is ``pyroaring.BitMap`` (Roaring bitmaps: compressed, with native
+intersections and cardinalities) when the optional ``pyroaring`` package is
+installed, and ``IntBitSet`` otherwise. ``IntBitSet`` keeps the ids as bits of
+one Python integer and implements the subset of the ``BitMap`` API the indexes
+use, so callers never need to know which one they got.
+
+``BitSet`` ``pyroaring`` ornatılǵan bolsa ``pyroaring.BitMap``, bolmasa
+``IntBitSet`` boladı; ekewi de birdey API beredi.
+"""
+
+from functools import reduce
+from typing import Iterable, Iterator, Optional
+
+
+class IntBitSet:
+    """
+    Set of non-negative ints stored as the bits of one Python integer.
+    Bir Python pútin sanınıń bitlerinde saqlanǵan teris emes sanlar toplamı.
+
+    Examples / Misallar:
+        >>> a = IntBitSet([1, 3, 5])
+        >>> b = IntBitSet([3, 4, 5])
+        >>> list(a & b)
+        [3, 5]
+        >>> a.intersection_cardinality(b)
+        2
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, values: Optional[Iterable[int]] = None):
+        """
+        Args:
+            values: Initial ids / Baslanǵısh id-lar
+        """
+        bits = 0
+        for value in values or ():
+            bits |= 1 << value
+        self._bits = bits
+
+    @classmethod
+    def _from_bits(cls, bits: int) -> "IntBitSet":
+        result = cls()
+        result._bits = bits
+        return result
+
+    def add(self, value: int) -> None:
+        """Add an id / Id qosıw"""
+        self._bits |= 1 << value
+
+    def discard(self, value: int) -> None:
+        """Remove an id if present / Bar bolsa id-dı óshiriw"""
+        self._bits &= ~(1 << value)
+
+    def copy(self) -> "IntBitSet":
+        return self._from_bits(self._bits)
+
+    def intersection_cardinality(self, other: "IntBitSet") -> int:
+        """Size of the intersection without building it / Kesilisiw ólshemi"""
+        return bin(self._bits & other._bits).count("1")
+
+    def __and__(self, other: "IntBitSet") -> "IntBitSet":
+        return self._from_bits(self._bits & other._bits)
+
+    def __or__(self, other: "IntBitSet") -> "IntBitSet":
+        return self._from_bits(self._bits | other._bits)
+
+    def __sub__(self, other: "IntBitSet") -> "IntBitSet":
+        return self._from_bits(self._bits & ~other._bits)
+
+    def __iand__(self, other: "IntBitSet") -> "IntBitSet":
+        self._bits &= other._bits
+        return self
+
+    def __ior__(self, other: "IntBitSet") -> "IntBitSet":
+        self._bits |= other._bits
+        return self
+
+    def __contains__(self, value: int) -> bool:
+        return value >= 0 and bool(self._bits >> value & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        """Ids in ascending order / Ósiw tártibindegi id-lar"""
+        bits = self._bits
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length() - 1
+            bits ^= lowest
+
+    def __len__(self) -> int:
+        return bin(self._bits).count("1")
+
+    def __bool__(self) -> bool:
+        return bool(self._bits)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, IntBitSet):
+            return self._bits == other._bits
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"IntBitSet({list(self)})"
+
+
+try:
+    from pyroaring import BitMap as BitSet
+except ImportError:  # pragma: no cover - depends on the environment
+    BitSet = IntBitSet
+
+
+def intersect_all(sets: Iterable["BitSet"]) -> Optional["BitSet"]:
+    """
+    Intersection of several sets, smallest first; None when there are none.
+    Bir neshe toplamnıń kesilisiwi, eń kishisinen baslap; joq bolsa None.
+
+    Args:
+        sets: Sets to intersect / Kesilisetuǵın toplamlar
+
+    Returns:
+        The intersection, or None for no sets / Kesilisiw yamasa None
+    """
+    ordered = sorted(sets, key=len)
+    if not ordered:
+        return None
+    return reduce(lambda acc, bits: acc & bits, ordered[1:], ordered[0].copy())
+
+
+def union_all(sets: Iterable["BitSet"]) -> "BitSet":
+    """
+    Union of several sets / Bir neshe toplamnıń birlesiwi
+    """
+    result = None
+    for bits in sets:
+        if result is None:
+            result = bits.copy()
+        else:
+            result |= bits
+    return BitSet() if result is None else result
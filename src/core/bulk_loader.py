@@ -0,0 +1,313 @@
+"""
+Parallel bulk loading of RDF files
+RDF fayllardı parallel kóplep júklew
+
+Every code of law is its own file under ``paths.ontologies`` and
+``paths.knowledge``. Parsing them one after another makes startup grow with
+every code added, so the loader parses the files in worker processes and
+merges the results into the target graph as each one finishes.
+
+A worker sends its triples back dictionary-encoded: the distinct terms once,
+plus one flat integer array of term ids. That pickles several times smaller
+and faster than a list of rdflib triples, and the parent shares one term
+object among all triples that use it.
+
+Small batches (one file, or less than ``min_parallel_bytes`` in total) are
+parsed in-process, where starting workers would cost more than it saves.
+
+N-Quads files are parsed into a ``Dataset`` so their graph names survive; they
+load into a ``Dataset`` target, and a plain ``Graph`` target fails the file
+rather than silently dropping or merging its named graphs.
+
+Hár kodeks óz faylında turadı. Júklewshi fayllardı jumısshı processlerde
+parallel parse etedi ha'm hár biri tayar bolǵanda nátiyjeni maqsetli grafqa
+qosadı.
+"""
+
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from loguru import logger
+from rdflib import Dataset, Graph
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.term import Node
+
+
+# File extension -> rdflib parser / Fayl keńeytpesi -> rdflib parseri
+RDF_FORMATS: Dict[str, str] = {
+    '.owl': 'xml',
+    '.rdf': 'xml',
+    '.ttl': 'turtle',
+    '.n3': 'n3',
+    '.nt': 'nt',
+    '.nq': 'nquads',
+    '.jsonld': 'json-ld',
+}
+
+# Formats that name graphs / Graf atların saqlaytuǵın formatlar
+QUAD_FORMATS = ('nquads',)
+
+# Parse in-process below this many bytes / Bunnan kishi bolsa processte parse etiw
+MIN_PARALLEL_BYTES = 1 << 20
+
+EncodedTriples = Tuple[List[Node], array]
+
+# Triples per graph name, None for the default graph
+# Graf atı boyınsha triple-lar, tiykarǵı graf ushın None
+EncodedGraphs = List[Tuple[Optional[Node], EncodedTriples]]
+
+
+@dataclass
+class FileLoad:
+    """
+    Outcome of loading one file; ``triples`` counts the triples it added.
+    Bir fayldı júklew nátiyjesi; ``triples`` qosılǵan triple-lar sanı.
+    """
+    path: Path
+    format: str
+    triples: int = 0
+    parse_seconds: float = 0.0
+    merge_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class LoadReport:
+    """
+    Per-file timings of a bulk load.
+    Kóplep júklewdiń hár fayl boyınsha waqıtları.
+    """
+    files: List[FileLoad] = field(default_factory=list)
+    workers: int = 1
+    total_seconds: float = 0.0
+
+    @property
+    def triples(self) -> int:
+        return sum(item.triples for item in self.files)
+
+    @property
+    def failed(self) -> List[FileLoad]:
+        return [item for item in self.files if not item.ok]
+
+    def summary(self) -> str:
+        """One line per file plus a total / Hár fayl ushın bir qatar ha'm jámi"""
+        lines = [
+            f"{item.path.name}: {item.triples} triples, parse {item.parse_seconds:.2f}s, "
+            f"merge {item.merge_seconds:.2f}s" if item.ok else f"{item.path.name}: {item.error}"
+            for item in self.files
+        ]
+        lines.append(
+            f"{len(self.files)} files, {self.triples} triples in {self.total_seconds:.2f}s "
+            f"({self.workers} workers)"
+        )
+        return "\n".join(lines)
+
+
+def guess_format(path: Union[str, Path]) -> str:
+    """
+    rdflib format for a file, from its extension (RDF/XML by default).
+    Fayl ushın rdflib formatı, keńeytpesi boyınsha (áhmiyetli RDF/XML).
+    """
+    return RDF_FORMATS.get(Path(path).suffix.lower(), 'xml')
+
+
+def discover_files(directories: Iterable[Union[str, Path]]) -> List[Path]:
+    """
+    RDF files under the given directories, in a stable order.
+    Berilgen papkalardaǵı RDF fayllar, turaqlı tártipte.
+
+    Args:
+        directories: Directories to search recursively / Izlenetuǵın papkalar
+
+    Returns:
+        Files with a known RDF extension / Belgili RDF keńeytpeli fayllar
+
+    Examples / Misallar:
+        >>> discover_files(["data/ontologies", "data/knowledge"])
+        [PosixPath('data/ontologies/legal_ontology.owl'), PosixPath('data/knowledge/criminal_code.ttl')]
+    """
+    files: List[Path] = []
+    for directory in directories:
+        directory = Path(directory)
+        if not directory.is_dir():
+            continue
+        files.extend(
+            sorted(path for path in directory.rglob('*')
+                   if path.is_file() and path.suffix.lower() in RDF_FORMATS)
+        )
+    return files
+
+
+def _encode(graph: Graph) -> EncodedTriples:
+    """Distinct terms plus a flat array of term ids / Terminler ha'm id massivi"""
+    ids: Dict[Node, int] = {}
+    terms: List[Node] = []
+    flat = array('L')
+    for triple in graph:
+        for term in triple:
+            term_id = ids.get(term)
+            if term_id is None:
+                term_id = ids[term] = len(terms)
+                terms.append(term)
+            flat.append(term_id)
+    return terms, flat
+
+
+def _decode(encoded: EncodedTriples):
+    """Triples back from their encoded form / Kodlanǵan túrinen triple-lar"""
+    terms, flat = encoded
+    term = terms.__getitem__
+    return zip(map(term, flat[0::3]), map(term, flat[1::3]), map(term, flat[2::3]))
+
+
+def _read(path: str, format: str) -> Graph:
+    """Parse a file, into a Dataset for quad formats / Fayldı parse etiw"""
+    graph = Dataset() if format in QUAD_FORMATS else Graph()
+    graph.parse(path, format=format)
+    return graph
+
+
+def _parts(graph: Graph) -> Iterator[Tuple[Optional[Node], Graph]]:
+    """Non-empty graphs of a parsed file by name / Parse etilgen fayldıń grafları"""
+    if not isinstance(graph, Dataset):
+        yield None, graph
+        return
+    for part in graph.graphs():
+        if len(part):
+            name = part.identifier
+            yield (None if name == DATASET_DEFAULT_GRAPH_ID else name), part
+
+
+def _size(graph: Graph) -> int:
+    """Triples in a graph, every graph of a Dataset / Graftaǵı triple-lar sanı"""
+    if isinstance(graph, Dataset):
+        return sum(len(part) for part in graph.graphs())
+    return len(graph)
+
+
+def _merge(target: Graph, parts: List[Tuple[Optional[Node], Iterable]]) -> None:
+    """
+    Add parsed triples to a graph, each named graph into its own graph.
+    Parse etilgen triple-lardı grafqa qosıw, hár atamalı graf óz grafına.
+
+    Raises:
+        ValueError: If named graphs would go into a plain Graph
+                    Atamalı graflar ápiwayı Graph-qa túsetuǵın bolsa
+    """
+    names = [name for name, _ in parts if name is not None]
+    if names and not isinstance(target, Dataset):
+        raise ValueError(
+            f"{len(names)} named graphs would be dropped loading into a plain Graph; "
+            f"load into a Dataset / {len(names)} atamalı graf ápiwayı Graph-qa "
+            f"júklengende joǵaladı; Dataset-qa júklew kerek"
+        )
+    for name, triples in parts:
+        if not isinstance(target, Dataset):
+            graph = target
+        else:
+            graph = target.graph(DATASET_DEFAULT_GRAPH_ID if name is None else name)
+        target.addN((s, p, o, graph) for s, p, o in triples)
+
+
+def _parse_file(path: str, format: str) -> Tuple[EncodedGraphs, float]:
+    """
+    Worker: parse one file and encode its triples.
+    Jumısshı: bir fayldı parse etiw ha'm triple-ların kodlaw.
+    """
+    start = time.perf_counter()
+    encoded = [(name, _encode(part)) for name, part in _parts(_read(path, format))]
+    return encoded, time.perf_counter() - start
+
+
+def load_files(
+    paths: Iterable[Union[str, Path]],
+    target: Union[Graph, Callable[[Path], Graph]],
+    workers: Optional[int] = None,
+    min_parallel_bytes: int = MIN_PARALLEL_BYTES,
+) -> LoadReport:
+    """
+    Parse files in parallel and merge their triples into a graph.
+    Fayllardı parallel parse etiw ha'm triple-ların grafqa qosıw.
+
+    A file that fails to parse is reported in ``LoadReport.failed``; the
+    other files still load. So is an N-Quads file with named graphs whose
+    target is not a ``Dataset``.
+
+    Args:
+        paths: RDF files / RDF fayllar
+        target: Graph to load into, or a function choosing one per file
+                Júklenetuǵın graf yamasa hár fayl ushın graf tańlaytuǵın funkciya
+        workers: Worker processes, None or 0 for one per CPU
+                 Jumısshı processler sanı, None yamasa 0 - hár CPU ushın bir
+        min_parallel_bytes: Smaller batches are parsed in-process
+                            Bunnan kishi toplamlar processte parse etiledi
+
+    Returns:
+        Per-file timings / Hár fayl boyınsha waqıtlar
+
+    Examples / Misallar:
+        >>> graph = Graph()
+        >>> report = load_files(discover_files(["data/knowledge"]), graph)
+        >>> print(report.summary())
+    """
+    start = time.perf_counter()
+    files = [FileLoad(Path(path), guess_format(path)) for path in paths]
+    choose = target if callable(target) else (lambda _: target)
+
+    workers = min(workers or os.cpu_count() or 1, len(files))
+    size = sum(item.path.stat().st_size for item in files if item.path.exists())
+    if workers <= 1 or size < min_parallel_bytes:
+        workers = 1
+
+    if workers == 1:
+        for item in files:
+            item_start = time.perf_counter()
+            try:
+                graph = choose(item.path)
+                before = _size(graph)
+                if item.format in QUAD_FORMATS:
+                    _merge(graph, list(_parts(_read(str(item.path), item.format))))
+                else:
+                    graph.parse(str(item.path), format=item.format)
+                item.triples = _size(graph) - before
+            except Exception as e:
+                item.error = str(e)
+            item.parse_seconds = time.perf_counter() - item_start
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = {
+                pool.submit(_parse_file, str(item.path), item.format): item
+                for item in files
+            }
+            # Merge each file as soon as it is parsed / Hár fayl parse etilgende qosıw
+            for future in as_completed(pending):
+                item = pending[future]
+                try:
+                    encoded, item.parse_seconds = future.result()
+                    merge_start = time.perf_counter()
+                    graph = choose(item.path)
+                    before = _size(graph)
+                    _merge(graph, [(name, _decode(part)) for name, part in encoded])
+                    item.triples = _size(graph) - before
+                    item.merge_seconds = time.perf_counter() - merge_start
+                except Exception as e:
+                    item.error = str(e)
+
+    for item in files:
+        if item.ok:
+            logger.debug(f"Loaded {item.path} ({item.triples} triples) / "
+                         f"{item.path} júklendi ({item.triples} triple)")
+        else:
+            logger.error(f"Failed to load {item.path}: {item.error} / "
+                         f"{item.path} júklenbedi: {item.error}")
+
+    return LoadReport(files=files, workers=workers, total_seconds=time.perf_counter() - start)
@@ -0,0 +1,376 @@
+"""
+Read-optimized, dictionary-encoded triple store
+Oqıwǵa optimallastırılǵan, sózlik penen kodlanǵan triple saqlaǵısh
+
+rdflib's default ``Memory`` store keeps three levels of nested dicts per index
+and per triple, which costs several hundred bytes per triple. The knowledge
+base is loaded once and almost never written, so ``CompactStore`` trades write
+speed for size:
+
+* every term is interned once and replaced by an integer id;
+* triples are kept in three sorted orders (SPO, POS, OSP), each stored as a
+  CSR layout: an offsets array over the first id and two ``array('L')``
+  columns for the other two ids, searched with ``bisect``;
+* writes go to a small delta (added / removed id triples) that is merged into
+  the arrays on the next read once it grows past ``merge_ratio`` of the base;
+  added triples are also indexed by subject, predicate and object so a
+  pattern only scans the delta entries that share its bound terms.
+
+The store registers itself as the ``"Compact"`` rdflib plugin, so any graph
+can use it and ``Graph.query`` works unchanged::
+
+    graph = Graph(store="Compact")
+
+Bilimler bazası bir ret júklenedi ha'm derlik ózgertilmeydi, sonlıqtan
+``CompactStore`` hár termindi bir ret pútin san id-ǵa aylandıradı ha'm
+triple-lardı SPO/POS/OSP tártibindegi sortlanǵan massivlerde saqlaydı.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from threading import RLock
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from rdflib import plugin
+from rdflib.store import Store
+from rdflib.term import Node, URIRef
+
+
+IdTriple = Tuple[int, int, int]
+
+# Positions of (s, p, o) in each sort order / Hár tártipte (s, p, o) orınları
+_ORDERS = {
+    "spo": (0, 1, 2),
+    "pos": (1, 2, 0),
+    "osp": (2, 0, 1),
+}
+
+
+class _SortedTriples:
+    """
+    Id triples in one sort order, as offsets + two columns.
+    Bir tártiptegi id triple-lar: offsetler + eki baǵana.
+    """
+
+    __slots__ = ("order", "offsets", "second", "third")
+
+    def __init__(self, order: str, triples: List[IdTriple], term_count: int):
+        """
+        Args:
+            order: "spo", "pos" or "osp" / Tártip
+            triples: Id triples in (s, p, o) form / (s, p, o) túrindegi id triple-lar
+            term_count: Number of term ids / Termin id-lar sanı
+        """
+        self.order = order
+        first, second, third = _ORDERS[order]
+        rows = sorted((t[first], t[second], t[third]) for t in triples)
+
+        counts = array("Q", [0]) * (term_count + 1)
+        self.second = array("L")
+        self.third = array("L")
+        for a, b, c in rows:
+            counts[a + 1] += 1
+            self.second.append(b)
+            self.third.append(c)
+        for i in range(term_count):
+            counts[i + 1] += counts[i]
+        self.offsets = counts
+
+    def span(self, a: int, b: Optional[int] = None, c: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Row range matching a prefix of the sort key.
+        Sortlaw giltiniń prefiksine sáykes qatarlar aralıǵı.
+        """
+        if a + 1 >= len(self.offsets):
+            return 0, 0
+        lo, hi = self.offsets[a], self.offsets[a + 1]
+        if b is not None:
+            lo, hi = bisect_left(self.second, b, lo, hi), bisect_right(self.second, b, lo, hi)
+            if c is not None:
+                lo, hi = bisect_left(self.third, c, lo, hi), bisect_right(self.third, c, lo, hi)
+        return lo, hi
+
+    def rows(self, a: int, lo: int, hi: int) -> Iterator[IdTriple]:
+        """Rows lo..hi of first id ``a``, back in (s, p, o) form / (s, p, o) túrinde qatarlar"""
+        second, third = self.second, self.third
+        if self.order == "spo":
+            for i in range(lo, hi):
+                yield a, second[i], third[i]
+        elif self.order == "pos":
+            for i in range(lo, hi):
+                yield third[i], a, second[i]
+        else:
+            for i in range(lo, hi):
+                yield second[i], third[i], a
+
+    def all_rows(self) -> Iterator[IdTriple]:
+        """Every row in sort order / Barlıq qatarlar"""
+        offsets = self.offsets
+        for a in range(len(offsets) - 1):
+            if offsets[a] != offsets[a + 1]:
+                yield from self.rows(a, offsets[a], offsets[a + 1])
+
+    def __len__(self) -> int:
+        return len(self.second)
+
+
+class CompactStore(Store):
+    """
+    Triple store with interned terms and sorted integer-array indexes.
+    Interned terminler ha'm sortlanǵan pútin san massiv indeksleri bar triple saqlaǵısh.
+
+    Not context aware: it backs a plain ``Graph``, like ``SimpleMemory``.
+
+    Examples / Misallar:
+        >>> graph = Graph(store="Compact")
+        >>> graph.parse("data/knowledge/criminal_code.ttl")
+        >>> len(graph.query("SELECT ?s WHERE { ?s a kk:Statiya }"))
+        10
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, configuration: Optional[str] = None,
+                 identifier: Optional[Node] = None, merge_ratio: float = 0.125):
+        """
+        Args:
+            configuration: Unused, kept for the Store API / Store API ushın
+            identifier: Store identifier / Saqlaǵısh identifikatorı
+            merge_ratio: Delta size, relative to the base, that triggers a merge
+                         Birlestiriwdi baslaytuǵın delta ólshemi
+        """
+        super().__init__(configuration)
+        self.identifier = identifier
+        self.merge_ratio = merge_ratio
+
+        self._terms: List[Node] = []
+        self._ids: Dict[Node, int] = {}
+        self._base: Dict[str, _SortedTriples] = self._build([])
+        self._added: Set[IdTriple] = set()
+        self._added_by: Tuple[Dict[int, Set[IdTriple]], ...] = ({}, {}, {})
+        self._removed: Set[IdTriple] = set()
+        self._lock = RLock()
+
+        self._namespace: Dict[str, URIRef] = {}
+        self._prefix: Dict[URIRef, str] = {}
+
+    # ------------------------------------------------------------------
+    # Encoding / Kodlaw
+    # ------------------------------------------------------------------
+
+    def _intern(self, term: Node) -> int:
+        """Id of a term, assigning one if new / Termin id-ı, jańa bolsa beriledi"""
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = len(self._terms)
+            self._terms.append(term)
+            self._ids[term] = term_id
+        return term_id
+
+    def _build(self, triples: List[IdTriple]) -> Dict[str, _SortedTriples]:
+        term_count = len(self._terms)
+        return {order: _SortedTriples(order, triples, term_count) for order in _ORDERS}
+
+    def _in_base(self, triple: IdTriple) -> bool:
+        lo, hi = self._base["spo"].span(*triple)
+        return hi > lo
+
+    def _add_delta(self, triple: IdTriple) -> None:
+        """Record an added triple and index it by each term / Qosılǵan triple-dı jazıw"""
+        self._added.add(triple)
+        for index, term_id in zip(self._added_by, triple):
+            index.setdefault(term_id, set()).add(triple)
+
+    def _discard_delta(self, triple: IdTriple) -> None:
+        """Forget an added triple / Qosılǵan triple-dı umıtıw"""
+        self._added.discard(triple)
+        for index, term_id in zip(self._added_by, triple):
+            bucket = index.get(term_id)
+            if bucket is not None:
+                bucket.discard(triple)
+                if not bucket:
+                    del index[term_id]
+
+    def compact(self) -> None:
+        """
+        Merge pending writes into the sorted arrays.
+        Kútip turǵan jazıwlardı sortlanǵan massivlerge birlestiriw.
+        """
+        with self._lock:
+            if not self._added and not self._removed:
+                return
+            removed = self._removed
+            triples = [t for t in self._base["spo"].all_rows() if t not in removed]
+            triples.extend(self._added)
+            self._base = self._build(triples)
+            self._added = set()
+            self._added_by = ({}, {}, {})
+            self._removed = set()
+
+    def _maybe_compact(self) -> None:
+        pending = len(self._added) + len(self._removed)
+        if pending and pending > len(self._base["spo"]) * self.merge_ratio:
+            self.compact()
+
+    # ------------------------------------------------------------------
+    # Store API
+    # ------------------------------------------------------------------
+
+    def add(self, triple, context=None, quoted: bool = False) -> None:
+        """Add a triple / Triple qosıw"""
+        with self._lock:
+            ids = tuple(self._intern(term) for term in triple)
+            if ids in self._removed:
+                self._removed.discard(ids)
+            elif not self._in_base(ids):
+                self._add_delta(ids)
+        super().add(triple, context, quoted)
+
+    def addN(self, quads) -> None:
+        """
+        Add many triples in one pass under one lock; like single adds they
+        go to the delta and are merged by the next read.
+        Kóp triple-dı bir ótiwde qosıw; olar keyingi oqıwda birlestiriledi.
+        """
+        with self._lock:
+            intern = self._intern
+            batch = {(intern(s), intern(p), intern(o)) for s, p, o, _ in quads}
+            if not batch:
+                return
+
+            # Re-added triples are still in the base / Qayta qosılǵanlar bazada bar
+            restored = batch & self._removed
+            self._removed -= restored
+            batch -= restored
+
+            if len(self._base["spo"]):
+                batch = {t for t in batch if not self._in_base(t)}
+            for t in batch - self._added:
+                self._add_delta(t)
+
+    def remove(self, triple_pattern, context=None) -> None:
+        """Remove triples matching a pattern / Úlgige sáykes triple-lardı óshiriw"""
+        with self._lock:
+            for ids in list(self._match(triple_pattern)):
+                if ids in self._added:
+                    self._discard_delta(ids)
+                else:
+                    self._removed.add(ids)
+        super().remove(triple_pattern, context)
+
+    def _match(self, triple_pattern) -> Iterator[IdTriple]:
+        """Id triples matching a pattern, base then delta / Úlgige sáykes id triple-lar"""
+        pattern = []
+        for term in triple_pattern:
+            if term is None:
+                pattern.append(None)
+            else:
+                term_id = self._ids.get(term)
+                if term_id is None:
+                    return
+                pattern.append(term_id)
+        s, p, o = pattern
+
+        base = self._base
+        if s is not None:
+            if p is None and o is not None:
+                index, key = base["osp"], (o, s)
+            else:
+                index, key = base["spo"], (s, p, o)
+        elif p is not None:
+            index, key = base["pos"], (p, o)
+        elif o is not None:
+            index, key = base["osp"], (o,)
+        else:
+            index, key = base["spo"], None
+
+        if key is None:
+            rows = index.all_rows()
+        else:
+            lo, hi = index.span(*key)
+            rows = index.rows(key[0], lo, hi)
+
+        removed = self._removed
+        if removed:
+            rows = (t for t in rows if t not in removed)
+        yield from rows
+
+        # Scan the smallest delta bucket of a bound term / Eń kishi delta bólimin qaraw
+        added = self._added
+        for index, term_id in zip(self._added_by, pattern):
+            if term_id is not None:
+                bucket = index.get(term_id)
+                if bucket is None:
+                    return
+                if len(bucket) < len(added):
+                    added = bucket
+
+        for t in list(added):
+            if (s is None or t[0] == s) and (p is None or t[1] == p) and (o is None or t[2] == o):
+                yield t
+
+    def triples(self, triple_pattern, context=None):
+        """Triples matching a pattern / Úlgige sáykes triple-lar"""
+        with self._lock:
+            self._maybe_compact()
+        terms = self._terms
+        for s, p, o in self._match(triple_pattern):
+            yield (terms[s], terms[p], terms[o]), iter(())
+
+    def __len__(self, context=None) -> int:
+        return len(self._base["spo"]) - len(self._removed) + len(self._added)
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a prefix, with the same rules as ``Memory.bind`` / Prefiks baylaw"""
+        bound_namespace = self._namespace.get(prefix)
+        bound_prefix = self._prefix.get(namespace)
+        if bound_prefix is None and bound_namespace is not None:
+            bound_prefix = self._prefix.get(bound_namespace)
+        if override:
+            if bound_prefix is not None:
+                del self._namespace[bound_prefix]
+            if bound_namespace is not None:
+                del self._prefix[bound_namespace]
+            self._prefix[namespace] = prefix
+            self._namespace[prefix] = namespace
+        else:
+            namespace = bound_namespace if bound_namespace is not None else namespace
+            prefix = bound_prefix if bound_prefix is not None else prefix
+            self._prefix[namespace] = prefix
+            self._namespace[prefix] = namespace
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        return self._prefix.get(namespace)
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        yield from list(self._namespace.items())
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Sizes of the term dictionary, arrays and delta.
+        Termin sózligi, massivler ha'm delta ólshemleri.
+        """
+        base = self._base
+        array_bytes = sum(
+            index.offsets.itemsize * len(index.offsets)
+            + index.second.itemsize * len(index.second)
+            + index.third.itemsize * len(index.third)
+            for index in base.values()
+        )
+        return {
+            "terms": len(self._terms),
+            "triples": len(self),
+            "base_triples": len(base["spo"]),
+            "pending_added": len(self._added),
+            "pending_removed": len(self._removed),
+            "array_bytes": array_bytes,
+        }
+
+
+plugin.register("Compact", Store, "src.core.compact_store", "CompactStore")
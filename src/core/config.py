@@ -20,6 +20,20 @@ class OntologyConfig(BaseModel):
     namespaces: Dict[str, str]
     classes: list[str]
     properties: Dict[str, list[str]]
+    store: str = "default"
+    store_path: Optional[str] = None
+    store_read_only: bool = False
+    store_options: Dict[str, Any] = Field(default_factory=dict)
+    load_workers: int = 0
+    import_batch_size: int = 50_000
+
+
+class AdmissionConfig(BaseModel):
+    """Cost-based admission control for in-process SPARQL queries"""
+    enabled: bool = True
+    max_cost: float = 5_000_000
+    max_unbounded_rows: int = 10_000
+    auto_limit: int = 1000
 
 
 class SPARQLConfig(BaseModel):
@@ -28,8 +42,20 @@ class SPARQLConfig(BaseModel):
     update_endpoint: str
     graph_store: str
     default_graph: str
+    graphs: Dict[str, str] = Field(default_factory=dict)
     timeout: int = 30
+    max_execution_time: int = 60
     retry_count: int = 3
+    slow_query_threshold: float = 1.0
+    slow_query_log_size: int = 100
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+
+
+class AdminConfig(BaseModel):
+    """Admin routes (query stats, traces, caches); off unless enabled with a key"""
+    enabled: bool = False
+    api_key_header: str = "X-API-Key"
+    api_key_env: str = "HUQUQAI_ADMIN_API_KEY"
 
 
 class APIConfig(BaseModel):
@@ -38,6 +64,11 @@ class APIConfig(BaseModel):
     port: int = 8000
     reload: bool = True
     workers: int = 1
+    cors: Dict[str, Any] = Field(default_factory=dict)
+    http_cache: Dict[str, Any] = Field(default_factory=dict)
+    compression: Dict[str, Any] = Field(default_factory=dict)
+    fast_json: bool = True
+    admin: AdminConfig = Field(default_factory=AdminConfig)
 
 
 class Config(BaseModel):
@@ -52,6 +83,7 @@ class Config(BaseModel):
     logging: Dict[str, Any]
     paths: Dict[str, str]
     search: Dict[str, Any]
+    monitoring: Dict[str, Any] = Field(default_factory=dict)
 
 
 class ConfigLoader:
@@ -0,0 +1,883 @@
+"""
+Secondary indexes over the knowledge graph
+Bilimler grafı ústindegi qosımsha indeksler
+
+SPARQL has no way to jump to an article by its number: every lookup scans all
+``Statiya`` subjects and filters them. ``ArticleIndex`` keeps a
+(code, article number) → subject map that is built once per graph and reused
+by the SPARQL engine and the Telegram bot, which then only evaluate their
+patterns for the handful of subjects it returns. ``RangeIndex`` does the same
+for punishment ranges: (min, max) years and fine amounts sit in sorted arrays,
+so a range query is a binary search followed by a walk over the hits, which
+come out already sorted. ``FacetIndex`` keeps one bitset of subject ids per
+facet value (severity, crime type, code, punishment type) and per trigram of
+the article text (``src.core.bitset``); a search combining a keyword with
+facet filters is a handful of bitset intersections, and every facet count is
+an intersection cardinality instead of a ``GROUP BY`` per facet.
+
+An index notices writes in two ways: callers that add an article refresh just
+that subject (``update_subject``), and any other change to the graph size or
+to the knowledge-base version (``src.utils.cache``) triggers a rebuild on the
+next lookup.
+
+SPARQL statiyaǵa nomeri boyınsha tuwrı óte almaydı: hár izlew barlıq
+``Statiya``-lardı qarap shıǵadı. ``ArticleIndex`` (kodeks, statiya nomeri) →
+subyekt kestesin bir ret dúzedi ha'm onı SPARQL mexanizmi menen Telegram bot
+qollanadı. ``RangeIndex`` jaza diapazonların (min, max jıl ha'm jarıma)
+sortlanǵan massivlerde saqlaydı, sonlıqtan diapazon sorawı ekilik izlew boladı.
+``FacetIndex`` hár facet mánisi ha'm tekst trigramı ushın subyektler bitsetin
+saqlaydı.
+"""
+
+import weakref
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from rdflib import Graph, Literal, Namespace, RDF, URIRef
+from rdflib.term import Node
+
+from src.core.bitset import BitSet, intersect_all, union_all
+from src.utils.cache import knowledge_version
+from src.utils.normalization import search_key
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+KK = Namespace("http://karakalpak.law/ontology#")
+
+
+@dataclass(frozen=True)
+class ArticleSchema:
+    """
+    Where a vocabulary stores article numbers and codes.
+    Sózlik statiya nomerlerin ha'm kodekslerin qayda saqlaytuǵını.
+    """
+    name: str
+    article_class: URIRef
+    number_predicates: Tuple[URIRef, ...]
+    code_predicates: Tuple[URIRef, ...] = ()
+
+
+# Ontology vocabulary used by OntologyManager and SPARQLEngine
+# OntologyManager ha'm SPARQLEngine qollanatuǵın ontologiya sózligi
+HUQUQ_SCHEMA = ArticleSchema(
+    name="huquq",
+    article_class=HUQUQ.Statiya,
+    number_predicates=(HUQUQ.articleNumber,),
+    code_predicates=(HUQUQ.codeType,),
+)
+
+# Knowledge-base vocabulary used by the Telegram bot
+# Telegram bot qollanatuǵın bilimler bazası sózligi
+KK_SCHEMA = ArticleSchema(
+    name="kk",
+    article_class=KK.Statiya,
+    number_predicates=(KK["nómiri"], KK["statiya_nómiri"]),
+    code_predicates=(KK["nızam_id"],),
+)
+
+
+@dataclass(frozen=True)
+class RangeSchema:
+    """
+    Where a vocabulary stores punishment bounds.
+    Sózlik jaza shegaraların qayda saqlaytuǵını.
+    """
+    name: str
+    subject_class: URIRef
+    min_predicate: URIRef
+    max_predicate: URIRef
+    fine_predicate: Optional[URIRef] = None
+
+
+# Punishments (huquq:Jaza) queried by SPARQLEngine.get_jaza_range
+# SPARQLEngine.get_jaza_range sorawlaytuǵın jazalar
+HUQUQ_PUNISHMENT_RANGE = RangeSchema(
+    name="huquq",
+    subject_class=HUQUQ.Jaza,
+    min_predicate=HUQUQ.durationMin,
+    max_predicate=HUQUQ.durationMax,
+    fine_predicate=HUQUQ.fineAmount,
+)
+
+# Article punishment ranges (kk:jaza_min / kk:jaza_max) used by the bot
+# Bot qollanatuǵın statiya jaza diapazonları
+KK_PUNISHMENT_RANGE = RangeSchema(
+    name="kk",
+    subject_class=KK.Statiya,
+    min_predicate=KK.jaza_min,
+    max_predicate=KK.jaza_max,
+)
+
+
+@dataclass(frozen=True)
+class FacetSchema:
+    """
+    Facets of a vocabulary: facet name → predicate holding its value.
+    Sózlik facetleri: facet atı → mánisti saqlaytuǵın predikat.
+
+    ``text_predicates`` are searched by keyword after ``text_key`` is applied
+    to both the text and the keyword, matching the front end's SPARQL filter.
+    """
+    name: str
+    subject_class: URIRef
+    facets: Tuple[Tuple[str, URIRef], ...]
+    text_predicates: Tuple[URIRef, ...] = ()
+    text_key: Callable[[str], str] = str.lower
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Facet names in schema order / Facet atları"""
+        return tuple(name for name, _ in self.facets)
+
+
+# Article facets of the knowledge base browsed by the bot and the CLI
+# Bot ha'm CLI kóretuǵın bilimler bazası statiya facetleri
+KK_FACETS = FacetSchema(
+    name="kk",
+    subject_class=KK.Statiya,
+    facets=(
+        ("severity", KK["awırlıq_dárejesi"]),
+        ("crime_type", KK.jinayat_turi),
+        ("code", KK["nızam_id"]),
+        ("punishment_type", KK.jaza_turi),
+    ),
+    # The bot compares hf:searchKey forms / Bot hf:searchKey formaların salıstıradı
+    text_predicates=(KK["sárelaw"], KK["tekstı"]),
+    text_key=search_key,
+)
+
+# Article facets of the huquq: ontology / huquq: ontologiyası statiya facetleri
+HUQUQ_FACETS = FacetSchema(
+    name="huquq",
+    subject_class=HUQUQ.Statiya,
+    facets=(
+        ("crime_type", HUQUQ.crimeType),
+        ("code", HUQUQ.codeType),
+        ("punishment_type", HUQUQ.punishmentType),
+    ),
+    # SPARQLEngine.search_statiya compares LCASE forms / LCASE formaların salıstıradı
+    text_predicates=(HUQUQ.title, HUQUQ.content),
+)
+
+
+def _key_text(value: Node) -> str:
+    """
+    Lexical form used as index key, so 169 and "169" meet.
+    Indeks gilti ushın leksikalıq forma, 169 ha'm "169" birdey boladı.
+    """
+    return str(value).strip()
+
+
+class GraphIndex:
+    """
+    Base class for indexes kept in step with one graph.
+    Bir graf penen birge jańalanatuǵın indeksler ushın tiykarǵı klass.
+
+    Subclasses index the instances of ``subject_class`` one subject at a time,
+    which gives full rebuilds and single-subject updates for free.
+    """
+
+    def __init__(self, graph: Graph, subject_class: URIRef):
+        """
+        Args:
+            graph: Graph to index / Indekslenetuǵın graf
+            subject_class: Class whose instances are indexed / Indekslenetuǵın klass
+        """
+        self._graph = weakref.ref(graph)
+        self.subject_class = subject_class
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._lock = Lock()
+        self.rebuild()
+
+    @property
+    def graph(self) -> Graph:
+        """Indexed graph, held weakly so the shared index does not keep it alive"""
+        return self._graph()
+
+    def _clear(self) -> None:
+        raise NotImplementedError
+
+    def _index_subject(self, subject: URIRef) -> None:
+        raise NotImplementedError
+
+    def _unindex_subject(self, subject: URIRef) -> None:
+        raise NotImplementedError
+
+    def _current_stamp(self) -> Tuple[int, int]:
+        return len(self.graph), knowledge_version()
+
+    def rebuild(self) -> None:
+        """
+        Index every instance in the graph.
+        Grafta barlıq misallardı indekslew.
+        """
+        with self._lock:
+            self._clear()
+            for subject in sorted(set(self.graph.subjects(RDF.type, self.subject_class))):
+                if isinstance(subject, URIRef):
+                    self._index_subject(subject)
+            self._stamp = self._current_stamp()
+
+    def update_subject(self, subject: URIRef) -> None:
+        """
+        Re-read one subject after it was written, without a full rebuild.
+        Jazılǵannan keyin bir subyektti tolıq qayta dúzbey oqıw.
+
+        The index is marked current afterwards, so use ``writing`` unless the
+        index is known to have been current before the write.
+
+        Args:
+            subject: Subject URI / Subyekt URI
+        """
+        with self._lock:
+            self._unindex_subject(subject)
+            if (subject, RDF.type, self.subject_class) in self.graph:
+                self._index_subject(subject)
+            self._stamp = self._current_stamp()
+
+    @contextmanager
+    def writing(self, subject: URIRef) -> Iterator[None]:
+        """
+        Keep the index current across a write that only touches ``subject``.
+        Tek ``subject``-qa tiyisli jazıwda indeksti jańa halda saqlaw.
+
+        Examples / Misallar:
+            >>> with index.writing(article_uri):
+            ...     graph.add((article_uri, HUQUQ.articleNumber, Literal("123")))
+        """
+        self.ensure_current()
+        yield
+        self.update_subject(subject)
+
+    def ensure_current(self) -> None:
+        """
+        Rebuild if the graph changed behind the index.
+        Graf indekstiń artınan ózgergen bolsa qayta dúziw.
+        """
+        if self._stamp != self._current_stamp():
+            self.rebuild()
+
+
+class ArticleIndex(GraphIndex):
+    """
+    (code, article number) → subject index for one graph.
+    Bir graf ushın (kodeks, statiya nomeri) → subyekt indeksi.
+
+    Examples / Misallar:
+        >>> index = get_article_index(graph)
+        >>> index.lookup("169")
+        [rdflib.term.URIRef('http://huquqai.org/ontology#Statiya_169')]
+        >>> index.lookup("169", code="criminal")
+    """
+
+    def __init__(self, graph: Graph, schema: ArticleSchema = HUQUQ_SCHEMA):
+        """
+        Args:
+            graph: Graph to index / Indekslenetuǵın graf
+            schema: Article vocabulary / Statiya sózligi
+        """
+        self.schema = schema
+        self._by_number: Dict[str, List[Tuple[Optional[str], URIRef]]] = {}
+        self._subject_keys: Dict[URIRef, List[str]] = {}
+        super().__init__(graph, schema.article_class)
+
+    def _clear(self) -> None:
+        self._by_number = {}
+        self._subject_keys = {}
+
+    def _codes(self, subject: URIRef) -> List[Optional[str]]:
+        """Codes an article belongs to / Statiya tiyisli kodeksler"""
+        codes = [
+            _key_text(value)
+            for predicate in self.schema.code_predicates
+            for value in self.graph.objects(subject, predicate)
+        ]
+        return codes or [None]
+
+    def _index_subject(self, subject: URIRef) -> None:
+        """Add one article's keys / Bir statiyanıń giltlerin qosıw"""
+        numbers = {
+            _key_text(value)
+            for predicate in self.schema.number_predicates
+            for value in self.graph.objects(subject, predicate)
+        }
+        if not numbers:
+            return
+        codes = self._codes(subject)
+        for number in numbers:
+            entries = self._by_number.setdefault(number, [])
+            for code in codes:
+                entries.append((code, subject))
+        self._subject_keys[subject] = sorted(numbers)
+
+    def _unindex_subject(self, subject: URIRef) -> None:
+        """Drop one article's keys / Bir statiyanıń giltlerin óshiriw"""
+        for number in self._subject_keys.pop(subject, ()):
+            entries = [e for e in self._by_number.get(number, []) if e[1] != subject]
+            if entries:
+                self._by_number[number] = entries
+            else:
+                self._by_number.pop(number, None)
+
+    def lookup(self, number: str, code: Optional[str] = None) -> List[URIRef]:
+        """
+        Articles with a number, optionally within one code.
+        Nomeri boyınsha statiyalar, qálese bir kodeks ishinde.
+
+        Args:
+            number: Article number / Statiya nomeri
+            code: Code value as stored (``criminal``, ``JinayatKodeksi_2023``)
+                  Saqlanǵan kodeks mánisi
+
+        Returns:
+            Matching subjects in insertion order / Sáykes subyektler
+        """
+        self.ensure_current()
+        entries = self._by_number.get(str(number).strip(), [])
+        subjects = [s for c, s in entries if code is None or c == code]
+        return list(dict.fromkeys(subjects))
+
+    def numbers(self) -> Iterable[str]:
+        """Indexed article numbers / Indekslengen statiya nomerleri"""
+        self.ensure_current()
+        return self._by_number.keys()
+
+    def __len__(self) -> int:
+        return len(self._subject_keys)
+
+
+def _number(value: Node) -> Optional[float]:
+    """
+    Numeric value of a literal, or None when it is not a number.
+    Literaldıń san mánisi, san bolmasa None.
+    """
+    if not isinstance(value, Literal):
+        return None
+    python_value = value.toPython()
+    if isinstance(python_value, bool):
+        return None
+    try:
+        return float(python_value)
+    except (TypeError, ValueError):
+        return None
+
+
+class SortedKeys:
+    """
+    Sorted (key, subject) array with logarithmic range scans.
+    Logarifmlik diapazon qaraw menen sortlanǵan (gilt, subyekt) massivi.
+    """
+
+    def __init__(self):
+        self._keys: List[float] = []
+        self._subjects: List[URIRef] = []
+
+    def add(self, key: float, subject: URIRef) -> None:
+        """Insert keeping order / Tártipti saqlap qosıw"""
+        position = bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._subjects.insert(position, subject)
+
+    def remove(self, key: float, subject: URIRef) -> None:
+        """Remove one entry / Bir jazıwdı óshiriw"""
+        position = bisect_left(self._keys, key)
+        while position < len(self._keys) and self._keys[position] == key:
+            if self._subjects[position] == subject:
+                del self._keys[position]
+                del self._subjects[position]
+                return
+            position += 1
+
+    def between(self, low: Optional[float] = None, high: Optional[float] = None,
+                descending: bool = False) -> Iterator[Tuple[float, URIRef]]:
+        """
+        Yield entries with low <= key <= high in key order.
+        low <= gilt <= high bolǵan jazıwlardı gilt tártibinde qaytarıw.
+        """
+        start = 0 if low is None else bisect_left(self._keys, low)
+        stop = len(self._keys) if high is None else bisect_right(self._keys, high)
+        positions = range(stop - 1, start - 1, -1) if descending else range(start, stop)
+        for position in positions:
+            yield self._keys[position], self._subjects[position]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class RangeIndex(GraphIndex):
+    """
+    Sorted index over punishment ranges (min/max years) and fine amounts.
+    Jaza diapazonları (min/max jıl) ha'm jarıma muǵdarları boyınsha sortlanǵan indeks.
+
+    Bounds are kept in two sorted arrays, so ``within`` finds both ends of
+    a key range by binary search and walks only the keys between them.
+
+    Examples / Misallar:
+        >>> index = get_range_index(graph, KK_PUNISHMENT_RANGE)
+        >>> list(index.within(1, 5))
+        [rdflib.term.URIRef('http://karakalpak.law/ontology#Statiya_175')]
+    """
+
+    def __init__(self, graph: Graph, schema: RangeSchema):
+        """
+        Args:
+            graph: Graph to index / Indekslenetuǵın graf
+            schema: Range vocabulary / Diapazon sózligi
+        """
+        self.schema = schema
+        self._bounds: Dict[URIRef, Tuple[Optional[float], Optional[float], Optional[float]]] = {}
+        self._by_min = SortedKeys()
+        self._by_max = SortedKeys()
+        self._by_fine = SortedKeys()
+        super().__init__(graph, schema.subject_class)
+
+    def _clear(self) -> None:
+        self._bounds = {}
+        self._by_min = SortedKeys()
+        self._by_max = SortedKeys()
+        self._by_fine = SortedKeys()
+
+    def _value(self, subject: URIRef, predicate: Optional[URIRef]) -> Optional[float]:
+        """First numeric value of a predicate / Predikattıń birinshi san mánisi"""
+        if predicate is None:
+            return None
+        for value in self.graph.objects(subject, predicate):
+            number = _number(value)
+            if number is not None:
+                return number
+        return None
+
+    def _index_subject(self, subject: URIRef) -> None:
+        """Add one subject's bounds / Bir subyekttiń shegaraların qosıw"""
+        low = self._value(subject, self.schema.min_predicate)
+        high = self._value(subject, self.schema.max_predicate)
+        fine = self._value(subject, self.schema.fine_predicate)
+        if low is None and high is None and fine is None:
+            return
+        self._bounds[subject] = (low, high, fine)
+        for keys, key in ((self._by_min, low), (self._by_max, high), (self._by_fine, fine)):
+            if key is not None:
+                keys.add(key, subject)
+
+    def _unindex_subject(self, subject: URIRef) -> None:
+        """Drop one subject's bounds / Bir subyekttiń shegaraların óshiriw"""
+        bounds = self._bounds.pop(subject, None)
+        if bounds is None:
+            return
+        for keys, key in zip((self._by_min, self._by_max, self._by_fine), bounds):
+            if key is not None:
+                keys.remove(key, subject)
+
+    def within(self, low: Optional[float] = None, high: Optional[float] = None,
+               order: str = "min", descending: bool = False) -> Iterator[URIRef]:
+        """
+        Subjects whose range lies inside [low, high], in sorted order.
+        Diapazonı [low, high] ishinde jatqan subyektler, sortlanǵan tártipte.
+
+        Matches the SPARQL filter ``?min >= low && ?max <= high``: a bound
+        that is given requires the matching value to be present, and the
+        other value may be missing. The walk runs over the array of a given
+        bound; results are streamed when that array is also the sort order,
+        else collected and sorted.
+
+        Args:
+            low: Smallest allowed minimum / Eń kishi ruxsat etilgen minimum
+            high: Largest allowed maximum / Eń úlken ruxsat etilgen maksimum
+            order: Sort by "min" or "max" / "min" yamasa "max" boyınsha sortlaw
+            descending: Largest first / Eń úlkeni birinshi
+
+        Yields:
+            Subject URIs / Subyekt URI-ları
+        """
+        self.ensure_current()
+
+        def accepted(subject: URIRef) -> bool:
+            min_value, max_value, _ = self._bounds[subject]
+            if low is not None and (min_value is None or min_value < low):
+                return False
+            if high is not None and (max_value is None or max_value > high):
+                return False
+            return True
+
+        by_order = self._by_max if order == "max" else self._by_min
+        if low is not None and high is not None:
+            # Both values are required and min <= max, so either array holds
+            # every match inside [low, high]
+            # Eki máni de kerek, sonlıqtan hár eki massivte barlıq sáykeslikler bar
+            keys = by_order
+        elif low is not None:
+            # Walk the array of the bound being checked; a subject missing
+            # the other value still matches
+            # Tekserilip atırǵan shegaranıń massivi boyınsha júriw
+            keys = self._by_min
+        elif high is not None:
+            keys = self._by_max
+        else:
+            keys = None
+
+        if keys is by_order:
+            for _, subject in keys.between(low, high, descending):
+                if accepted(subject):
+                    yield subject
+            return
+
+        # Matches walked in the other order are sorted like SPARQL ORDER BY,
+        # a missing value first
+        # Basqa tártipte tabılǵanlar SPARQL ORDER BY sıyaqlı sortlanadı
+        if keys is None:
+            matches = list(self._bounds)
+        else:
+            matches = [subject for _, subject in keys.between(low, high) if accepted(subject)]
+        position = 1 if order == "max" else 0
+
+        def sort_key(subject: URIRef) -> float:
+            value = self._bounds[subject][position]
+            return float("-inf") if value is None else value
+
+        yield from sorted(matches, key=sort_key, reverse=descending)
+
+    def fines_between(self, low: Optional[float] = None,
+                      high: Optional[float] = None) -> Iterator[URIRef]:
+        """
+        Subjects with a fine amount in [low, high], smallest first.
+        Jarıma muǵdarı [low, high] ishinde bolǵan subyektler.
+        """
+        self.ensure_current()
+        for _, subject in self._by_fine.between(low, high):
+            yield subject
+
+    def bounds(self, subject: URIRef) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        """(min, max, fine) of one subject / Bir subyekttiń (min, max, jarıma) mánisleri"""
+        self.ensure_current()
+        return self._bounds.get(subject, (None, None, None))
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+
+@dataclass
+class FacetResult:
+    """
+    Subjects matching a faceted search and the facet counts around them.
+    Facet izlewine sáykes subyektler ha'm facet sanları.
+
+    Counts for one facet ignore that facet's own selection, so the values a
+    user could switch to keep their counts.
+    """
+    subjects: List[URIRef]
+    facets: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return len(self.subjects)
+
+
+FacetFilters = Dict[str, Union[str, Iterable[str]]]
+
+
+def _text_grams(text: str) -> set:
+    """Character trigrams of a keyed text / Tekst trigramları"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class FacetIndex(GraphIndex):
+    """
+    Bitset postings of facet values and text trigrams for one graph.
+    Bir graf ushın facet mánisleri ha'm tekst trigramlarınıń bitset postingleri.
+
+    Each subject gets a small integer id; every facet value and every trigram
+    of the keyed article text keeps the ``BitSet`` of ids carrying it, so
+    filters are intersections and counts are intersection cardinalities. A
+    keyword is looked up through its trigrams and the few candidates left are
+    checked against the stored text, so matches equal the SPARQL ``CONTAINS``.
+
+    Examples / Misallar:
+        >>> index = get_facet_index(graph, KK_FACETS)
+        >>> result = index.search({"severity": "Awır"}, keyword="qarsı")
+        >>> result.facets["crime_type"]
+        {'Adamǵa qarsi': 2, 'Múlikke qarsi': 1}
+    """
+
+    def __init__(self, graph: Graph, schema: FacetSchema = KK_FACETS):
+        """
+        Args:
+            graph: Graph to index / Indekslenetuǵın graf
+            schema: Facet vocabulary / Facet sózligi
+        """
+        self.schema = schema
+        self._clear()
+        super().__init__(graph, schema.subject_class)
+
+    def _clear(self) -> None:
+        self._ids: Dict[URIRef, int] = {}
+        self._subjects: List[Optional[URIRef]] = []
+        self._all = BitSet()
+        self._postings: Dict[str, Dict[str, BitSet]] = {name: {} for name in self.schema.names}
+        self._subject_values: Dict[URIRef, List[Tuple[str, str]]] = {}
+        self._grams: Dict[str, BitSet] = {}
+        self._texts: Dict[int, List[str]] = {}
+
+    def _index_subject(self, subject: URIRef) -> None:
+        """Add the subject's ids to its postings / Subyekt id-ın postinglerge qosıw"""
+        subject_id = self._ids.get(subject)
+        if subject_id is None:
+            subject_id = len(self._subjects)
+            self._ids[subject] = subject_id
+            self._subjects.append(subject)
+
+        values = []
+        for name, predicate in self.schema.facets:
+            for value in set(_key_text(v) for v in self.graph.objects(subject, predicate)):
+                self._postings[name].setdefault(value, BitSet()).add(subject_id)
+                values.append((name, value))
+        self._subject_values[subject] = values
+
+        texts = [
+            self.schema.text_key(str(value))
+            for predicate in self.schema.text_predicates
+            for value in self.graph.objects(subject, predicate)
+            if isinstance(value, Literal)
+        ]
+        if texts:
+            self._texts[subject_id] = texts
+            for gram in set().union(*(_text_grams(text) for text in texts)):
+                self._grams.setdefault(gram, BitSet()).add(subject_id)
+
+        self._all.add(subject_id)
+
+    def _unindex_subject(self, subject: URIRef) -> None:
+        """Drop the subject from its postings, keeping its id / Subyektti postinglerden óshiriw"""
+        subject_id = self._ids.get(subject)
+        if subject_id is None:
+            return
+        for name, value in self._subject_values.pop(subject, ()):
+            postings = self._postings[name]
+            postings[value].discard(subject_id)
+            if not postings[value]:
+                del postings[value]
+        for text in self._texts.pop(subject_id, ()):
+            for gram in _text_grams(text):
+                bits = self._grams.get(gram)
+                if bits is not None:
+                    bits.discard(subject_id)
+                    if not bits:
+                        del self._grams[gram]
+        self._all.discard(subject_id)
+
+    def _selection(self, name: str, selected: Union[str, Iterable[str]]) -> BitSet:
+        """Union of the selected values of one facet / Bir facet mánisleriniń birlesiwi"""
+        if name not in self._postings:
+            raise ValueError(f"Unknown facet: {name} / Belgisiz facet: {name}")
+        if isinstance(selected, str):
+            selected = [selected]
+        postings = self._postings[name]
+        return union_all(
+            postings[value] for value in (str(v).strip() for v in selected) if value in postings
+        )
+
+    def ids(self, subjects: Iterable[URIRef]) -> BitSet:
+        """
+        Id set of known subjects, to combine with other indexes.
+        Basqa indeksler menen biriktiriw ushın belgili subyektlerdiń id toplamı.
+        """
+        self.ensure_current()
+        return BitSet(self._ids[s] for s in subjects if s in self._ids)
+
+    def keyword_ids(self, keyword: str) -> BitSet:
+        """
+        Ids whose text contains the keyword, after ``text_key``.
+        ``text_key``-tan keyin teksti gilt sózdi qamtıytuǵın id-lar.
+
+        Args:
+            keyword: Search keyword / Izlew gilt sózi
+
+        Returns:
+            Matching ids / Sáykes id-lar
+        """
+        self.ensure_current()
+        key = self.schema.text_key(keyword)
+        grams = _text_grams(key)
+        if grams:
+            candidates = intersect_all(self._grams.get(gram, BitSet()) for gram in grams)
+        else:
+            candidates = self._all
+        return BitSet(
+            subject_id for subject_id in candidates
+            if any(key in text for text in self._texts.get(subject_id, ()))
+        )
+
+    def values(self, subject: URIRef) -> Dict[str, List[str]]:
+        """
+        Facet values of one subject / Bir subyekttiń facet mánisleri
+        """
+        self.ensure_current()
+        values: Dict[str, List[str]] = {}
+        for name, value in self._subject_values.get(subject, ()):
+            values.setdefault(name, []).append(value)
+        return values
+
+    def subjects(self, filters: Optional[FacetFilters] = None,
+                 keyword: Optional[str] = None,
+                 within: Optional[Iterable[URIRef]] = None) -> List[URIRef]:
+        """
+        Subjects matching the criteria, without counting facets.
+        Facetlerdi sanamay, shártlerge sáykes subyektler.
+        """
+        return self.search(filters, keyword=keyword, within=within, counts=False).subjects
+
+    def search(self, filters: Optional[FacetFilters] = None,
+               within: Optional[Iterable[URIRef]] = None,
+               counts: bool = True,
+               keyword: Optional[str] = None) -> FacetResult:
+        """
+        Faceted search: values within a facet are ORed, criteria are ANDed.
+        Facet izlewi: bir facet ishindegi mánisler OR, shártler AND.
+
+        Args:
+            filters: Facet name → value or values / Facet atı → mánis(ler)
+            within: Restrict to these subjects (e.g. a punishment range)
+                    Tek usı subyektler (mısalı, jaza diapazonı)
+            counts: Compute facet counts / Facet sanların esaplaw
+            keyword: Text the article must contain / Statiya qamtıwı kerek tekst
+
+        Returns:
+            FacetResult with matching subjects and counts
+            Sáykes subyektler ha'm sanlar menen FacetResult
+
+        Raises:
+            ValueError: If a filter names an unknown facet / Belgisiz facet bolsa
+        """
+        self.ensure_current()
+        selections = {
+            name: self._selection(name, selected)
+            for name, selected in (filters or {}).items()
+        }
+        base = self._all
+        if within is not None:
+            base = base & self.ids(within)
+        if keyword is not None:
+            base = base & self.keyword_ids(keyword)
+
+        matched = intersect_all([base, *selections.values()])
+
+        facets: Dict[str, Dict[str, int]] = {}
+        if counts:
+            for name in self.schema.names:
+                scope = intersect_all(
+                    [base, *(bits for other, bits in selections.items() if other != name)]
+                )
+                facet_counts = {
+                    value: bits.intersection_cardinality(scope)
+                    for value, bits in self._postings[name].items()
+                }
+                facets[name] = {
+                    value: count
+                    for value, count in sorted(facet_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+                    if count
+                }
+
+        return FacetResult(subjects=[self._subjects[i] for i in matched], facets=facets)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+
+# Indexes by graph id, holding the graph weakly / Graf id boyınsha indeksler
+IndexSchema = Union[ArticleSchema, RangeSchema, FacetSchema]
+_indexes: Dict[Tuple[int, IndexSchema], Tuple["weakref.ref[Graph]", GraphIndex]] = {}
+_indexes_lock = Lock()
+
+
+def _find_index(graph: Graph, schema: IndexSchema) -> Optional[GraphIndex]:
+    """Registered index for (graph, schema) / (graf, sxema) ushın indeks"""
+    entry = _indexes.get((id(graph), schema))
+    if entry is not None and entry[0]() is graph:
+        return entry[1]
+    return None
+
+
+def _shared_index(graph: Graph, schema: IndexSchema,
+                  factory: Callable[[Graph, IndexSchema], GraphIndex]) -> GraphIndex:
+    """Build and register an index once per (graph, schema) / Indeksti bir ret dúziw"""
+    index = _find_index(graph, schema)
+    if index is None:
+        with _indexes_lock:
+            index = _find_index(graph, schema)
+            if index is None:
+                index = factory(graph, schema)
+                key = (id(graph), schema)
+                _indexes[key] = (
+                    weakref.ref(graph, lambda _: _indexes.pop(key, None)),
+                    index,
+                )
+    return index
+
+
+def find_article_index(graph: Graph,
+                       schema: ArticleSchema = HUQUQ_SCHEMA) -> Optional[ArticleIndex]:
+    """
+    Index already built for a graph, or None.
+    Graf ushın aldın dúzilgen indeks yamasa None.
+    """
+    return _find_index(graph, schema)
+
+
+def get_article_index(graph: Graph, schema: ArticleSchema = HUQUQ_SCHEMA) -> ArticleIndex:
+    """
+    Shared article index for a graph, built on first use.
+    Graf ushın ortaq statiya indeksi, birinshi qollanıwda dúziledi.
+
+    Args:
+        graph: Knowledge graph / Bilimler grafı
+        schema: Article vocabulary / Statiya sózligi
+
+    Returns:
+        Current ArticleIndex / Jańa ArticleIndex
+    """
+    return _shared_index(graph, schema, ArticleIndex)
+
+
+def get_range_index(graph: Graph,
+                    schema: RangeSchema = HUQUQ_PUNISHMENT_RANGE) -> RangeIndex:
+    """
+    Shared punishment range index for a graph, built on first use.
+    Graf ushın ortaq jaza diapazonı indeksi, birinshi qollanıwda dúziledi.
+
+    Args:
+        graph: Knowledge graph / Bilimler grafı
+        schema: Range vocabulary / Diapazon sózligi
+
+    Returns:
+        Current RangeIndex / Jańa RangeIndex
+    """
+    return _shared_index(graph, schema, RangeIndex)
+
+
+def get_facet_index(graph: Graph, schema: FacetSchema = KK_FACETS) -> FacetIndex:
+    """
+    Shared facet index for a graph, built on first use.
+    Graf ushın ortaq facet indeksi, birinshi qollanıwda dúziledi.
+
+    Args:
+        graph: Knowledge graph / Bilimler grafı
+        schema: Facet vocabulary / Facet sózligi
+
+    Returns:
+        Current FacetIndex / Jańa FacetIndex
+    """
+    return _shared_index(graph, schema, FacetIndex)
+
+
+def values_clause(variable: str, subjects: Iterable[URIRef]) -> str:
+    """
+    SPARQL ``VALUES`` block binding a variable to index hits.
+    Indeks nátiyjelerin ózgeriwshige baylaytuǵın SPARQL ``VALUES`` bloki.
+
+    Examples / Misallar:
+        >>> values_clause("statiya", [URIRef("http://huquqai.org/ontology#Statiya_1")])
+        'VALUES ?statiya { <http://huquqai.org/ontology#Statiya_1> }'
+    """
+    return f"VALUES ?{variable} {{ {' '.join(s.n3() for s in subjects)} }}"
@@ -0,0 +1,373 @@
+"""
+Trigram index for typo-tolerant label search
+Qáteliklerge shıdamlı label izlewi ushın trigram indeksi
+
+Labels are normalized once (diacritic folding and suffix stripping, see
+``src.utils.normalization``) and split into tokens. Every distinct token is
+indexed by its padded character trigrams, so fuzzy candidates for a query token
+are retrieved by trigram overlap instead of comparing against every label. The
+candidates are then scored with a bounded Levenshtein distance that stops as
+soon as the distance limit is exceeded.
+
+Normalization transliterates Cyrillic, so a label and a query meet in one Latin
+form whatever script either was typed in. Translations of a label (for example
+the Russian and Uzbek terms from ``terminology.translations``) are stored as
+extra forms of the same entry and are matched by the same lookups.
+
+Labellar bir ret normalizaciyalanadı ha'm tokenlerge bólinedi. Hár bir token óz
+trigramları boyınsha indekslenedi, sonlıqtan anıq emes kandidatlar barlıq
+labellar menen salıstırılmay, trigram kesilisiwi arqalı tabıladı.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from rdflib import Graph, Literal, RDFS, URIRef
+
+from src.utils.normalization import search_key
+
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def normalize_label(text: str) -> str:
+    """
+    Normalize a label for matching, the same way queries are normalized.
+    Labeldı sorawlar sıyaqlı sáykeslik ushın normalizaciyalaw.
+
+    Args:
+        text: Label text / Label teksti
+
+    Returns:
+        Folded and stemmed tokens / Birlestirilgen ha'm túbirlengen tokenler
+    """
+    return search_key(text)
+
+
+def trigrams(token: str) -> Set[str]:
+    """
+    Padded character trigrams of a token.
+    Tokenniń tolıqtırılǵan hárip trigramları.
+
+    Examples / Misallar:
+        >>> sorted(trigrams("jaza"))
+        ['  j', ' ja', 'a  ', 'aza', 'jaz', 'za ']
+    """
+    padded = f"  {token}  "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance, cut off once it exceeds ``max_distance``.
+    ``max_distance``-tan asqanda toqtaytuǵın Levenshtein aralıǵı.
+
+    Args:
+        a: First string / Birinshi qatar
+        b: Second string / Ekinshi qatar
+        max_distance: Largest distance of interest / Qızıqtıratuǵın eń úlken aralıq
+
+    Returns:
+        The distance, or ``max_distance + 1`` if it is larger
+        Aralıq yamasa ol úlken bolsa ``max_distance + 1``
+
+    Examples / Misallar:
+        >>> bounded_levenshtein("jınayat", "jinayat", 2)
+        1
+        >>> bounded_levenshtein("jaza", "nızam", 1)
+        2
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) > len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        # Only cells within the diagonal band can stay under the limit
+        # Tek diagonal jolaq ishindegi kletkalar shekten tómen qala aladı
+        low = max(1, i - max_distance)
+        high = min(len(b), i + max_distance)
+        if low > 1:
+            current[low - 1] = max_distance + 1
+        row_min = current[0] if low == 1 else max_distance + 1
+        for j in range(low, high + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        for j in range(high + 1, len(b) + 1):
+            current[j] = max_distance + 1
+        if row_min > max_distance:
+            return max_distance + 1
+        previous = current
+
+    return min(previous[len(b)], max_distance + 1)
+
+
+@dataclass
+class LabelEntry:
+    """
+    One indexed ``rdfs:label``.
+    Indekslengen bir ``rdfs:label``.
+    """
+    uri: str
+    label: str
+    language: Optional[str]
+    normalized: str
+    forms: Tuple[str, ...] = ()
+
+    @property
+    def keys(self) -> Tuple[str, ...]:
+        """Normalized label and its alternative forms / Normalizaciyalanǵan formalar"""
+        return (self.normalized,) + self.forms
+
+
+class LabelIndex:
+    """
+    Trigram index over the ``rdfs:label`` values of a graph.
+    Graf ``rdfs:label`` mánisleri boyınsha trigram indeksi.
+
+    Examples / Misallar:
+        >>> index = LabelIndex.from_graph(graph)
+        >>> for entry, score in index.search("jınayat", lang="kaa"):
+        ...     print(entry.uri, entry.label, score)
+    """
+
+    def __init__(self, entries: Iterable[LabelEntry]):
+        """
+        Args:
+            entries: Labels to index / Indekslenetuǵın labellar
+        """
+        self.entries: List[LabelEntry] = list(entries)
+        self._token_entries: Dict[str, Set[int]] = defaultdict(set)
+        self._trigram_tokens: Dict[str, Set[str]] = defaultdict(set)
+        self._length_tokens: Dict[int, Set[str]] = defaultdict(set)
+        # One- and two-character substrings, for terms too short for trigrams
+        # Trigram ushın tım qısqa terminler ushın bir ha'm eki háripli bólekler
+        self._short_tokens: Dict[str, Set[str]] = defaultdict(set)
+
+        for entry_id, entry in enumerate(self.entries):
+            for token in _TOKEN_RE.findall(" ".join(entry.keys)):
+                if token not in self._token_entries:
+                    for gram in trigrams(token):
+                        self._trigram_tokens[gram].add(token)
+                    self._length_tokens[len(token)].add(token)
+                    for size in (1, 2):
+                        for i in range(len(token) - size + 1):
+                            self._short_tokens[token[i:i + size]].add(token)
+                self._token_entries[token].add(entry_id)
+
+    @classmethod
+    def from_graph(
+        cls,
+        graph: Graph,
+        predicates: Sequence[URIRef] = (RDFS.label,),
+        synonyms: Optional[Dict[str, Sequence[str]]] = None
+    ) -> 'LabelIndex':
+        """
+        Index every literal label (and title) in a graph.
+        Graftaǵı barlıq literal label (ha'm atama) mánislerin indekslew.
+
+        Args:
+            graph: RDF graph / RDF grafı
+            predicates: Predicates whose literals are indexed / Indekslenetuǵın predikatlar
+            synonyms: Alternative terms keyed by normalized label, stored as extra forms
+                      Normalizaciyalanǵan label boyınsha qosımsha terminler
+
+        Returns:
+            LabelIndex instance / LabelIndex misalı
+        """
+        synonym_forms = {
+            key: tuple(normalize_label(term) for term in terms)
+            for key, terms in (synonyms or {}).items()
+        }
+
+        def entries() -> Iterable[LabelEntry]:
+            for predicate in predicates:
+                for s, o in graph.subject_objects(predicate):
+                    if not isinstance(o, Literal):
+                        continue
+                    normalized = normalize_label(str(o))
+                    yield LabelEntry(
+                        uri=str(s),
+                        label=str(o),
+                        language=o.language,
+                        normalized=normalized,
+                        forms=synonym_forms.get(normalized, ())
+                    )
+
+        return cls(entries())
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _similar_tokens(self, token: str, max_distance: int) -> Dict[str, int]:
+        """
+        Indexed tokens within ``max_distance`` edits of ``token``.
+        ``token``-nan ``max_distance`` ózgeriske shekem alıslıqtaǵı tokenler.
+        """
+        grams = trigrams(token)
+        # Each edit destroys at most three trigrams (q-gram lemma)
+        # Hár bir ózgeris eń kóp úsh trigramdı buzadı
+        required = len(grams) - 3 * max_distance
+
+        if required > 0:
+            overlap: Dict[str, int] = defaultdict(int)
+            for gram in grams:
+                for candidate in self._trigram_tokens.get(gram, ()):
+                    overlap[candidate] += 1
+            candidates: Iterable[str] = (c for c, n in overlap.items() if n >= required)
+        else:
+            candidates = (
+                c
+                for length in range(len(token) - max_distance, len(token) + max_distance + 1)
+                for c in self._length_tokens.get(length, ())
+            )
+
+        matches = {}
+        for candidate in candidates:
+            distance = bounded_levenshtein(token, candidate, max_distance)
+            if distance <= max_distance:
+                matches[candidate] = distance
+        return matches
+
+    def _tokens_containing(self, part: str) -> Set[str]:
+        """
+        Indexed tokens that contain ``part``, found through its rarest trigram.
+        ``part``-tı qamtıytuǵın tokenler, eń siyrek trigramı arqalı tabıladı.
+        """
+        if len(part) < 3:
+            return self._short_tokens.get(part, set())
+        postings = min(
+            (self._trigram_tokens.get(part[i:i + 3], set()) for i in range(len(part) - 2)),
+            key=len
+        )
+        return {token for token in postings if part in token}
+
+    def _containing(self, query: str) -> List[int]:
+        """
+        Ids of entries with a key that contains ``query``, in graph order.
+        ``query``-dı qamtıytuǵın jazıwlar id-ları, graf tártibinde.
+
+        Every query token lies inside some token of a matching key, so the
+        candidates are the entries of the tokens containing the longest query
+        token; containment is then confirmed on those alone.
+        """
+        query_tokens = _TOKEN_RE.findall(query)
+        if not query_tokens:
+            return []
+        candidates: Set[int] = set()
+        for token in self._tokens_containing(max(query_tokens, key=len)):
+            candidates |= self._token_entries[token]
+        return [
+            entry_id for entry_id in sorted(candidates)
+            if any(query in key for key in self.entries[entry_id].keys)
+        ]
+
+    def _language_ok(self, entry: LabelEntry, lang: Optional[str]) -> bool:
+        """Language filter / Til filtri"""
+        return lang is None or not entry.language or entry.language == lang
+
+    def contains(self, term: str, lang: Optional[str] = None) -> List[LabelEntry]:
+        """
+        Labels whose normalized form contains the normalized term.
+        Normalizaciyalanǵan forması termindi qamtıytuǵın labellar.
+
+        Args:
+            term: Search term / Izlew termini
+            lang: Keep labels in this language or untagged / Tek usı tildegi labellar
+
+        Returns:
+            Matching entries in graph order / Sáykes jazıwlar
+        """
+        query = normalize_label(term)
+        if not query:
+            return []
+        return [
+            self.entries[entry_id] for entry_id in self._containing(query)
+            if self._language_ok(self.entries[entry_id], lang)
+        ]
+
+    def search(
+        self,
+        term: str,
+        lang: Optional[str] = None,
+        threshold: float = 0.8,
+        limit: Optional[int] = None
+    ) -> List[Tuple[LabelEntry, float]]:
+        """
+        Typo-tolerant label search.
+        Qáteliklerge shıdamlı label izlewi.
+
+        A label matches when it contains the term (score 1.0), or when every
+        token of the term is within the allowed edit distance of some token of
+        the label. The allowed distance for a token is
+        ``len(token) * (1 - threshold)``, at least one edit. A label made of
+        whole words of a longer term ("urlıq" in "urlıq jazası qanday") scores
+        the share of the term it covers.
+
+        Label termindi qamtısa yamasa termin tokenleriniń hár biri labeldıń
+        qanday da bir tokenine ruxsat etilgen aralıqta jaqın bolsa sáykes keledi.
+
+        Args:
+            term: Search term / Izlew termini
+            lang: Keep labels in this language or untagged / Tek usı tildegi labellar
+            threshold: Similarity in [0, 1] / Uqsaslıq shegi
+            limit: Maximum results / Eń kóp nátiyјeler
+
+        Returns:
+            (entry, score) pairs, best first / (jazıw, upay) jupları, eń jaqsısı birinshi
+        """
+        query = normalize_label(term)
+        if not query:
+            return []
+
+        # Labels containing the term / Termindi qamtıytuǵın labellar
+        scores: Dict[int, float] = {entry_id: 1.0 for entry_id in self._containing(query)}
+
+        # Labels inside the term, scored by coverage / Termin ishindegi labellar
+        query_tokens = _TOKEN_RE.findall(query)
+        for token in set(query_tokens):
+            for entry_id in self._token_entries.get(token, ()):
+                covered = max(
+                    (len(key) for key in self.entries[entry_id].keys if key and key in query),
+                    default=0
+                )
+                if covered:
+                    scores[entry_id] = max(scores.get(entry_id, 0.0), covered / len(query))
+
+        if query_tokens:
+            matched: Optional[Dict[int, float]] = None
+            for token in query_tokens:
+                max_distance = max(1, int(len(token) * (1.0 - threshold)))
+                token_scores: Dict[int, float] = {}
+                for candidate, distance in self._similar_tokens(token, max_distance).items():
+                    similarity = 1.0 - distance / max(len(token), len(candidate))
+                    for entry_id in self._token_entries[candidate]:
+                        if similarity > token_scores.get(entry_id, 0.0):
+                            token_scores[entry_id] = similarity
+                if matched is None:
+                    matched = token_scores
+                else:
+                    matched = {
+                        entry_id: min(score, token_scores[entry_id])
+                        for entry_id, score in matched.items()
+                        if entry_id in token_scores
+                    }
+                if not matched:
+                    break
+            for entry_id, score in (matched or {}).items():
+                scores[entry_id] = max(scores.get(entry_id, 0.0), score)
+
+        results = [
+            (self.entries[entry_id], score)
+            for entry_id, score in scores.items()
+            if self._language_ok(self.entries[entry_id], lang)
+        ]
+        results.sort(key=lambda item: (-item[1], item[0].label))
+        return results[:limit] if limit else results
@@ -10,18 +10,32 @@ qollanıp professional ontologiya basqarıw sistemasın beredi.
 """
 
 import logging
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple, Union
+from typing import Callable, Iterable, Optional, List, Dict, Any, Tuple, Union
 from threading import Lock
 from datetime import datetime
 
-from rdflib import Graph, Namespace, URIRef, Literal, RDF, RDFS, OWL
+from rdflib import Dataset, Graph, Namespace, URIRef, Literal, RDF, RDFS, OWL, plugin
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
 from rdflib.namespace import XSD
 from rdflib.plugins.sparql import prepareQuery
+from rdflib.store import VALID_STORE, Store
 from owlready2 import get_ontology, World, Thing
 from loguru import logger
 
+from src.core import compact_store  # noqa: F401  registers the "Compact" store plugin
+from src.core.bulk_loader import LoadReport, discover_files, guess_format, load_files
 from src.core.config import get_config
+from src.core.graph_index import find_article_index
+from src.core.label_index import LabelIndex
+from src.core.query_cost import writing_statistics
+from src.core.sqlite_store import SQLiteStore
+from src.core.stream_import import ImportReport, import_file, stream_format
+from src.utils.cache import bump_knowledge_version, knowledge_version
+from src.utils.language import get_language_utils
+from src.utils.metrics import get_metrics_registry
 
 
 class OntologyManagerError(Exception):
@@ -51,6 +65,54 @@ class OntologyNotLoadedError(OntologyManagerError):
     pass
 
 
+# Code type names and aliases / Kodeks túri atları ha'm sinonimleri
+CODE_ALIASES: Dict[str, str] = {
+    'jinayat': 'criminal',
+    'criminal': 'criminal',
+    'puqaralıq': 'civil',
+    'civil': 'civil',
+    'administrativ': 'administrative',
+    'administrative': 'administrative',
+}
+
+# Code type -> key of its named graph in ``sparql.graphs``
+# Kodeks túri -> ``sparql.graphs`` ishindegi atamalı graf gilti
+CODE_GRAPHS: Dict[str, str] = {
+    'criminal': 'criminal_law',
+    'civil': 'civil_law',
+    'administrative': 'administrative_law',
+}
+
+
+def normalize_code(kodeks: str) -> str:
+    """
+    Canonical code type for a code name or alias.
+    Kodeks atı yamasa sinonimi ushın kanonikalıq kodeks túri.
+
+    Examples / Misallar:
+        >>> normalize_code("Jinayat")
+        'criminal'
+    """
+    return CODE_ALIASES.get(kodeks.lower(), kodeks)
+
+
+def code_graph_id(kodeks: str) -> Optional[URIRef]:
+    """
+    Named graph URI configured for a code, or None.
+    Kodeks ushın sazlanǵan atamalı graf URI, yamasa None.
+
+    Args:
+        kodeks: Code type or alias / Kodeks túri yamasa sinonimi
+
+    Returns:
+        Graph URI from ``sparql.graphs`` / ``sparql.graphs`` ishindegi graf URI
+    """
+    graphs = get_config().sparql.graphs
+    code = normalize_code(kodeks)
+    uri = graphs.get(CODE_GRAPHS.get(code, code))
+    return URIRef(uri) if uri else None
+
+
 class OntologyManager:
     """
     Singleton OWL Ontology Manager for Karakalpak Legal Knowledge Base.
@@ -103,10 +165,14 @@ class OntologyManager:
         self._initialized = True
         self.config = get_config()
 
-        # RDFLib graph for RDF/SPARQL operations
+        # RDFLib graph for RDF/SPARQL operations; a Dataset whose default
+        # graph is the union of all named graphs when the store allows it
         # RDF/SPARQL ámeliyatlar ushın RDFLib grafı
         self.graph: Optional[Graph] = None
 
+        # Named graph per legal code / Hár kodeks ushın atamalı graf
+        self.partitions: Dict[str, Graph] = {}
+
         # Owlready2 world for OWL reasoning
         # OWL sebep-saldar shıǵarıw ushın Owlready2 world
         self.world: Optional[World] = None
@@ -125,6 +191,22 @@ class OntologyManager:
             'individual_count': 0,
         }
 
+        # Fuzzy label index, rebuilt when the graph changes
+        # Anıq emes label indeksi, graf ózgergende qayta dúziledi
+        self._label_index: Optional[LabelIndex] = None
+        self._label_index_key: Optional[Tuple[int, int]] = None
+
+        # Graph size metrics, read at scrape time / Graf ólshemi metrikaları
+        registry = get_metrics_registry()
+        registry.gauge(
+            "huquqai_graph_triples", "Triples in the knowledge graph", ["graph"]
+        ).labels(graph="ontology").set_function(
+            lambda: len(self.graph) if self.graph is not None else 0
+        )
+        self._entity_gauge = registry.gauge(
+            "huquqai_ontology_entities", "Classes and individuals in the ontology", ["kind"]
+        )
+
         logger.info("OntologyManager initialized / Ontologiya Menedžer inizializaciya etildi")
 
     def _setup_namespaces(self) -> None:
@@ -144,7 +226,8 @@ class OntologyManager:
     def load_ontology(
         self,
         file_path: Union[str, Path],
-        format: str = "auto"
+        format: str = "auto",
+        code: Optional[str] = None
     ) -> bool:
         """
         Load ontology file containing Karakalpak legal data.
@@ -153,9 +236,17 @@ class OntologyManager:
         Supports .owl (RDF/XML), .ttl (Turtle), and .rdf formats.
         .owl (RDF/XML), .ttl (Turtle), ha'm .rdf formatların qollap-quwatlaydı.
 
+        Without ``code`` the file starts a new graph. With ``code`` it is added
+        to that code's named graph (``sparql.graphs``) of the loaded graph, so
+        code-specific queries scan only that code.
+
+        ``code`` bolmasa fayl jańa graf baslaydı; ``code`` berilse fayl sol
+        kodekstiń atamalı grafına qosıladı.
+
         Args:
             file_path: Path to .owl or .ttl file / .owl yamasa .ttl fayl jolı
             format: File format (auto, xml, turtle, n3) / Fayl formatı
+            code: Legal code of the file, e.g. "criminal" / Fayldıń kodeksi
 
         Returns:
             True if successful / Tabıslı bolsa True
@@ -172,6 +263,9 @@ class OntologyManager:
             >>> # Load knowledge base / Bilimler bazasın júklew
             >>> manager.load_ontology("data/knowledge/legal_kb.ttl", format="turtle")
             True
+            >>> # Criminal Code into its named graph / Jinayat Kodeksin óz grafına
+            >>> manager.load_ontology("data/knowledge/criminal_code.ttl", code="jinayat")
+            True
         """
         start_time = datetime.now()
         file_path = Path(file_path)
@@ -186,12 +280,16 @@ class OntologyManager:
         try:
             logger.info(f"Loading ontology / Ontologiyani júklew: {file_path}")
 
-            # Initialize RDFLib graph / RDFLib grafın inizializaciyalaw
-            self.graph = Graph()
+            # Initialize RDFLib graph on the configured store
+            # Sazlanǵan saqlaǵıshta RDFLib grafın inizializaciyalaw
+            if code is None or self.graph is None:
+                self.graph = self._open_graph()
+                self.partitions = {}
+                self._label_index = None
 
-            # Bind namespaces / Namespace-lardı baylaw
-            for prefix, namespace in self.namespaces.items():
-                self.graph.bind(prefix, namespace)
+                # Bind namespaces / Namespace-lardı baylaw
+                for prefix, namespace in self.namespaces.items():
+                    self.graph.bind(prefix, namespace)
 
             # Determine format / Formatı anıqlaw
             if format == "auto":
@@ -200,36 +298,264 @@ class OntologyManager:
             # Parse ontology / Ontologiyani parse etiw
             logger.debug(f"Parsing file with format: {format} / "
                         f"Fayldi formatlaw: {format}")
-            self.graph.parse(file_path, format=format)
+            if code is None:
+                self._ingest(
+                    [file_path],
+                    lambda: self._default_graph().parse(str(file_path), format=format)
+                )
+
+                # Load with Owlready2 for reasoning / Sebep-saldar ushın Owlready2 menen júklew
+                self._load_owlready2(file_path)
+            else:
+                self._partition(code).parse(str(file_path), format=format)
 
-            # Load with Owlready2 for reasoning / Sebep-saldar ushın Owlready2 menen júklew
-            self._load_owlready2(file_path)
+            self._mark_loaded(start_time)
+            return True
 
-            # Update statistics / Statistikani jańalaw
-            self._update_statistics()
+        except Exception as e:
+            error_msg = f"Failed to load ontology: {str(e)}"
+            error_msg_kaa = f"Ontologiyani júklew sátsiz: {str(e)}"
+            logger.error(f"{error_msg} / {error_msg_kaa}")
+            raise OntologyManagerError(error_msg, error_msg_kaa) from e
 
-            load_duration = (datetime.now() - start_time).total_seconds()
-            self.stats['loaded'] = True
-            self.stats['load_time'] = load_duration
+    def load_knowledge(
+        self,
+        paths: Optional[List[Union[str, Path]]] = None,
+        workers: Optional[int] = None
+    ) -> LoadReport:
+        """
+        Load all ontology and knowledge files at once, parsing them in parallel.
+        Barlıq ontologiya ha'm bilim faylların bir ret, parallel parse etip júklew.
 
-            logger.info(
-                f"Ontology loaded successfully in {load_duration:.2f}s / "
-                f"Ontologiya tabıslı júklendi {load_duration:.2f}s ishinde"
-            )
-            logger.info(
-                f"Triples: {self.stats['triple_count']}, "
-                f"Classes: {self.stats['class_count']}, "
-                f"Individuals: {self.stats['individual_count']}"
+        By default every RDF file under ``paths.ontologies`` and
+        ``paths.knowledge`` is loaded into a new graph. A file named after a
+        code (``criminal_code.ttl``, ``jinayat_kodeksi.ttl``) goes into that
+        code's named graph; the others go into the default graph.
+
+        Áhmiyetli ``paths.ontologies`` ha'm ``paths.knowledge`` papkalarındaǵı
+        barlıq RDF fayllar jańa grafqa júklenedi; kodeks atındaǵı fayl sol
+        kodekstiń atamalı grafına túsedi.
+
+        Args:
+            paths: Files to load / Júklenetuǵın fayllar
+            workers: Parser processes, default ``ontology.load_workers``
+                     Parser processler sanı
+
+        Returns:
+            Per-file timings / Hár fayl boyınsha waqıtlar
+
+        Raises:
+            OntologyManagerError: If no file is found or one fails to load
+                                  Fayl tabılmasa yamasa júklenbese
+
+        Examples / Misallar:
+            >>> report = manager.load_knowledge()
+            >>> print(report.summary())
+            legal_ontology.owl: 185 triples, parse 0.05s, merge 0.00s
+            criminal_code.ttl: 165 triples, parse 0.04s, merge 0.00s
+            2 files, 350 triples in 0.09s (1 workers)
+        """
+        start_time = datetime.now()
+        if paths is None:
+            directories = [self.config.paths.get('ontologies'), self.config.paths.get('knowledge')]
+            files = discover_files(directory for directory in directories if directory)
+        else:
+            files = [Path(path) for path in paths]
+
+        if not files:
+            raise OntologyManagerError(
+                "No ontology or knowledge files found",
+                "Ontologiya yamasa bilim faylları tabılmadı"
             )
+        if workers is None:
+            workers = self.config.ontology.load_workers
 
-            return True
+        try:
+            logger.info(f"Loading {len(files)} files / {len(files)} fayl júklenbekte")
+            self.graph = self._open_graph()
+            self.partitions = {}
+            self._label_index = None
+            for prefix, namespace in self.namespaces.items():
+                self.graph.bind(prefix, namespace)
 
+            report = LoadReport()
+
+            def load() -> None:
+                nonlocal report
+                report = load_files(files, self._graph_for_file, workers=workers)
+
+            self._ingest(files, load)
+            if report.failed:
+                names = ", ".join(f"{item.path.name} ({item.error})" for item in report.failed)
+                raise OntologyManagerError(
+                    f"Failed to load files: {names}",
+                    f"Fayllar júklenbedi: {names}"
+                )
+            logger.info(f"Bulk load / Kóplep júklew:\n{report.summary()}")
+
+            ontology_file = next((f for f in files if guess_format(f) == 'xml'), None)
+            if ontology_file is not None:
+                self._load_owlready2(ontology_file)
+
+            self._mark_loaded(start_time)
+            return report
+
+        except OntologyManagerError:
+            raise
         except Exception as e:
-            error_msg = f"Failed to load ontology: {str(e)}"
-            error_msg_kaa = f"Ontologiyani júklew sátsiz: {str(e)}"
+            error_msg = f"Failed to load knowledge: {str(e)}"
+            error_msg_kaa = f"Bilimlerdi júklew sátsiz: {str(e)}"
             logger.error(f"{error_msg} / {error_msg_kaa}")
             raise OntologyManagerError(error_msg, error_msg_kaa) from e
 
+    def _graph_for_file(self, file_path: Path) -> Graph:
+        """
+        Named graph of the code a file is named after, else the default graph.
+        Fayl atındaǵı kodekstiń atamalı grafı, bolmasa tiykarǵı graf.
+        """
+        prefix = file_path.stem.split('_')[0].lower()
+        if prefix in CODE_ALIASES and code_graph_id(prefix) is not None:
+            return self._partition(prefix)
+        return self._default_graph()
+
+    def _default_graph(self) -> Graph:
+        """Graph that unpartitioned triples go into / Bólimlenbegen triple-lar grafı"""
+        if isinstance(self.graph, Dataset):
+            return self.graph.graph(DATASET_DEFAULT_GRAPH_ID)
+        return self.graph
+
+    def _mark_loaded(self, start_time: datetime) -> None:
+        """
+        Update statistics and mark the ontology as loaded.
+        Statistikanı jańalaw ha'm ontologiyanı júklengen dep belgilew.
+        """
+        # Update statistics / Statistikani jańalaw
+        self._update_statistics()
+
+        load_duration = (datetime.now() - start_time).total_seconds()
+        self.stats['loaded'] = True
+        self.stats['load_time'] = load_duration
+        bump_knowledge_version("ontology loaded")
+
+        logger.info(
+            f"Ontology loaded successfully in {load_duration:.2f}s / "
+            f"Ontologiya tabıslı júklendi {load_duration:.2f}s ishinde"
+        )
+        logger.info(
+            f"Triples: {self.stats['triple_count']}, "
+            f"Classes: {self.stats['class_count']}, "
+            f"Individuals: {self.stats['individual_count']}"
+        )
+
+    def _open_graph(self) -> Graph:
+        """
+        Graph on the configured store, opened when the store is persistent.
+        Sazlanǵan saqlaǵıshtaǵı graf, saqlaǵısh turaqlı bolsa ashıladı.
+
+        The graph is a ``Dataset`` (default graph = union of all graphs) only
+        when named graphs are configured in ``sparql.graphs`` and the store
+        supports them; otherwise it is a plain ``Graph``. Iterating a
+        ``Dataset`` yields quads, so callers wanting triples use
+        ``graph.triples((None, None, None))``, which works on both.
+
+        Graf tek ``sparql.graphs`` sazlanǵan ha'm saqlaǵısh atamalı graflardı
+        qollaǵanda ``Dataset`` boladı, basqa jaǵdayda ápiwayı ``Graph``.
+
+        Raises:
+            OntologyManagerError: If a read-only store file is missing
+                                  Tek oqıw ushın saqlaǵısh faylı joq bolsa
+        """
+        settings = self.config.ontology
+        options = dict(settings.store_options)
+        if settings.store_read_only:
+            options["read_only"] = True
+
+        store = plugin.get(settings.store, Store)(**options)
+        if store.context_aware and self.config.sparql.graphs:
+            graph: Graph = Dataset(store=store, default_union=True)
+        else:
+            graph = Graph(store=store)
+        if settings.store_path:
+            status = graph.open(settings.store_path, create=not settings.store_read_only)
+            if status != VALID_STORE:
+                raise OntologyManagerError(
+                    f"Store not found: {settings.store_path}",
+                    f"Saqlaǵısh tabılmadı: {settings.store_path}"
+                )
+        return graph
+
+    def _ingest(self, files: List[Path], load: Callable[[], None]) -> None:
+        """
+        Load files into the graph, unless a persistent store already holds them.
+        Fayllardı grafqa júklew, turaqlı saqlaǵıshta bar bolsa ótkerip jiberiw.
+
+        A persistent store remembers the files (path, size, mtime) it was last
+        ingested from; matching files are not parsed again, changed ones
+        replace the stored triples.
+
+        Args:
+            files: Source files / Derek fayllar
+            load: Parses the files into the graph / Fayllardı grafqa parse etedi
+        """
+        store = self.graph.store
+        if not isinstance(store, SQLiteStore):
+            load()
+            return
+
+        fingerprint = ";".join(
+            f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}"
+            for path, stat in ((path, path.stat()) for path in files)
+        )
+        names = ", ".join(str(path) for path in files)
+        if store.get_meta("source") == fingerprint:
+            logger.info(f"Persistent store already holds {names}, not parsing / "
+                        f"Turaqlı saqlaǵıshta {names} bar, parse etilmeydi")
+            return
+        if store.read_only:
+            raise OntologyManagerError(
+                f"Read-only store was not ingested from {names}",
+                f"Tek oqıw ushın saqlaǵısh {names} faylınan júklenbegen"
+            )
+
+        with store.bulk():
+            self.graph.remove((None, None, None))
+            load()
+            store.set_meta("source", fingerprint)
+        logger.info(f"Ingested {names} into {store.path} / "
+                    f"{names} {store.path} saqlaǵıshına júklendi")
+
+    def _partition(self, code: str) -> Graph:
+        """
+        Named graph for a code, created on first use.
+        Kodeks ushın atamalı graf, birinshi qollanıwda jaratıladı.
+
+        Falls back to the whole graph when the store has no named graphs or
+        the code has no configured graph.
+
+        Raises:
+            OntologyManagerError: If the code is unknown / Kodeks belgisiz bolsa
+        """
+        code = normalize_code(code)
+        partition = self.partitions.get(code)
+        if partition is not None:
+            return partition
+
+        graph_id = code_graph_id(code)
+        if graph_id is None:
+            raise OntologyManagerError(
+                f"No named graph configured for code: {code}",
+                f"Kodeks ushın atamalı graf sazlanbaǵan: {code}"
+            )
+        if not isinstance(self.graph, Dataset):
+            logger.warning(f"Store '{self.config.ontology.store}' has no named graphs, "
+                           f"loading {code} into the default graph / "
+                           f"Saqlaǵıshta atamalı graflar joq, {code} tiykarǵı grafqa júklenedi")
+            return self.graph
+
+        partition = self.graph.graph(graph_id)
+        self.partitions[code] = partition
+        return partition
+
     def _detect_format(self, file_path: Path) -> str:
         """
         Auto-detect file format based on extension.
@@ -241,16 +567,7 @@ class OntologyManager:
         Returns:
             Format string / Format júrgen shıǵı
         """
-        extension = file_path.suffix.lower()
-        format_map = {
-            '.owl': 'xml',
-            '.rdf': 'xml',
-            '.ttl': 'turtle',
-            '.n3': 'n3',
-            '.nt': 'nt',
-            '.jsonld': 'json-ld',
-        }
-        return format_map.get(extension, 'xml')
+        return guess_format(file_path)
 
     def _load_owlready2(self, file_path: Path) -> None:
         """
@@ -278,6 +595,9 @@ class OntologyManager:
 
         # Count triples / Triple-lardı sanaw
         self.stats['triple_count'] = len(self.graph)
+        self.stats['partitions'] = {
+            code: len(partition) for code, partition in self.partitions.items()
+        }
 
         # Count classes / Klasslardı sanaw
         classes = list(self.graph.subjects(RDF.type, OWL.Class))
@@ -290,6 +610,9 @@ class OntologyManager:
                 individuals.add(s)
         self.stats['individual_count'] = len(individuals)
 
+        self._entity_gauge.labels(kind="class").set(self.stats['class_count'])
+        self._entity_gauge.labels(kind="individual").set(self.stats['individual_count'])
+
     def query_sparql(
         self,
         query: str,
@@ -467,7 +790,9 @@ class OntologyManager:
         Args:
             search_term: Search term / Izlew termini
             lang: Language / Til
-            fuzzy: Enable fuzzy matching / Anıq emes sáykeslikti qosıw
+            fuzzy: Enable typo-tolerant matching through the trigram label index;
+                   results are ranked and carry a ``score``
+                   Trigram label indeksi arqalı anıq emes sáykeslikti qosıw
 
         Returns:
             Matching resources / Sáykes resurslar
@@ -480,68 +805,63 @@ class OntologyManager:
         """
         self._check_loaded()
 
-        results = []
-        search_lower = search_term.lower()
-
-        # Search in rdfs:label / rdfs:label ishinde izlew
-        for s, p, o in self.graph.triples((None, RDFS.label, None)):
-            if not isinstance(o, Literal):
-                continue
-
-            # Check language / Tildi tekseriv
-            if o.language and o.language != lang:
-                continue
-
-            label = str(o).lower()
-
-            # Match / Sáykeslik
-            if fuzzy:
-                # Simple fuzzy matching / Qарапайım anıq emes sáykeslik
-                if search_lower in label or label in search_lower:
-                    match = True
-                else:
-                    # Levenshtein-like simple check
-                    match = self._simple_fuzzy_match(search_lower, label)
-            else:
-                match = search_lower in label
-
-            if match:
-                results.append({
-                    'uri': str(s),
-                    'label': str(o),
-                    'language': o.language or 'unknown'
-                })
+        if fuzzy:
+            threshold = self.config.search.get('fuzzy_threshold', 0.8)
+            results = [
+                {
+                    'uri': entry.uri,
+                    'label': entry.label,
+                    'language': entry.language or 'unknown',
+                    'score': score,
+                }
+                for entry, score in self._get_label_index().search(
+                    search_term, lang=lang, threshold=threshold
+                )
+            ]
+        else:
+            results = [
+                {
+                    'uri': entry.uri,
+                    'label': entry.label,
+                    'language': entry.language or 'unknown'
+                }
+                for entry in self._get_label_index().contains(search_term, lang=lang)
+            ]
 
         logger.debug(f"Search '{search_term}' found {len(results)} results / "
                     f"'{search_term}' izlewi {len(results)} nátiyјe tapdı")
 
         return results
 
-    def _simple_fuzzy_match(self, term1: str, term2: str, threshold: float = 0.7) -> bool:
+    def _get_label_index(self) -> LabelIndex:
         """
-        Simple fuzzy string matching.
-        Qарапайım anıq emes júrgen shıǵı sáykesligi.
+        Get the trigram label index, rebuilding it if the graph changed.
+        Trigram label indeksin alıw, graf ózgerse qayta dúziw.
 
-        Args:
-            term1: First term / Birinshi termin
-            term2: Second term / Ekinshi termin
-            threshold: Similarity threshold / Uyqaslıq shegi
+        Labels and article titles are indexed together with the configured
+        translations of each term, so Cyrillic, Russian and Uzbek queries
+        resolve through the same lookup.
 
         Returns:
-            True if similar / Uyqas bolsa True
+            LabelIndex for the current graph / Házirgi graf ushın LabelIndex
         """
-        # Simple character overlap ratio / Qарапайım hárip qabat qawısıw koefficienti
-        set1 = set(term1)
-        set2 = set(term2)
-
-        if not set1 or not set2:
-            return False
-
-        intersection = len(set1.intersection(set2))
-        union = len(set1.union(set2))
-
-        similarity = intersection / union if union > 0 else 0
-        return similarity >= threshold
+        # Same stamp as GraphIndex: writes through the manager or a SPARQL
+        # update bump the version; the size catches direct graph writes
+        # GraphIndex sıyaqlı: versiya ózgeriwi yamasa graf ólsheminiń ózgeriwi
+        key = (knowledge_version(), len(self.graph))
+        if self._label_index is None or self._label_index_key != key:
+            predicates = [RDFS.label]
+            if 'huquq' in self.namespaces:
+                predicates.append(self.namespaces['huquq'].title)
+            self._label_index = LabelIndex.from_graph(
+                self.graph,
+                predicates=predicates,
+                synonyms=get_language_utils().term_synonyms()
+            )
+            self._label_index_key = key
+            logger.debug(f"Label index built: {len(self._label_index)} labels / "
+                        f"Label indeksi dúzildi: {len(self._label_index)} label")
+        return self._label_index
 
     def get_related(
         self,
@@ -633,7 +953,7 @@ class OntologyManager:
         individual_uri = huquq[individual_name]
 
         # Add type / Tipti qosıw
-        self.graph.add((individual_uri, RDF.type, class_uri))
+        triples = [(individual_uri, RDF.type, class_uri)]
 
         # Add properties / Xassalarni qosıw
         if properties:
@@ -647,20 +967,187 @@ class OntologyManager:
                         literal = Literal(value, lang=lang)
                     else:
                         literal = Literal(value)
-                    self.graph.add((individual_uri, prop_uri, literal))
+                    triples.append((individual_uri, prop_uri, literal))
                 elif isinstance(value, (int, float)):
                     literal = Literal(value)
-                    self.graph.add((individual_uri, prop_uri, literal))
+                    triples.append((individual_uri, prop_uri, literal))
                 else:
                     # Assume URI reference
                     obj_uri = URIRef(value) if isinstance(value, str) else value
-                    self.graph.add((individual_uri, prop_uri, obj_uri))
+                    triples.append((individual_uri, prop_uri, obj_uri))
+
+        # Keep an existing article index and the cost statistics current
+        # Bar statiya indeksin ha'm baha statistikasın jańa halda saqlaw
+        article_index = find_article_index(self.graph)
+        index_writing = article_index.writing(individual_uri) if article_index else nullcontext()
+        with writing_statistics(self.graph, triples), index_writing:
+            for triple in triples:
+                self.graph.add(triple)
+
+            bump_knowledge_version("individual added")
 
         logger.info(f"Added individual: {individual_name} of type {class_name} / "
                    f"Individual qosıldı: {class_name} tipindegi {individual_name}")
 
         return individual_uri
 
+    def add_many(
+        self,
+        triples: Iterable[Tuple[Any, Any, Any]],
+        code: Optional[str] = None,
+        batch_size: int = 50_000
+    ) -> int:
+        """
+        Add triples in batches, updating statistics once at the end.
+        Triple-lardı toplamlap qosıw, statistika aqırında bir ret jańalanadı.
+
+        Batches go through the store's ``addN`` (one SQL statement per batch
+        for the SQLite store, one delta merge for the Compact store) inside a
+        single transaction. Indexes are not maintained per triple; the
+        knowledge version is bumped once, so they rebuild on next use.
+
+        Toplamlar saqlaǵıshtıń ``addN`` metodı arqalı bir tranzakciyada qosıladı;
+        indeksler hár triple ushın emes, keyingi qollanıwda qayta dúziledi.
+
+        Args:
+            triples: (subject, predicate, object) triples / Triple-lar
+            code: Named graph of a legal code, None for the default graph
+                  Kodekstiń atamalı grafı, None - tiykarǵı graf
+            batch_size: Triples per ``addN`` call / Bir ``addN`` shaqırıwındaǵı triple-lar
+
+        Returns:
+            Number of new triples / Jańa triple-lar sanı
+
+        Raises:
+            OntologyNotLoadedError: If ontology not loaded / Ontologiya júklenmegen bolsa
+
+        Examples / Misallar:
+            >>> added = manager.add_many(data_graph)
+            >>> print(f"{added} triples added")
+        """
+        self._check_loaded()
+        target = self._default_graph() if code is None else self._partition(code)
+        store = self.graph.store
+        before = len(self.graph)
+
+        iterator = iter(triples)
+        # Cost statistics follow the batches instead of a rescan
+        # Baha statistikası qayta sanawsız toplamlarǵa erip jańalanadı
+        with writing_statistics(target) as record:
+            with store.bulk() if isinstance(store, SQLiteStore) else nullcontext():
+                while True:
+                    batch = list(islice(iterator, batch_size))
+                    if not batch:
+                        break
+                    record(batch)
+                    target.addN((s, p, o, target) for s, p, o in batch)
+
+            added = len(self.graph) - before
+            if added:
+                bump_knowledge_version("triples added")
+
+        if added:
+            self._update_statistics()
+        logger.info(f"Added {added} triples / {added} triple qosıldı")
+        return added
+
+    def merge_graph(self, graph: Graph, code: Optional[str] = None) -> int:
+        """
+        Merge all triples of another graph, see ``add_many``.
+        Basqa graftıń barlıq triple-ların qosıw, ``add_many`` qarańız.
+
+        Args:
+            graph: Graph to merge / Qosılatuǵın graf
+            code: Named graph of a legal code / Kodekstiń atamalı grafı
+
+        Returns:
+            Number of new triples / Jańa triple-lar sanı
+
+        Examples / Misallar:
+            >>> data = Graph().parse("data/knowledge/criminal_code.ttl")
+            >>> manager.merge_graph(data, code="jinayat")
+            165
+        """
+        return self.add_many(graph.triples((None, None, None)), code=code)
+
+    def import_stream(
+        self,
+        file_path: Union[str, Path],
+        code: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        progress: Optional[Callable[[ImportReport], None]] = None
+    ) -> ImportReport:
+        """
+        Stream a large N-Triples or N-Quads dump into the graph.
+        Úlken N-Triples yamasa N-Quads faylın grafqa aǵım menen júklew.
+
+        The file is parsed line by line and inserted ``batch_size`` statements
+        at a time, so memory does not grow with the file. Bad lines are
+        skipped and listed in the report. Without ``code``, N-Quads
+        statements go into the named graph of their fourth term; on a store
+        without named graphs they are skipped and reported as bad lines.
+
+        Fayl qatarma-qatar parse etilip, toplamlar menen qosıladı; yad fayl
+        ólshemine qaray ósmeydi. Qáte qatarlar ótkerip jiberiledi.
+
+        Args:
+            file_path: ``.nt`` or ``.nq`` file, optionally gzipped
+                       ``.nt`` yamasa ``.nq`` faylı, gzip bolıwı múmkin
+            code: Named graph of a legal code, None to keep the file's graphs
+                  Kodekstiń atamalı grafı, None - fayldıń grafları saqlanadı
+            batch_size: Statements per insert, default ``ontology.import_batch_size``
+                        Bir qosıwdaǵı tastıyıqlar
+            progress: Called with the report after every batch
+                      Hár toplamnan keyin esabat penen shaqırıladı
+
+        Returns:
+            Counts, throughput and bad lines / Sanlar, tezlik ha'm qáte qatarlar
+
+        Raises:
+            OntologyNotLoadedError: If ontology not loaded / Ontologiya júklenmegen bolsa
+            OntologyManagerError: If the file is missing or not line-based
+                                  Fayl joq yamasa qatarlı emes bolsa
+
+        Examples / Misallar:
+            >>> report = manager.import_stream("data/dumps/lex_uz.nt.gz", code="jinayat")
+            >>> print(report.summary())
+        """
+        self._check_loaded()
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise OntologyManagerError(
+                f"Import file not found: {file_path}",
+                f"Import faylı tabılmadı: {file_path}"
+            )
+        try:
+            stream_format(file_path)
+        except ValueError as e:
+            raise OntologyManagerError(
+                f"Cannot stream {file_path.name}: only N-Triples and N-Quads are supported",
+                f"{file_path.name} aǵım menen júklenbeydi: tek N-Triples ha'm N-Quads"
+            ) from e
+
+        if code is not None:
+            target = self._partition(code)
+        elif isinstance(self.graph, Dataset):
+            target = self.graph
+        else:
+            target = self._default_graph()
+        store = self.graph.store
+
+        with store.bulk() if isinstance(store, SQLiteStore) else nullcontext():
+            report = import_file(
+                file_path, target,
+                batch_size=batch_size or self.config.ontology.import_batch_size,
+                progress=progress,
+                merge_graphs=code is not None
+            )
+
+        if report.added:
+            self._update_statistics()
+            bump_knowledge_version("triples imported")
+        return report
+
     def save_ontology(
         self,
         file_path: Union[str, Path],
@@ -753,11 +1240,14 @@ class OntologyManager:
         if self.graph:
             self.graph.close()
             self.graph = None
+        self.partitions = {}
 
         if self.world:
             self.world = None
 
         self.ontology = None
+        self._label_index = None
+        self._label_index_key = None
 
         self.stats = {
             'loaded': False,
@@ -766,6 +1256,7 @@ class OntologyManager:
             'class_count': 0,
             'individual_count': 0,
         }
+        bump_knowledge_version("ontology cleared")
 
         logger.info("Ontology cleared / Ontologiya tazalandı")
 
@@ -0,0 +1,625 @@
+"""
+Static cost estimation for SPARQL queries
+SPARQL sorawları ushın statikalıq bahá esaplaw
+
+This module walks the parsed SPARQL algebra produced by RDFLib and estimates
+result cardinality and evaluation work from graph statistics (predicate counts,
+class extents, distinct subjects/objects). SPARQLEngine uses the estimate for
+admission control: queries above the budget are rejected or automatically limited
+before they reach the evaluator.
+
+Bul modul RDFLib jasaǵan SPARQL algebrasın aralap, graf statistikası
+(predikat sanları, klass kólemi) boyınsha nátiyјe sanın ha'm orınlaw jumısın
+bahalaydı. SPARQLEngine bul bahanı sorawlardı qabıllaw ushın qollanadı.
+"""
+
+import math
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock, RLock
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from rdflib import ConjunctiveGraph, Dataset, Graph, Literal, URIRef, Variable
+from rdflib.namespace import RDF
+from rdflib.term import Node
+from rdflib.plugins.sparql.parserutils import CompValue
+
+from src.utils.cache import knowledge_version
+
+
+# Filter selectivity guesses / Filtr saylawshańlıǵı bahaları
+DEFAULT_SELECTIVITY = 0.5
+EQUALITY_SELECTIVITY = 0.1
+REGEX_SELECTIVITY = 0.3
+
+# Relative per-row evaluation cost of filter expressions / Filtr ańlatpalarınıń salıstırmalı bahası
+FILTER_ROW_COST = 1.0
+REGEX_ROW_COST = 10.0
+
+# Operators that must consume all input before producing output
+# Nátiyјe beriwden aldın barlıq kiris ma'limlerin oqıytuǵın operatorlar
+BLOCKING_OPERATORS = {"OrderBy", "Group", "AggregateJoin"}
+
+
+Triple = Tuple[Node, Node, Node]
+
+
+def _increment(counts: Dict[Any, int], key: Any) -> bool:
+    """Count one more ``key``; True if it is new / Sanın arttırıw, jańa bolsa True"""
+    counts[key] = counts.get(key, 0) + 1
+    return counts[key] == 1
+
+
+def _decrement(counts: Dict[Any, int], key: Any) -> bool:
+    """Count one less ``key``; True if it is gone / Sanın kemeytiw, joq bolsa True"""
+    count = counts.get(key, 0) - 1
+    if count > 0:
+        counts[key] = count
+        return False
+    counts.pop(key, None)
+    return True
+
+
+@dataclass
+class GraphStatistics:
+    """
+    Cardinality statistics of a graph used by the cost estimator.
+    Bahá esaplawshı qollanatuǵın graf kardinallıq statistikası.
+
+    Distinct counts are kept with their multiplicities, so ``add`` and
+    ``remove`` update them one triple at a time without a rescan.
+    """
+    triple_count: int = 0
+    subject_count: int = 0
+    object_count: int = 0
+    predicate_counts: Dict[URIRef, int] = field(default_factory=dict)
+    predicate_subjects: Dict[URIRef, int] = field(default_factory=dict)
+    predicate_objects: Dict[URIRef, int] = field(default_factory=dict)
+    class_extents: Dict[Any, int] = field(default_factory=dict)
+    _subjects: Counter = field(default_factory=Counter, repr=False)
+    _objects: Counter = field(default_factory=Counter, repr=False)
+    _pairs_sp: Counter = field(default_factory=Counter, repr=False)
+    _pairs_po: Counter = field(default_factory=Counter, repr=False)
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'GraphStatistics':
+        """
+        Collect statistics in a single pass over the graph.
+        Graf boyınsha bir ret ótip statistika jıynaw.
+
+        Args:
+            graph: RDFLib graph / RDFLib grafı
+
+        Returns:
+            Graph statistics / Graf statistikası
+        """
+        stats = cls()
+        for triple in graph.triples((None, None, None)):
+            stats.add(triple)
+        return stats
+
+    def add(self, triple: Triple) -> None:
+        """
+        Count a triple that was added to the graph.
+        Grafqa qosılǵan triple-dı esapqa alıw.
+        """
+        s, p, o = triple
+        self.triple_count += 1
+        _increment(self.predicate_counts, p)
+        if _increment(self._subjects, s):
+            self.subject_count += 1
+        if _increment(self._objects, o):
+            self.object_count += 1
+        if _increment(self._pairs_sp, (p, s)):
+            _increment(self.predicate_subjects, p)
+        if _increment(self._pairs_po, (p, o)):
+            _increment(self.predicate_objects, p)
+        if p == RDF.type:
+            _increment(self.class_extents, o)
+
+    def remove(self, triple: Triple) -> None:
+        """
+        Uncount a triple that was removed from the graph.
+        Graftan óshirilgen triple-dı esaptan shıǵarıw.
+        """
+        s, p, o = triple
+        self.triple_count -= 1
+        _decrement(self.predicate_counts, p)
+        if _decrement(self._subjects, s):
+            self.subject_count -= 1
+        if _decrement(self._objects, o):
+            self.object_count -= 1
+        if _decrement(self._pairs_sp, (p, s)):
+            _decrement(self.predicate_subjects, p)
+        if _decrement(self._pairs_po, (p, o)):
+            _decrement(self.predicate_objects, p)
+        if p == RDF.type:
+            _decrement(self.class_extents, o)
+
+
+class _SharedStatistics:
+    """
+    Statistics of one graph, rescanned only when a write bypassed ``writing_statistics``.
+    Bir graftıń statistikası, tek jazıw ``writing_statistics``-ten tıs bolsa qayta sanaladı.
+    """
+
+    def __init__(self, graph: Graph, on_release):
+        self._graph = weakref.ref(graph, on_release)
+        self.stats: Optional[GraphStatistics] = None
+        self.stamp: Optional[Tuple[int, int]] = None
+        self.generation = 0
+        self.lock = RLock()
+
+    @property
+    def graph(self) -> Optional[Graph]:
+        return self._graph()
+
+    def current(self) -> GraphStatistics:
+        """Statistics, rescanned if the graph changed unseen / Házirgi statistika"""
+        with self.lock:
+            graph = self.graph
+            stamp = (len(graph), knowledge_version())
+            if self.stats is None or stamp != self.stamp:
+                self.stats = GraphStatistics.from_graph(graph)
+                self.stamp = stamp
+                self.generation += 1
+            return self.stats
+
+
+# Shared statistics per (store, graph name); None names a union graph
+# Hár (saqlaǵısh, graf atı) ushın ortaq statistika; None - birlesken graf
+_statistics: Dict[Tuple[int, Optional[Hashable]], _SharedStatistics] = {}
+_statistics_lock = Lock()
+
+
+def _is_union(graph: Graph) -> bool:
+    """Whether a graph reads every graph of its store / Graf barlıq graflardı oqıy ma"""
+    if isinstance(graph, Dataset):
+        return graph.default_union
+    return isinstance(graph, ConjunctiveGraph)
+
+
+def _statistics_key(graph: Graph) -> Tuple[int, Optional[Hashable]]:
+    if _is_union(graph):
+        return id(graph.store), None
+    if isinstance(graph, ConjunctiveGraph):
+        return id(graph.store), graph.default_context.identifier
+    return id(graph.store), graph.identifier
+
+
+def _shared_statistics(graph: Graph) -> _SharedStatistics:
+    """Entry for a graph, created on first use / Graf ushın jazıw"""
+    key = _statistics_key(graph)
+    with _statistics_lock:
+        shared = _statistics.get(key)
+        if shared is None or shared.graph is None:
+            def release(_, key=key):
+                with _statistics_lock:
+                    if _statistics.get(key) is shared:
+                        del _statistics[key]
+            shared = _statistics[key] = _SharedStatistics(graph, release)
+        return shared
+
+
+def get_graph_statistics(graph: Graph) -> GraphStatistics:
+    """
+    Current statistics of a graph, shared by every estimator on it.
+    Graftıń házirgi statistikası, onıń barlıq bahalawshıları ushın ortaq.
+
+    A named graph of a Dataset has its own statistics, apart from the union.
+    They are rescanned when the graph size or the knowledge version changed
+    outside ``writing_statistics``.
+
+    Examples / Misallar:
+        >>> get_graph_statistics(dataset.graph(criminal_graph)).triple_count
+        165
+    """
+    return _shared_statistics(graph).current()
+
+
+def invalidate_graph_statistics(graph: Graph) -> None:
+    """Rescan a graph's statistics on next use / Keyingi qollanıwda qayta sanaw"""
+    key = _statistics_key(graph)
+    with _statistics_lock:
+        shared = _statistics.get(key)
+    if shared is not None:
+        with shared.lock:
+            shared.stats = None
+            shared.stamp = None
+
+
+@contextmanager
+def writing_statistics(graph: Graph,
+                       triples: Iterable[Triple] = ()) -> Iterator[Callable[[Iterable[Triple]], None]]:
+    """
+    Keep shared statistics current across a write of ``triples`` to ``graph``.
+    ``graph``-qa ``triples`` jazılǵanda ortaq statistikanı jańa halda saqlaw.
+
+    The statistics of the written graph, and of the union graph over its
+    store, are updated from the triples that appeared or disappeared instead
+    of being rescanned. More triples can be announced with the yielded
+    function, before they are written. Bump the knowledge version inside the
+    block. If a rescan happened during the write, the statistics are
+    rescanned again on next use rather than counted twice.
+
+    Examples / Misallar:
+        >>> with writing_statistics(graph) as record:
+        ...     for batch in batches:
+        ...         record(batch)
+        ...         graph.addN((s, p, o, graph) for s, p, o in batch)
+        ...     bump_knowledge_version("triples added")
+    """
+    store = id(graph.store)
+    if _is_union(graph):
+        names = [None, graph.default_context.identifier]
+    else:
+        names = [_statistics_key(graph)[1], None]
+
+    with _statistics_lock:
+        entries = [_statistics.get((store, name)) for name in names]
+    tracked = []
+    for shared in entries:
+        view = shared.graph if shared is not None else None
+        if view is not None:
+            with shared.lock:
+                shared.current()
+                tracked.append((shared, view, shared.generation, [], set()))
+
+    def record(batch: Iterable[Triple]) -> None:
+        batch = list(batch)
+        for _, view, _, written, present in tracked:
+            written.extend(batch)
+            present.update(t for t in batch if t in view)
+
+    record(triples)
+    yield record
+
+    for shared, view, generation, written, present in tracked:
+        with shared.lock:
+            if shared.stats is None or shared.generation != generation:
+                shared.stamp = None
+                continue
+            for triple in written:
+                now = triple in view
+                if now and triple not in present:
+                    shared.stats.add(triple)
+                    present.add(triple)
+                elif not now and triple in present:
+                    shared.stats.remove(triple)
+                    present.discard(triple)
+            shared.stamp = (len(view), knowledge_version())
+
+
+@dataclass
+class QueryCost:
+    """
+    Estimated cost of a SPARQL query.
+    SPARQL sorawınıń bahalanǵan bahası.
+
+    Attributes:
+        estimated_rows: Estimated result rows / Bahalanǵan nátiyјe qatarları
+        estimated_cost: Estimated work units (triples touched) / Bahalanǵan jumıs birlikleri
+        query_type: SelectQuery, AskQuery, ConstructQuery or DescribeQuery
+        has_limit: Whether the query has a LIMIT / Sorawda LIMIT bar ma
+        limit: LIMIT value if present / LIMIT mánisi
+        cartesian_products: Joins without shared variables / Ortaq ózgeriwshisiz birlesiwler
+        regex_filters: REGEX filters evaluated / REGEX filtrleri sanı
+        plan: Indented operator tree with estimates / Bahalar menen operator aǵashı
+        warnings: Human-readable findings / Tabılǵan máseleler
+    """
+    estimated_rows: float = 0.0
+    estimated_cost: float = 0.0
+    query_type: str = ""
+    has_limit: bool = False
+    limit: Optional[int] = None
+    cartesian_products: int = 0
+    regex_filters: int = 0
+    plan: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dict / JSON ushın dict kórinisine aylandırıw"""
+        return {
+            'estimated_rows': round(self.estimated_rows, 2),
+            'estimated_cost': round(self.estimated_cost, 2),
+            'query_type': self.query_type,
+            'has_limit': self.has_limit,
+            'limit': self.limit,
+            'cartesian_products': self.cartesian_products,
+            'regex_filters': self.regex_filters,
+            'plan': list(self.plan),
+            'warnings': list(self.warnings),
+        }
+
+
+class QueryCostEstimator:
+    """
+    Estimate SPARQL query cost from parsed algebra and graph statistics.
+    Talqılanǵan algebra ha'm graf statistikası boyınsha SPARQL soraw bahasın esaplaw.
+
+    Statistics are kept per graph and shared through ``get_graph_statistics``,
+    so a query on a named graph is costed from that graph's counts. Writers
+    update them with ``writing_statistics``; other changes are caught by the
+    graph size and knowledge version, like ``GraphIndex``, and rescanned.
+    Statistika hár graf ushın bólek saqlanadı; jazıwshılar olardı
+    ``writing_statistics`` arqalı jańalaydı.
+
+    Examples / Misallar:
+        >>> estimator = QueryCostEstimator(graph)
+        >>> cost = estimator.estimate(prepareQuery(query).algebra)
+        >>> print(cost.estimated_rows, cost.estimated_cost)
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        Args:
+            graph: Graph the queries will run against / Sorawlar orınlanatuǵın graf
+        """
+        self.graph = graph
+
+    @property
+    def statistics(self) -> GraphStatistics:
+        """Current graph statistics / Házirgi graf statistikası"""
+        return get_graph_statistics(self.graph)
+
+    def invalidate(self) -> None:
+        """Drop cached statistics / Keshlengen statistikani óshiriw"""
+        invalidate_graph_statistics(self.graph)
+
+    def estimate(self, algebra: CompValue, graph: Optional[Graph] = None) -> QueryCost:
+        """
+        Estimate the cost of a translated query.
+        Awdarılǵan sorawdıń bahasın esaplaw.
+
+        Args:
+            algebra: ``prepareQuery(...).algebra`` / Soraw algebrası
+            graph: Graph the query runs on, e.g. a code's named graph, default
+                   the estimator's graph / Soraw orınlanatuǵın graf
+
+        Returns:
+            Query cost estimate / Soraw bahası
+        """
+        stats = get_graph_statistics(self.graph if graph is None else graph)
+        cost = QueryCost(query_type=algebra.name)
+        rows, work = self._walk(algebra.p, stats, cost, set(), 0)
+        cost.estimated_rows = rows
+        cost.estimated_cost = work
+
+        if cost.cartesian_products:
+            cost.warnings.append(
+                f"{cost.cartesian_products} cartesian product(s) between unconnected patterns"
+            )
+        if cost.regex_filters:
+            cost.warnings.append(f"{cost.regex_filters} REGEX filter(s) evaluated per row")
+        if algebra.name == "SelectQuery" and not cost.has_limit:
+            cost.warnings.append("No LIMIT clause")
+
+        return cost
+
+    # ------------------------------------------------------------------
+    # Algebra walk / Algebranı aralaw
+    # ------------------------------------------------------------------
+
+    def _walk(self, node: Any, stats: GraphStatistics, cost: QueryCost,
+              bound: Set[Variable], depth: int) -> Tuple[float, float]:
+        """
+        Return (rows, work) for an algebra node and record plan lines.
+        Algebra túyini ushın (qatarlar, jumıs) qaytarıw.
+        """
+        if not isinstance(node, CompValue):
+            return 1.0, 0.0
+
+        name = node.name
+        line_index = len(cost.plan)
+        cost.plan.append("")
+
+        if name == "BGP":
+            rows, work = self._estimate_bgp(node.triples, stats, cost, bound)
+            detail = f"BGP triples={len(node.triples)}"
+
+        elif name == "Join":
+            rows1, work1 = self._walk(node.p1, stats, cost, bound, depth + 1)
+            vars1 = set(bound) | _node_vars(node.p1)
+            rows2, work2 = self._walk(node.p2, stats, cost, vars1, depth + 1)
+            if vars1 & _node_vars(node.p2):
+                rows = max(min(rows1, rows2), 1.0) if rows1 and rows2 else 0.0
+                work = work1 + work2
+            else:
+                cost.cartesian_products += 1
+                rows = rows1 * rows2
+                work = work1 + rows1 * max(work2, 1.0)
+            detail = "Join"
+
+        elif name == "LeftJoin":
+            rows1, work1 = self._walk(node.p1, stats, cost, bound, depth + 1)
+            _, work2 = self._walk(node.p2, stats, cost, set(bound) | _node_vars(node.p1), depth + 1)
+            rows, work = rows1, work1 + work2
+            detail = "LeftJoin"
+
+        elif name == "Union":
+            rows1, work1 = self._walk(node.p1, stats, cost, bound, depth + 1)
+            rows2, work2 = self._walk(node.p2, stats, cost, bound, depth + 1)
+            rows, work = rows1 + rows2, work1 + work2
+            detail = "Union"
+
+        elif name == "Minus":
+            rows1, work1 = self._walk(node.p1, stats, cost, bound, depth + 1)
+            _, work2 = self._walk(node.p2, stats, cost, bound, depth + 1)
+            rows, work = rows1, work1 + work2
+            detail = "Minus"
+
+        elif name == "Filter":
+            child_rows, child_work = self._walk(node.p, stats, cost, bound, depth + 1)
+            selectivity, row_cost = self._filter_factors(node.expr, cost)
+            rows = child_rows * selectivity
+            work = child_work + child_rows * row_cost
+            detail = f"Filter selectivity={selectivity:g}"
+
+        elif name == "Slice":
+            child_rows, child_work = self._walk(node.p, stats, cost, bound, depth + 1)
+            length = node.get('length')
+            start = node.get('start') or 0
+            rows, work = child_rows, child_work
+            if length is not None:
+                cost.has_limit = True
+                cost.limit = int(length)
+                rows = min(child_rows, float(length))
+                if child_rows > 0 and not _contains_blocking(node.p):
+                    # Evaluation is lazy, so LIMIT stops it early
+                    # Orınlaw jalqaw, sonlıqtan LIMIT onı erte toqtatadı
+                    work = child_work * min(1.0, (float(length) + start) / child_rows)
+            detail = f"Slice limit={length} offset={start}"
+
+        elif name == "OrderBy":
+            rows, child_work = self._walk(node.p, stats, cost, bound, depth + 1)
+            work = child_work + rows * math.log2(rows + 1)
+            detail = "OrderBy"
+
+        elif name in ("Group", "AggregateJoin"):
+            child_rows, work = self._walk(node.p, stats, cost, bound, depth + 1)
+            rows = math.sqrt(child_rows) if node.get('expr') or name == "Group" else 1.0
+            detail = name
+
+        elif name == "ToMultiSet" and isinstance(node.get('p'), CompValue) \
+                and node.p.name == "values":
+            rows, work = float(len(node.p.res)), 0.0
+            detail = "Values"
+
+        elif isinstance(node.get('p'), CompValue):
+            rows, work = self._walk(node.p, stats, cost, bound, depth + 1)
+            detail = name
+
+        else:
+            rows, work = 1.0, 0.0
+            detail = name
+
+        cost.plan[line_index] = (
+            f"{'  ' * depth}{detail} rows≈{rows:.0f} cost≈{work:.0f}"
+        )
+        return rows, work
+
+    def _estimate_bgp(self, triples: List[Tuple[Any, Any, Any]], stats: GraphStatistics,
+                      cost: QueryCost, bound: Set[Variable]) -> Tuple[float, float]:
+        """
+        Estimate a basic graph pattern evaluated as nested index lookups.
+        Tiykarǵı graf úlgisin izbe-iz indeks izlewleri retinde bahalaw.
+        """
+        bound = set(bound)
+        rows = 1.0
+        work = 0.0
+
+        for position, (s, p, o) in enumerate(triples):
+            pattern_vars = {t for t in (s, p, o) if isinstance(t, Variable)}
+            if position > 0 and pattern_vars and not (pattern_vars & bound):
+                cost.cartesian_products += 1
+
+            card = self._pattern_cardinality(s, p, o, stats, bound)
+            work += rows * max(card, 1.0)
+            rows *= card
+            bound |= pattern_vars
+
+        return rows, work
+
+    def _pattern_cardinality(self, s: Any, p: Any, o: Any, stats: GraphStatistics,
+                             bound: Set[Variable]) -> float:
+        """
+        Estimate matches of one triple pattern given already-bound variables.
+        Aldınnan baylanǵan ózgeriwshiler menen bir triple úlgisiniń sáykesliklerin bahalaw.
+        """
+
+        def is_bound(term: Any) -> bool:
+            return not isinstance(term, Variable) or term in bound
+
+        s_bound, p_bound, o_bound = is_bound(s), is_bound(p), is_bound(o)
+
+        if s_bound and p_bound and o_bound:
+            return 1.0
+
+        if p_bound and not isinstance(p, Variable):
+            count = stats.predicate_counts.get(p, 0)
+            if count == 0:
+                return 0.0
+            if p == RDF.type and o_bound and not isinstance(o, Variable):
+                extent = float(stats.class_extents.get(o, 0))
+                return 1.0 if s_bound and extent else extent
+            if s_bound:
+                return count / max(stats.predicate_subjects.get(p, 1), 1)
+            if o_bound:
+                return count / max(stats.predicate_objects.get(p, 1), 1)
+            return float(count)
+
+        total = float(stats.triple_count)
+        if s_bound and o_bound:
+            return max(total / max(stats.subject_count * stats.object_count, 1), 1.0)
+        if s_bound:
+            return total / max(stats.subject_count, 1)
+        if o_bound:
+            return total / max(stats.object_count, 1)
+        return total
+
+    def _filter_factors(self, expr: Any, cost: QueryCost) -> Tuple[float, float]:
+        """
+        Return (selectivity, per-row cost) of a filter expression.
+        Filtr ańlatpasınıń (saylawshańlıq, qatar bahası) jubın qaytarıw.
+        """
+        selectivity = DEFAULT_SELECTIVITY
+        row_cost = FILTER_ROW_COST
+
+        for sub in _iter_expressions(expr):
+            name = getattr(sub, 'name', '')
+            if name == "Builtin_REGEX":
+                cost.regex_filters += 1
+                selectivity = min(selectivity, REGEX_SELECTIVITY)
+                row_cost += REGEX_ROW_COST
+            elif name == "RelationalExpression" and sub.get('op') == '=':
+                selectivity = min(selectivity, EQUALITY_SELECTIVITY)
+            elif name == "TrueFilter":
+                selectivity = 1.0
+
+        return selectivity, row_cost
+
+
+def _node_vars(node: Any) -> Set[Variable]:
+    """Variables in scope of an algebra node / Algebra túyinindegi ózgeriwshiler"""
+    if isinstance(node, CompValue):
+        return set(node.get('_vars') or ())
+    return set()
+
+
+def _contains_blocking(node: Any) -> bool:
+    """Whether the subtree has an operator that reads all input / Bloklawshı operator bar ma"""
+    if not isinstance(node, CompValue):
+        return False
+    if node.name in BLOCKING_OPERATORS:
+        return True
+    return any(_contains_blocking(node.get(key)) for key in ('p', 'p1', 'p2'))
+
+
+def _iter_expressions(expr: Any):
+    """Yield every CompValue inside a filter expression / Filtr ishindegi barlıq túyinler"""
+    stack = [expr]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, CompValue):
+            yield item
+            stack.extend(v for k, v in item.items() if k != '_vars')
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+
+
+def add_limit(query: str, limit: int) -> str:
+    """
+    Append a LIMIT clause to a SELECT query that has none.
+    LIMIT joq SELECT sorawına LIMIT qosıw.
+
+    Args:
+        query: SPARQL query text / SPARQL soraw teksti
+        limit: Row limit / Qatar shegi
+
+    Returns:
+        Rewritten query text / Qayta jazılǵan soraw teksti
+    """
+    return f"{query.rstrip()}\nLIMIT {int(limit)}\n"
+
@@ -0,0 +1,224 @@
+"""
+Query deadlines and cooperative cancellation for in-process SPARQL evaluation
+Jergilikli SPARQL orınlaw ushın soraw waqıt shegi ha'm biykarlaw
+
+RDFLib evaluates SPARQL lazily by pulling triples from the store. This module
+wraps the store of a graph so that every triple pulled by the evaluator checks a
+shared deadline, which lets a runaway query (for example a REGEX filter over all
+labels) be aborted from the inside instead of running unbounded.
+
+RDFLib SPARQL sorawların store-dan triple-lardı alıp orınlaydı. Bul modul graf
+store-ın oraydı, sonda hár bir alınǵan triple waqıt shegin tekseredi ha'm
+shegaralanbaǵan soraw ishinen toqtatıladı.
+"""
+
+import time
+from threading import Event
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from rdflib import ConjunctiveGraph, Dataset, Graph
+from rdflib.query import Result
+from rdflib.store import Store
+
+
+class DeadlineExceeded(Exception):
+    """
+    Raised from inside query evaluation when the deadline passes or the query is cancelled.
+    Waqıt shegi ótkende yamasa soraw biykarlanǵanda orınlaw ishinen qaldırıladı.
+    """
+
+    def __init__(self, elapsed: float, cancelled: bool = False):
+        """
+        Args:
+            elapsed: Seconds spent before aborting / Toqtatıwǵa shekem ótken sekundlar
+            cancelled: True if cancelled explicitly / Anıq biykarlanǵan bolsa True
+        """
+        self.elapsed = elapsed
+        self.cancelled = cancelled
+        reason = "cancelled" if cancelled else "deadline exceeded"
+        super().__init__(f"Query {reason} after {elapsed:.3f}s")
+
+
+class QueryDeadline:
+    """
+    Deadline and cancellation token shared by one query evaluation.
+    Bir soraw orınlawı ushın ortaq waqıt shegi ha'm biykarlaw belgisi.
+
+    The token is thread-safe: ``cancel()`` may be called from another thread
+    (for example from an API worker whose client disconnected) while the query
+    is being evaluated.
+
+    Examples / Misallar:
+        >>> deadline = QueryDeadline(timeout=2.0)
+        >>> results = run_with_deadline(graph, prepared_query, deadline)
+        >>> # From another thread / Basqa aǵımnan
+        >>> deadline.cancel()
+    """
+
+    # Check the clock once per this many triples / Saattı hár N triple sayın tekseriw
+    CHECK_INTERVAL = 64
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: Seconds allowed, None or <= 0 for no limit
+                     Ruxsat etilgen sekundlar, shekleme ushın None yamasa <= 0
+        """
+        self.timeout = timeout if timeout and timeout > 0 else None
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + self.timeout if self.timeout else None
+        self._cancelled = Event()
+        self._ticks = 0
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the deadline was created / Jaratılǵannan beri ótken sekundlar"""
+        return time.monotonic() - self.started_at
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether ``cancel()`` was called / ``cancel()`` shaqırılǵan ba"""
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """
+        Request cooperative cancellation of the running query.
+        Orınlanıp atırǵan sorawdı biykarlawdı soraw.
+        """
+        self._cancelled.set()
+
+    def check(self) -> None:
+        """
+        Raise DeadlineExceeded if cancelled or past the deadline.
+        Biykarlanǵan yamasa waqıt shegi ótken bolsa DeadlineExceeded qaldırıw.
+        """
+        if self._cancelled.is_set():
+            raise DeadlineExceeded(self.elapsed, cancelled=True)
+        if self.expires_at is not None and time.monotonic() > self.expires_at:
+            raise DeadlineExceeded(self.elapsed)
+
+    def tick(self) -> None:
+        """
+        Cheap per-triple check; consults the clock every CHECK_INTERVAL calls.
+        Hár triple ushın arzan tekseriw; saat hár CHECK_INTERVAL shaqırıwda tekseriledi.
+        """
+        self._ticks += 1
+        if self._ticks % self.CHECK_INTERVAL == 0:
+            self.check()
+
+
+class _DeadlineStore(Store):
+    """
+    Read-through store proxy that checks a deadline for every yielded triple.
+    Hár bir qaytarılǵan triple ushın waqıt shegin tekseretuǵın store proksisi.
+    """
+
+    def __init__(self, store: Store, deadline: QueryDeadline):
+        super().__init__()
+        self._store = store
+        self._deadline = deadline
+        self.context_aware = store.context_aware
+        self.formula_aware = store.formula_aware
+        self.graph_aware = store.graph_aware
+        self.transaction_aware = store.transaction_aware
+
+    def triples(self, triple_pattern: Tuple[Any, Any, Any], context: Optional[Graph] = None
+                ) -> Iterator[Tuple[Tuple[Any, Any, Any], Iterator[Any]]]:
+        tick = self._deadline.tick
+        for item in self._store.triples(triple_pattern, context):
+            tick()
+            yield item
+
+    def __len__(self, context: Optional[Graph] = None) -> int:
+        return self._store.__len__(context)
+
+    def contexts(self, triple: Optional[Tuple[Any, Any, Any]] = None) -> Iterator[Graph]:
+        return self._store.contexts(triple)
+
+    def add(self, triple, context, quoted=False):
+        return self._store.add(triple, context, quoted)
+
+    def addN(self, quads):
+        return self._store.addN(quads)
+
+    def remove(self, triple, context=None):
+        return self._store.remove(triple, context)
+
+    def add_graph(self, graph):
+        return self._store.add_graph(graph)
+
+    def remove_graph(self, graph):
+        return self._store.remove_graph(graph)
+
+    def bind(self, prefix, namespace, override=True):
+        return self._store.bind(prefix, namespace, override=override)
+
+    def prefix(self, namespace):
+        return self._store.prefix(namespace)
+
+    def namespace(self, prefix):
+        return self._store.namespace(prefix)
+
+    def namespaces(self):
+        return self._store.namespaces()
+
+
+def guard_graph(graph: Graph, deadline: QueryDeadline) -> Graph:
+    """
+    Return a view of ``graph`` whose triple lookups honour ``deadline``.
+    Triple izlewleri ``deadline``-ǵa boysınatuǵın ``graph`` kórinisin qaytarıw.
+
+    The view shares the underlying store, so no data is copied.
+    Kórinis tiykarǵı store-dı bólisedi, sonlıqtan ma'limler kóshirilmeydi.
+
+    Args:
+        graph: Graph, ConjunctiveGraph or Dataset / Graf
+        deadline: Deadline token / Waqıt shegi belgisi
+
+    Returns:
+        Guarded graph view / Qorǵalǵan graf kórinisi
+    """
+    store = _DeadlineStore(graph.store, deadline)
+
+    if isinstance(graph, Dataset):
+        view: Graph = Dataset(store=store, default_union=graph.default_union)
+    elif isinstance(graph, ConjunctiveGraph):
+        view = ConjunctiveGraph(store=store, identifier=graph.default_context.identifier)
+    else:
+        view = Graph(store=store, identifier=graph.identifier)
+
+    view.namespace_manager = graph.namespace_manager
+    return view
+
+
+def run_with_deadline(
+    graph: Graph,
+    query: Any,
+    deadline: QueryDeadline,
+    init_bindings: Optional[Dict[str, Any]] = None
+) -> Result:
+    """
+    Evaluate a query against ``graph`` and fully materialize it under ``deadline``.
+    Sorawdı ``graph`` boyınsha orınlaw ha'm ``deadline`` astında tolıq materiallastırıw.
+
+    SELECT results are lazy in RDFLib, so the bindings are materialized here
+    while the deadline is still enforced rather than later in the caller.
+
+    Args:
+        graph: Graph to query / Soraw beriletuǵın graf
+        query: Query string or prepared query / Soraw júrgen shıǵı yamasa tayarlanǵan soraw
+        deadline: Deadline token / Waqıt shegi belgisi
+        init_bindings: Initial variable bindings / Baslanǵısh ózgeriwshi baylanısları
+
+    Returns:
+        Materialized query result / Materiallastırılǵan soraw nátiyјesi
+
+    Raises:
+        DeadlineExceeded: If the deadline passes or the query is cancelled
+    """
+    deadline.check()
+    view = guard_graph(graph, deadline)
+    results = view.query(query, initBindings=init_bindings or {})
+    # Force evaluation inside the deadline / Orınlawdı waqıt shegi ishinde májbúrlew
+    len(results)
+    return results
@@ -0,0 +1,350 @@
+"""
+Per-template query statistics and slow-query log
+Úlgi boyınsha soraw statistikası ha'm áste sorawlar jurnalı
+
+Queries are grouped by a fingerprint: the query text with comments removed,
+literals and numbers replaced by placeholders and whitespace collapsed. For
+every fingerprint a latency histogram (p50/p95/p99), row counts and cache hit
+ratio are kept. Queries slower than a configurable threshold are recorded in a
+bounded slow-query log together with their bindings and cost plan.
+
+Sorawlar izi (fingerprint) boyınsha toparlanadı: kommentariyalar alıp taslanǵan,
+literallar ha'm sanlar orın iyeleri menen almastırılǵan soraw teksti. Hár bir iz
+ushın keshigiw gistogramması, qatar sanları ha'm kesh úlesi saqlanadı.
+"""
+
+import hashlib
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from src.core.config import get_config
+
+
+# Latency bucket upper bounds in seconds / Keshigiw sebetleriniń joqarǵı shegi (sekund)
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float('inf'),
+)
+
+_COMMENT_RE = re.compile(r'#[^\n]*')
+_STRING_RE = re.compile(r'"""(?:.|\n)*?"""|\'\'\'(?:.|\n)*?\'\'\'|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'')
+_IRI_RE = re.compile(r'<[^<>\s]*>')
+_NUMBER_RE = re.compile(r'(?<![\w:?$])[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b')
+_SPACE_RE = re.compile(r'\s+')
+_VALUES_RE = re.compile(r'\bVALUES\s+(\?\w+|\([^()]*\))\s*\{[^{}]*\}', re.IGNORECASE)
+
+
+def fingerprint_query(query: str) -> Tuple[str, str, List[str]]:
+    """
+    Normalize a query into a template fingerprint.
+    Sorawdı úlgi izine normalizaciyalaw.
+
+    IRIs are kept (they identify the shape of the query); string literals and
+    numbers become ``?``. A ``VALUES`` block is data, not shape: its body
+    becomes ``...`` so queries binding different index hits share a template.
+
+    Args:
+        query: SPARQL query text / SPARQL soraw teksti
+
+    Returns:
+        (fingerprint id, normalized template, extracted literal values)
+        (iz identifikatorı, normalizaciyalanǵan úlgi, alınǵan literal mánisleri)
+
+    Examples / Misallar:
+        >>> fid, template, params = fingerprint_query('SELECT ?s WHERE { ?s ?p "urılıq" } LIMIT 10')
+        >>> template
+        'SELECT ?s WHERE { ?s ?p ? } LIMIT ?'
+        >>> params
+        ['"urılıq"', '10']
+    """
+    params: List[str] = []
+    iris: List[str] = []
+
+    def keep_iri(match: 're.Match[str]') -> str:
+        iris.append(match.group(0))
+        return f"\x00iri{len(iris) - 1}\x00"
+
+    def placeholder(match: 're.Match[str]') -> str:
+        params.append(match.group(0))
+        return '?'
+
+    text = _STRING_RE.sub(placeholder, query)
+    text = _IRI_RE.sub(keep_iri, text)
+    text = _COMMENT_RE.sub(' ', text)
+    text = _NUMBER_RE.sub(placeholder, text)
+    text = _VALUES_RE.sub(lambda m: f"VALUES {m.group(1)} {{ ... }}", text)
+    text = _SPACE_RE.sub(' ', text).strip()
+    text = re.sub(r'\x00iri(\d+)\x00', lambda m: iris[int(m.group(1))], text)
+
+    digest = hashlib.sha1(text.encode('utf-8')).hexdigest()[:12]
+    return digest, text, params
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram with percentile estimates.
+    Procentil bahaları menen turaqlı sebetli keshigiw gistogramması.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one observation / Bir ólshewdi jazıw"""
+        for index, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Estimate a percentile by linear interpolation inside its bucket.
+        Procentildi sebet ishinde sızıqlı interpolyaciya menen bahalaw.
+
+        Args:
+            q: Percentile in [0, 100] / Procentil
+
+        Returns:
+            Estimated latency in seconds / Bahalanǵan keshigiw sekundlarda
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q / 100.0 * self.count
+        cumulative = 0
+        lower = 0.0
+        for bound, bucket_count in zip(self.buckets, self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                upper = min(bound, self.max)
+                fraction = (rank - cumulative) / bucket_count
+                return lower + (max(upper, lower) - lower) * fraction
+            cumulative += bucket_count
+            lower = bound
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        """Summary with percentiles / Procentiller menen juwmaq"""
+        return {
+            'count': self.count,
+            'avg': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+@dataclass
+class TemplateStats:
+    """
+    Statistics for one query template.
+    Bir soraw úlgisi ushın statistika.
+    """
+    fingerprint: str
+    template: str
+    executions: int = 0
+    cached: int = 0
+    errors: int = 0
+    total_rows: int = 0
+    last_seen: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dict / JSON ushın dict kórinisine aylandırıw"""
+        calls = self.executions + self.cached
+        return {
+            'fingerprint': self.fingerprint,
+            'template': self.template,
+            'executions': self.executions,
+            'cached': self.cached,
+            'errors': self.errors,
+            'cache_hit_ratio': self.cached / calls if calls else 0.0,
+            'total_rows': self.total_rows,
+            'avg_rows': self.total_rows / self.executions if self.executions else 0.0,
+            'latency': self.latency.to_dict(),
+            'last_seen': self.last_seen,
+        }
+
+
+class QueryStatsCollector:
+    """
+    Thread-safe collector of per-template statistics and slow queries.
+    Úlgi statistikası ha'm áste sorawlardıń aǵımǵa qáwipsiz jıynawshısı.
+
+    Examples / Misallar:
+        >>> stats = get_query_stats()
+        >>> stats.record(query, duration=0.12, rows=5)
+        >>> stats.templates(sort_by='p95')[0]['latency']['p95']
+        >>> stats.slow_queries()
+    """
+
+    def __init__(
+        self,
+        slow_threshold: float = 1.0,
+        slow_log_size: int = 100,
+        max_templates: int = 1000
+    ):
+        """
+        Args:
+            slow_threshold: Seconds after which a query is logged as slow / Áste soraw shegi
+            slow_log_size: Slow-query entries kept / Saqlanatuǵın áste sorawlar sanı
+            max_templates: Templates tracked before evicting the oldest / Úlgiler shegi
+        """
+        self.slow_threshold = slow_threshold
+        self.max_templates = max_templates
+        self._templates: Dict[str, TemplateStats] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=slow_log_size)
+        self._lock = Lock()
+
+    def record(
+        self,
+        query: str,
+        duration: float,
+        rows: int = 0,
+        cached: bool = False,
+        error: bool = False,
+        bindings: Optional[Dict[str, Any]] = None,
+        plan: Optional[Callable[[], List[str]]] = None
+    ) -> str:
+        """
+        Record one query execution.
+        Bir soraw orınlawın jazıw.
+
+        Args:
+            query: Query text / Soraw teksti
+            duration: Execution time in seconds / Orınlaw waqtı sekundlarda
+            rows: Result rows / Nátiyјe qatarları
+            cached: Served from cache / Keshten berildi me
+            error: Execution failed / Orınlaw sátsiz boldı ma
+            bindings: Explicit variable bindings / Anıq ózgeriwshi baylanısları
+            plan: Callable returning the cost plan, only called for slow queries
+                  Tek áste sorawlar ushın shaqırılatuǵın baha jobası funkciyası
+
+        Returns:
+            Query fingerprint id / Soraw izi identifikatorı
+        """
+        fid, template, params = fingerprint_query(query)
+        now = time.time()
+
+        with self._lock:
+            stats = self._templates.get(fid)
+            if stats is None:
+                if len(self._templates) >= self.max_templates:
+                    oldest = min(self._templates.values(), key=lambda t: t.last_seen)
+                    del self._templates[oldest.fingerprint]
+                stats = TemplateStats(fingerprint=fid, template=template)
+                self._templates[fid] = stats
+
+            stats.last_seen = now
+            if cached:
+                stats.cached += 1
+                return fid
+            stats.executions += 1
+            if error:
+                stats.errors += 1
+            stats.total_rows += rows
+            stats.latency.observe(duration)
+
+        if not cached and duration >= self.slow_threshold:
+            try:
+                plan_lines = plan() if plan else []
+            except Exception:
+                plan_lines = []
+            entry = {
+                'timestamp': now,
+                'fingerprint': fid,
+                'duration': duration,
+                'rows': rows,
+                'error': error,
+                'query': query,
+                'bindings': {k: str(v) for k, v in (bindings or {}).items()} or params,
+                'plan': plan_lines,
+            }
+            with self._lock:
+                self._slow.append(entry)
+            logger.warning(
+                f"Slow query {fid} took {duration:.3f}s / "
+                f"Áste soraw {fid} {duration:.3f}s aldı"
+            )
+
+        return fid
+
+    def templates(self, sort_by: str = 'total', limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Per-template summaries, slowest first.
+        Úlgi juwmaqları, eń áste birinshi.
+
+        Args:
+            sort_by: 'total', 'count', 'p50', 'p95' or 'p99' / Sortlaw gilti
+            limit: Maximum templates returned / Eń kóp úlgiler
+
+        Returns:
+            List of template summaries / Úlgi juwmaqları listi
+        """
+        with self._lock:
+            summaries = [t.to_dict() for t in self._templates.values()]
+
+        def key(summary: Dict[str, Any]) -> float:
+            latency = summary['latency']
+            if sort_by == 'total':
+                return latency['avg'] * latency['count']
+            return latency.get(sort_by, summary.get(sort_by, 0))
+
+        summaries.sort(key=key, reverse=True)
+        return summaries[:limit] if limit else summaries
+
+    def slow_queries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Most recent slow queries, newest first.
+        Eń sońǵı áste sorawlar, jańası birinshi.
+
+        Args:
+            limit: Maximum entries / Eń kóp jazıwlar
+
+        Returns:
+            Slow-query log entries / Áste soraw jurnalı jazıwları
+        """
+        with self._lock:
+            entries = list(reversed(self._slow))
+        return entries[:limit] if limit else entries
+
+    def reset(self) -> None:
+        """Clear all statistics / Barlıq statistikani tazalaw"""
+        with self._lock:
+            self._templates.clear()
+            self._slow.clear()
+
+
+# Process-wide collector / Process boyınsha jıynawshı
+_query_stats: Optional[QueryStatsCollector] = None
+
+
+def get_query_stats() -> QueryStatsCollector:
+    """
+    Get the process-wide query statistics collector.
+    Process boyınsha soraw statistikası jıynawshısın alıw.
+
+    Returns:
+        QueryStatsCollector instance / QueryStatsCollector misalı
+    """
+    global _query_stats
+    if _query_stats is None:
+        sparql = get_config().sparql
+        _query_stats = QueryStatsCollector(
+            slow_threshold=sparql.slow_query_threshold,
+            slow_log_size=sparql.slow_query_log_size
+        )
+    return _query_stats
@@ -35,6 +35,8 @@ from owlready2 import (
 from rdflib import Graph, URIRef, Literal, Namespace
 from rdflib.namespace import RDF, RDFS, OWL
 
+from src.utils.metrics import get_metrics_registry
+
 # Configure logging / Jurnal yazıwdı konfiguraciyalaw
 logging.basicConfig(
     level=logging.INFO,
@@ -42,6 +44,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Metrics / Metrikalar
+_metrics = get_metrics_registry()
+REASONING_DURATION = _metrics.histogram(
+    "huquqai_reasoning_duration_seconds", "Reasoner run time by operation", ["operation"]
+)
+REASONING_INFERENCES = _metrics.counter(
+    "huquqai_reasoning_inferences_total", "Inferences made by operation", ["operation"]
+)
+
 
 # ============================================================================
 # Custom Exceptions / Maxsus istinalar
@@ -346,6 +357,7 @@ class ReasoningEngine:
             self.stats['last_reasoning_time'] = execution_time
             self.stats['total_reasoning_time'] += execution_time
             self.stats['reasoning_runs'] += 1
+            REASONING_DURATION.labels(operation="consistency").observe(execution_time)
 
             if inconsistent_classes:
                 self.stats['inconsistencies_found'] += len(inconsistent_classes)
@@ -443,6 +455,8 @@ class ReasoningEngine:
             self.stats['total_reasoning_time'] += execution_time
             self.stats['reasoning_runs'] += 1
             self.stats['inferences_made'] += len(inferences)
+            REASONING_DURATION.labels(operation="classify").observe(execution_time)
+            REASONING_INFERENCES.labels(operation="classify").inc(len(inferences))
 
             logger.info(
                 f"Classification completed: {len(inferences)} inferences in {execution_time:.4f}s / "
@@ -519,6 +533,8 @@ class ReasoningEngine:
             self.stats['total_reasoning_time'] += execution_time
             self.stats['reasoning_runs'] += 1
             self.stats['inferences_made'] += len(inferences)
+            REASONING_DURATION.labels(operation="infer_facts").observe(execution_time)
+            REASONING_INFERENCES.labels(operation="infer_facts").inc(len(inferences))
 
             logger.info(
                 f"Fact inference completed in {execution_time:.4f}s / "
@@ -608,6 +624,7 @@ class ReasoningEngine:
                 severity.value
             ))
             self.stats['inferences_made'] += 1
+            REASONING_INFERENCES.labels(operation="crime_severity").inc()
 
             return severity
 
@@ -683,6 +700,7 @@ class ReasoningEngine:
                     punishment_type.value
                 ))
                 self.stats['inferences_made'] += 1
+                REASONING_INFERENCES.labels(operation="punishment_type").inc()
 
             return punishment_type
 
@@ -17,13 +17,37 @@ from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib import Dataset, Graph, Literal, Namespace, URIRef
 from rdflib.plugins.sparql import prepareQuery
 from rdflib.plugins.sparql.processor import SPARQLResult
 from loguru import logger
 
 from src.core.config import get_config
-from src.core.ontology_manager import get_ontology_manager
+from src.core.graph_index import (
+    HUQUQ_FACETS, get_article_index, get_facet_index, get_range_index, values_clause,
+)
+from src.core.ontology_manager import code_graph_id, get_ontology_manager, normalize_code
+from src.core.query_cost import QueryCost, QueryCostEstimator, add_limit
+from src.core.query_deadline import DeadlineExceeded, QueryDeadline, run_with_deadline
+from src.core.query_stats import get_query_stats
+from src.utils.metrics import get_metrics_registry
+from src.utils.normalization import FUNCTION_NS, register_sparql_functions, search_key, search_tokens
+from src.utils.tracing import current_span, traced
+
+# hf:searchKey for normalized label matching / Normalizaciyalanǵan label sáykesligi ushın
+register_sparql_functions()
+
+# Metrics / Metrikalar
+_metrics = get_metrics_registry()
+SPARQL_QUERIES = _metrics.counter(
+    "huquqai_sparql_queries_total", "In-process SPARQL queries by outcome", ["status"]
+)
+SPARQL_DURATION = _metrics.histogram(
+    "huquqai_sparql_query_duration_seconds", "In-process SPARQL evaluation time"
+)
+CACHE_REQUESTS = _metrics.counter(
+    "huquqai_cache_requests_total", "Cache lookups by cache and result", ["cache", "result"]
+)
 
 
 class SPARQLEngineError(Exception):
@@ -53,6 +77,50 @@ class QueryValidationError(SPARQLEngineError):
     pass
 
 
+class QueryRejectedError(QueryValidationError):
+    """
+    Exception raised when admission control rejects an expensive query.
+    Qabıllaw qadaǵalawı qımbat sorawdı biykarlaǵanda qaldırılatuǵın istisna.
+    """
+    def __init__(self, message: str, message_kaa: Optional[str] = None,
+                 cost: Optional[QueryCost] = None):
+        """
+        Args:
+            message: Error message in English / Inglizше qátelik xabarı
+            message_kaa: Error message in Karakalpak / Qaraqalpaqsha qátelik xabarı
+            cost: Estimated query cost / Sorawdıń bahalanǵan bahası
+        """
+        super().__init__(message, message_kaa)
+        self.cost = cost
+
+
+class QueryTimeoutError(SPARQLEngineError):
+    """
+    Exception raised when in-process evaluation exceeds its deadline.
+    Jergilikli orınlaw waqıt shegin asıp ketkende qaldırılatuǵın istisna.
+    """
+    def __init__(self, message: str, message_kaa: Optional[str] = None,
+                 timeout: Optional[float] = None, elapsed: float = 0.0):
+        """
+        Args:
+            message: Error message in English / Inglizше qátelik xabarı
+            message_kaa: Error message in Karakalpak / Qaraqalpaqsha qátelik xabarı
+            timeout: Configured timeout in seconds / Sazlanǵan waqıt shegi
+            elapsed: Seconds spent before aborting / Toqtatıwǵa shekem ótken sekundlar
+        """
+        super().__init__(message, message_kaa)
+        self.timeout = timeout
+        self.elapsed = elapsed
+
+
+class QueryCancelledError(QueryTimeoutError):
+    """
+    Exception raised when a running query is cancelled cooperatively.
+    Orınlanıp atırǵan soraw biykarlanǵanda qaldırılatuǵın istisna.
+    """
+    pass
+
+
 class SPARQLEngine:
     """
     SPARQL Query Engine optimized for Karakalpak legal content.
@@ -61,7 +129,10 @@ class SPARQLEngine:
     This engine provides high-performance SPARQL query execution with:
     - Query caching (LRU) / Soraw keshlawi (LRU)
     - Query validation / Soraw validaciya
-    - Performance logging / Performans loglaw
+    - Cost-based admission control / Bahaǵa tiykarlanǵan qabıllaw qadaǵalawı
+    - Hard execution deadlines / Qatań orınlaw waqıt shegi
+    - Per-template latency histograms and slow-query log
+      Úlgi boyınsha keshigiw gistogrammaları ha'm áste sorawlar jurnalı
     - UTF-8 support for Karakalpak / Qaraqalpaq ushın UTF-8 qollap-quwatlawish
     - Parameterized queries / Parametrlengen sorawlar
 
@@ -104,16 +175,32 @@ class SPARQLEngine:
         # Setup namespaces / Namespace-lardı ornatiw
         self.namespaces = self._setup_namespaces()
 
+        # Views of per-code named graphs / Kodeks boyınsha atamalı graf kórinisleri
+        self._partitions: Dict[URIRef, Graph] = {}
+
+        # Default in-process deadline / Jergilikli orınlaw ushın áhmiyetli waqıt shegi
+        self.default_timeout: Optional[float] = float(self.config.sparql.max_execution_time)
+
+        # Cost estimation and admission control / Bahá esaplaw ha'm qabıllaw qadaǵalawı
+        self.admission = self.config.sparql.admission
+        self.cost_estimator = QueryCostEstimator(self.graph)
+
+        # Per-template statistics shared by all engines / Barlıq mexanizmler ushın úlgi statistikası
+        self.query_stats = get_query_stats()
+
         # Query statistics / Soraw statistikası
         self.stats = {
             'total_queries': 0,
             'cached_queries': 0,
             'failed_queries': 0,
+            'timed_out_queries': 0,
+            'rejected_queries': 0,
+            'auto_limited_queries': 0,
             'total_execution_time': 0.0,
             'avg_execution_time': 0.0,
         }
 
-        logger.info("SPARQLEngine initialized / SPARQL Mexanizmi inizializaciya etildi")
+        logger.debug("SPARQLEngine initialized / SPARQL Mexanizmi inizializaciya etildi")
 
     def _setup_namespaces(self) -> Dict[str, Namespace]:
         """
@@ -180,28 +267,56 @@ class SPARQLEngine:
             logger.error(f"{error_msg} / {error_msg_kaa}")
             raise QueryValidationError(error_msg, error_msg_kaa) from e
 
+    @traced("sparql_engine.execute")
     def _execute_query(
         self,
         query: str,
         validate: bool = True,
-        use_cache: bool = True
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+        deadline: Optional[QueryDeadline] = None,
+        bindings: Optional[Dict[str, Any]] = None,
+        graph: Optional[Graph] = None,
+        admit: bool = True
     ) -> SPARQLResult:
         """
         Execute SPARQL query with validation and caching.
         Validaciya ha'm keshlaw menen SPARQL sorawdı orınlaw.
 
+        Evaluation runs under a hard deadline (``timeout`` seconds, or
+        ``sparql.max_execution_time`` by default) and is aborted from inside
+        RDFLib once it passes.
+
+        Orınlaw qatań waqıt shegi astında júredi ha'm ol ótkende RDFLib
+        ishinen toqtatıladı.
+
         Args:
             query: SPARQL query / SPARQL soraw
             validate: Validate before execution / Orınlawdan aldın validaciyalaw
             use_cache: Use cache if available / Keshni qollanıw
+            timeout: Deadline in seconds, 0 disables / Waqıt shegi sekundlarda, 0 óshiredi
+            deadline: Caller-owned deadline for cancellation / Biykarlaw ushın shaqırıwshı belgisi
+            bindings: Initial variable bindings / Baslanǵısh ózgeriwshi baylanısları
+            graph: Graph to query instead of the whole graph / Soraw beriletuǵın graf
+            admit: Apply admission control; False for the engine's own templates
+                   Qabıllaw qadaǵalawın qollanıw; mexanizmniń óz úlgileri ushın False
 
         Returns:
             SPARQL query results / SPARQL soraw nátiyјeleri
 
         Raises:
+            QueryRejectedError: If the estimated cost is over budget / Baha shekten assa
+            QueryTimeoutError: If the deadline passes / Waqıt shegi ótse
+            QueryCancelledError: If the deadline is cancelled / Biykarlansa
             SPARQLEngineError: If execution fails / Orınlaw sátsiz bolsa
         """
         start_time = time.time()
+        prepared = None
+
+        if deadline is None:
+            deadline = QueryDeadline(
+                self.default_timeout if timeout is None else timeout
+            )
 
         try:
             # Validate query / Sorawdı validaciyalaw
@@ -212,14 +327,22 @@ class SPARQLEngine:
             logger.debug("Executing SPARQL query / SPARQL sorawdı orınlaw")
             prepared = prepareQuery(query, initNs=self.namespaces)
 
-            # Execute / Orınlaw
-            results = self.graph.query(prepared)
+            # Admission control / Qabıllaw qadaǵalawı
+            if validate and admit and self.admission.enabled:
+                prepared = self._admit_query(query, prepared, graph)
+
+            # Execute under deadline / Waqıt shegi astında orınlaw
+            target = self.graph if graph is None else graph
+            results = run_with_deadline(target, prepared, deadline, bindings)
 
             # Update statistics / Statistikani jańalaw
             execution_time = time.time() - start_time
             self._update_stats(execution_time, cached=False)
+            self._record_template(query, prepared, execution_time, len(results), bindings=bindings)
+            SPARQL_QUERIES.labels(status="ok").inc()
+            SPARQL_DURATION.observe(execution_time)
 
-            logger.info(
+            logger.debug(
                 f"Query executed in {execution_time:.3f}s / "
                 f"Soraw {execution_time:.3f}s ishinde orınlandı"
             )
@@ -228,13 +351,155 @@ class SPARQLEngine:
 
         except QueryValidationError:
             raise
+        except DeadlineExceeded as e:
+            self.stats['timed_out_queries'] += 1
+            self._record_template(
+                query, prepared, time.time() - start_time, 0, error=True, bindings=bindings
+            )
+            SPARQL_QUERIES.labels(status="cancelled" if e.cancelled else "timeout").inc()
+            SPARQL_DURATION.observe(e.elapsed)
+            error_cls = QueryCancelledError if e.cancelled else QueryTimeoutError
+            if e.cancelled:
+                error_msg = f"Query cancelled after {e.elapsed:.3f}s"
+                error_msg_kaa = f"Soraw {e.elapsed:.3f}s keyin biykarlandı"
+            else:
+                error_msg = f"Query timed out after {e.elapsed:.3f}s (limit {deadline.timeout}s)"
+                error_msg_kaa = (
+                    f"Soraw waqıt shegi {e.elapsed:.3f}s keyin ótti (shek {deadline.timeout}s)"
+                )
+            logger.warning(f"{error_msg} / {error_msg_kaa}")
+            raise error_cls(
+                error_msg, error_msg_kaa, timeout=deadline.timeout, elapsed=e.elapsed
+            ) from e
         except Exception as e:
             self.stats['failed_queries'] += 1
+            self._record_template(
+                query, prepared, time.time() - start_time, 0, error=True, bindings=bindings
+            )
+            SPARQL_QUERIES.labels(status="error").inc()
             error_msg = f"Query execution failed: {str(e)}"
             error_msg_kaa = f"Soraw orınlaw sátsiz: {str(e)}"
             logger.error(f"{error_msg} / {error_msg_kaa}")
             raise SPARQLEngineError(error_msg, error_msg_kaa) from e
 
+    def explain(self, query: str) -> QueryCost:
+        """
+        Estimate the cost of a query without executing it.
+        Sorawdı orınlamay onıń bahasın esaplaw.
+
+        Args:
+            query: SPARQL query / SPARQL soraw
+
+        Returns:
+            Query cost estimate with operator plan / Operator jobası menen soraw bahası
+
+        Raises:
+            QueryValidationError: If query is invalid / Soraw noto'g'ri bolsa
+
+        Examples / Misallar:
+            >>> cost = engine.explain("SELECT * WHERE { ?s ?p ?o }")
+            >>> print(cost.estimated_rows, cost.warnings)
+        """
+        self._validate_query(query)
+        prepared = prepareQuery(query, initNs=self.namespaces)
+        return self.cost_estimator.estimate(prepared.algebra)
+
+    def _admit_query(self, query: str, prepared: Any, graph: Optional[Graph] = None) -> Any:
+        """
+        Apply cost-based admission control to a prepared query.
+        Tayarlanǵan sorawǵa bahaǵa tiykarlanǵan qabıllaw qadaǵalawın qollanıw.
+
+        A SELECT without LIMIT that is estimated to return more than
+        ``max_unbounded_rows`` rows, or to exceed ``max_cost``, gets
+        ``LIMIT auto_limit`` appended. Queries still over ``max_cost`` are rejected.
+        A query on a code's named graph is costed from that graph's statistics.
+
+        Args:
+            query: Original query text / Dáslepki soraw teksti
+            prepared: Prepared query / Tayarlanǵan soraw
+            graph: Graph the query runs on, None for the whole graph
+                   Soraw orınlanatuǵın graf, None - pútin graf
+
+        Returns:
+            Prepared query to execute, possibly rewritten / Orınlanatuǵın soraw
+
+        Raises:
+            QueryRejectedError: If the query is over budget / Soraw shekten assa
+        """
+        admission = self.admission
+        cost = self.cost_estimator.estimate(prepared.algebra, graph)
+
+        over_budget = cost.estimated_cost > admission.max_cost
+        unbounded = not cost.has_limit and cost.estimated_rows > admission.max_unbounded_rows
+
+        if (over_budget or unbounded) and cost.query_type == "SelectQuery" \
+                and not cost.has_limit and admission.auto_limit > 0:
+            try:
+                limited = prepareQuery(add_limit(query, admission.auto_limit),
+                                       initNs=self.namespaces)
+            except Exception:
+                limited = None
+
+            if limited is not None:
+                limited_cost = self.cost_estimator.estimate(limited.algebra, graph)
+                if limited_cost.estimated_cost <= admission.max_cost:
+                    self.stats['auto_limited_queries'] += 1
+                    logger.warning(
+                        f"Query auto-limited to {admission.auto_limit} rows "
+                        f"(estimated {cost.estimated_rows:.0f}) / "
+                        f"Soraw {admission.auto_limit} qatarǵa sheklendi"
+                    )
+                    return limited
+                cost = limited_cost
+            over_budget = True
+
+        if over_budget or unbounded:
+            self.stats['rejected_queries'] += 1
+            SPARQL_QUERIES.labels(status="rejected").inc()
+            reasons = "; ".join(cost.warnings) or "estimated cost over budget"
+            error_msg = (
+                f"Query rejected: estimated cost {cost.estimated_cost:.0f} "
+                f"exceeds budget {admission.max_cost:.0f} ({reasons})"
+            )
+            error_msg_kaa = (
+                f"Soraw biykarlandı: bahalanǵan baha {cost.estimated_cost:.0f} "
+                f"shekten {admission.max_cost:.0f} asadı"
+            )
+            logger.warning(f"{error_msg} / {error_msg_kaa}")
+            raise QueryRejectedError(error_msg, error_msg_kaa, cost=cost)
+
+        return prepared
+
+    def _record_template(
+        self,
+        query: str,
+        prepared: Any,
+        execution_time: float,
+        rows: int,
+        error: bool = False,
+        bindings: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Record an execution in the per-template statistics.
+        Orınlawdı úlgi statistikasına jazıw.
+
+        The cost plan is computed only if the query turns out to be slow.
+        Baha jobası tek soraw áste bolsa esaplanadı.
+        """
+        def plan() -> List[str]:
+            if prepared is None:
+                return []
+            return self.cost_estimator.estimate(prepared.algebra).plan
+
+        fingerprint = self.query_stats.record(
+            query, execution_time, rows=rows, error=error, bindings=bindings, plan=plan
+        )
+
+        stage = current_span()
+        if stage is not None:
+            stage.set_attribute("fingerprint", fingerprint)
+            stage.set_attribute("rows", rows)
+
     def _update_stats(self, execution_time: float, cached: bool = False) -> None:
         """
         Update query statistics.
@@ -306,7 +571,11 @@ class SPARQLEngine:
     def select(
         self,
         query: str,
-        lang: Optional[str] = "kaa"
+        lang: Optional[str] = "kaa",
+        timeout: Optional[float] = None,
+        deadline: Optional[QueryDeadline] = None,
+        graph: Optional[Graph] = None,
+        admit: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Execute SPARQL SELECT query.
@@ -315,6 +584,12 @@ class SPARQLEngine:
         Args:
             query: SELECT query / SELECT soraw
             lang: Language filter / Til filtri
+            timeout: Deadline in seconds / Waqıt shegi sekundlarda
+            deadline: Caller-owned deadline for cancellation / Biykarlaw ushın belgi
+            graph: Graph to query, e.g. from graph_for_code / Soraw beriletuǵın graf
+            admit: Apply admission control (auto LIMIT, rejection); the engine's
+                   own templates pass False
+                   Qabıllaw qadaǵalawı; mexanizmniń óz úlgileri False beredi
 
         Returns:
             Query results / Soraw nátiyјeleri
@@ -342,16 +617,24 @@ class SPARQLEngine:
                     f'WHERE {{\n    # Language filter: {lang}\n'
                 )
 
-        results = self._execute_query(query)
+        results = self._execute_query(query, timeout=timeout, deadline=deadline,
+                                      graph=graph, admit=admit)
         return self._format_results(results)
 
-    def ask(self, query: str) -> bool:
+    def ask(
+        self,
+        query: str,
+        timeout: Optional[float] = None,
+        deadline: Optional[QueryDeadline] = None
+    ) -> bool:
         """
         Execute SPARQL ASK query.
         SPARQL ASK sorawdı orınlaw.
 
         Args:
             query: ASK query / ASK soraw
+            timeout: Deadline in seconds / Waqıt shegi sekundlarda
+            deadline: Caller-owned deadline for cancellation / Biykarlaw ushın belgi
 
         Returns:
             Boolean result / Boolean nátiyјe
@@ -373,13 +656,15 @@ class SPARQLEngine:
                 "Soraw ASK soraw bolıwı kerek"
             )
 
-        results = self._execute_query(query)
+        results = self._execute_query(query, timeout=timeout, deadline=deadline)
         return bool(results)
 
     def construct(
         self,
         query: str,
-        format: str = "turtle"
+        format: str = "turtle",
+        timeout: Optional[float] = None,
+        deadline: Optional[QueryDeadline] = None
     ) -> str:
         """
         Execute SPARQL CONSTRUCT query.
@@ -388,6 +673,8 @@ class SPARQLEngine:
         Args:
             query: CONSTRUCT query / CONSTRUCT soraw
             format: Output format (turtle, xml, n3) / Shıǵıs formatı
+            timeout: Deadline in seconds / Waqıt shegi sekundlarda
+            deadline: Caller-owned deadline for cancellation / Biykarlaw ushın belgi
 
         Returns:
             Constructed graph as string / Jasalǵan graf júrgen shıǵı kórinisinde
@@ -411,11 +698,42 @@ class SPARQLEngine:
                 "Soraw CONSTRUCT soraw bolıwı kerek"
             )
 
-        results = self._execute_query(query)
+        results = self._execute_query(query, timeout=timeout, deadline=deadline)
 
         # Serialize the resulting graph / Nátiyјe grafın serializaciyalaw
         return results.serialize(format=format)
 
+    def graph_for_code(self, kodeks: Optional[str]) -> Graph:
+        """
+        Graph holding a code's triples.
+        Kodeks triple-ların saqlaytuǵın graf.
+
+        When the knowledge base is a Dataset with a loaded named graph for the
+        code (``sparql.graphs``), queries about that code scan only it;
+        otherwise they run on the whole graph.
+
+        Args:
+            kodeks: Code type or alias, or None / Kodeks túri yamasa None
+
+        Returns:
+            The code's named graph or the whole graph / Atamalı graf yamasa pútin graf
+        """
+        if not kodeks or not isinstance(self.graph, Dataset):
+            return self.graph
+        graph_id = code_graph_id(kodeks)
+        if graph_id is None:
+            return self.graph
+
+        partition = self._partitions.get(graph_id)
+        if partition is None:
+            partition = Graph(
+                store=self.graph.store,
+                identifier=graph_id,
+                namespace_manager=self.graph.namespace_manager,
+            )
+            self._partitions[graph_id] = partition
+        return partition if len(partition) else self.graph
+
     # =========================================================================
     # Karakalpak Legal Specific Queries / Qaraqalpaq Huquqıy Arnaýı Sorawlar
     # =========================================================================
@@ -424,7 +742,8 @@ class SPARQLEngine:
         self,
         term: str,
         fuzzy: bool = False,
-        limit: int = 10
+        limit: int = 10,
+        timeout: Optional[float] = None
     ) -> List[Dict[str, Any]]:
         """
         Search by Karakalpak term.
@@ -441,10 +760,14 @@ class SPARQLEngine:
                   Examples: "urılıq" (theft), "jinayat" (crime), "jaza" (punishment)
             fuzzy: Enable fuzzy search / Anıq emes izlewdi qosıw
             limit: Maximum results / Eń kóp nátiyјe
+            timeout: Deadline in seconds / Waqıt shegi sekundlarda
 
         Returns:
             Matching resources / Sáykes resurslar
 
+        Raises:
+            QueryTimeoutError: If the search exceeds its deadline / Waqıt shegi ótse
+
         Examples / Misallar:
             >>> # Search for theft / Urılıqdı izlew
             >>> results = engine.search_by_term_kaa("urılıq")
@@ -454,20 +777,22 @@ class SPARQLEngine:
             >>> # Search for punishment / Jazanı izlew
             >>> results = engine.search_by_term_kaa("jaza", fuzzy=True)
         """
-        # Normalize term / Termin normallaw
-        search_term = term.lower().strip()
-
-        # Build filter / Filtr jasawiш
+        # Normalize term exactly like the labels are normalized by hf:searchKey
+        # Termindi hf:searchKey labellardı normalizaciyalaǵanday normallaw
         if fuzzy:
-            # Fuzzy matching with REGEX / REGEX menen anıq emes sáykeslik
-            filter_clause = f'FILTER(REGEX(LCASE(?label), "{search_term}", "i"))'
+            # Every stemmed token, in any order / Hár túbir, qálegen tártipte
+            tokens = search_tokens(term) or [""]
+            filter_clause = "FILTER(" + " && ".join(
+                f'CONTAINS(hf:searchKey(?label), "{token}")' for token in tokens
+            ) + ")"
         else:
-            # Exact matching with CONTAINS / CONTAINS menen anıq sáykeslik
-            filter_clause = f'FILTER(CONTAINS(LCASE(?label), "{search_term}"))'
+            # The normalized phrase / Normalizaciyalanǵan sóz dizbegi
+            filter_clause = f'FILTER(CONTAINS(hf:searchKey(?label), "{search_key(term)}"))'
 
         query = f"""
         PREFIX huquq: <{self.namespaces['huquq']}>
         PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+        PREFIX hf: <{FUNCTION_NS}>
 
         SELECT ?resource ?type ?label ?description
         WHERE {{
@@ -494,12 +819,12 @@ class SPARQLEngine:
         LIMIT {limit}
         """
 
-        logger.info(
+        logger.debug(
             f"Searching by Karakalpak term: '{term}' / "
             f"Qaraqalpaq termin boyınsha izlew: '{term}'"
         )
 
-        return self.select(query)
+        return self.select(query, timeout=timeout, admit=False)
 
     def get_jaza_range(
         self,
@@ -548,12 +873,23 @@ class SPARQLEngine:
 
         filter_clause = " && ".join(filters) if filters else "true"
 
+        # Year bounds resolve through the sorted range index; the FILTER stays
+        # so results are exactly what the plain query would return
+        # Jıl shegaraları sortlanǵan diapazon indeksi arqalı tabıladı
+        bindings = ""
+        if min_jıl is not None or max_jıl is not None:
+            subjects = list(get_range_index(self.graph).within(min_jıl, max_jıl))
+            if not subjects:
+                return []
+            bindings = values_clause("jaza", subjects)
+
         query = f"""
         PREFIX huquq: <{self.namespaces['huquq']}>
         PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 
         SELECT ?jaza ?name ?description ?duration_min ?duration_max ?fine
         WHERE {{
+            {bindings}
             ?jaza a huquq:Jaza ;
                   rdfs:label ?name .
 
@@ -571,12 +907,12 @@ class SPARQLEngine:
         ORDER BY ?duration_min
         """
 
-        logger.info(
+        logger.debug(
             f"Getting punishments: min={min_jıl}, max={max_jıl}, type={jaza_turi} / "
             f"Jazalarni alıw: min={min_jıl}, max={max_jıl}, túr={jaza_turi}"
         )
 
-        return self.select(query)
+        return self.select(query, admit=False)
 
     def search_jinayat_turi(
         self,
@@ -647,12 +983,12 @@ class SPARQLEngine:
         LIMIT {limit}
         """
 
-        logger.info(
+        logger.debug(
             f"Searching crimes by type: '{turi}' / "
             f"Jinayatlardı túri boyınsha izlew: '{turi}'"
         )
 
-        return self.select(query)
+        return self.select(query, admit=False)
 
     def search_statiya(
         self,
@@ -684,20 +1020,36 @@ class SPARQLEngine:
             >>> results = engine.search_statiya(kodeks="jinayat", keyword="urılıq")
         """
         filters = []
-
-        if nomer:
-            filters.append(f'?articleNumber = "{nomer}"')
+        code_type = None
 
         if kodeks:
-            code_mapping = {
-                'jinayat': 'criminal',
-                'criminal': 'criminal',
-                'puqaralıq': 'civil',
-                'civil': 'civil',
-            }
-            code_type = code_mapping.get(kodeks.lower(), kodeks)
+            code_type = normalize_code(kodeks)
             filters.append(f'?codeType = "{code_type}"')
 
+        # A partitioned knowledge base is searched in the code's named graph only
+        # Bólimlengen bilimler bazasında tek kodekstiń atamalı grafı izlenedi
+        graph = self.graph_for_code(kodeks)
+
+        # Numbers, codes and keywords resolve through the indexes (bitset
+        # intersections) instead of a FILTER scan; the FILTERs stay so the
+        # results are exactly those of the plain query
+        # Nomer, kodeks ha'm gilt sózler FILTER ornına indeksler arqalı tabıladı
+        subjects = None
+        if nomer:
+            subjects = get_article_index(graph).lookup(nomer, code_type)
+        if keyword or (code_type and subjects is None):
+            subjects = get_facet_index(graph, HUQUQ_FACETS).subjects(
+                {"code": code_type} if code_type else None,
+                keyword=keyword,
+                within=subjects,
+            )
+
+        bindings = ""
+        if subjects is not None:
+            if not subjects:
+                return []
+            bindings = values_clause("statiya", subjects)
+
         if keyword:
             filters.append(
                 f'(CONTAINS(LCASE(?title), LCASE("{keyword}")) || '
@@ -712,6 +1064,7 @@ class SPARQLEngine:
 
         SELECT ?statiya ?articleNumber ?title ?content ?codeType
         WHERE {{
+            {bindings}
             ?statiya a huquq:Statiya ;
                      huquq:articleNumber ?articleNumber ;
                      huquq:title ?title .
@@ -729,12 +1082,12 @@ class SPARQLEngine:
         LIMIT {limit}
         """
 
-        logger.info(
+        logger.debug(
             f"Searching articles: number={nomer}, code={kodeks}, keyword={keyword} / "
             f"Statiyalardı izlew: nomer={nomer}, kodeks={kodeks}, kalit={keyword}"
         )
 
-        return self.select(query)
+        return self.select(query, graph=graph, admit=False)
 
     def get_related_jinayat_jaza(
         self,
@@ -780,7 +1133,7 @@ class SPARQLEngine:
         }}
         """
 
-        results = self.select(query)
+        results = self.select(query, admit=False)
 
         if not results:
             return {
@@ -807,7 +1160,6 @@ class SPARQLEngine:
             ]
         }
 
-    @lru_cache(maxsize=128)
     def execute_cached(
         self,
         query: str,
@@ -817,6 +1169,9 @@ class SPARQLEngine:
         Execute query with LRU caching.
         LRU keshlaw menen sorawdı orınlaw.
 
+        Cache hits are counted in the engine and per-template statistics.
+        Kesh tabıslı shaqırıwları mexanizm ha'm úlgi statistikasında sanaladı.
+
         Args:
             query: SPARQL query / SPARQL soraw
             query_type: Query type (select, ask, construct) / Soraw túri
@@ -830,6 +1185,30 @@ class SPARQLEngine:
             >>> # Second call returns cached results / Ekinshi shaqırıw keshlengen nátiyјeni qaytaradı
             >>> results2 = engine.execute_cached("SELECT * WHERE {?s ?p ?o} LIMIT 1")
         """
+        start_time = time.time()
+        hits_before = self._execute_cached.cache_info().hits
+
+        result = self._execute_cached(query, query_type)
+
+        if self._execute_cached.cache_info().hits > hits_before:
+            self._update_stats(0.0, cached=True)
+            self.query_stats.record(query, time.time() - start_time, cached=True)
+            CACHE_REQUESTS.labels(cache="sparql", result="hit").inc()
+        else:
+            CACHE_REQUESTS.labels(cache="sparql", result="miss").inc()
+
+        return result
+
+    @lru_cache(maxsize=128)
+    def _execute_cached(
+        self,
+        query: str,
+        query_type: str = "select"
+    ) -> Union[List[Dict[str, Any]], bool, str]:
+        """
+        LRU-cached body of ``execute_cached``.
+        ``execute_cached`` ushın LRU keshlengen tiykar.
+        """
         logger.debug(f"Executing cached query of type: {query_type}")
 
         # This method is cached by @lru_cache decorator
@@ -843,11 +1222,22 @@ class SPARQLEngine:
         else:
             raise ValueError(f"Unknown query type: {query_type}")
 
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(
+        self,
+        top_templates: int = 20,
+        slow_queries: int = 20
+    ) -> Dict[str, Any]:
         """
         Get engine statistics.
         Mexanizm statistikasın alıw.
 
+        Includes per-template latency percentiles and the most recent slow queries.
+        Úlgi boyınsha keshigiw procentilleri ha'm eń sońǵı áste sorawlardı qamtıydı.
+
+        Args:
+            top_templates: Templates returned, by total time / Qaytarılatuǵın úlgiler sanı
+            slow_queries: Slow-query entries returned / Qaytarılatuǵın áste sorawlar sanı
+
         Returns:
             Statistics dictionary / Statistika dictionary
 
@@ -862,10 +1252,16 @@ class SPARQLEngine:
                 self.stats['cached_queries'] / self.stats['total_queries']
             )
 
+        cache_info = self._execute_cached.cache_info()
+
         return {
             **self.stats,
             'cache_hit_rate': cache_hit_rate,
-            'cache_info': self.execute_cached.cache_info()._asdict()
+            'cache_hits': cache_info.hits,
+            'cache_misses': cache_info.misses,
+            'cache_info': cache_info._asdict(),
+            'templates': self.query_stats.templates(limit=top_templates),
+            'slow_queries': self.query_stats.slow_queries(limit=slow_queries),
         }
 
     def clear_cache(self) -> None:
@@ -873,7 +1269,7 @@ class SPARQLEngine:
         Clear query cache.
         Soraw keshini tazalaw.
         """
-        self.execute_cached.cache_clear()
+        self._execute_cached.cache_clear()
         logger.info("Query cache cleared / Soraw keshi tazalandı")
 
     def __repr__(self) -> str:
@@ -0,0 +1,448 @@
+"""
+Persistent SQLite triple store
+Turaqlı SQLite triple saqlaǵısh
+
+``OntologyManager`` otherwise parses the whole knowledge base into memory in
+every process on every start. ``SQLiteStore`` keeps the graph in one SQLite
+file instead: ingest once, then any number of processes open it instantly,
+read-only if they like, and share the operating system's page cache.
+
+Layout: terms are stored once in ``terms`` and triples as three integer ids in
+``triples`` (primary key SPO plus POS and OSP indexes), so every triple pattern
+is an index range scan. The database runs in WAL mode, so readers never block
+the writer, and is memory-mapped (``mmap_size``), so hot pages come straight
+from the page cache and a corpus larger than RAM still works.
+
+The store registers itself as the ``"SQLite"`` rdflib plugin::
+
+    graph = Graph(store="SQLite")
+    graph.open("data/knowledge/huquqai.sqlite", create=True)
+
+Bilimler bazası bir ret SQLite faylına júklenedi, keyin hár process onı
+birden (qálese tek oqıw ushın) ashadı ha'm operaciyalıq sistemanıń bet
+keshin bólisedi.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+from rdflib import plugin
+from rdflib.store import NO_STORE, VALID_STORE, Store
+from rdflib.term import BNode, Literal, Node, URIRef
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    datatype TEXT NOT NULL DEFAULT '',
+    lang TEXT NOT NULL DEFAULT '',
+    UNIQUE (kind, value, datatype, lang)
+);
+CREATE TABLE IF NOT EXISTS triples (
+    s INTEGER NOT NULL,
+    p INTEGER NOT NULL,
+    o INTEGER NOT NULL,
+    PRIMARY KEY (s, p, o)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS triples_pos ON triples (p, o, s);
+CREATE INDEX IF NOT EXISTS triples_osp ON triples (o, s, p);
+CREATE TABLE IF NOT EXISTS namespaces (
+    prefix TEXT PRIMARY KEY,
+    uri TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('triple_count', '0');
+"""
+
+TermRow = Tuple[str, str, str, str]
+
+
+def encode_term(term: Node) -> TermRow:
+    """
+    (kind, value, datatype, lang) row of a term.
+    Terminniń (túr, mánis, datatype, til) qatarı.
+
+    Raises:
+        TypeError: For terms a triple store cannot hold / Saqlanbaytuǵın terminler
+    """
+    if isinstance(term, Literal):
+        return "L", str(term), str(term.datatype or ""), term.language or ""
+    if isinstance(term, URIRef):
+        return "U", str(term), "", ""
+    if isinstance(term, BNode):
+        return "B", str(term), "", ""
+    raise TypeError(f"Unsupported term: {term!r} / Qollanılmaytuǵın termin")
+
+
+def decode_term(kind: str, value: str, datatype: str, lang: str) -> Node:
+    """
+    Term from its stored row / Saqlanǵan qatardan termin
+    """
+    if kind == "L":
+        return Literal(value, lang=lang or None, datatype=URIRef(datatype) if datatype else None)
+    if kind == "U":
+        return URIRef(value)
+    return BNode(value)
+
+
+class SQLiteStore(Store):
+    """
+    rdflib store persisted in one SQLite file.
+    Bir SQLite faylında saqlanatuǵın rdflib saqlaǵıshı.
+
+    Each thread gets its own connection. Writes commit immediately unless
+    they run inside ``bulk()``, which commits once at the end (use it for
+    ingestion). Not context aware: it backs a plain ``Graph``.
+
+    Examples / Misallar:
+        >>> store = SQLiteStore(read_only=True)
+        >>> graph = Graph(store=store)
+        >>> graph.open("data/knowledge/huquqai.sqlite")
+        >>> len(graph)
+        185
+    """
+
+    context_aware = False
+    formula_aware = False
+    transaction_aware = False
+    graph_aware = False
+
+    def __init__(self, configuration: Optional[str] = None,
+                 identifier: Optional[Node] = None,
+                 read_only: bool = False,
+                 mmap_size: int = 256 * 1024 * 1024,
+                 term_cache_size: int = 100_000):
+        """
+        Args:
+            configuration: Database path; opens it when given / Baza jolı
+            identifier: Store identifier / Saqlaǵısh identifikatorı
+            read_only: Open the file read-only / Fayldı tek oqıw ushın ashıw
+            mmap_size: Bytes of the file to memory-map / Yadqa kórsetiletuǵın baytlar
+            term_cache_size: Decoded terms kept in memory / Yadta saqlanatuǵın terminler
+        """
+        self.read_only = read_only
+        self.mmap_size = mmap_size
+        self.term_cache_size = term_cache_size
+        self.path: Optional[Path] = None
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._terms: Dict[int, Node] = {}
+        self._ids: Dict[Node, int] = {}
+        self._namespace: Dict[str, URIRef] = {}
+        self._prefix: Dict[URIRef, str] = {}
+
+        self.identifier = identifier
+        super().__init__(configuration, identifier)
+
+    # ------------------------------------------------------------------
+    # Connections / Baylanıslar
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        """New connection with the store's pragmas / Jańa baylanıs"""
+        if self.read_only:
+            connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+            )
+        else:
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+        connection.execute("PRAGMA busy_timeout=5000")
+        with self._connections_lock:
+            self._connections.append(connection)
+        return connection
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """This thread's connection / Usı aǵımnıń baylanısı"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if self.path is None:
+                raise RuntimeError("SQLiteStore is not open / SQLiteStore ashılmaǵan")
+            connection = self._connect()
+            self._local.connection = connection
+        return connection
+
+    def open(self, configuration: str, create: bool = False) -> Optional[int]:
+        """
+        Open (and with ``create`` initialize) the database file.
+        Baza faylın ashıw (``create`` bolsa jasaw).
+
+        Returns:
+            VALID_STORE, or NO_STORE if the file is missing and not created
+        """
+        path = Path(configuration)
+        if not path.exists() and (not create or self.read_only):
+            return NO_STORE
+        self.path = path
+        if not self.read_only:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with self._db as connection:
+                connection.executescript(_SCHEMA)
+        # Prefixes bound before opening (rdflib's defaults) join the stored ones
+        # Ashıwdan aldın baylanǵan prefiksler saqlanǵanlarǵa qosıladı
+        pending = list(self._namespace.items())
+        self._load_namespaces()
+        for prefix, namespace in pending:
+            self.bind(prefix, namespace, override=False)
+        logger.debug(f"SQLite store opened / SQLite saqlaǵısh ashıldı: {path}")
+        return VALID_STORE
+
+    def close(self, commit_pending_transaction: bool = False) -> None:
+        """Close every thread's connection / Barlıq baylanıslardı jabıw"""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            if commit_pending_transaction and not self.read_only:
+                connection.commit()
+            connection.close()
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Transactions / Tranzakciyalar
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """
+        Group writes of this thread into one transaction.
+        Usı aǵımnıń jazıwların bir tranzakciyaǵa toplaw.
+
+        Examples / Misallar:
+            >>> with graph.store.bulk():
+            ...     graph.parse("data/knowledge/criminal_code.ttl")
+        """
+        depth = getattr(self._local, "bulk", 0)
+        self._local.bulk = depth + 1
+        try:
+            yield
+        except BaseException:
+            if depth == 0:
+                self.rollback()
+            raise
+        else:
+            if depth == 0:
+                self._db.commit()
+        finally:
+            self._local.bulk = depth
+
+    def _written(self) -> None:
+        """Commit unless inside ``bulk()`` / ``bulk()`` ishinde bolmasa saqlaw"""
+        if not getattr(self._local, "bulk", 0):
+            self._db.commit()
+
+    def commit(self) -> None:
+        self._db.commit()
+
+    def rollback(self) -> None:
+        """
+        Undo uncommitted writes and forget the terms they cached.
+        Saqlanbaǵan jazıwlardı artqa qaytarıw ha'm olar keshlegen terminlerdi umıtıw.
+
+        SQLite reuses the ids of rolled-back ``terms`` rows, so a cached id
+        from the undone transaction would point at whatever term gets it next.
+        Artqa qaytarılǵan ``terms`` id-ların SQLite qayta beredi, sonlıqtan
+        keshtegi eski id basqa terminge tiyisli bolıp qaladı.
+        """
+        self._db.rollback()
+        self._terms.clear()
+        self._ids.clear()
+        if self.path is not None:
+            self._load_namespaces()
+
+    # ------------------------------------------------------------------
+    # Terms / Terminler
+    # ------------------------------------------------------------------
+
+    def _cache(self, term_id: int, term: Node) -> None:
+        if len(self._terms) >= self.term_cache_size:
+            self._terms.clear()
+            self._ids.clear()
+        self._terms[term_id] = term
+        self._ids[term] = term_id
+
+    def _lookup(self, term: Node) -> Optional[int]:
+        """Id of a stored term, or None / Saqlanǵan termin id-ı"""
+        term_id = self._ids.get(term)
+        if term_id is None:
+            row = self._db.execute(
+                "SELECT id FROM terms WHERE kind = ? AND value = ? AND datatype = ? AND lang = ?",
+                encode_term(term),
+            ).fetchone()
+            if row is None:
+                return None
+            term_id = row[0]
+            self._cache(term_id, term)
+        return term_id
+
+    def _intern(self, term: Node) -> int:
+        """Id of a term, inserting it if new / Termin id-ı, jańa bolsa qosıladı"""
+        term_id = self._lookup(term)
+        if term_id is None:
+            cursor = self._db.execute(
+                "INSERT INTO terms (kind, value, datatype, lang) VALUES (?, ?, ?, ?)",
+                encode_term(term),
+            )
+            term_id = cursor.lastrowid
+            self._cache(term_id, term)
+        return term_id
+
+    def _decode(self, ids: Iterable[int]) -> Dict[int, Node]:
+        """Terms for ids, fetching cache misses in one query / Id-lar ushın terminler"""
+        terms: Dict[int, Node] = {}
+        missing = []
+        for term_id in ids:
+            if term_id not in terms:
+                term = self._terms.get(term_id)
+                if term is None:
+                    missing.append(term_id)
+                else:
+                    terms[term_id] = term
+        if missing:
+            missing = list(set(missing))
+            marks = ",".join("?" * len(missing))
+            for term_id, kind, value, datatype, lang in self._db.execute(
+                f"SELECT id, kind, value, datatype, lang FROM terms WHERE id IN ({marks})",
+                missing,
+            ):
+                term = decode_term(kind, value, datatype, lang)
+                terms[term_id] = term
+                self._cache(term_id, term)
+        return terms
+
+    def _pattern(self, triple_pattern) -> Optional[Tuple[str, List[int]]]:
+        """WHERE clause for a pattern, or None if a term is unknown / Úlgi ushın WHERE"""
+        conditions, params = [], []
+        for column, term in zip("spo", triple_pattern):
+            if term is not None:
+                term_id = self._lookup(term)
+                if term_id is None:
+                    return None
+                conditions.append(f"{column} = ?")
+                params.append(term_id)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
+
+    # ------------------------------------------------------------------
+    # Store API
+    # ------------------------------------------------------------------
+
+    def _change_count(self, delta: int) -> None:
+        if delta:
+            self._db.execute(
+                "UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'triple_count'",
+                (delta,),
+            )
+
+    def add(self, triple, context=None, quoted: bool = False) -> None:
+        """Add a triple / Triple qosıw"""
+        ids = tuple(self._intern(term) for term in triple)
+        cursor = self._db.execute("INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)", ids)
+        self._change_count(cursor.rowcount)
+        self._written()
+        super().add(triple, context, quoted)
+
+    def addN(self, quads) -> None:
+        """Add many triples in one statement / Kóp triple-dı bir buyrıqta qosıw"""
+        rows = [tuple(self._intern(term) for term in (s, p, o)) for s, p, o, _ in quads]
+        if rows:
+            cursor = self._db.executemany(
+                "INSERT OR IGNORE INTO triples (s, p, o) VALUES (?, ?, ?)", rows
+            )
+            self._change_count(cursor.rowcount)
+        self._written()
+
+    def remove(self, triple_pattern, context=None) -> None:
+        """Remove triples matching a pattern / Úlgige sáykes triple-lardı óshiriw"""
+        pattern = self._pattern(triple_pattern)
+        if pattern is not None:
+            where, params = pattern
+            cursor = self._db.execute(f"DELETE FROM triples{where}", params)
+            self._change_count(-cursor.rowcount)
+            self._written()
+        super().remove(triple_pattern, context)
+
+    def triples(self, triple_pattern, context=None):
+        """Triples matching a pattern / Úlgige sáykes triple-lar"""
+        pattern = self._pattern(triple_pattern)
+        if pattern is None:
+            return
+        where, params = pattern
+        cursor = self._db.execute(f"SELECT s, p, o FROM triples{where}", params)
+        while True:
+            rows = cursor.fetchmany(512)
+            if not rows:
+                break
+            terms = self._decode(term_id for row in rows for term_id in row)
+            for s, p, o in rows:
+                yield (terms[s], terms[p], terms[o]), iter(())
+
+    def __len__(self, context=None) -> int:
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'triple_count'").fetchone()
+        return int(row[0]) if row else 0
+
+    # ------------------------------------------------------------------
+    # Metadata and namespaces / Metamaǵlıwmat ha'm namespace-lar
+    # ------------------------------------------------------------------
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Stored metadata value / Saqlanǵan metamaǵlıwmat"""
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """Store a metadata value / Metamaǵlıwmattı saqlaw"""
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        self._written()
+
+    def _load_namespaces(self) -> None:
+        self._namespace = {
+            prefix: URIRef(uri)
+            for prefix, uri in self._db.execute("SELECT prefix, uri FROM namespaces")
+        }
+        self._prefix = {uri: prefix for prefix, uri in self._namespace.items()}
+
+    def bind(self, prefix: str, namespace: URIRef, override: bool = True) -> None:
+        """Bind a prefix and persist it / Prefiksti baylaw ha'm saqlaw"""
+        namespace = URIRef(namespace)
+        bound_namespace = self._namespace.get(prefix)
+        bound_prefix = self._prefix.get(namespace)
+        if not override and (bound_namespace is not None or bound_prefix is not None):
+            return
+        if bound_prefix is not None:
+            del self._namespace[bound_prefix]
+        if bound_namespace is not None:
+            del self._prefix[bound_namespace]
+        self._namespace[prefix] = namespace
+        self._prefix[namespace] = prefix
+        if not self.read_only and self.path is not None:
+            self._db.execute("DELETE FROM namespaces WHERE prefix = ? OR uri = ?",
+                             (prefix, str(namespace)))
+            self._db.execute("INSERT INTO namespaces (prefix, uri) VALUES (?, ?)",
+                             (prefix, str(namespace)))
+            self._written()
+
+    def namespace(self, prefix: str) -> Optional[URIRef]:
+        return self._namespace.get(prefix)
+
+    def prefix(self, namespace: URIRef) -> Optional[str]:
+        return self._prefix.get(namespace)
+
+    def namespaces(self) -> Iterator[Tuple[str, URIRef]]:
+        yield from list(self._namespace.items())
+
+
+plugin.register("SQLite", Store, "src.core.sqlite_store", "SQLiteStore")
@@ -0,0 +1,301 @@
+"""
+Streaming import of N-Triples and N-Quads files
+N-Triples ha'm N-Quads faylların aǵım menen import etiw
+
+``Graph.parse`` reads a whole file before the first triple reaches the store,
+so a large legal dump needs memory in proportion to its size. N-Triples and
+N-Quads put one statement per line, so the importer reads the file line by
+line, parses each line on its own and hands the store one batch of
+``batch_size`` statements at a time. Memory stays bounded by the batch size;
+only the blank node labels of the file are remembered until the end.
+
+A line that does not parse (or is not valid UTF-8) is skipped and recorded
+with its line number; the rest of the file still loads. So is an N-Quads
+statement that names a graph when the target has no named graphs, rather
+than being merged into it with its graph name lost. Gzipped dumps
+(``.nt.gz``, ``.nq.gz``) are read directly.
+
+N-Triples ha'm N-Quads fayllarında hár qatarda bir tastıyıq bar. Importshı
+fayldı qatarma-qatar oqıp, ``batch_size`` ólshemli toplamlar menen saqlaǵıshqa
+qosadı; yad fayldıń ólshemine emes, toplam ólshemine baylanıslı. Qáte qatarlar
+ótkerip jiberiledi ha'm esabatqa jazıladı.
+"""
+
+import gzip
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from loguru import logger
+from rdflib import Dataset, Graph
+from rdflib.exceptions import ParserError
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
+from rdflib.plugins.parsers.ntriples import W3CNTriplesParser, r_tail, r_wspace, r_wspaces
+from rdflib.term import Node
+
+from src.core.bulk_loader import guess_format
+
+
+# Line-based formats / Qatarlı formatlar
+STREAM_FORMATS = ('nt', 'nquads')
+
+# Statements per store call / Bir saqlaǵısh shaqırıwındaǵı tastıyıqlar
+DEFAULT_BATCH_SIZE = 50_000
+
+# Bad lines kept in the report / Esabatta saqlanatuǵın qáte qatarlar
+MAX_ERROR_SAMPLES = 100
+
+Quad = Tuple[Node, Node, Node, Optional[Node]]
+
+
+@dataclass
+class LineError:
+    """
+    A line that could not be imported.
+    Import etilmegen qatar.
+    """
+    line: int
+    text: str
+    message: str
+
+
+@dataclass
+class ImportReport:
+    """
+    Progress and outcome of a streaming import; updated after every batch.
+    Aǵım menen import etiwdiń barısı ha'm nátiyjesi; hár toplamnan keyin jańalanadı.
+    """
+    path: Path
+    format: str
+    lines: int = 0
+    statements: int = 0
+    added: int = 0
+    batches: int = 0
+    error_count: int = 0
+    errors: List[LineError] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Statements per second / Sekundına tastıyıqlar"""
+        return self.statements / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """Totals plus the first bad lines / Jámi ha'm birinshi qáte qatarlar"""
+        lines = [
+            f"{self.path.name}: {self.statements} statements ({self.added} new) from "
+            f"{self.lines} lines in {self.seconds:.2f}s ({self.throughput:,.0f}/s), "
+            f"{self.error_count} bad lines"
+        ]
+        lines.extend(f"  line {error.line}: {error.message}: {error.text}" for error in self.errors)
+        if self.error_count > len(self.errors):
+            lines.append(f"  ... {self.error_count - len(self.errors)} more")
+        return "\n".join(lines)
+
+
+class _LineParser(W3CNTriplesParser):
+    """
+    Parses one N-Triples or N-Quads line at a time.
+    Bir ret bir N-Triples yamasa N-Quads qatarın parse etedi.
+    """
+
+    def __init__(self, quads: bool):
+        super().__init__(bnode_context={})
+        self.quads = quads
+
+    def statement(self, text: str) -> Optional[Quad]:
+        """
+        Statement on a line, None for blank and comment lines.
+        Qatardaǵı tastıyıq, bos ha'm kommentariy qatarlar ushın None.
+
+        Raises:
+            ParserError: If the line is malformed / Qatar qáte bolsa
+        """
+        self.line = text
+        self.eat(r_wspace)
+        if not self.line or self.line.startswith("#"):
+            return None
+
+        subject = self.subject()
+        self.eat(r_wspace if self.quads else r_wspaces)
+        predicate = self.predicate()
+        self.eat(r_wspace if self.quads else r_wspaces)
+        obj = self.object()
+
+        context = None
+        if self.quads:
+            self.eat(r_wspace)
+            context = self.uriref() or self.nodeid() or None
+        self.eat(r_tail)
+        if self.line:
+            raise ParserError("Trailing garbage")
+        return subject, predicate, obj, context
+
+
+def stream_format(path: Union[str, Path]) -> str:
+    """
+    Line-based format of a file, looking through a ``.gz`` suffix.
+    Fayldıń qatarlı formatı, ``.gz`` keńeytpesin esapqa almay.
+
+    Raises:
+        ValueError: If the file is not N-Triples or N-Quads
+                    Fayl N-Triples yamasa N-Quads bolmasa
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.gz':
+        path = path.with_suffix('')
+    format = guess_format(path)
+    if format not in STREAM_FORMATS:
+        raise ValueError(f"Not a line-based RDF file: {path.name} / "
+                         f"Qatarlı RDF fayl emes: {path.name}")
+    return format
+
+
+def _open(path: Path):
+    """Binary line reader, gunzipping ``.gz`` files / ``.gz`` fayllardı ashıp oqıw"""
+    if path.suffix.lower() == '.gz':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def iter_batches(
+    path: Union[str, Path],
+    report: ImportReport,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_error_samples: int = MAX_ERROR_SAMPLES,
+    named_graphs: bool = True,
+) -> Iterator[List[Quad]]:
+    """
+    Parsed statements of a file, ``batch_size`` at a time.
+    Fayldıń parse etilgen tastıyıqları, ``batch_size`` boyınsha.
+
+    Line counts and bad lines are recorded in ``report`` as the file is read.
+
+    Args:
+        path: N-Triples or N-Quads file / N-Triples yamasa N-Quads faylı
+        report: Report to update / Jańalanatuǵın esabat
+        batch_size: Statements per batch / Toplamdaǵı tastıyıqlar
+        max_error_samples: Bad lines kept in the report / Saqlanatuǵın qáte qatarlar
+        named_graphs: False to skip, as bad lines, statements naming a graph
+                      False bolsa, graf atı bar tastıyıqlar qáte qatar retinde ótkeriledi
+
+    Examples / Misallar:
+        >>> report = ImportReport(Path("dump.nt"), "nt")
+        >>> for batch in iter_batches("dump.nt", report):
+        ...     graph.addN((s, p, o, graph) for s, p, o, _ in batch)
+    """
+    parser = _LineParser(quads=report.format == 'nquads')
+    batch: List[Quad] = []
+
+    def skip(number: int, raw: bytes, message: str) -> None:
+        report.error_count += 1
+        if len(report.errors) < max_error_samples:
+            text = raw.decode('utf-8', 'replace').strip()
+            report.errors.append(LineError(number, text[:200], message[:200]))
+
+    with _open(Path(path)) as source:
+        for number, raw in enumerate(source, 1):
+            report.lines = number
+            try:
+                statement = parser.statement(raw.decode('utf-8').rstrip('\r\n'))
+            except (ParserError, UnicodeDecodeError) as e:
+                skip(number, raw, str(e))
+                continue
+            if statement is None:
+                continue
+            if statement[3] is not None and not named_graphs:
+                skip(number, raw, "Named graph needs a Dataset target or a code")
+                continue
+
+            batch.append(statement)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def import_file(
+    path: Union[str, Path],
+    target: Graph,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[ImportReport], None]] = None,
+    max_error_samples: int = MAX_ERROR_SAMPLES,
+    merge_graphs: bool = False,
+) -> ImportReport:
+    """
+    Stream an N-Triples or N-Quads file into a graph.
+    N-Triples yamasa N-Quads faylın grafqa aǵım menen júklew.
+
+    Each batch goes to the store in one ``addN`` call. When ``target`` is a
+    ``Dataset``, N-Quads statements go into the named graph of their fourth
+    term and the rest into the default graph. A plain ``Graph`` takes the
+    statements without a graph name; those naming a graph are skipped and
+    reported as bad lines, unless ``merge_graphs`` asks to merge them in.
+
+    ``target`` ``Dataset`` bolsa, N-Quads tastıyıqları tórtinshi terminniń
+    atamalı grafına, qalǵanları tiykarǵı grafqa túsedi. Ápiwayı ``Graph``
+    graf atı bar tastıyıqlardı ``merge_graphs`` bolmasa qabıl etpeydi.
+
+    Args:
+        path: N-Triples or N-Quads file, optionally gzipped
+              N-Triples yamasa N-Quads faylı, gzip bolıwı múmkin
+        target: Graph to import into / Import etiletuǵın graf
+        batch_size: Statements per ``addN`` call / Bir ``addN`` shaqırıwındaǵı tastıyıqlar
+        progress: Called with the report after every batch
+                  Hár toplamnan keyin esabat penen shaqırıladı
+        max_error_samples: Bad lines kept in the report / Saqlanatuǵın qáte qatarlar
+        merge_graphs: Put statements naming a graph into a plain ``Graph`` target
+                      Graf atı bar tastıyıqlardı ápiwayı ``Graph``-qa qosıw
+
+    Returns:
+        Counts, throughput and bad lines / Sanlar, tezlik ha'm qáte qatarlar
+
+    Raises:
+        ValueError: If the file is not N-Triples or N-Quads
+                    Fayl N-Triples yamasa N-Quads bolmasa
+
+    Examples / Misallar:
+        >>> graph = Graph(store="SQLite")
+        >>> report = import_file("dump.nt.gz", graph, progress=lambda r: print(r.statements))
+        >>> print(report.summary())
+    """
+    start = time.perf_counter()
+    path = Path(path)
+    report = ImportReport(path, stream_format(path))
+    before = len(target)
+
+    graphs: Dict[Optional[Node], Graph] = {}
+
+    def graph_for(context: Optional[Node]) -> Graph:
+        graph = graphs.get(context)
+        if graph is None:
+            if not isinstance(target, Dataset):
+                graph = target
+            else:
+                graph = target.graph(DATASET_DEFAULT_GRAPH_ID if context is None else context)
+            graphs[context] = graph
+        return graph
+
+    named_graphs = merge_graphs or isinstance(target, Dataset)
+    for batch in iter_batches(path, report, batch_size, max_error_samples, named_graphs):
+        target.addN((s, p, o, graph_for(c)) for s, p, o, c in batch)
+        report.statements += len(batch)
+        report.batches += 1
+        report.seconds = time.perf_counter() - start
+        logger.debug(f"{path.name}: {report.statements} statements, "
+                     f"{report.throughput:,.0f}/s / {report.statements} tastıyıq")
+        if progress is not None:
+            progress(report)
+
+    report.added = len(target) - before
+    report.seconds = time.perf_counter() - start
+
+    if report.error_count:
+        logger.warning(f"Skipped {report.error_count} bad lines in {path} / "
+                       f"{path} faylında {report.error_count} qáte qatar ótkerip jiberildi")
+    logger.info(f"Imported {report.statements} statements from {path} in "
+                f"{report.seconds:.2f}s ({report.throughput:,.0f}/s) / "
+                f"{path} faylınan {report.statements} tastıyıq import etildi")
+    return report
@@ -5,7 +5,7 @@ Huqıqlıq ma'lumotlar modelleri
 
 from typing import List, Optional, Dict, Any
 from enum import Enum
-from pydantic import Field
+from pydantic import BaseModel, Field
 from src.core.base import Entity
 
 
@@ -172,3 +172,31 @@ class Answer(Entity):
                 "sources": ["art123", "art456"]
             }
         }
+
+
+class ArticleRef(BaseModel):
+    """Article reference in a batch lookup / Toplam izlewdegi statiya siltemesi"""
+    number: str = Field(..., min_length=1, description="Article number / Statiya nomeri")
+    code_type: Optional[CodeType] = Field(
+        None, description="Restrict to one code / Bir kodeks penen sheklew"
+    )
+
+
+class ArticleBatchRequest(BaseModel):
+    """Batch article lookup request / Statiyalardı toplap izlew sorawı"""
+    articles: List[ArticleRef] = Field(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Articles in the order they should be returned / Qaytarılıw tártibindegi statiyalar"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "articles": [
+                    {"number": "97"},
+                    {"number": "169", "code_type": "criminal"}
+                ]
+            }
+        }
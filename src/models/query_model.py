@@ -200,7 +200,7 @@ class QueryTemplates:
             # Belgili jaza diapazonındaǵı statiyalar
             FILTER (?jaza_min >= {min_jıl} && ?jaza_max <= {max_jıl})
         }}
-        ORDER BY ?jaza_max DESC
+        ORDER BY DESC(?jaza_max)
         """
 
     @staticmethod
@@ -0,0 +1,185 @@
+"""
+Legal-term keyword extraction for user questions
+Paydalanıwshı sorawlarınan huquqıy termin gilt sózlerin alıw
+
+The question is normalized once (folding, transliteration, stemming) and
+scanned in a single pass by an Aho-Corasick automaton compiled from the
+terminology in every configured language. Recognized terms are emitted in
+their Karakalpak form, which is how the knowledge base stores them; remaining
+content words are kept only when they are not stopwords. Every candidate is
+weighted and only the strongest few are returned, so each question fans out to
+a handful of SPARQL searches instead of one per word.
+
+Soraw bir ret normalizaciyalanadı ha'm barlıq tillerdegi terminologiyadan
+dúzilgen Aho-Corasick avtomatı menen bir ótiwde qaraladı. Tanılǵan terminler
+Qaraqalpaq formasında qaytarıladı, qalǵan sózler stop-sóz bolmasa ǵana alınadı.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.core.config import get_config
+from src.utils.aho_corasick import AhoCorasick
+from src.utils.language import get_language_utils
+from src.utils.normalization import fold_text, search_key, stem_token
+from src.utils.transliteration import to_latin
+
+
+# Words keep inner apostrophes (ha'm) so they fold like search keys do
+# Sózler ishki apostroflardı saqlaydı (ha'm)
+_WORD_RE = re.compile(r"\w+(?:['’ʻʼ`]\w+)*")
+
+# Question words, particles and postpositions that never narrow a search
+# Izlewdi tarayta almaytuǵın soraw sózleri, janapaylar ha'm kómekshi sózler
+STOPWORDS = frozenset({
+    # Karakalpak / Qaraqalpaqsha
+    "ne", "nedir", "neshe", "nege", "nelikten", "qanday", "qaysı", "qashan",
+    "qayda", "qalay", "kim", "haqqında", "ushın", "menen", "ha'm",
+    "hám", "jáne", "yamasa", "bolsa", "bolıp", "boladı", "beriledi", "degen",
+    "degenimiz", "bul", "usı", "sol", "ol", "men", "sen", "biz", "siz", "ma",
+    "me", "ba", "be", "pa", "pe", "da", "de", "ta", "te", "emes", "bar", "joq",
+    "kerek", "múmkin", "qansha", "túsindir", "aytıń", "maǵan",
+    # Uzbek / Ózbekshe
+    "nima", "qanday", "qachon", "qayer", "haqida", "uchun", "bilan", "va",
+    # Russian / Russha
+    "что", "такое", "какой", "какая", "какие", "как", "где", "когда", "для",
+    "про", "это", "или", "и", "в", "на", "за", "по", "о", "об",
+    # English / Inglisshe
+    "what", "which", "when", "where", "how", "the", "for", "about", "and", "with",
+    "is", "are", "of", "in",
+})
+
+# Candidate weights / Kandidat salmaqları
+TERM_WEIGHT = 2.0
+TERM_WORD_BONUS = 0.5
+NUMBER_WEIGHT = 1.5
+WORD_WEIGHT = 1.0
+
+
+@dataclass
+class Keyword:
+    """
+    One weighted keyword.
+    Bir salmaqlı gilt sóz.
+    """
+    text: str
+    weight: float
+    term_key: Optional[str] = None
+
+
+class KeywordExtractor:
+    """
+    Compiled multi-pattern legal-term extractor.
+    Kompilyaciyalanǵan kóp úlgili huquqıy termin alıwshı.
+
+    Examples / Misallar:
+        >>> extractor = KeywordExtractor()
+        >>> [k.text for k in extractor.extract("Urlıqtıń jazası qanday?")]
+        ['Jaza', 'urlıq']
+    """
+
+    def __init__(self, max_keywords: Optional[int] = None, min_word_length: int = 4):
+        """
+        Args:
+            max_keywords: Keywords returned per question / Hár soraw ushın gilt sózler sanı
+            min_word_length: Shortest free word kept / Eń qısqa erkin sóz uzınlıǵı
+        """
+        search = get_config().search
+        self.max_keywords = max_keywords or search.get('max_keywords', 3)
+        self.min_word_length = min_word_length
+
+        language = get_language_utils()
+        self._automaton: AhoCorasick[Tuple[str, int]] = AhoCorasick()
+        self._canonical: Dict[str, str] = {}
+        for term_key, term in language.terminology.items():
+            self._canonical[term_key] = term
+            for form in language.get_term_translations(term_key).values():
+                key = search_key(form) if form else ""
+                if key:
+                    self._automaton.add(f" {key} ", (term_key, key.count(" ") + 1))
+        self._automaton.build()
+
+        self._stopwords = frozenset(stem_token(fold_text(w)) for w in STOPWORDS)
+
+    def extract(self, question: str) -> List[Keyword]:
+        """
+        Extract the strongest keywords from a question.
+        Sorawdan eń kúshli gilt sózlerdi alıw.
+
+        Args:
+            question: User question in any supported language or script
+                      Qálegen qollanılatuǵın tildegi yamasa jazıwdaǵı soraw
+
+        Returns:
+            Keywords, strongest first / Gilt sózler, eń kúshlisi birinshi
+        """
+        words = _WORD_RE.findall(to_latin(question))
+        stems = [stem_token(fold_text(word)) for word in words]
+
+        # Word index by character offset in the padded text / Ornı boyınsha sóz indeksi
+        offsets, position = {}, 1
+        for index, stem in enumerate(stems):
+            offsets[position] = index
+            position += len(stem) + 1
+        text = " " + " ".join(stems) + " "
+
+        candidates: Dict[str, Keyword] = {}
+        covered = set()
+
+        for start, end, (term_key, length) in self._automaton.iter(text):
+            first = offsets[start + 1]
+            covered.update(range(first, first + length))
+            weight = TERM_WEIGHT + TERM_WORD_BONUS * (length - 1)
+            canonical = self._canonical[term_key]
+            current = candidates.get(canonical)
+            if current is None or current.weight < weight:
+                candidates[canonical] = Keyword(canonical, weight, term_key)
+
+        for index, (word, stem) in enumerate(zip(words, stems)):
+            if index in covered or stem in self._stopwords:
+                continue
+            if stem.isdigit():
+                weight = NUMBER_WEIGHT
+            elif len(stem) >= self.min_word_length:
+                weight = WORD_WEIGHT
+            else:
+                continue
+            surface = self._surface_stem(word, stem)
+            if surface not in candidates:
+                candidates[surface] = Keyword(surface, weight)
+
+        ranked = sorted(candidates.values(), key=lambda k: (-k.weight, -len(k.text)))
+        return ranked[:self.max_keywords]
+
+    @staticmethod
+    def _surface_stem(word: str, stem: str) -> str:
+        """
+        Cut the original spelling to the stem length, keeping its diacritics.
+        Túpnusqa jazılıwdı diakritikaların saqlap túbir uzınlıǵına qısqartıw.
+
+        Remote endpoints compare with ``LCASE`` only, so ``urlıq`` finds
+        ``Urlıq`` where the folded ``urliq`` would not.
+        """
+        lowered = word.lower()
+        if len(fold_text(lowered)) == len(lowered):
+            return lowered[:len(stem)]
+        return stem
+
+
+# Global instance / Global misal
+_keyword_extractor: Optional[KeywordExtractor] = None
+
+
+def get_keyword_extractor() -> KeywordExtractor:
+    """
+    Get the process-wide keyword extractor.
+    Process boyınsha gilt sóz alıwshını alıw.
+
+    Returns:
+        KeywordExtractor instance / KeywordExtractor misalı
+    """
+    global _keyword_extractor
+    if _keyword_extractor is None:
+        _keyword_extractor = KeywordExtractor()
+    return _keyword_extractor
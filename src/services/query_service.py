@@ -3,12 +3,17 @@ Query service for huquqAI system
 Handles user queries and natural language processing
 """
 
-from typing import List, Dict, Any, Optional
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 from src.core.base import Service, QueryResult
 from src.core.config import get_config
+from src.services.keyword_extractor import get_keyword_extractor
 from src.services.sparql_service import SPARQLService
 from src.models.legal_entities import Query, Answer
+from src.utils.cache import TTLCache
+from src.utils.singleflight import SingleFlight
+from src.utils.tracing import span
 
 
 class QueryService(Service):
@@ -17,21 +22,42 @@ class QueryService(Service):
     def __init__(self):
         self.config = get_config()
         self.sparql_service = SPARQLService()
+        self.keyword_extractor = get_keyword_extractor()
         self.terminology = self.config.terminology.get("karakalpak", {})
+        self.answer_cache = _get_answer_cache()
 
     async def execute(self, query: Query) -> Answer:
-        """Execute user query"""
+        """
+        Execute user query
+        Answers are cached by language and extracted keywords, which are
+        exactly what the knowledge-base searches depend on, so rephrasings
+        and inflections of the same question share one entry; concurrent
+        misses for the same key wait for a single execution
+        """
         try:
             logger.info(f"Processing query: {query.question}")
 
-            # Extract keywords from query
-            keywords = self._extract_keywords(query.question)
+            with span("query_service.execute", language=query.language) as root:
+                # Extract keywords from query
+                with span("query_service.extract_keywords") as stage:
+                    keywords = self._extract_keywords(query.question)
+                    stage.set_attribute("keywords", len(keywords))
 
-            # Search for relevant articles
-            results = await self._search_knowledge_base(keywords, query.language)
+                cache_key = self._cache_key(keywords, query.language)
+                if self.answer_cache is not None:
+                    cached = self.answer_cache.get(cache_key)
+                    root.set_attribute("cache_hit", cached is not None)
+                    if cached is not None:
+                        return self._answer_for(cached, query)
 
-            # Generate answer
-            answer = await self._generate_answer(query, results)
+                # Identical in-flight questions share one execution
+                answer, shared = await _answer_flights.do(
+                    cache_key, self._answer, query, keywords, cache_key
+                )
+                root.set_attribute("coalesced", shared)
+                answer = self._answer_for(answer, query)
+
+                root.set_attribute("confidence", answer.confidence)
 
             return answer
 
@@ -44,35 +70,72 @@ class QueryService(Service):
                 sources=[]
             )
 
-    def _extract_keywords(self, question: str) -> List[str]:
-        """Extract keywords from question"""
-        # Simple keyword extraction
-        # In production, use NLP models
-        keywords = []
-
-        # Check for legal terms
-        for term_key, term_value in self.terminology.items():
-            if term_value.lower() in question.lower():
-                keywords.append(term_value)
-
-        # Add words from question (simple tokenization)
-        words = question.split()
-        keywords.extend([w for w in words if len(w) > 3])
+    async def _answer(self, query: Query, keywords: List[str],
+                      cache_key: Tuple[str, ...]) -> Answer:
+        """Search the knowledge base, build the answer and cache it"""
+        # Search for relevant articles
+        with span("query_service.search_knowledge_base", keywords=len(keywords)) as stage:
+            failures: List[str] = []
+            results = await self._search_knowledge_base(keywords, query.language, failures)
+            stage.set_attribute("results", len(results))
+
+        # Generate answer
+        with span("query_service.generate_answer"):
+            answer = await self._generate_answer(query, results)
 
-        return list(set(keywords))
+        # Endpoint failures must not be remembered as "not found"
+        if self.answer_cache is not None and not failures:
+            self.answer_cache.set(cache_key, answer)
+
+        return answer
+
+    @staticmethod
+    def _answer_for(answer: Answer, query: Query) -> Answer:
+        """
+        Caller's own copy of a cached or shared answer
+        The copy has the caller's query_id, no id and fresh timestamps, and
+        is deep so changing it leaves the cached answer untouched
+        """
+        now = datetime.now()
+        return answer.model_copy(
+            update={"id": None, "query_id": query.id or "unknown",
+                    "created_at": now, "updated_at": now},
+            deep=True
+        )
 
-    async def _search_knowledge_base(self, keywords: List[str],
-                                     language: str) -> List[Dict[str, Any]]:
-        """Search knowledge base using keywords"""
+    def _extract_keywords(self, question: str) -> List[str]:
+        """
+        Extract weighted legal-term keywords from question
+        Terminology terms (any language or script) come first in their
+        Karakalpak form, then non-stopword content words, capped at
+        search.max_keywords so each question triggers few searches
+        """
+        return [keyword.text for keyword in self.keyword_extractor.extract(question)]
+
+    @staticmethod
+    def _cache_key(keywords: List[str], language: str) -> Tuple[str, ...]:
+        """Answer cache key: language followed by the searched keywords"""
+        return (language, *keywords)
+
+    async def _search_knowledge_base(self, keywords: List[str], language: str,
+                                     failures: Optional[List[str]] = None
+                                     ) -> List[Dict[str, Any]]:
+        """
+        Search knowledge base using keywords
+        Keywords whose search failed are appended to ``failures``
+        """
         all_results = []
 
         for keyword in keywords:
             result = await self.sparql_service.search_articles(keyword, language)
+            if not result.success and failures is not None:
+                failures.append(keyword)
             if result.success and result.data:
                 all_results.extend(result.data)
 
         # Remove duplicates
-        unique_results = {r.get('article'): r for r in all_results}.values()
+        with span("query_service.dedup", rows=len(all_results)):
+            unique_results = {r.get('article'): r for r in all_results}.values()
         return list(unique_results)
 
     async def _generate_answer(self, query: Query,
@@ -120,3 +183,25 @@ class QueryService(Service):
             "confidence": answer.confidence,
             "sources": answer.sources
         }
+
+
+# In-flight answers by cache key / Orınlanıp atırǵan juwaplar
+_answer_flights = SingleFlight("answer")
+
+# Shared answer cache / Ortaq juwap keshi
+_answer_cache: Optional[TTLCache[Answer]] = None
+
+
+def _get_answer_cache() -> Optional[TTLCache[Answer]]:
+    """Answer cache configured by search.answer_cache, None when disabled"""
+    global _answer_cache
+    settings = get_config().search.get("answer_cache", {})
+    if not settings.get("enabled", True):
+        return None
+    if _answer_cache is None:
+        _answer_cache = TTLCache(
+            "answer",
+            max_size=settings.get("max_size", 1000),
+            ttl=settings.get("ttl", 600),
+        )
+    return _answer_cache
@@ -2,11 +2,14 @@
 SPARQL query service for huquqAI system
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from SPARQLWrapper import SPARQLWrapper, JSON, POST
 from loguru import logger
 from src.core.config import get_config
 from src.core.base import Service, QueryResult
+from src.utils.cache import bump_knowledge_version
+from src.utils.singleflight import SingleFlight
+from src.utils.tracing import span
 
 
 class SPARQLService(Service):
@@ -37,11 +40,13 @@ class SPARQLService(Service):
     async def _execute_select(self, query: str) -> QueryResult:
         """Execute SELECT query"""
         try:
-            self.endpoint.setQuery(query)
-            results = self.endpoint.query().convert()
+            with span("sparql_service.select", endpoint=self.endpoint.endpoint) as stage:
+                self.endpoint.setQuery(query)
+                results = self.endpoint.query().convert()
 
-            bindings = results.get("results", {}).get("bindings", [])
-            processed_results = self._process_results(bindings)
+                bindings = results.get("results", {}).get("bindings", [])
+                processed_results = self._process_results(bindings)
+                stage.set_attribute("rows", len(processed_results))
 
             return QueryResult(
                 success=True,
@@ -55,8 +60,10 @@ class SPARQLService(Service):
     async def _execute_update(self, query: str) -> QueryResult:
         """Execute UPDATE query"""
         try:
-            self.update_endpoint.setQuery(query)
-            self.update_endpoint.query()
+            with span("sparql_service.update"):
+                self.update_endpoint.setQuery(query)
+                self.update_endpoint.query()
+            bump_knowledge_version("SPARQL update")
 
             return QueryResult(
                 success=True,
@@ -78,7 +85,11 @@ class SPARQLService(Service):
         return processed
 
     async def search_articles(self, keyword: str, language: str = "kaa") -> QueryResult:
-        """Search articles by keyword"""
+        """
+        Search articles by keyword
+        The filter compares with LCASE, so concurrent searches differing only
+        in case share one endpoint round trip
+        """
         query = f"""
         PREFIX huquq: <{self.config.ontology.base_uri}>
         PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
@@ -95,10 +106,15 @@ class SPARQLService(Service):
                 CONTAINS(LCASE(?content), LCASE("{keyword}"))
             )
         }}
-        LIMIT {self.config.search.max_results}
+        LIMIT {self.config.search.get("max_results", 10)}
         """
 
-        return await self.execute(query)
+        with span("sparql_service.search_articles", keyword=keyword, language=language) as stage:
+            result, shared = await _search_flights.do(
+                (keyword.lower(), language), self.execute, query
+            )
+            stage.set_attribute("coalesced", shared)
+            return result
 
     async def get_article_by_number(self, article_number: str) -> QueryResult:
         """Get article by number"""
@@ -115,7 +131,63 @@ class SPARQLService(Service):
         }}
         """
 
-        return await self.execute(query)
+        with span("sparql_service.get_article_by_number", article_number=article_number):
+            return await self.execute(query)
+
+    async def get_articles_by_numbers(
+        self, refs: Sequence[Tuple[str, Optional[str]]]
+    ) -> QueryResult:
+        """
+        Get many articles in one query
+        refs are (article number, code type or None) pairs; they are bound
+        through a single VALUES block and the rows are returned in request
+        order, with None where no article matched
+        """
+        unique_refs = list(dict.fromkeys(refs))
+        values = " ".join(
+            f'({_literal(number)} {_literal(code) if code else "UNDEF"})'
+            for number, code in unique_refs
+        )
+        query = f"""
+        PREFIX huquq: <{self.config.ontology.base_uri}>
+
+        SELECT ?number ?article ?title ?content ?codeType
+        WHERE {{
+            VALUES (?number ?codeType) {{ {values} }}
+            ?article a huquq:Statiya ;
+                     huquq:articleNumber ?number ;
+                     huquq:title ?title ;
+                     huquq:content ?content ;
+                     huquq:codeType ?codeType .
+        }}
+        """
+
+        with span("sparql_service.get_articles_by_numbers", articles=len(unique_refs)) as stage:
+            result = await self.execute(query)
+            if not result.success:
+                return result
+
+            by_number: Dict[str, List[Dict[str, Any]]] = {}
+            for row in result.data or []:
+                by_number.setdefault(row.get("number"), []).append(row)
+
+            ordered = []
+            for number, code in refs:
+                rows = by_number.get(number, [])
+                match = next(
+                    (row for row in rows if code is None or row.get("codeType") == code),
+                    None
+                )
+                ordered.append(match)
+
+            found = sum(1 for row in ordered if row is not None)
+            stage.set_attribute("found", found)
+
+        return QueryResult(
+            success=True,
+            data=ordered,
+            metadata={"count": len(ordered), "found": found}
+        )
 
     async def get_crimes_by_type(self, crime_type: str) -> QueryResult:
         """Get crimes by type"""
@@ -135,7 +207,8 @@ class SPARQLService(Service):
         }}
         """
 
-        return await self.execute(query)
+        with span("sparql_service.get_crimes_by_type", crime_type=crime_type):
+            return await self.execute(query)
 
     async def get_related_articles(self, article_id: str) -> QueryResult:
         """Get related articles"""
@@ -150,4 +223,15 @@ class SPARQLService(Service):
         }}
         """
 
-        return await self.execute(query)
+        with span("sparql_service.get_related_articles", article_id=article_id):
+            return await self.execute(query)
+
+
+def _literal(value: str) -> str:
+    """Quote a string as a SPARQL literal"""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+# In-flight article searches by (lowercased keyword, language)
+_search_flights = SingleFlight("search_articles")
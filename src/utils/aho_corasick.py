@@ -0,0 +1,120 @@
+"""
+Aho-Corasick automaton for multi-pattern term spotting
+Kóp úlgili terminlerdi tabıw ushın Aho-Corasick avtomatı
+
+All patterns are compiled into one trie with failure links, so a text is
+scanned once, in O(len(text) + matches), however many terms are known.
+
+Barlıq úlgiler qátelik baylanısları bar bir trie-ge jıynaladı, sonlıqtan tekst
+terminler sanına qaramastan bir ret qaralıp shıǵıladı.
+"""
+
+from collections import deque
+from typing import Any, Dict, Generic, Iterator, List, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class AhoCorasick(Generic[T]):
+    """
+    Multi-pattern string matcher.
+    Kóp úlgili qatar izlewshi.
+
+    Examples / Misallar:
+        >>> automaton = AhoCorasick()
+        >>> automaton.add("jinayat", "crime")
+        >>> automaton.add("jaza", "punishment")
+        >>> automaton.build()
+        >>> list(automaton.iter("jinayat ushın jaza"))
+        [(0, 7, 'crime'), (14, 18, 'punishment')]
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # (pattern length, value) pairs ending at each state / Hár jaǵdayda tamamlanatuǵın úlgiler
+        self._output: List[List[Tuple[int, T]]] = [[]]
+        self._built = False
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, value: T) -> None:
+        """
+        Add a pattern; call ``build`` before matching.
+        Úlgi qosıw; izlewden aldın ``build`` shaqırıń.
+
+        Args:
+            pattern: Non-empty pattern / Bos emes úlgi
+            value: Value reported for matches / Sáykeslikte qaytarılatuǵın mánis
+        """
+        if not pattern:
+            raise ValueError("Pattern must not be empty / Úlgi bos bolmawı kerek")
+
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(pattern), value))
+        self._size += 1
+        self._built = False
+
+    def build(self) -> None:
+        """
+        Compute failure links (breadth-first).
+        Qátelik baylanısların esaplaw (keńlik boyınsha).
+        """
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+        self._built = True
+
+    def iter(self, text: str) -> Iterator[Tuple[int, int, T]]:
+        """
+        Yield every (start, end, value) occurrence, including overlaps.
+        Barlıq (baslanıw, tamamlanıw, mánis) sáykesliklerin qaytarıw.
+
+        Args:
+            text: Text to scan / Qaralatuǵın tekst
+
+        Yields:
+            Match spans ordered by end position / Tamamlanıw ornı boyınsha sáykeslikler
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in output[state]:
+                yield index + 1 - length, index + 1, value
+
+    def find_all(self, text: str) -> List[Tuple[int, int, Any]]:
+        """
+        List of all occurrences / Barlıq sáykeslikler listi
+        """
+        return list(self.iter(text))
@@ -0,0 +1,192 @@
+"""
+In-memory TTL + LRU caches invalidated by knowledge-base version
+Bilimler bazası versiyası menen jaramsız etiletuǵın yadtaǵı TTL + LRU keshler
+
+Every entry remembers the knowledge-base version it was computed against.
+Reloading the ontology, adding individuals or running a SPARQL update bumps the
+version through ``bump_knowledge_version()``, after which older entries are
+treated as misses, so no cache has to be cleared explicitly.
+
+Hár jazıw óz esaplanǵan bilimler bazası versiyasın saqlaydı. Ontologiya qayta
+júklengende yamasa SPARQL jańalanǵanda versiya ósedi ha'm eski jazıwlar
+esapqa alınbaydı.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+from src.utils.metrics import get_metrics_registry
+
+
+V = TypeVar("V")
+
+_metrics = get_metrics_registry()
+CACHE_REQUESTS = _metrics.counter(
+    "huquqai_cache_requests_total", "Cache lookups by cache and result", ["cache", "result"]
+)
+CACHE_ENTRIES = _metrics.gauge(
+    "huquqai_cache_entries", "Entries currently held by each cache", ["cache"]
+)
+CACHE_EVICTIONS = _metrics.counter(
+    "huquqai_cache_evictions_total", "Cache entries dropped by reason", ["cache", "reason"]
+)
+
+# Knowledge-base version / Bilimler bazası versiyası
+_knowledge_version = 0
+_version_lock = Lock()
+
+# Named caches for the admin API / Admin API ushın atalǵan keshler
+_caches: Dict[str, 'TTLCache'] = {}
+
+
+def knowledge_version() -> int:
+    """
+    Current knowledge-base version.
+    Bilimler bazasınıń házirgi versiyası.
+    """
+    return _knowledge_version
+
+
+def bump_knowledge_version(reason: str = "") -> int:
+    """
+    Mark every cached answer derived from the knowledge base as stale.
+    Bilimler bazasınan alınǵan barlıq keshlengen juwaplardı eskirgen dep belgilew.
+
+    Args:
+        reason: Why the knowledge base changed, for the log / Sebebi
+
+    Returns:
+        New version / Jańa versiya
+    """
+    global _knowledge_version
+    with _version_lock:
+        _knowledge_version += 1
+        version = _knowledge_version
+    logger.debug(f"Knowledge base version {version} ({reason}) / "
+                f"Bilimler bazası versiyası {version} ({reason})")
+    return version
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe LRU cache with per-entry expiry and version checks.
+    Hár jazıw múddeti ha'm versiya tekseriwi bar aǵımǵa qáwipsiz LRU kesh.
+
+    Examples / Misallar:
+        >>> cache = TTLCache("answer", max_size=1000, ttl=600)
+        >>> answer = cache.get(key)
+        >>> if answer is None:
+        ...     answer = compute()
+        ...     cache.set(key, answer)
+    """
+
+    def __init__(self, name: str, max_size: int = 1000, ttl: float = 600.0,
+                 versioned: bool = True):
+        """
+        Args:
+            name: Cache name used in metrics / Metrikalardaǵı kesh atı
+            max_size: Entries kept before evicting the least recently used
+                      Eń az qollanılǵanı shıǵarılmastan aldın saqlanatuǵın jazıwlar
+            ttl: Seconds an entry stays valid / Jazıwdıń jaramlılıq waqtı sekundlarda
+            versioned: Drop entries older than the knowledge-base version
+                       Bilimler bazası versiyasınan eski jazıwlardı taslaw
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl = ttl
+        self.versioned = versioned
+        self._data: "OrderedDict[Hashable, Tuple[V, float, int]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+        self._hit_counter = CACHE_REQUESTS.labels(cache=name, result="hit")
+        self._miss_counter = CACHE_REQUESTS.labels(cache=name, result="miss")
+        CACHE_ENTRIES.labels(cache=name).set_function(lambda: len(self._data))
+        _caches[name] = self
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        Look up a fresh entry and mark it recently used.
+        Jaramlı jazıwdı tabıw ha'm onı jaqında qollanılǵan dep belgilew.
+
+        Returns:
+            Cached value or None / Keshlengen mánis yamasa None
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires, version = entry
+                if expires < now:
+                    del self._data[key]
+                    CACHE_EVICTIONS.labels(cache=self.name, reason="expired").inc()
+                elif self.versioned and version != _knowledge_version:
+                    del self._data[key]
+                    CACHE_EVICTIONS.labels(cache=self.name, reason="stale").inc()
+                else:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    self._hit_counter.inc()
+                    return value
+            self.misses += 1
+        self._miss_counter.inc()
+        return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+        Mánisti saqlaw, tolı bolsa eń az qollanılǵanın shıǵarıw.
+        """
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl, _knowledge_version)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                CACHE_EVICTIONS.labels(cache=self.name, reason="lru").inc()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry / Bir jazıwdı óshiriw"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries / Barlıq jazıwlardı óshiriw"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Size and hit-rate summary.
+        Ólshem ha'm tabıs úlesi juwmaǵı.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'name': self.name,
+            'size': len(self._data),
+            'max_size': self.max_size,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+def cache_stats() -> List[Dict[str, Any]]:
+    """
+    Statistics of every named cache.
+    Barlıq atalǵan keshlerdiń statistikası.
+    """
+    return [cache.stats() for cache in _caches.values()]
+
+
+def get_cache(name: str) -> Optional[TTLCache]:
+    """Find a named cache / Atalǵan keshti tabıw"""
+    return _caches.get(name)
@@ -6,6 +6,8 @@ import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from src.utils.normalization import fold_text_cased
+
 
 def clean_text(text: str) -> str:
     """Clean and normalize text"""
@@ -56,22 +58,10 @@ def paginate(items: List[Any], page: int = 1, page_size: int = 10) -> Dict[str,
 def normalize_karakalpak_text(text: str) -> str:
     """
     Normalize Karakalpak text
-    Handle different character encodings
+    Handle different character encodings (ǵ/g, ń/n, ı/i, ú/u, ó/o, ...)
+    in a single translate pass, keeping letter case
     """
-    # Mapping of similar characters
-    replacements = {
-        'ń': 'n',
-        'ǵ': 'g',
-        'ı': 'i',
-        'ú': 'u',
-        'ó': 'o'
-    }
-
-    normalized = text
-    for old, new in replacements.items():
-        normalized = normalized.replace(old, new)
-
-    return normalized
+    return fold_text_cased(text)
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
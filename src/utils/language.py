@@ -3,34 +3,77 @@ Language utilities for huquqAI system
 Til qollaniw ushın kómeқlik funktsialar
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 from src.core.config import get_config
+from src.utils.aho_corasick import AhoCorasick
+from src.utils.normalization import search_key
+from src.utils.transliteration import detect_script_language
+
+
+# (term key, language) pair / (termin gilti, til) jubı
+TermRef = Tuple[str, str]
 
 
 class LanguageUtils:
-    """Language utility class"""
+    """
+    Language utility class
+    Lookup tables are built once: a reverse map from the normalized form of
+    every term in every language to its term key, and an Aho-Corasick
+    automaton over the same forms for spotting terms in free text
+    """
 
     def __init__(self):
         self.config = get_config()
         self.terminology = self.config.terminology.get("karakalpak", {})
         self.translations = self.config.terminology.get("translations", {})
 
+        # Normalized term -> every (term key, language) it spells
+        self._term_index: Dict[str, List[TermRef]] = {}
+        for term_key in self.terminology:
+            for lang, term in self.get_term_translations(term_key).items():
+                if term:
+                    self._term_index.setdefault(search_key(term), []).append((term_key, lang))
+
+        # Patterns are padded with spaces so only whole words match
+        self._automaton: AhoCorasick[str] = AhoCorasick()
+        for key in self._term_index:
+            if key:
+                self._automaton.add(f" {key} ", key)
+        self._automaton.build()
+
+    def lookup_term(self, term: str, lang: Optional[str] = None) -> Optional[TermRef]:
+        """
+        Find the term key of a term written in any supported language or script
+        Prefers the reading in ``lang`` when a spelling is shared
+        """
+        refs = self._term_index.get(search_key(term))
+        if not refs:
+            return None
+        for ref in refs:
+            if ref[1] == lang:
+                return ref
+        return refs[0]
+
     def translate_term(self, term: str, from_lang: str = "kaa",
                        to_lang: str = "en") -> str:
         """Translate legal term between languages"""
-        # Find term in Karakalpak terminology
-        term_key = None
-        for key, value in self.terminology.items():
-            if value.lower() == term.lower():
-                term_key = key
-                break
-
-        if not term_key:
+        ref = self.lookup_term(term, from_lang)
+        if not ref:
             return term  # Return original if not found
 
         # Get translation
-        term_translations = self.translations.get(term_key, {})
-        return term_translations.get(to_lang, term)
+        return self.get_term_translations(ref[0]).get(to_lang) or term
+
+    def find_terms(self, text: str) -> List[Tuple[str, TermRef]]:
+        """
+        Spot known terms in text in a single pass
+        Returns (normalized term, (term key, language)) in text order
+        """
+        found = []
+        for _, _, key in self._automaton.iter(f" {search_key(text)} "):
+            for ref in self._term_index[key]:
+                found.append((key, ref))
+        return found
 
     def get_supported_languages(self) -> list:
         """Get list of supported languages"""
@@ -51,25 +94,43 @@ class LanguageUtils:
         result.update(translations)
         return result
 
+    def term_synonyms(self) -> Dict[str, List[str]]:
+        """
+        Translations of each Karakalpak term, keyed by its search key
+        Used to store translated forms next to labels in the label index
+        """
+        synonyms = {}
+        for term_key, term in self.terminology.items():
+            translations = self.translations.get(term_key, {})
+            if translations:
+                synonyms[search_key(term)] = list(translations.values())
+        return synonyms
+
     def detect_language(self, text: str) -> Optional[str]:
         """
         Detect language of text
-        Simple detection based on terminology
+        Script-specific letters first (Latin/Cyrillic Karakalpak, Uzbek,
+        Russian), then known terms in every supported language, Karakalpak
+        first when a spelling is shared
         In production, use proper language detection library
         """
-        # Check for Karakalpak specific characters
-        karakalpak_chars = set("ǵńıúó")
-        if any(char in text for char in karakalpak_chars):
-            return "kaa"
+        detected = detect_script_language(text)
+        if detected:
+            return detected
+
+        languages = [ref[1] for _, ref in self.find_terms(text)]
+        if not languages:
+            return None
+        return "kaa" if "kaa" in languages else languages[0]
 
-        # Check for specific terms
-        for term in self.terminology.values():
-            if term.lower() in text.lower():
-                return "kaa"
 
-        return None
+# Global instance
+_language_utils: Optional[LanguageUtils] = None
 
 
 def get_language_utils() -> LanguageUtils:
     """Get language utils instance"""
-    return LanguageUtils()
+    global _language_utils
+    if _language_utils is None:
+        _language_utils = LanguageUtils()
+    return _language_utils
@@ -0,0 +1,345 @@
+"""
+Process-wide metrics registry with Prometheus text exposition
+Prometheus tekst formatı menen process boyınsha metrikalar reestri
+
+Counters, gauges and histograms are registered once by name and shared by the
+API, SPARQL engine, reasoner, ontology manager and Telegram bot. The registry
+renders the Prometheus text format (version 0.0.4), so ``/metrics`` can be
+scraped without any client library.
+
+Hisablawıshlar, ólshewishler ha'm gistogrammalar bir ret atı boyınsha dizimge
+alınadı ha'm barlıq komponentler tárepinen bólisiledi.
+"""
+
+import math
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Default latency buckets in seconds / Sekundlardaǵı áhmiyetli keshigiw sebetleri
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value / Úlgi mánisin formatlaw"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value / Belgi mánisin ekranlaw"""
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str],
+                   extra: Optional[Tuple[str, str]] = None) -> str:
+    """Render ``{a="x",b="y"}`` / Belgilerdi formatlaw"""
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """
+    Base class for labelled metrics.
+    Belgili metrikalar ushın bazalıq klass.
+    """
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str, **kwargs: str):
+        """
+        Return the child for one label combination.
+        Bir belgiler kombinaciyası ushın balanı qaytarıw.
+        """
+        if kwargs:
+            if set(kwargs) != set(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {tuple(kwargs)}"
+                )
+            values = tuple(str(kwargs[name]) for name in self.labelnames)
+        else:
+            values = tuple(str(v) for v in values)
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values}"
+            )
+        with self._lock:
+            child = self._children.get(values)
+            if child is None:
+                child = self._new_child()
+                self._children[values] = child
+            return child
+
+    def _default(self):
+        """Child used when the metric has no labels / Belgisiz metrika balası"""
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Render HELP, TYPE and samples / HELP, TYPE ha'm úlgilerdi formatlaw"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(self._samples())
+        return lines
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing counter.
+    Tek ósetuǵın hisablawısh.
+    """
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the unlabelled counter / Belgisiz hisablawıshtı arttırıw"""
+        self._default().inc(amount)
+
+    def total(self) -> float:
+        """Sum over all label combinations / Barlıq belgiler boyınsha jıyındı"""
+        with self._lock:
+            return sum(child.value for child in self._children.values())
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class _GaugeChild:
+    def __init__(self):
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+        self._lock = Lock()
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.function = function
+
+    def get(self) -> float:
+        if self.function is not None:
+            try:
+                return float(self.function())
+            except Exception:
+                return float('nan')
+        return self.value
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down, optionally computed at scrape time.
+    Kóbeyip hám azayatuǵın mánis, talap boyınsha esaplanıwı múmkin.
+    """
+    type_name = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge / Belgisiz ólshewishti ornatıw"""
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the value at scrape time / Mánisti oqıw waqtında esaplaw"""
+        self._default().set_function(function)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            value = child.get()
+            if math.isnan(value):
+                continue
+            yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}"
+
+
+class _HistogramChild:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[index] += 1
+                    break
+
+
+class Histogram(_Metric):
+    """
+    Bucketed distribution of observations (for example latencies).
+    Ólshewlerdiń sebetlengen bólistiriliwi (mısalı keshigiwler).
+    """
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets)
+        if not bounds or not math.isinf(bounds[-1]):
+            bounds.append(float('inf'))
+        self.buckets = tuple(bounds)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record an unlabelled observation / Belgisiz ólshewdi jazıw"""
+        self._default().observe(value)
+
+    def _samples(self) -> Iterable[str]:
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            with child._lock:
+                counts = list(child.counts)
+                total, count = child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, values, ("le", _format_value(bound)))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """
+    Registry of named metrics.
+    Atalǵan metrikalar reestri.
+
+    Registration is idempotent: asking for an existing name returns the same
+    metric, so modules can declare the metrics they use at import time.
+
+    Examples / Misallar:
+        >>> registry = get_metrics_registry()
+        >>> queries = registry.counter("huquqai_sparql_queries_total", "Queries", ["status"])
+        >>> queries.labels(status="ok").inc()
+        >>> print(registry.render())
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = Lock()
+
+    def _register(self, cls, name: str, documentation: str,
+                  labelnames: Sequence[str], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, labelnames, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered with a different shape")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter / Hisablawıshtı alıw yamasa jaratıw"""
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge / Ólshewishti alıw yamasa jaratıw"""
+        return self._register(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Get or create a histogram / Gistogrammanı alıw yamasa jaratıw"""
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Look up a metric by name / Metrikani atı boyınsha tabıw"""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text format.
+        Barlıq metrikalardı Prometheus tekst formatında shıǵarıw.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Global registry / Global reestr
+_registry: Optional[MetricsRegistry] = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the process-wide metrics registry.
+    Process boyınsha metrikalar reestrin alıw.
+
+    Returns:
+        MetricsRegistry instance / MetricsRegistry misalı
+    """
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
@@ -0,0 +1,235 @@
+"""
+Karakalpak text normalization and stemming for search
+Izlew ushın Qaraqalpaq tekstin normalizaciyalaw ha'm túbir ajıratıw
+
+Every search path (label index, SPARQL filters, bot keyword search) folds text
+through the same pipeline so that stored labels and user queries meet in one
+form:
+
+1. ``casefold`` and a single ``str.translate`` pass that maps diacritic variants
+   (ǵ→g, ń→n, ı→i, ú→u, ó→o, á→a, ū→u …) to ASCII base letters, transliterates
+   Cyrillic (урлық → urliq, see ``src.utils.transliteration``) and drops
+   combining marks and apostrophes;
+2. tokenization on word characters;
+3. suffix stripping for the common Karakalpak case, possessive and plural
+   endings (jinayattıń → jinayat, jazası → jaza, nızamlardıń → nizam).
+
+Saqlanǵan labellar ha'm paydalanıwshı sorawları bir formaǵa kelıwı ushın barlıq
+izlew jolları tekstti usı bir konveyer arqalı ótkeredi.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from rdflib import Literal, URIRef
+
+from src.utils.transliteration import CYRILLIC_TO_LATIN
+
+
+# Diacritic and look-alike folding / Diakritik ha'm uqsas háriplerdi birlestiriw
+_LETTER_MAP: Dict[str, str] = {
+    'ǵ': 'g', 'ğ': 'g', 'ń': 'n', 'ñ': 'n', 'ı': 'i', 'ú': 'u', 'ü': 'u',
+    'ū': 'u', 'ó': 'o', 'ö': 'o', 'á': 'a', 'ä': 'a', 'ş': 's', 'ç': 'c',
+    'í': 'i', 'é': 'e',
+    # Cyrillic je that slips into Latin-script text (nátiyјe)
+    # Latın jazıwlı tekstke kirip qalatuǵın kirill ј háripi
+    'ј': 'j',
+}
+
+# Cyrillic (Karakalpak, Uzbek, Russian) straight to folded Latin
+# Kirill háriplerin tikkeley birlestirilgen latınǵa
+_CYRILLIC_MAP: Dict[str, str] = {
+    k: ''.join(_LETTER_MAP.get(c, c) for c in v) for k, v in CYRILLIC_TO_LATIN.items()
+}
+
+# Combining diacritics, for decomposed input / Qosılatuǵın diakritik belgiler
+_COMBINING = {code: None for code in range(0x0300, 0x0370)}
+
+# Apostrophes used in ha'm, ma'lumot / Apostroflar
+_APOSTROPHES = {ord(c): None for c in "'’ʻʼ`"}
+
+
+
+def _compile_table(mapping: Dict[int, Optional[str]]) -> List[Optional[str]]:
+    """
+    Turn a translate mapping into a list indexed by code point.
+    Audarma keste-sin kod noqatı boyınsha indekslengen listke aylandırıw.
+
+    ``str.translate`` looks up a list by index instead of hashing every
+    character, which is about twice as fast on short labels; code points past
+    the end of the list are left unchanged.
+    """
+    table: List[Optional[str]] = [chr(code) for code in range(max(mapping) + 1)]
+    for code, value in mapping.items():
+        table[code] = value
+    return table
+
+
+_FOLD_TABLE = _compile_table({
+    **str.maketrans(_LETTER_MAP),
+    **str.maketrans(_CYRILLIC_MAP),
+    **_COMBINING,
+    **_APOSTROPHES,
+})
+
+# Case-preserving table for normalize_karakalpak_text / Registrdi saqlaytuǵın keste
+_FOLD_TABLE_CASED = _compile_table({
+    **str.maketrans(_LETTER_MAP),
+    **str.maketrans({k.upper(): v.upper() for k, v in _LETTER_MAP.items() if k.upper() != k}),
+    **_COMBINING,
+})
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# Suffixes on folded text, longest first within each group
+# Birlestirilgen tekstegi qosımtalar, hár toparda eń uzını birinshi
+_SUFFIX_GROUPS: Tuple[Tuple[str, ...], ...] = (
+    # Case endings / Seplik jalǵawları
+    ('lardin', 'lerdin', 'lardan', 'lerden',
+     'nin', 'din', 'tin', 'nan', 'nen', 'dan', 'den', 'tan', 'ten',
+     'ga', 'ge', 'qa', 'ke', 'ni', 'di', 'ti', 'da', 'de', 'ta', 'te',
+     'na', 'ne'),
+    # Possessive endings / Tartım jalǵawları
+    ('imiz', 'iniz', 'si', 'im', 'in', 'i'),
+    # Plural / Kóplik
+    ('lar', 'ler', 'dar', 'der', 'tar', 'ter'),
+)
+
+_VOWELS = frozenset('aeiou')
+
+# Shortest stem kept after stripping / Qosımta alınǵannan keyingi eń qısqa túbir
+MIN_STEM_LENGTH = 4
+
+# Namespace for custom SPARQL functions / Arnawlı SPARQL funkciyaları namespace
+FUNCTION_NS = "http://huquqai.org/function#"
+SEARCH_KEY_FUNCTION = URIRef(FUNCTION_NS + "searchKey")
+
+
+def fold_text(text: str) -> str:
+    """
+    Case-fold and map diacritic variants to base letters.
+    Kishi háriplerge ótkeriw ha'm diakritik variantların tiykarǵı háriplerge aylandırıw.
+
+    Examples / Misallar:
+        >>> fold_text("Ūrlıq")
+        'urliq'
+        >>> fold_text("Жинаяттың")
+        'jinayattin'
+    """
+    return text.casefold().translate(_FOLD_TABLE)
+
+
+def fold_text_cased(text: str) -> str:
+    """
+    Map diacritic variants to base letters, keeping letter case.
+    Registrdi saqlap, diakritik variantlardı tiykarǵı háriplerge aylandırıw.
+    """
+    return text.translate(_FOLD_TABLE_CASED)
+
+
+@lru_cache(maxsize=65536)
+def stem_token(token: str) -> str:
+    """
+    Strip Karakalpak inflectional suffixes from a folded token.
+    Birlestirilgen tokennen Qaraqalpaq jalǵawların alıp taslaw.
+
+    Each suffix group is tried once, from the outermost (case) to the
+    innermost (plural). A suffix is only removed when the remaining stem keeps
+    at least ``MIN_STEM_LENGTH`` characters and agrees with the suffix's
+    harmony: t-/d- and vowel-initial endings follow consonants, s- endings
+    follow vowels and n- endings follow vowels or nasals (so jinayatı →
+    jinayat, not jinaya).
+
+    Args:
+        token: Folded token / Birlestirilgen token
+
+    Returns:
+        Stem / Túbir
+
+    Examples / Misallar:
+        >>> stem_token("nizamlardin")
+        'nizam'
+        >>> stem_token("jazasi")
+        'jaza'
+    """
+    stem = token
+    for group in _SUFFIX_GROUPS:
+        for suffix in group:
+            if stem.endswith(suffix) and _can_strip(stem[:-len(suffix)], suffix):
+                stem = stem[:-len(suffix)]
+                break
+    return stem
+
+
+def _can_strip(stem: str, suffix: str) -> bool:
+    """Check a suffix fits the stem it would leave / Qosımta túbirge sáykes pe"""
+    if len(stem) < MIN_STEM_LENGTH:
+        return False
+    ends_in_vowel = stem[-1] in _VOWELS
+    if suffix[0] == 'n':
+        return ends_in_vowel or stem[-1] in 'mn'
+    if suffix[0] == 's':
+        return ends_in_vowel
+    if suffix[0] in 'td' or suffix[0] in _VOWELS:
+        return not ends_in_vowel
+    return True
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Folded tokens of a text, without stemming.
+    Tekstiń túbirsiz birlestirilgen tokenleri.
+    """
+    return _TOKEN_RE.findall(fold_text(text))
+
+
+def search_tokens(text: str) -> List[str]:
+    """
+    Folded and stemmed tokens of a text.
+    Tekstiń birlestirilgen ha'm túbirlengen tokenleri.
+
+    Examples / Misallar:
+        >>> search_tokens("Jinayattıń awır túri")
+        ['jinayat', 'awir', 'turi']
+    """
+    return [stem_token(token) for token in _TOKEN_RE.findall(fold_text(text))]
+
+
+@lru_cache(maxsize=65536)
+def search_key(text: str) -> str:
+    """
+    Normalized form used on both the index and the query side.
+    Indeks ha'm soraw tárepinde qollanılatuǵın normalizaciyalanǵan forma.
+
+    Args:
+        text: Label, literal or query text / Label, literal yamasa soraw teksti
+
+    Returns:
+        Space-separated stemmed tokens / Probel menen ajıratılǵan túbirler
+
+    Examples / Misallar:
+        >>> search_key("Jinayattıń") == search_key("jinayat")
+        True
+    """
+    return " ".join(search_tokens(text))
+
+
+def _sparql_search_key(value: Optional[Literal] = None, *args) -> Literal:
+    """SPARQL binding for ``search_key`` / ``search_key`` ushın SPARQL funkciyası"""
+    return Literal(search_key(str(value)) if value is not None else "")
+
+
+def register_sparql_functions() -> None:
+    """
+    Register ``hf:searchKey`` with rdflib's SPARQL engine.
+    ``hf:searchKey`` funkciyasın rdflib SPARQL mexanizminde dizimge alıw.
+
+    Queries can then normalize stored literals exactly like the query text:
+
+        PREFIX hf: <http://huquqai.org/function#>
+        FILTER(CONTAINS(hf:searchKey(?label), "jinayat"))
+    """
+    from rdflib.plugins.sparql.operators import register_custom_function
+
+    register_custom_function(SEARCH_KEY_FUNCTION, _sparql_search_key, override=True)
@@ -0,0 +1,87 @@
+"""
+Single-flight coalescing of identical concurrent calls
+Birdey parallel shaqırıwlardı bir orınlawǵa biriktiriw
+
+While a call for a key is running, later callers with the same key await the
+same task instead of starting their own, so a burst of identical questions
+reaches the SPARQL endpoint once. Nothing is remembered after the task
+finishes; caching finished results is ``src.utils.cache``'s job.
+
+Bir gilt ushın shaqırıw orınlanıp atırǵanda, sol gilt penen kelgen keyingi
+shaqırıwlar óz orınlawın baslamay, sol tapsırmanı kútedi.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+from src.utils.metrics import get_metrics_registry
+
+
+T = TypeVar("T")
+
+_metrics = get_metrics_registry()
+SINGLEFLIGHT_CALLS = _metrics.counter(
+    "huquqai_singleflight_calls_total",
+    "Coalesced calls by group and role (leader executes, shared waits)",
+    ["group", "role"]
+)
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls by key.
+    Gilt boyınsha parallel async shaqırıwlardı qaytalamaw.
+
+    The shared task is shielded, so one caller being cancelled (client
+    disconnect) does not cancel the work the other callers are waiting for.
+
+    Examples / Misallar:
+        >>> flights = SingleFlight("search")
+        >>> result = await flights.do(("urlıq", "kaa"), search, "urlıq", "kaa")
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Group name used in metrics / Metrikalardaǵı topar atı
+        """
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._leader = SINGLEFLIGHT_CALLS.labels(group=name, role="leader")
+        self._shared = SINGLEFLIGHT_CALLS.labels(group=name, role="shared")
+
+    async def do(self, key: Hashable, function: Callable[..., Awaitable[T]],
+                 *args: Any, **kwargs: Any) -> Tuple[T, bool]:
+        """
+        Run ``function`` unless a call with the same key is already running.
+        Sol gilt penen shaqırıw orınlanbay atırǵan bolsa ``function``-dı orınlaw.
+
+        Args:
+            key: Normalized call key / Normallastırılǵan shaqırıw gilti
+            function: Coroutine function to run / Orınlanatuǵın korutina funkciyası
+
+        Returns:
+            (result, shared) - shared is True when another caller's run was reused
+            (nátiyje, shared) - basqa shaqırıwdıń nátiyjesi alınsa shared True
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if shared:
+            self._shared.inc()
+        else:
+            task = asyncio.ensure_future(function(*args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+            self._leader.inc()
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        """Drop a finished task / Tamamlanǵan tapsırmanı óshiriw"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
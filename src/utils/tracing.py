@@ -0,0 +1,300 @@
+"""
+Lightweight request tracing with in-memory span storage
+Yadta saqlanatuǵın jeńil soraw izlew (tracing)
+
+Spans are opened with ``span()`` (or the ``traced`` decorator) and nest through
+``contextvars``, so the parent/child relation follows the async call chain
+(API route → QueryService → SPARQLService → SPARQLEngine) without passing
+anything explicitly. Finished traces are kept in a ring buffer and can be read
+back through the admin API; no external collector is needed.
+
+Span-lar ``span()`` arqalı ashıladı ha'm ``contextvars`` arqalı asinxron
+shaqırıwlar shınjırı boyınsha bir-birine kiredi. Tamamlanǵan izler saqıyna
+buferde saqlanadı ha'm admin API arqalı oqıladı.
+"""
+
+import asyncio
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+from src.core.config import get_config
+
+
+@dataclass
+class Span:
+    """
+    One timed unit of work inside a trace.
+    Iz ishindegi bir waqıt ólshengen jumıs birligi.
+    """
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start: float = field(default_factory=time.time)
+    duration: float = 0.0
+    status: str = "ok"
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach an attribute / Atribut qosıw"""
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-friendly dict / JSON ushın dict kórinisine aylandırıw"""
+        return {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': self.start,
+            'duration_ms': round(self.duration * 1000, 3),
+            'status': self.status,
+            'error': self.error,
+            'attributes': {k: _jsonable(v) for k, v in self.attributes.items()},
+        }
+
+
+def _jsonable(value: Any) -> Any:
+    """Keep attribute values JSON-friendly / Atribut mánislerin JSON ushın saqlaw"""
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def _new_id(length: int) -> str:
+    """Random hex identifier / Tosınnan hex identifikator"""
+    return os.urandom(length // 2).hex()
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("huquqai_current_span", default=None)
+
+
+class Tracer:
+    """
+    Collects finished spans into traces kept in a ring buffer.
+    Tamamlanǵan span-lardı saqıyna buferdegi izlerge jıynaydı.
+
+    Examples / Misallar:
+        >>> tracer = get_tracer()
+        >>> with span("query_service.execute", question=question):
+        ...     with span("query_service.extract_keywords"):
+        ...         keywords = extract(question)
+        >>> tracer.traces(limit=1)[0]['spans']
+    """
+
+    # Unfinished traces kept before the oldest is dropped / Tamamlanbaǵan izler shegi
+    MAX_PENDING = 1000
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        buffer_size: int = 200,
+        log_spans: bool = False,
+        slow_threshold: float = 1.0
+    ):
+        """
+        Args:
+            enabled: Record spans / Span-lardı jazıw
+            buffer_size: Finished traces kept / Saqlanatuǵın izler sanı
+            log_spans: Log every finished trace at DEBUG / Hár izdi DEBUG-ta loglaw
+            slow_threshold: Seconds after which a trace is logged at INFO / Áste iz shegi
+        """
+        self.enabled = enabled
+        self.log_spans = log_spans
+        self.slow_threshold = slow_threshold
+        self._traces: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self._pending: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._lock = Lock()
+
+    def finish(self, finished: Span) -> None:
+        """
+        Record a finished span; close the trace when the root finishes.
+        Tamamlanǵan span-dı jazıw; túbir tamamlanǵanda izdi jabıw.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            spans = self._pending.setdefault(finished.trace_id, [])
+            spans.append(finished)
+            if finished.parent_id is not None:
+                if len(self._pending) > self.MAX_PENDING:
+                    self._pending.popitem(last=False)
+                return
+            del self._pending[finished.trace_id]
+            trace = self._build_trace(finished, spans)
+            self._traces.append(trace)
+
+        if finished.duration >= self.slow_threshold:
+            logger.info(f"Slow trace / Áste iz: {self.format_trace(trace)}")
+        elif self.log_spans:
+            logger.debug(f"Trace / Iz: {self.format_trace(trace)}")
+
+    @staticmethod
+    def _build_trace(root: Span, spans: List[Span]) -> Dict[str, Any]:
+        """Assemble spans into a nested tree / Span-lardan aǵash jasaw"""
+        nodes = {s.span_id: {**s.to_dict(), 'children': []} for s in spans}
+        for s in sorted(spans, key=lambda item: item.start):
+            if s.parent_id in nodes:
+                nodes[s.parent_id]['children'].append(nodes[s.span_id])
+        return {
+            'trace_id': root.trace_id,
+            'name': root.name,
+            'start': root.start,
+            'duration_ms': round(root.duration * 1000, 3),
+            'status': root.status,
+            'span_count': len(spans),
+            'root': nodes[root.span_id],
+        }
+
+    @staticmethod
+    def format_trace(trace: Dict[str, Any]) -> str:
+        """
+        One-line summary of a trace with per-stage timings.
+        Basqıshlar waqtı menen izdiń bir qatarlı juwmaǵı.
+        """
+        parts: List[str] = []
+
+        def walk(node: Dict[str, Any], depth: int) -> None:
+            parts.append(f"{'>' * depth}{node['name']}={node['duration_ms']}ms")
+            for child in node['children']:
+                walk(child, depth + 1)
+
+        walk(trace['root'], 0)
+        return f"{trace['trace_id']} " + " ".join(parts)
+
+    def traces(self, limit: Optional[int] = None, min_duration_ms: float = 0.0
+               ) -> List[Dict[str, Any]]:
+        """
+        Most recent traces, newest first.
+        Eń sońǵı izler, jańası birinshi.
+
+        Args:
+            limit: Maximum traces / Eń kóp izler
+            min_duration_ms: Skip faster traces / Bunnan tez izlerdi ótkerip jiberiw
+
+        Returns:
+            List of trace trees / Iz aǵashları listi
+        """
+        with self._lock:
+            traces = [t for t in reversed(self._traces) if t['duration_ms'] >= min_duration_ms]
+        return traces[:limit] if limit else traces
+
+    def get_trace(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """Find a trace by id / Izdi identifikatorı boyınsha tabıw"""
+        with self._lock:
+            for trace in self._traces:
+                if trace['trace_id'] == trace_id:
+                    return trace
+        return None
+
+    def clear(self) -> None:
+        """Drop all stored traces / Barlıq izlerdi óshiriw"""
+        with self._lock:
+            self._traces.clear()
+            self._pending.clear()
+
+
+# Global tracer / Global tracer
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """
+    Get the process-wide tracer configured from ``monitoring.tracing``.
+    ``monitoring.tracing`` boyınsha sazlanǵan process tracer-in alıw.
+
+    Returns:
+        Tracer instance / Tracer misalı
+    """
+    global _tracer
+    if _tracer is None:
+        settings = get_config().monitoring.get("tracing", {})
+        _tracer = Tracer(
+            enabled=settings.get("enabled", True),
+            buffer_size=settings.get("buffer_size", 200),
+            log_spans=settings.get("log_spans", False),
+            slow_threshold=settings.get("slow_threshold", 1.0)
+        )
+    return _tracer
+
+
+def current_span() -> Optional[Span]:
+    """Span active in the current context / Házirgi kontekstegi span"""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Time a block of work as a child of the current span.
+    Jumıs blokın házirgi span-nıń balası retinde ólshew.
+
+    Args:
+        name: Span name, e.g. ``query_service.extract_keywords`` / Span atı
+        **attributes: Attributes attached to the span / Span atributları
+
+    Yields:
+        The open span / Ashıq span
+
+    Examples / Misallar:
+        >>> with span("sparql_service.search_articles", keyword=keyword) as s:
+        ...     result = await self.execute(query)
+        ...     s.set_attribute("rows", len(result.data or []))
+    """
+    parent = _current_span.get()
+    opened = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else _new_id(32),
+        span_id=_new_id(16),
+        parent_id=parent.span_id if parent else None,
+        attributes=dict(attributes),
+    )
+    token = _current_span.set(opened)
+    started = time.perf_counter()
+    try:
+        yield opened
+    except BaseException as e:
+        opened.status = "error"
+        opened.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        opened.duration = time.perf_counter() - started
+        _current_span.reset(token)
+        get_tracer().finish(opened)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator that wraps a sync or async function in a span.
+    Sinxron yamasa asinxron funkciyanı span-ǵa oraytuǵın dekorator.
+
+    Args:
+        name: Span name, defaults to ``module.qualname`` / Span atı
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,107 @@
+"""
+Cyrillic to Latin transliteration for Karakalpak search
+Qaraqalpaq izlewi ushın kirillden latınǵa transliteraciya
+
+Labels are stored in Latin Karakalpak, while users often type Cyrillic
+Karakalpak (урлық), Uzbek Cyrillic or Russian. The table below follows the
+Karakalpak Latin alphabet and also covers the Uzbek and Russian letters, so
+every script ends up in one Latin form. ``src.utils.normalization`` folds the
+same table into its single translate pass, which means stored labels and
+queries are transliterated identically without any extra lookups.
+
+Labellar latın Qaraqalpaq jazıwında saqlanadı, al paydalanıwshılar kóbinese
+kirill jazıwında jazadı. Tómendegi keste hár qıylı jazıwlardı bir latın formasına
+keltiredi.
+"""
+
+from typing import Dict, Optional
+
+# Karakalpak Cyrillic → Karakalpak Latin (2016), plus Uzbek and Russian letters
+# Qaraqalpaq kirill → Qaraqalpaq latın (2016), ózbek ha'm rus háripleri menen
+CYRILLIC_TO_LATIN: Dict[str, str] = {
+    'а': 'a', 'ә': 'á', 'б': 'b', 'в': 'v', 'г': 'g', 'ғ': 'ǵ', 'д': 'd',
+    'е': 'e', 'ё': 'yo', 'ж': 'j', 'з': 'z', 'и': 'i', 'й': 'y', 'к': 'k',
+    'қ': 'q', 'л': 'l', 'м': 'm', 'н': 'n', 'ң': 'ń', 'о': 'o', 'ө': 'ó',
+    'п': 'p', 'р': 'r', 'с': 's', 'т': 't', 'у': 'u', 'ү': 'ú', 'ў': 'w',
+    'ф': 'f', 'х': 'x', 'ҳ': 'h', 'ц': 'c', 'ч': 'ch', 'ш': 'sh', 'щ': 'sh',
+    'ъ': '', 'ы': 'ı', 'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya',
+    # Kazakh/Tatar variants seen in pasted text / Kóshirilgen tekstegi variantlar
+    'і': 'i', 'ұ': 'u', 'һ': 'h',
+}
+
+_TO_LATIN_TABLE = str.maketrans({
+    **CYRILLIC_TO_LATIN,
+    **{k.upper(): v[:1].upper() + v[1:] for k, v in CYRILLIC_TO_LATIN.items() if v},
+    **{k.upper(): '' for k, v in CYRILLIC_TO_LATIN.items() if not v},
+})
+
+# Letters that only occur in Karakalpak (and Kazakh) Cyrillic / Tek Qaraqalpaq háripleri
+_KARAKALPAK_CYRILLIC = frozenset('әңөүұ')
+# Letters shared by Karakalpak and Uzbek Cyrillic / Qaraqalpaq ha'm ózbek háripleri
+_TURKIC_CYRILLIC = frozenset('ғқўҳ')
+# Latin Karakalpak diacritics / Latın Qaraqalpaq diakritikaları
+_KARAKALPAK_LATIN = frozenset('ǵńıúóá')
+
+
+def has_cyrillic(text: str) -> bool:
+    """
+    Check whether text contains Cyrillic letters.
+    Tekstte kirill háripleri bar ekenin tekseriw.
+    """
+    return any('Ѐ' <= char <= 'ӿ' for char in text)
+
+
+def to_latin(text: str) -> str:
+    """
+    Transliterate Cyrillic text to Latin Karakalpak, keeping case.
+    Kirill tekstin registrdi saqlap latın Qaraqalpaq jazıwına ótkeriw.
+
+    Args:
+        text: Text in any script / Qálegen jazıwdaǵı tekst
+
+    Returns:
+        Latin text; Latin input is returned unchanged / Latın tekst
+
+    Examples / Misallar:
+        >>> to_latin("Урлық")
+        'Urlıq'
+        >>> to_latin("Жинаяттың аўыр түри")
+        'Jinayattıń awır túri'
+    """
+    return text.translate(_TO_LATIN_TABLE)
+
+
+def detect_script_language(text: str) -> Optional[str]:
+    """
+    Guess the language from script-specific letters.
+    Jazıwǵa tán háripler boyınsha tildi anıqlaw.
+
+    Args:
+        text: Input text / Kiris tekst
+
+    Returns:
+        'kaa', 'uz', 'ru' or None when the letters are not conclusive
+        'kaa', 'uz', 'ru' yamasa anıq bolmasa None
+
+    Examples / Misallar:
+        >>> detect_script_language("урлықтың жазасы")
+        'kaa'
+        >>> detect_script_language("кража")
+        'ru'
+    """
+    lowered = text.lower()
+    letters = set(lowered)
+
+    if has_cyrillic(lowered):
+        if letters & _KARAKALPAK_CYRILLIC:
+            return "kaa"
+        if letters & _TURKIC_CYRILLIC:
+            # Uzbek Cyrillic has no ы / Ózbek kirill jazıwında ы joq
+            return "kaa" if 'ы' in letters else "uz"
+        return "ru"
+
+    if letters & _KARAKALPAK_LATIN:
+        return "kaa"
+    if "o'" in lowered or "g'" in lowered or "oʻ" in lowered or "gʻ" in lowered:
+        return "uz"
+    return None
@@ -65,8 +65,7 @@ class HuquqAIDemo:
 
             # Merge with ontology graph
             if self.ontology_manager.graph:
-                for triple in self.graph:
-                    self.ontology_manager.graph.add(triple)
+                self.ontology_manager.merge_graph(self.graph)
                 self.graph = self.ontology_manager.graph
 
             # Initialize SPARQL engine
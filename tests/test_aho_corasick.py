@@ -0,0 +1,71 @@
+"""
+Tests for the Aho-Corasick automaton
+Aho-Corasick avtomatı ushın testler
+"""
+
+import pytest
+
+from src.utils.aho_corasick import AhoCorasick
+
+
+def build(*patterns):
+    """Automaton reporting each pattern as its value / Úlgilerden avtomat jasaw"""
+    automaton = AhoCorasick()
+    for pattern in patterns:
+        automaton.add(pattern, pattern)
+    automaton.build()
+    return automaton
+
+
+class TestAhoCorasick:
+    """Test multi-pattern matching / Kóp úlgili izlewdi test etiw"""
+
+    def test_overlapping_matches(self):
+        """
+        Test overlapping and nested patterns are all reported.
+        Ústpe-úst túsken úlgiler barlıǵı tabılıwın test etiw.
+        """
+        automaton = build("he", "she", "his", "hers")
+
+        assert automaton.find_all("ushers") == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+    def test_failure_links(self):
+        """
+        Test matching resumes correctly after a partial match.
+        Jarım sáykeslikten keyin izlew durıs dawam etiwin test etiw.
+        """
+        automaton = build("jinayat", "nayza")
+
+        assert automaton.find_all("jinaynayza") == [(5, 10, "nayza")]
+
+    def test_unicode_and_values(self):
+        """
+        Test Karakalpak letters and custom values.
+        Qaraqalpaq háripleri ha'm arnawlı mánislerdi test etiw.
+        """
+        automaton = AhoCorasick()
+        automaton.add("jınayat", ("jinayat", "kaa"))
+        automaton.add("jaza", ("jaza", "kaa"))
+
+        matches = [value for _, _, value in automaton.iter("jınayat ushın jaza")]
+
+        assert matches == [("jinayat", "kaa"), ("jaza", "kaa")]
+        assert len(automaton) == 2
+
+    def test_builds_lazily(self):
+        """
+        Test patterns added after build are found.
+        build-ten keyin qosılǵan úlgiler tabılıwın test etiw.
+        """
+        automaton = build("sot")
+        automaton.add("sud", "sud")
+
+        assert [v for _, _, v in automaton.iter("sud ha'm sot")] == ["sud", "sot"]
+
+    def test_empty_pattern_rejected(self):
+        """
+        Test empty patterns raise.
+        Bos úlgiler qátelik beriwin test etiw.
+        """
+        with pytest.raises(ValueError):
+            AhoCorasick().add("", None)
@@ -0,0 +1,128 @@
+"""
+Tests for batch article lookup
+Statiyalardı toplap izlew ushın testler
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from rdflib import Graph, Literal, Namespace, RDF
+
+from src.api import routes
+from src.api.main import app
+from src.core.base import QueryResult
+from src.core.config import get_config
+from src.services.sparql_service import SPARQLService
+
+
+HUQUQ = Namespace(get_config().ontology.base_uri)
+
+
+@pytest.fixture
+def graph():
+    """Articles from two codes / Eki kodeksten statiyalar"""
+    graph = Graph()
+    for number, code, title in [
+        ("97", "criminal", "Qasten adam óltiriw"),
+        ("169", "criminal", "Urlıq"),
+        ("169", "civil", "Múlik huqıqı"),
+        ("12", "labor", "Miynet shártnaması"),
+    ]:
+        article = HUQUQ[f"Statiya_{code}_{number}"]
+        graph.add((article, RDF.type, HUQUQ.Statiya))
+        graph.add((article, HUQUQ.articleNumber, Literal(number)))
+        graph.add((article, HUQUQ.title, Literal(title, lang="kaa")))
+        graph.add((article, HUQUQ.content, Literal(f"{title} haqqında")))
+        graph.add((article, HUQUQ.codeType, Literal(code)))
+    return graph
+
+
+@pytest.fixture
+def service(graph, monkeypatch):
+    """Service answering from the local graph / Jergilikli graftan juwap beretuǵın servis"""
+    service = SPARQLService()
+    service.queries = []
+
+    async def local_execute(query, is_update=False):
+        service.queries.append(query)
+        rows = [
+            {str(k): str(v) for k, v in row.asdict().items()}
+            for row in graph.query(query)
+        ]
+        return QueryResult(success=True, data=rows)
+
+    monkeypatch.setattr(service, "execute", local_execute)
+    return service
+
+
+class TestGetArticlesByNumbers:
+    """SPARQLService.get_articles_by_numbers / Toplap izlew"""
+
+    @pytest.mark.asyncio
+    async def test_single_query_in_request_order(self, service):
+        """
+        Test all articles come from one query, ordered as requested.
+        Barlıq statiyalar bir sorawdan sorawdaǵı tártipte keliwin test etiw.
+        """
+        result = await service.get_articles_by_numbers([("12", None), ("97", None)])
+
+        assert len(service.queries) == 1
+        assert "VALUES" in service.queries[0]
+        assert [row["number"] for row in result.data] == ["12", "97"]
+        assert result.metadata == {"count": 2, "found": 2}
+
+    @pytest.mark.asyncio
+    async def test_code_type_restricts_match(self, service):
+        """
+        Test a code type picks the article of that code.
+        Kodeks túri sol kodekstiń statiyasın tańlawın test etiw.
+        """
+        result = await service.get_articles_by_numbers([("169", "civil"), ("169", "criminal")])
+
+        assert [row["title"] for row in result.data] == ["Múlik huqıqı", "Urlıq"]
+
+    @pytest.mark.asyncio
+    async def test_missing_and_duplicates(self, service):
+        """
+        Test unknown numbers give None and duplicates are repeated.
+        Belgisiz nomerler None beriwin ha'm qaytalanǵanlar qaytalanıwın test etiw.
+        """
+        result = await service.get_articles_by_numbers(
+            [("97", None), ("404", None), ("97", None), ("12", "civil")]
+        )
+
+        assert result.data[0] == result.data[2]
+        assert result.data[1] is None
+        assert result.data[3] is None
+        assert service.queries[0].count('"97"') == 1
+
+    @pytest.mark.asyncio
+    async def test_literals_escaped(self, service):
+        """
+        Test quotes in numbers cannot break out of the literal.
+        Nomerdegi qoshtırnaqlar literaldan shıǵa almawın test etiw.
+        """
+        result = await service.get_articles_by_numbers([('97" } ?x ?y ?z {', None)])
+
+        assert result.success
+        assert result.data == [None]
+
+
+def test_batch_endpoint(service, monkeypatch):
+    """
+    Test the batch endpoint reports found and missing articles.
+    Toplam endpoint tabılǵan ha'm tabılmaǵan statiyalardı kórsetiwin test etiw.
+    """
+    monkeypatch.setattr(routes, "sparql_service", service)
+    client = TestClient(app)
+
+    response = client.post("/api/v1/articles/batch", json={
+        "articles": [{"number": "169", "code_type": "civil"}, {"number": "404"}]
+    })
+    body = response.json()
+
+    assert response.status_code == 200
+    assert body["found"] == 1
+    assert body["missing"] == ["404"]
+    assert body["articles"][0]["title"] == "Múlik huqıqı"
+
+    assert client.post("/api/v1/articles/batch", json={"articles": []}).status_code == 422
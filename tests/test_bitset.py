@@ -0,0 +1,59 @@
+"""
+Tests for compressed id sets
+Qısılǵan id toplamları ushın testler
+"""
+
+import pytest
+
+from src.core.bitset import BitSet, IntBitSet, intersect_all, union_all
+
+
+@pytest.fixture(params=["int", "default"])
+def bitset(request):
+    """Both the fallback and the active implementation / Eki implementaciya da"""
+    return IntBitSet if request.param == "int" else BitSet
+
+
+class TestBitSet:
+    """Set operations shared by both backends / Eki backend ushın ortaq ámeller"""
+
+    def test_operators_match_python_sets(self, bitset):
+        """
+        Test &, |, - and iteration agree with Python sets.
+        &, |, - ha'm iteraciya Python toplamları menen sáykes keliwin test etiw.
+        """
+        a, b = {1, 5, 64, 200}, {5, 64, 65, 1000}
+        left, right = bitset(a), bitset(b)
+
+        assert list(left & right) == sorted(a & b)
+        assert list(left | right) == sorted(a | b)
+        assert list(left - right) == sorted(a - b)
+        assert left.intersection_cardinality(right) == 2
+        assert len(left) == 4 and 200 in left and 2 not in left
+
+    def test_add_discard_and_copy(self, bitset):
+        """
+        Test in-place updates do not leak into copies.
+        Orınında ózgertiwler kóshirmelerge tásir etpewin test etiw.
+        """
+        bits = bitset([3])
+        copy = bits.copy()
+        bits.add(7)
+        bits.discard(3)
+        bits.discard(99)
+
+        assert list(bits) == [7]
+        assert list(copy) == [3]
+        assert not bitset()
+
+    def test_intersect_and_union_all(self, bitset):
+        """
+        Test the helpers leave their inputs untouched.
+        Járdemshi funkciyalar kirisiwlerdi ózgertpewin test etiw.
+        """
+        sets = [bitset([1, 2, 3]), bitset([2, 3]), bitset([3, 4])]
+
+        assert list(intersect_all(sets)) == [3]
+        assert list(union_all(sets)) == [1, 2, 3, 4]
+        assert list(sets[1]) == [2, 3]
+        assert intersect_all([]) is None
@@ -0,0 +1,161 @@
+"""
+Tests for the parallel bulk loader
+Parallel kóplep júklewshi ushın testler
+"""
+
+from pathlib import Path
+
+import pytest
+from rdflib import Dataset, Graph, Literal, URIRef
+
+from src.core.bulk_loader import discover_files, guess_format, load_files
+from src.core.ontology_manager import OntologyManager, OntologyManagerError
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+ONTOLOGY_FILE = DATA_DIR / "ontologies" / "legal_ontology.owl"
+KNOWLEDGE_FILE = DATA_DIR / "knowledge" / "criminal_code.ttl"
+HUQUQ = "http://huquqai.org/ontology#"
+CRIMINAL_GRAPH = URIRef("http://huquqai.org/graph/criminal")
+
+
+def _sequential() -> Graph:
+    graph = Graph()
+    graph.parse(str(ONTOLOGY_FILE), format="xml")
+    graph.parse(str(KNOWLEDGE_FILE), format="turtle")
+    return graph
+
+
+@pytest.fixture
+def broken_file(tmp_path):
+    """A Turtle file that does not parse / Parse etilmeytuǵın Turtle faylı"""
+    path = tmp_path / "broken.ttl"
+    path.write_text("this is not turtle .", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def quads_file(tmp_path):
+    """N-Quads file with a named and a default statement / N-Quads faylı"""
+    path = tmp_path / "dump.nq"
+    path.write_text(
+        f'<{HUQUQ}Statiya_1> <{HUQUQ}codeType> "criminal" <{CRIMINAL_GRAPH}> .\n'
+        f'<{HUQUQ}Statiya_2> <{HUQUQ}codeType> "civil" .\n',
+        encoding="utf-8"
+    )
+    return path
+
+
+class TestBulkLoader:
+    """Parallel loading matches sequential parsing / Parallel júklew izbe-iz parse penen sáykes"""
+
+    def test_discover_files(self):
+        """
+        Test discovery finds the RDF files and skips the rest.
+        Izlew RDF fayllardı tabıwın ha'm basqaların ótkerip jiberiwin test etiw.
+        """
+        files = discover_files([DATA_DIR / "ontologies", DATA_DIR / "knowledge", DATA_DIR / "missing"])
+
+        assert files == [ONTOLOGY_FILE, KNOWLEDGE_FILE]
+        assert [guess_format(path) for path in files] == ["xml", "turtle"]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_load_matches_sequential(self, workers):
+        """
+        Test in-process and worker loads give the sequential graph.
+        Processte ha'm jumısshılarda júklew izbe-iz graf beriwin test etiw.
+        """
+        graph = Graph()
+
+        report = load_files([ONTOLOGY_FILE, KNOWLEDGE_FILE], graph,
+                            workers=workers, min_parallel_bytes=0)
+
+        assert report.workers == workers
+        assert set(graph) == set(_sequential())
+        assert [item.triples for item in report.files] == [185, 165]
+        assert report.triples == len(graph)
+        assert "2 files, 350 triples" in report.summary()
+
+    def test_target_per_file(self):
+        """
+        Test a target function sends each file to its own graph.
+        Maqset funkciyası hár fayldı óz grafına jiberiwin test etiw.
+        """
+        graphs = {ONTOLOGY_FILE: Graph(), KNOWLEDGE_FILE: Graph()}
+
+        load_files([ONTOLOGY_FILE, KNOWLEDGE_FILE], graphs.__getitem__, workers=2, min_parallel_bytes=0)
+
+        assert [len(graph) for graph in graphs.values()] == [185, 165]
+
+    def test_failed_file_is_reported(self, broken_file):
+        """
+        Test a broken file is reported while the others still load.
+        Buzıq fayl xabarlanıwın, basqaları bolsa júkleniwin test etiw.
+        """
+        graph = Graph()
+
+        report = load_files([broken_file, KNOWLEDGE_FILE], graph)
+
+        assert [item.path for item in report.failed] == [broken_file]
+        assert len(graph) == 165
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_quads_keep_graph_names(self, quads_file, workers):
+        """
+        Test N-Quads statements load into the named graph of their fourth term.
+        N-Quads tastıyıqları tórtinshi termin grafına júkleniwin test etiw.
+        """
+        dataset = Dataset()
+
+        report = load_files([quads_file, KNOWLEDGE_FILE], dataset,
+                            workers=workers, min_parallel_bytes=0)
+
+        assert not report.failed
+        assert report.files[0].triples == 2
+        assert len(dataset.graph(CRIMINAL_GRAPH)) == 1
+        assert (URIRef(HUQUQ + "Statiya_2"), URIRef(HUQUQ + "codeType"), Literal("civil")) in dataset
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_quads_into_plain_graph_fail(self, quads_file, workers):
+        """
+        Test named graphs are not silently dropped into a plain Graph.
+        Atamalı graflar ápiwayı Graph-qa jasırın joǵalmawın test etiw.
+        """
+        graph = Graph()
+
+        report = load_files([quads_file, KNOWLEDGE_FILE], graph,
+                            workers=workers, min_parallel_bytes=0)
+
+        assert [item.path for item in report.failed] == [quads_file]
+        assert "named graphs" in report.failed[0].error
+        assert len(graph) == 165
+
+
+class TestLoadKnowledge:
+    """OntologyManager.load_knowledge / OntologyManager.load_knowledge"""
+
+    @pytest.fixture
+    def manager(self):
+        manager = OntologyManager()
+        yield manager
+        manager.clear()
+
+    def test_loads_files_into_code_graphs(self, manager):
+        """
+        Test a code-named file lands in that code's named graph.
+        Kodeks atındaǵı fayl sol kodekstiń atamalı grafına túsiwin test etiw.
+        """
+        report = manager.load_knowledge([ONTOLOGY_FILE, KNOWLEDGE_FILE], workers=1)
+
+        assert manager.is_loaded()
+        assert report.triples == 350
+        assert manager.stats["triple_count"] == 350
+        assert manager.stats["partitions"] == {"criminal": 165}
+
+    def test_failed_file_raises(self, manager, broken_file):
+        """
+        Test a file that fails to parse fails the load.
+        Parse etilmegen fayl júklewdi toqtatıwın test etiw.
+        """
+        with pytest.raises(OntologyManagerError):
+            manager.load_knowledge([ONTOLOGY_FILE, broken_file])
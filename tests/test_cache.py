@@ -0,0 +1,213 @@
+"""
+Tests for TTL/LRU caches and the QueryService answer cache
+TTL/LRU keshler ha'm QueryService juwap keshi ushın testler
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.base import QueryResult
+from src.models.legal_entities import Query
+from src.services.query_service import QueryService
+from src.utils import cache as cache_module
+from src.utils.cache import TTLCache, bump_knowledge_version, cache_stats, get_cache
+from src.utils.metrics import get_metrics_registry
+
+
+class TestTTLCache:
+    """TTLCache behaviour / TTLCache qásiyetleri"""
+
+    def test_hit_and_miss(self):
+        """
+        Test stored values are returned and counted as hits.
+        Saqlanǵan mánisler qaytarılıwın ha'm tabıs dep esaplanıwın test etiw.
+        """
+        cache = TTLCache("test_basic", max_size=10, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert stats['hits'] == 1
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+
+    def test_lru_eviction(self):
+        """
+        Test the least recently used entry is evicted first.
+        Eń az qollanılǵan jazıw birinshi shıǵarılıwın test etiw.
+        """
+        cache = TTLCache("test_lru", max_size=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_expiry(self, monkeypatch):
+        """
+        Test entries expire after the TTL.
+        Jazıwlar TTL-den keyin eskiriwin test etiw.
+        """
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+        cache = TTLCache("test_ttl", max_size=10, ttl=5)
+        cache.set("a", 1)
+        now[0] += 4
+        assert cache.get("a") == 1
+        now[0] += 2
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_knowledge_version_invalidates(self):
+        """
+        Test a knowledge-base change makes older entries stale.
+        Bilimler bazası ózgeriwi eski jazıwlardı eskirtiwin test etiw.
+        """
+        cache = TTLCache("test_version", max_size=10, ttl=60)
+        unversioned = TTLCache("test_unversioned", max_size=10, ttl=60, versioned=False)
+        cache.set("a", 1)
+        unversioned.set("a", 1)
+
+        bump_knowledge_version("test")
+
+        assert cache.get("a") is None
+        assert unversioned.get("a") == 1
+
+    def test_registry_and_metrics(self):
+        """
+        Test named caches are listed and lookups are exported as metrics.
+        Atalǵan keshler kórsetiliwin ha'm metrikalarǵa shıǵıwın test etiw.
+        """
+        cache = TTLCache("test_metrics", max_size=10, ttl=60)
+        cache.get("missing")
+
+        assert get_cache("test_metrics") is cache
+        assert any(s['name'] == "test_metrics" for s in cache_stats())
+
+        rendered = get_metrics_registry().render()
+        assert 'huquqai_cache_requests_total{cache="test_metrics",result="miss"} 1' in rendered
+        assert 'huquqai_cache_entries{cache="test_metrics"} 0' in rendered
+
+
+class TestAnswerCache:
+    """QueryService answer cache / QueryService juwap keshi"""
+
+    @pytest.fixture
+    def service(self, monkeypatch):
+        """Service with a counting fake endpoint / Sanawshı jalǵan endpoint"""
+        service = QueryService()
+        service.answer_cache.clear()
+        service.calls = []
+
+        async def fake_execute(query, is_update=False):
+            service.calls.append(query)
+            return QueryResult(
+                success=True,
+                data=[{"article": "a1", "number": "1", "title": "Urlıq"}]
+            )
+
+        monkeypatch.setattr(service.sparql_service, "execute", fake_execute)
+        yield service
+        service.answer_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_rephrased_question_hits(self, service):
+        """
+        Test case, punctuation and inflection variants share one answer.
+        Registr, tınıs belgileri ha'm qosımta variantları bir juwaptı bólisiwin test etiw.
+        """
+        first = await service.execute(Query(id="q1", question="Urlıqtıń jazası qanday?"))
+        searches = len(service.calls)
+        second = await service.execute(Query(id="q2", question="urlıq jaza"))
+
+        assert len(service.calls) == searches
+        assert second.answer == first.answer
+        assert second.query_id == "q2"
+
+    @pytest.mark.asyncio
+    async def test_every_caller_gets_own_copy(self, service):
+        """
+        Test cached answers are copied with fresh timestamps, the leader's included.
+        Keshlengen juwaplar jańa waqıt belgileri menen kóshirilíwin test etiw.
+        """
+        query = Query(id="q1", question="Urlıq jazası")
+        first = await service.execute(query)
+        key = service._cache_key(service._extract_keywords(query.question), query.language)
+        first.sources.append("changed")
+        first.answer = "changed"
+
+        second = await service.execute(Query(id="q2", question="Urlıq jazası"))
+
+        assert service.answer_cache.get(key).answer != "changed"
+        assert second.answer != "changed"
+        assert "changed" not in second.sources
+        assert second.query_id == "q2"
+        assert second.created_at > first.created_at
+        assert second.updated_at == second.created_at
+
+    @pytest.mark.asyncio
+    async def test_language_is_part_of_key(self, service):
+        """
+        Test the same question in another language is searched again.
+        Basqa tildegi sol soraw qaytadan izleniwin test etiw.
+        """
+        await service.execute(Query(question="Urlıq jazası", language="kaa"))
+        searches = len(service.calls)
+        await service.execute(Query(question="Urlıq jazası", language="uz"))
+
+        assert len(service.calls) > searches
+
+    @pytest.mark.asyncio
+    async def test_failed_search_not_cached(self, service, monkeypatch):
+        """
+        Test answers built while the endpoint failed are not cached.
+        Endpoint qáte bergende dúzilgen juwaplar keshlenbewin test etiw.
+        """
+        async def failing_execute(query, is_update=False):
+            return QueryResult(success=False, data=None, message="down")
+
+        monkeypatch.setattr(service.sparql_service, "execute", failing_execute)
+        await service.execute(Query(question="Urlıq jazası"))
+
+        assert len(service.answer_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_reload_invalidates(self, service):
+        """
+        Test a knowledge-base change forces a fresh search.
+        Bilimler bazası ózgeriwi jańa izlewdi talap etiwin test etiw.
+        """
+        await service.execute(Query(question="Urlıq jazası"))
+        searches = len(service.calls)
+
+        bump_knowledge_version("reload")
+        await service.execute(Query(question="Urlıq jazası"))
+
+        assert len(service.calls) > searches
+
+
+def test_admin_cache_routes(monkeypatch):
+    """
+    Test the admin API lists and clears caches.
+    Admin API keshlerdi kórsetiwin ha'm tazalawın test etiw.
+    """
+    from src.api.main import create_app
+    from src.core.config import get_config
+
+    monkeypatch.setattr(get_config().api.admin, "enabled", True)
+    monkeypatch.setenv("HUQUQAI_ADMIN_API_KEY", "secret")
+    TTLCache("test_admin", max_size=10, ttl=60).set("a", 1)
+    client = TestClient(create_app(), headers={"X-API-Key": "secret"})
+
+    names = [c['name'] for c in client.get("/api/v1/admin/cache").json()['caches']]
+    assert "test_admin" in names
+
+    assert client.delete("/api/v1/admin/cache/test_admin").status_code == 200
+    assert len(get_cache("test_admin")) == 0
+    assert client.delete("/api/v1/admin/cache/unknown").status_code == 404
@@ -0,0 +1,180 @@
+"""
+Tests for the compact triple store
+Kompakt triple saqlaǵısh ushın testler
+"""
+
+from itertools import product
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF
+
+from src.core.compact_store import CompactStore
+
+
+KNOWLEDGE_FILE = Path(__file__).parent.parent / "data" / "knowledge" / "criminal_code.ttl"
+KK = Namespace("http://karakalpak.law/ontology#")
+
+
+@pytest.fixture
+def graphs():
+    """The knowledge base on both stores / Bilimler bazası eki saqlaǵıshta"""
+    memory = Graph()
+    compact = Graph(store="Compact")
+    for graph in (memory, compact):
+        graph.parse(str(KNOWLEDGE_FILE), format="turtle")
+    return memory, compact
+
+
+class TestCompactStore:
+    """CompactStore behaves like the Memory store / CompactStore Memory sıyaqlı isleydi"""
+
+    def test_plugin_registered(self, graphs):
+        """
+        Test Graph(store="Compact") builds a CompactStore.
+        Graph(store="Compact") CompactStore jasawın test etiw.
+        """
+        assert isinstance(graphs[1].store, CompactStore)
+
+    def test_every_pattern_matches_memory(self, graphs):
+        """
+        Test all eight bound/unbound patterns give the same triples.
+        Barlıq segiz úlgi birdey triple-lar beriwin test etiw.
+        """
+        memory, compact = graphs
+
+        assert len(compact) == len(memory)
+        for triple in list(memory)[:30]:
+            for mask in product([False, True], repeat=3):
+                pattern = tuple(term if bound else None for term, bound in zip(triple, mask))
+                assert set(compact.triples(pattern)) == set(memory.triples(pattern)), pattern
+
+    def test_sparql_query(self, graphs):
+        """
+        Test Graph.query gives the same rows on both stores.
+        Graph.query eki saqlaǵıshta birdey qatarlar beriwin test etiw.
+        """
+        query = """
+            PREFIX kk: <http://karakalpak.law/ontology#>
+            SELECT ?s ?n WHERE { ?s a kk:Statiya ; kk:nómiri ?n . FILTER(?n > 180) }
+            ORDER BY ?n
+        """
+        memory, compact = graphs
+
+        rows = [tuple(row) for row in compact.query(query)]
+        assert rows == [tuple(row) for row in memory.query(query)]
+        assert rows
+
+    def test_writes_before_and_after_merge(self, graphs):
+        """
+        Test buffered adds and removes are visible and survive a merge.
+        Buferdegi qosıw ha'm óshiriwler kóriniwin ha'm birlestiriwden keyin saqlanıwın test etiw.
+        """
+        memory, compact = graphs
+        for graph in graphs:
+            graph.add((KK.Statiya_999, RDF.type, KK.Statiya))
+            graph.remove((KK.Statiya_169, None, None))
+            graph.set((KK.Statiya_175, KK.jaza_max, Literal(4)))
+            graph.update('INSERT DATA { kk:Statiya_999 kk:nómiri 999 }',
+                         initNs={"kk": KK})
+
+        assert set(compact) == set(memory)
+
+        compact.store.compact()
+
+        stats = compact.store.stats()
+        assert set(compact) == set(memory)
+        assert (stats["pending_added"], stats["pending_removed"]) == (0, 0)
+        assert stats["base_triples"] == len(memory)
+
+    def test_delta_merged_on_read_once_large(self):
+        """
+        Test writes stay buffered until they outgrow ``merge_ratio``.
+        Jazıwlar ``merge_ratio``-dan asqanǵa shekem buferde turıwın test etiw.
+        """
+        graph = Graph(store=CompactStore(merge_ratio=0.5))
+        for i in range(10):
+            graph.add((KK[f"S{i}"], RDF.type, KK.Statiya))
+        len(list(graph.triples((None, RDF.type, None))))
+        graph.add((KK.S10, RDF.type, KK.Statiya))
+
+        assert graph.store.stats()["pending_added"] == 1
+        assert len(list(graph.triples((None, RDF.type, KK.Statiya)))) == 11
+
+    def test_delta_lookups_touch_only_bound_terms(self):
+        """
+        Test a pattern scans only the delta entries sharing its bound terms.
+        Úlgi tek baylanǵan terminleri bar delta jazıwların qarawın test etiw.
+        """
+        memory = Graph()
+        graph = Graph(store=CompactStore(merge_ratio=100))
+        for i in range(200):
+            for target in (memory, graph):
+                target.add((KK[f"S{i}"], RDF.type, KK.Statiya))
+                target.add((KK[f"S{i}"], KK.number, Literal(i)))
+        graph.remove((KK.S7, None, None))
+        memory.remove((KK.S7, None, None))
+        assert graph.store.stats()["pending_added"] == 398
+
+        for triple in list(memory)[:20]:
+            for mask in product([False, True], repeat=3):
+                pattern = tuple(term if bound else None for term, bound in zip(triple, mask))
+                assert set(graph.triples(pattern)) == set(memory.triples(pattern)), pattern
+
+        class Unscannable(set):
+            def __iter__(self):
+                raise AssertionError("whole delta scanned / barlıq delta qaraldı")
+
+        graph.store._added = Unscannable(graph.store._added)
+        assert len(list(graph.triples((KK.S5, None, None)))) == 2
+        assert list(graph.triples((None, KK.number, Literal(9)))) == [(KK.S9, KK.number, Literal(9))]
+        assert list(graph.triples((KK.S7, None, None))) == []
+
+    def test_unknown_terms_and_re_adding(self):
+        """
+        Test unknown terms match nothing and re-adding a removed triple restores it.
+        Belgisiz terminler hesh nárse tappawın ha'm óshirilgen triple qayta qosılıwın test etiw.
+        """
+        graph = Graph(store="Compact")
+        triple = (KK.A, KK.p, Literal("x"))
+        graph.add(triple)
+        graph.store.compact()
+
+        graph.remove(triple)
+        assert triple not in graph
+        graph.add(triple)
+
+        assert triple in graph
+        assert len(graph) == 1
+        assert list(graph.triples((KK.Missing, None, None))) == []
+
+    def test_add_many_matches_add(self, graphs):
+        """
+        Test addN gives the same graph as adding one by one, duplicates included.
+        addN birim-birim qosıw menen birdey graf beriwin test etiw.
+        """
+        memory, compact = graphs
+        compact.store.compact()
+        compact.remove((KK.Statiya_169, None, None))
+        memory.remove((KK.Statiya_169, None, None))
+        batch = list(Graph().parse(str(KNOWLEDGE_FILE), format="turtle"))
+        batch.append((KK.Statiya_999, RDF.type, KK.Statiya))
+
+        compact.addN((s, p, o, compact) for s, p, o in batch)
+        for triple in batch:
+            memory.add(triple)
+
+        assert len(compact) == len(memory)
+        assert set(compact) == set(memory)
+
+    def test_namespace_bindings(self):
+        """
+        Test prefixes bind and serialize like on the Memory store.
+        Prefiksler Memory saqlaǵıshtaǵıday baylanıwın test etiw.
+        """
+        graph = Graph(store="Compact")
+        graph.bind("kk", KK)
+        graph.add((KK.A, RDF.type, KK.Statiya))
+
+        assert str(graph.store.namespace("kk")) == str(KK)
+        assert "kk:A a kk:Statiya" in graph.serialize(format="turtle")
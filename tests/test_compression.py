@@ -0,0 +1,129 @@
+"""
+Tests for response compression and fast JSON serialization
+Juwaptı qısıw ha'm tez JSON serializaciyası ushın testler
+"""
+
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware import CompressionMiddleware, negotiate_encoding
+from src.api.responses import FastJSONResponse, dumps
+
+
+ARTICLE = {
+    "number": "97",
+    "title": "Qasten adam óltiriw",
+    "content": "Qasten adam óltiriw, yaǵnıy basqa adamǵa qasten ólim keltiriw, "
+               "jeti jıldan on bes jılǵa shekem azatlıqtan ayırıw menen jazalanadı. " * 20,
+}
+
+
+@pytest.fixture
+def client():
+    """Small app behind the middleware / Middleware artındaǵı kishi qosımsha"""
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/article")
+    async def article():
+        return ARTICLE
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/tagged")
+    async def tagged():
+        return FastJSONResponse(ARTICLE, headers={"ETag": '"kb-1"'})
+
+    return TestClient(app)
+
+
+class TestCompressionMiddleware:
+    """CompressionMiddleware behaviour / CompressionMiddleware qásiyetleri"""
+
+    def test_large_json_is_gzipped(self, client):
+        """
+        Test large JSON bodies are gzip-encoded and round-trip.
+        Úlken JSON juwaplar gzip penen qısılıwın test etiw.
+        """
+        response = client.get("/article", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(dumps(ARTICLE))
+        assert response.json() == ARTICLE
+
+    def test_small_body_not_compressed(self, client):
+        """
+        Test bodies below the threshold are sent as-is.
+        Shekten kishi juwaplar qısılmawın test etiw.
+        """
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_identity_client(self, client):
+        """
+        Test clients without Accept-Encoding get the plain body.
+        Accept-Encoding joq klientler ápiwayı juwap alıwın test etiw.
+        """
+        response = client.get("/article", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == ARTICLE
+
+    def test_etag_weakened(self, client):
+        """
+        Test a strong ETag becomes weak once the body is encoded.
+        Qısılǵan juwapta kúshli ETag álsiz bolıwın test etiw.
+        """
+        response = client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["etag"] == 'W/"kb-1"'
+
+    def test_gzip_deterministic(self):
+        """
+        Test the gzip body is valid and deterministic.
+        gzip juwap durıs ha'm turaqlı ekenin test etiw.
+        """
+        middleware = CompressionMiddleware(app=None)
+        body = dumps(ARTICLE)
+
+        first = middleware.compress(body, "gzip")
+        assert gzip.decompress(first) == body
+        assert middleware.compress(body, "gzip") == first
+
+
+@pytest.mark.parametrize("header, brotli_available, expected", [
+    ("gzip, deflate, br", True, "br"),
+    ("gzip, deflate, br", False, "gzip"),
+    ("br;q=0, gzip", True, "gzip"),
+    ("gzip;q=0", True, None),
+    ("*", False, "gzip"),
+    ("identity", True, None),
+    ("", True, None),
+])
+def test_negotiate_encoding(header, brotli_available, expected):
+    """
+    Test Accept-Encoding negotiation with q-values and wildcards.
+    q-mánisler ha'm wildcard penen Accept-Encoding tańlawın test etiw.
+    """
+    assert negotiate_encoding(header, brotli_available) == expected
+
+
+def test_fast_json_matches_standard_output():
+    """
+    Test fast JSON keeps Karakalpak letters unescaped and parses identically.
+    Tez JSON Qaraqalpaq háriplerin saqlawın ha'm birdey oqılıwın test etiw.
+    """
+    body = dumps(ARTICLE)
+
+    assert "óltiriw".encode("utf-8") in body
+    assert json.loads(body) == ARTICLE
+    assert FastJSONResponse(ARTICLE).body == body
@@ -0,0 +1,478 @@
+"""
+Tests for the article-number, punishment range and facet indexes
+Statiya nomeri, jaza diapazonı ha'm facet indeksleri ushın testler
+"""
+
+import gc
+
+import pytest
+from fastapi.testclient import TestClient
+from rdflib import Graph, Literal, RDF, RDFS
+
+from src.core.graph_index import (
+    HUQUQ, HUQUQ_PUNISHMENT_RANGE, HUQUQ_SCHEMA, KK, KK_FACETS, KK_PUNISHMENT_RANGE,
+    KK_SCHEMA, ArticleIndex, FacetIndex, RangeIndex, find_article_index, get_article_index,
+    get_facet_index, get_range_index, values_clause,
+)
+from src.api.main import app
+from src.core import ontology_manager
+from src.core.ontology_manager import OntologyManager
+from src.core.sparql_engine import SPARQLEngine
+from src.utils.cache import bump_knowledge_version
+
+
+def add_article(graph, name, number, code=None, title="Statiya"):
+    """Add a huquq: article / huquq: statiya qosıw"""
+    article = HUQUQ[name]
+    graph.add((article, RDF.type, HUQUQ.Statiya))
+    graph.add((article, HUQUQ.articleNumber, Literal(number)))
+    graph.add((article, HUQUQ.title, Literal(title, lang="kaa")))
+    if code:
+        graph.add((article, HUQUQ.codeType, Literal(code)))
+    return article
+
+
+def add_punishment(graph, name, low=None, high=None, fine=None):
+    """Add a huquq:Jaza / huquq:Jaza qosıw"""
+    jaza = HUQUQ[name]
+    graph.add((jaza, RDF.type, HUQUQ.Jaza))
+    graph.add((jaza, RDFS.label, Literal(name, lang="kaa")))
+    for predicate, value in ((HUQUQ.durationMin, low), (HUQUQ.durationMax, high),
+                             (HUQUQ.fineAmount, fine)):
+        if value is not None:
+            graph.add((jaza, predicate, Literal(value)))
+    return jaza
+
+
+@pytest.fixture
+def punishments():
+    """Punishments with year ranges and fines / Jıl diapazonı ha'm jarımalı jazalar"""
+    graph = Graph()
+    add_punishment(graph, "J_1_3", 1, 3)
+    add_punishment(graph, "J_2_5", 2, 5)
+    add_punishment(graph, "J_3_10", 3, 10)
+    add_punishment(graph, "J_7_15", 7, 15)
+    add_punishment(graph, "J_min_only", low=4)
+    add_punishment(graph, "J_fine", fine=5000)
+    add_punishment(graph, "J_fine_big", fine=100000)
+    return graph
+
+
+def add_kk_article(graph, number, severity, crime_type, punishment="Erkinlikten ayırıw"):
+    """Add a kk: article with facet values / Facet mánisleri menen kk: statiya qosıw"""
+    article = KK[f"Statiya_{number}"]
+    graph.add((article, RDF.type, KK.Statiya))
+    graph.add((article, RDFS.label, Literal(f"Statiya {number}", lang="kk")))
+    graph.add((article, KK["awırlıq_dárejesi"], Literal(severity)))
+    graph.add((article, KK.jinayat_turi, Literal(crime_type)))
+    graph.add((article, KK["nızam_id"], Literal("JinayatKodeksi_2023")))
+    graph.add((article, KK.jaza_turi, Literal(punishment)))
+    return article
+
+
+@pytest.fixture
+def articles():
+    """kk: articles across severities and crime types / Túrli kk: statiyalar"""
+    graph = Graph()
+    add_kk_article(graph, 169, "Awır", "Adamǵa qarsi")
+    add_kk_article(graph, 175, "Orta", "Múlikke qarsi", "Aqsha jazası")
+    add_kk_article(graph, 177, "Awır", "Múlikke qarsi")
+    add_kk_article(graph, 189, "Orta", "Dawlat hákim-basqarıwına qarsi")
+    add_kk_article(graph, 200, "Jeńil", "Múlikke qarsi", "Aqsha jazası")
+    return graph
+
+
+@pytest.fixture
+def graph():
+    """Articles of two codes / Eki kodekstiń statiyaları"""
+    graph = Graph()
+    add_article(graph, "JK_123", "123", "JK", "Jinayattıń awır túri")
+    add_article(graph, "AK_123", "123", "AK", "Administrativ huqıqbuzarlıq")
+    add_article(graph, "JK_97", "97", "JK", "Qasten adam óltiriw")
+    return graph
+
+
+class TestArticleIndex:
+    """ArticleIndex lookups and freshness / ArticleIndex izlewi ha'm jańalıǵı"""
+
+    def test_lookup_by_number_and_code(self, graph):
+        """
+        Test numbers resolve across codes and within one code.
+        Nomerler barlıq kodekslerde ha'm bir kodeks ishinde tabılıwın test etiw.
+        """
+        index = ArticleIndex(graph)
+
+        assert set(index.lookup("123")) == {HUQUQ.JK_123, HUQUQ.AK_123}
+        assert index.lookup("123", code="AK") == [HUQUQ.AK_123]
+        assert index.lookup(" 97 ") == [HUQUQ.JK_97]
+        assert index.lookup("404") == []
+        assert len(index) == 3
+
+    def test_typed_numbers_match_strings(self):
+        """
+        Test integer-typed numbers (kk:nómiri 169) are found by "169".
+        Pútin san túrindegi nomerler "169" arqalı tabılıwın test etiw.
+        """
+        graph = Graph()
+        graph.add((KK.Statiya_169, RDF.type, KK.Statiya))
+        graph.add((KK.Statiya_169, KK["nómiri"], Literal(169)))
+        graph.add((KK.Statiya_169, KK["nızam_id"], Literal("JinayatKodeksi_2023")))
+
+        index = ArticleIndex(graph, KK_SCHEMA)
+
+        assert index.lookup("169") == [KK.Statiya_169]
+        assert index.lookup(169, code="JinayatKodeksi_2023") == [KK.Statiya_169]
+
+    def test_rebuilds_after_external_write(self, graph):
+        """
+        Test writes that bypass the index are picked up on the next lookup.
+        Indeksti aylanıp ótken jazıwlar keyingi izlewde esapqa alınıwın test etiw.
+        """
+        index = ArticleIndex(graph)
+        add_article(graph, "JK_200", "200", "JK")
+
+        assert index.lookup("200") == [HUQUQ.JK_200]
+
+    def test_rebuilds_after_version_bump(self, graph):
+        """
+        Test same-size replacements are seen through the knowledge version.
+        Ólshemi ózgermegen almastırıwlar versiya arqalı kóriniwin test etiw.
+        """
+        index = ArticleIndex(graph)
+        graph.set((HUQUQ.JK_97, HUQUQ.articleNumber, Literal("98")))
+        bump_knowledge_version("test")
+
+        assert index.lookup("97") == []
+        assert index.lookup("98") == [HUQUQ.JK_97]
+
+    def test_writing_updates_one_subject(self, graph, monkeypatch):
+        """
+        Test ``writing`` updates the index without a full rebuild.
+        ``writing`` indeksti tolıq qayta dúzbey jańalawın test etiw.
+        """
+        index = ArticleIndex(graph)
+        rebuilds = []
+        monkeypatch.setattr(index, "rebuild", lambda: rebuilds.append(1))
+
+        with index.writing(HUQUQ.JK_300):
+            add_article(graph, "JK_300", "300", "JK")
+            bump_knowledge_version("test")
+
+        assert index.lookup("300") == [HUQUQ.JK_300]
+        assert rebuilds == []
+
+    def test_shared_index_per_graph(self, graph):
+        """
+        Test one index is shared per graph and released with it.
+        Hár graf ushın bir indeks bólisiliwin ha'm graf penen birge bosatılıwın test etiw.
+        """
+        index = get_article_index(graph)
+
+        assert get_article_index(graph) is index
+        assert find_article_index(graph, KK_SCHEMA) is None
+
+        other = Graph()
+        get_article_index(other)
+        del other
+        gc.collect()
+
+        assert find_article_index(graph, HUQUQ_SCHEMA) is index
+
+    def test_values_clause(self):
+        """
+        Test the VALUES block lists subjects as IRIs.
+        VALUES bloki subyektlerdi IRI retinde kórsetiwin test etiw.
+        """
+        assert values_clause("s", [HUQUQ.A, HUQUQ.B]) == (
+            f"VALUES ?s {{ <{HUQUQ.A}> <{HUQUQ.B}> }}"
+        )
+
+
+class TestRangeIndex:
+    """RangeIndex lookups / RangeIndex izlewleri"""
+
+    def test_within_matches_filter_in_order(self, punishments):
+        """
+        Test ``within`` returns what ``?min >= lo && ?max <= hi`` keeps, sorted.
+        ``within`` FILTER qaldıratuǵın nátiyjelerdi sortlanǵan túrde qaytarıwın test etiw.
+        """
+        index = RangeIndex(punishments, HUQUQ_PUNISHMENT_RANGE)
+
+        assert list(index.within(1, 5)) == [HUQUQ.J_1_3, HUQUQ.J_2_5]
+        assert list(index.within(2, 15)) == [HUQUQ.J_2_5, HUQUQ.J_3_10, HUQUQ.J_7_15]
+        assert list(index.within(3)) == [HUQUQ.J_3_10, HUQUQ.J_min_only, HUQUQ.J_7_15]
+        assert list(index.within(high=5)) == [HUQUQ.J_1_3, HUQUQ.J_2_5]
+        assert list(index.within(8, 20)) == []
+
+    def test_descending_by_max(self, punishments):
+        """
+        Test ordering by the upper bound, longest first.
+        Joqarǵı shegara boyınsha, eń uzınınan baslap tártiplewdi test etiw.
+        """
+        index = RangeIndex(punishments, HUQUQ_PUNISHMENT_RANGE)
+
+        assert list(index.within(1, 15, order="max", descending=True)) == [
+            HUQUQ.J_7_15, HUQUQ.J_3_10, HUQUQ.J_2_5, HUQUQ.J_1_3,
+        ]
+
+    @pytest.mark.parametrize("order", ["min", "max"])
+    def test_within_visits_only_keys_in_range(self, order, monkeypatch):
+        """
+        Test a lookup walks only the entries whose sort key is inside [low, high].
+        Izlew tek sortlaw gilti [low, high] ishindegi jazıwlardı qarawın test etiw.
+        """
+        graph = Graph()
+        for i in range(200):
+            jaza = HUQUQ[f"J_{i}"]
+            graph.add((jaza, RDF.type, HUQUQ.Jaza))
+            graph.add((jaza, HUQUQ.durationMin, Literal(i)))
+            graph.add((jaza, HUQUQ.durationMax, Literal(i + 1)))
+        index = RangeIndex(graph, HUQUQ_PUNISHMENT_RANGE)
+        keys = index._by_max if order == "max" else index._by_min
+        visited = []
+        between = keys.between
+
+        def counting(*args):
+            for entry in between(*args):
+                visited.append(entry)
+                yield entry
+
+        monkeypatch.setattr(keys, "between", counting)
+
+        assert list(index.within(50, 55, order=order)) == [HUQUQ[f"J_{i}"] for i in range(50, 55)]
+        assert len(visited) <= 6
+        visited.clear()
+        assert len(list(index.within(high=3, order=order))) == 3
+        assert len(visited) <= 4
+
+    def test_one_sided_bound_keeps_subjects_missing_the_other(self, punishments):
+        """
+        Test a subject with only a max (or only a min) matches a bound on that value.
+        Tek maksimumı (yamasa minimumı) bar subyekt sol shegarada tabılıwın test etiw.
+        """
+        add_punishment(punishments, "J_max_only", high=3)
+        index = RangeIndex(punishments, HUQUQ_PUNISHMENT_RANGE)
+
+        assert list(index.within(high=5)) == [HUQUQ.J_max_only, HUQUQ.J_1_3, HUQUQ.J_2_5]
+        assert list(index.within(high=5, order="max", descending=True))[0] == HUQUQ.J_2_5
+        assert list(index.within(3, order="max")) == [HUQUQ.J_min_only, HUQUQ.J_3_10, HUQUQ.J_7_15]
+
+        engine = SPARQLEngine(punishments)
+        rows = engine.get_jaza_range(max_jıl=5)
+        assert {row["jaza"]["value"] for row in rows} == {
+            str(HUQUQ.J_max_only), str(HUQUQ.J_1_3), str(HUQUQ.J_2_5),
+        }
+
+    def test_fines_and_bounds(self, punishments):
+        """
+        Test fine ranges and per-subject bounds.
+        Jarıma diapazonların ha'm subyekt shegaraların test etiw.
+        """
+        index = RangeIndex(punishments, HUQUQ_PUNISHMENT_RANGE)
+
+        assert list(index.fines_between(1000, 10000)) == [HUQUQ.J_fine]
+        assert list(index.fines_between(1000)) == [HUQUQ.J_fine, HUQUQ.J_fine_big]
+        assert index.bounds(HUQUQ.J_2_5) == (2.0, 5.0, None)
+        assert len(index) == 7
+
+    def test_writing_moves_subject(self, punishments):
+        """
+        Test an updated range is re-sorted without a full rebuild.
+        Jańalanǵan diapazon tolıq qayta dúzbey qayta sortlanıwın test etiw.
+        """
+        index = RangeIndex(punishments, HUQUQ_PUNISHMENT_RANGE)
+
+        with index.writing(HUQUQ.J_7_15):
+            punishments.set((HUQUQ.J_7_15, HUQUQ.durationMin, Literal(1)))
+            punishments.set((HUQUQ.J_7_15, HUQUQ.durationMax, Literal(2)))
+
+        assert list(index.within(1, 5)) == [HUQUQ.J_1_3, HUQUQ.J_7_15, HUQUQ.J_2_5]
+        assert list(index.within(7)) == []
+
+    def test_non_numeric_values_skipped(self):
+        """
+        Test literals that are not numbers are left out of the index.
+        San bolmaǵan literallar indekske kirmewin test etiw.
+        """
+        graph = Graph()
+        graph.add((KK.Statiya_1, RDF.type, KK.Statiya))
+        graph.add((KK.Statiya_1, KK.jaza_min, Literal("bes jıl")))
+        graph.add((KK.Statiya_2, RDF.type, KK.Statiya))
+        graph.add((KK.Statiya_2, KK.jaza_min, Literal(2)))
+        graph.add((KK.Statiya_2, KK.jaza_max, Literal(6)))
+
+        index = get_range_index(graph, KK_PUNISHMENT_RANGE)
+
+        assert list(index.within(0, 10)) == [KK.Statiya_2]
+        assert get_range_index(graph, KK_PUNISHMENT_RANGE) is index
+
+
+class TestFacetIndex:
+    """FacetIndex search and counts / FacetIndex izlewi ha'm sanları"""
+
+    def test_counts_without_filters(self, articles):
+        """
+        Test counts over all articles equal a GROUP BY per facet.
+        Barlıq statiyalar boyınsha sanlar hár facet ushın GROUP BY-ǵa teń ekenin test etiw.
+        """
+        result = FacetIndex(articles, KK_FACETS).search()
+
+        assert result.total == 5
+        assert result.facets["severity"] == {"Awır": 2, "Orta": 2, "Jeńil": 1}
+        assert result.facets["crime_type"]["Múlikke qarsi"] == 3
+        assert result.facets["code"] == {"JinayatKodeksi_2023": 5}
+
+        for row in articles.query("""
+            PREFIX kk: <http://karakalpak.law/ontology#>
+            SELECT ?v (COUNT(?s) AS ?n) WHERE { ?s a kk:Statiya ; kk:jinayat_turi ?v }
+            GROUP BY ?v
+        """):
+            assert result.facets["crime_type"][str(row.v)] == int(row.n)
+
+    def test_filters_and_disjunctive_counts(self, articles):
+        """
+        Test facets AND together and a facet's counts ignore its own selection.
+        Facetler AND bolıwın ha'm facet sanları óz tańlawın esapqa almawın test etiw.
+        """
+        result = FacetIndex(articles, KK_FACETS).search(
+            {"crime_type": "Múlikke qarsi", "punishment_type": "Aqsha jazası"}
+        )
+
+        assert result.subjects == [KK.Statiya_175, KK.Statiya_200]
+        assert result.facets["severity"] == {"Jeńil": 1, "Orta": 1}
+        assert result.facets["crime_type"] == {"Múlikke qarsi": 2}
+        assert result.facets["punishment_type"] == {"Aqsha jazası": 2, "Erkinlikten ayırıw": 1}
+
+    def test_values_within_facet_are_ored(self, articles):
+        """
+        Test several values of one facet widen the match.
+        Bir facettiń bir neshe mánisi nátiyjeni keńeytiwin test etiw.
+        """
+        index = FacetIndex(articles, KK_FACETS)
+
+        assert index.subjects({"severity": ["Awır", "Jeńil"]}) == [
+            KK.Statiya_169, KK.Statiya_177, KK.Statiya_200,
+        ]
+        assert index.search(within=[KK.Statiya_169, KK.Statiya_175]).total == 2
+        with pytest.raises(ValueError):
+            index.search({"colour": "red"})
+
+    def test_keyword_combined_with_facets_and_range(self, articles):
+        """
+        Test keyword, facet and range criteria intersect exactly.
+        Gilt sóz, facet ha'm diapazon shártleri anıq kesilisiwin test etiw.
+        """
+        articles.add((KK.Statiya_175, KK["tekstı"], Literal("Múlikti jasırın urlaw", lang="kk")))
+        articles.add((KK.Statiya_177, KK["tekstı"], Literal("Múlikti ashıq tartıp alıw", lang="kk")))
+        articles.add((KK.Statiya_175, KK.jaza_min, Literal(0)))
+        articles.add((KK.Statiya_175, KK.jaza_max, Literal(3)))
+        articles.add((KK.Statiya_177, KK.jaza_min, Literal(5)))
+        articles.add((KK.Statiya_177, KK.jaza_max, Literal(12)))
+        index = get_facet_index(articles, KK_FACETS)
+
+        assert index.subjects(keyword="múlikti") == [KK.Statiya_175, KK.Statiya_177]
+        assert index.subjects(keyword="MÚLIK") == [KK.Statiya_175, KK.Statiya_177]
+        assert index.subjects({"severity": "Awır"}, keyword="múlik") == [KK.Statiya_177]
+        assert index.subjects(keyword="tlaw") == []
+        assert index.subjects(keyword="li", within=[KK.Statiya_175]) == [KK.Statiya_175]
+
+        short = get_range_index(articles, KK_PUNISHMENT_RANGE).within(0, 5)
+        result = index.search(keyword="múlik", within=short)
+        assert result.subjects == [KK.Statiya_175]
+        assert result.facets["severity"] == {"Orta": 1}
+
+    def test_writing_updates_postings(self, articles):
+        """
+        Test a changed facet value moves the article between postings.
+        Ózgergen facet mánisi statiyanı postingler arasında kóshiriwin test etiw.
+        """
+        index = get_facet_index(articles, KK_FACETS)
+
+        with index.writing(KK.Statiya_200):
+            articles.set((KK.Statiya_200, KK["awırlıq_dárejesi"], Literal("Awır")))
+
+        assert index.search().facets["severity"] == {"Awır": 3, "Orta": 2}
+        assert index.values(KK.Statiya_200)["severity"] == ["Awır"]
+        assert len(index) == 5
+
+
+class TestIndexedFrontEnds:
+    """Article lookups that use the index / Indeksti qollanatuǵın izlewler"""
+
+    def test_search_statiya_by_number(self, graph):
+        """
+        Test SPARQLEngine.search_statiya resolves numbers via the index.
+        SPARQLEngine.search_statiya nomerlerdi indeks arqalı tabıwın test etiw.
+        """
+        engine = SPARQLEngine(graph)
+
+        both = engine.search_statiya(nomer="123")
+        criminal = engine.search_statiya(nomer="123", kodeks="JK")
+
+        assert {r['codeType']['value'] for r in both} == {"JK", "AK"}
+        assert [r['title']['value'] for r in criminal] == ["Jinayattıń awır túri"]
+        assert engine.search_statiya(nomer="404") == []
+
+    def test_add_individual_keeps_index_current(self, graph, monkeypatch):
+        """
+        Test OntologyManager.add_individual updates an existing index.
+        OntologyManager.add_individual bar indeksti jańalawın test etiw.
+        """
+        manager = OntologyManager()
+        monkeypatch.setattr(manager, "graph", graph)
+        monkeypatch.setattr(manager, "is_loaded", lambda: True)
+        monkeypatch.setattr(manager, "get_class", lambda name: HUQUQ[name])
+
+        index = get_article_index(graph)
+        manager.add_individual("Statiya", "Statiya_555", {"articleNumber": "555"})
+
+        assert index.lookup("555") == [HUQUQ.Statiya_555]
+
+    def test_get_jaza_range_uses_index(self, punishments):
+        """
+        Test SPARQLEngine.get_jaza_range agrees with the range filter.
+        SPARQLEngine.get_jaza_range diapazon filtri menen sáykes keliwin test etiw.
+        """
+        engine = SPARQLEngine(punishments)
+
+        rows = engine.get_jaza_range(min_jıl=1, max_jıl=5)
+
+        assert [r['name']['value'] for r in rows] == ["J_1_3", "J_2_5"]
+        assert engine.get_jaza_range(min_jıl=8, max_jıl=9) == []
+        assert len(engine.get_jaza_range()) == 7
+
+    def test_search_statiya_keyword_and_code(self, graph):
+        """
+        Test keyword and code searches match the plain FILTER query.
+        Gilt sóz ha'm kodeks izlewi ápiwayı FILTER sorawı menen sáykes keliwin test etiw.
+        """
+        engine = SPARQLEngine(graph)
+
+        by_keyword = engine.search_statiya(keyword="AWıR")
+        by_code = engine.search_statiya(kodeks="AK")
+        both = engine.search_statiya(kodeks="AK", keyword="óltiriw")
+
+        assert [r['title']['value'] for r in by_keyword] == ["Jinayattıń awır túri"]
+        assert [r['title']['value'] for r in by_code] == ["Administrativ huqıqbuzarlıq"]
+        assert both == []
+
+    def test_facets_endpoint(self, articles, monkeypatch):
+        """
+        Test /facets returns matching articles with facet counts.
+        /facets sáykes statiyalardı facet sanları menen qaytarıwın test etiw.
+        """
+        manager = OntologyManager()
+        monkeypatch.setattr(manager, "graph", articles)
+        monkeypatch.setattr(manager, "is_loaded", lambda: True)
+        monkeypatch.setattr(ontology_manager, "get_ontology_manager", lambda: manager)
+
+        response = TestClient(app).get(
+            "/api/v1/facets", params=[("severity", "Awır"), ("severity", "Orta")]
+        )
+        body = response.json()
+
+        assert response.status_code == 200
+        assert body["total"] == 4
+        assert body["facets"]["severity"]["Jeńil"] == 1
+        assert body["articles"][0]["severity"] == ["Awır"]
+        assert body["articles"][0]["label"] == "Statiya 169"
@@ -0,0 +1,104 @@
+"""
+Tests for ETag / Cache-Control handling on read-only routes
+Tek oqıw jollarındaǵı ETag / Cache-Control ushın testler
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.api.http_cache import _matches, knowledge_etag
+from src.api.main import app
+from src.core.base import QueryResult
+from src.utils.cache import bump_knowledge_version
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Client with a counting fake article lookup / Sanawshı jalǵan statiya izlewi"""
+    calls = []
+
+    async def fake_article(article_number):
+        calls.append(article_number)
+        return QueryResult(success=True, data=[{"article": "a97", "title": "Qasten adam óltiriw"}])
+
+    monkeypatch.setattr(routes.sparql_service, "get_article_by_number", fake_article)
+    client = TestClient(app)
+    client.calls = calls
+    return client
+
+
+class TestConditionalRequests:
+    """If-None-Match handling / If-None-Match islew"""
+
+    def test_validators_attached(self, client):
+        """
+        Test responses carry ETag and Cache-Control.
+        Juwaplarda ETag ha'm Cache-Control bar ekenin test etiw.
+        """
+        response = client.get("/api/v1/articles/97")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == knowledge_etag()
+        assert "max-age=" in response.headers["cache-control"]
+
+    def test_matching_tag_returns_304_without_query(self, client):
+        """
+        Test a current tag gets 304 and the graph is not queried.
+        Jańa teg 304 alıwın ha'm graf soralmawın test etiw.
+        """
+        etag = client.get("/api/v1/articles/97").headers["etag"]
+        response = client.get("/api/v1/articles/97", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert client.calls == ["97"]
+
+    def test_reload_changes_tag(self, client):
+        """
+        Test a knowledge-base change invalidates the client copy.
+        Bilimler bazası ózgeriwi klient nusqasın eskirtiwin test etiw.
+        """
+        etag = client.get("/api/v1/articles/97").headers["etag"]
+        bump_knowledge_version("test")
+
+        response = client.get("/api/v1/articles/97", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_terminology_conditional(self, client):
+        """
+        Test terminology honours If-None-Match too.
+        Terminologiya da If-None-Match-ti esapqa alıwın test etiw.
+        """
+        etag = client.get("/api/v1/terminology").headers["etag"]
+        response = client.get("/api/v1/terminology", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_invalid_crime_type_not_cached(self, client):
+        """
+        Test validation errors carry no validators.
+        Tekseriw qátelerinde validatorlar joq ekenin test etiw.
+        """
+        response = client.get("/api/v1/crimes/unknown")
+
+        assert response.status_code == 400
+        assert "etag" not in response.headers
+
+
+@pytest.mark.parametrize("header, expected", [
+    ('"kb-1"', True),
+    ('W/"kb-1"', True),
+    ('"kb-0", "kb-1"', True),
+    ('*', True),
+    ('"kb-2"', False),
+])
+def test_if_none_match_parsing(header, expected):
+    """
+    Test list, weak and wildcard If-None-Match forms.
+    List, álsiz ha'm wildcard If-None-Match formaların test etiw.
+    """
+    assert _matches(header, '"kb-1"') is expected
@@ -0,0 +1,73 @@
+"""
+Tests for the legal-term keyword extractor
+Huquqıy termin gilt sóz alıwshısı ushın testler
+"""
+
+import pytest
+
+from src.services.keyword_extractor import KeywordExtractor
+
+
+@pytest.fixture
+def extractor():
+    """Extractor with the configured terminology / Sazlanǵan terminologiya menen"""
+    return KeywordExtractor(max_keywords=3)
+
+
+def texts(keywords):
+    return [keyword.text for keyword in keywords]
+
+
+class TestKeywordExtractor:
+    """Test keyword extraction / Gilt sóz alıwdı test etiw"""
+
+    def test_terms_ranked_first(self, extractor):
+        """
+        Test terminology terms outrank free words.
+        Terminologiya terminleri erkin sózlerden joqarı turıwın test etiw.
+        """
+        keywords = extractor.extract("Urlıqtıń jazası qanday?")
+
+        assert texts(keywords) == ["Jaza", "urlıq"]
+        assert keywords[0].term_key == "jaza"
+
+    def test_longest_term_weighted_higher(self, extractor):
+        """
+        Test multi-word terms weigh more than the terms inside them.
+        Kóp sózli terminler ishindegi terminlerden awırıraq ekenin test etiw.
+        """
+        keywords = extractor.extract("Jinayattıń awır túri nedir?")
+
+        assert texts(keywords) == ["Jinayattıń awır túri", "Jinayat"]
+
+    def test_stopwords_dropped(self, extractor):
+        """
+        Test question words and particles are not searched.
+        Soraw sózleri ha'm janapaylar izlenbewin test etiw.
+        """
+        assert extractor.extract("Qanday ha'm qashan beriledi?") == []
+
+    def test_other_scripts_map_to_karakalpak(self, extractor):
+        """
+        Test Russian and Cyrillic questions yield Karakalpak terms.
+        Rus ha'm kirill sorawları Qaraqalpaq terminlerin beriwin test etiw.
+        """
+        assert texts(extractor.extract("Что такое преступление?")) == ["Jinayat"]
+        assert texts(extractor.extract("урлық ушын жаза")) == ["Jaza", "urlıq"]
+
+    def test_numbers_kept(self, extractor):
+        """
+        Test article numbers survive as keywords.
+        Statiya nomerleri gilt sóz bolıp qalıwın test etiw.
+        """
+        assert texts(extractor.extract("Statiya 123 nedir?")) == ["Statiya", "123"]
+
+    def test_keyword_cap(self):
+        """
+        Test at most max_keywords are returned.
+        Eń kóp max_keywords qaytarılıwın test etiw.
+        """
+        extractor = KeywordExtractor(max_keywords=2)
+        keywords = extractor.extract("Sot advokat prokuror tergewshi guwa")
+
+        assert texts(keywords) == ["Advokat", "Sot"]
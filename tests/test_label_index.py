@@ -0,0 +1,151 @@
+"""
+Tests for the trigram label index
+Trigram label indeksi ushın testler
+"""
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDFS
+
+from src.core.label_index import LabelIndex, bounded_levenshtein, trigrams
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+
+
+@pytest.fixture
+def index():
+    """Index over a few labels / Bir neshe label boyınsha indeks"""
+    g = Graph()
+    g.add((HUQUQ.Jinayat, RDFS.label, Literal("Jinayat", lang="kaa")))
+    g.add((HUQUQ.Jinayat, RDFS.label, Literal("Crime", lang="en")))
+    g.add((HUQUQ.Urliq, RDFS.label, Literal("Urılıq jinayatı", lang="kaa")))
+    g.add((HUQUQ.Jaza, RDFS.label, Literal("Jaza", lang="kaa")))
+    g.add((HUQUQ.Nizam, RDFS.label, Literal("Nızam")))
+    return LabelIndex.from_graph(g)
+
+
+class TestBoundedLevenshtein:
+    """Test the bounded edit distance / Shekli ózgeris aralıǵın test etiw"""
+
+    @pytest.mark.parametrize("a,b,expected", [
+        ("jinayat", "jinayat", 0),
+        ("jınayat", "jinayat", 1),
+        ("jaza", "jazası", 2),
+        ("", "abc", 3),
+    ])
+    def test_distance(self, a, b, expected):
+        """
+        Test distances within the limit are exact.
+        Shek ishindegi aralıqlar anıq ekenin test etiw.
+        """
+        assert bounded_levenshtein(a, b, 3) == expected
+
+    def test_cutoff(self):
+        """
+        Test distances above the limit are capped.
+        Shekten úlken aralıqlar sheklengenin test etiw.
+        """
+        assert bounded_levenshtein("jaza", "nızam", 1) == 2
+        assert bounded_levenshtein("a", "abcdef", 2) == 3
+
+    def test_trigrams_padded(self):
+        """
+        Test trigrams include word boundaries.
+        Trigramlar sóz shegaraların qamtıwın test etiw.
+        """
+        assert "  j" in trigrams("jaza")
+        assert "a  " in trigrams("jaza")
+
+
+class TestLabelIndex:
+    """Test label search / Label izlewin test etiw"""
+
+    def test_typo_match(self, index):
+        """
+        Test a misspelled term finds the label.
+        Qáte jazılǵan termin labeldı tabıwın test etiw.
+        """
+        uris = [entry.uri for entry, _ in index.search("jinaiat", lang="kaa")]
+
+        assert uris == [str(HUQUQ.Jinayat), str(HUQUQ.Urliq)]
+
+    def test_inflected_forms_contained(self, index):
+        """
+        Test inflected and diacritic variants match through normalization.
+        Jalǵawlı ha'm diakritik variantlar normalizaciya arqalı sáykes keliwin test etiw.
+        """
+        labels = [entry.label for entry in index.contains("jınayattıń", lang="kaa")]
+
+        assert labels == ["Jinayat", "Urılıq jinayatı"]
+
+    def test_substring_ranked_first(self, index):
+        """
+        Test exact containment scores above fuzzy matches.
+        Anıq qamtıw anıq emes sáykesliklerden joqarı turıwın test etiw.
+        """
+        results = index.search("jinayat", lang="kaa")
+
+        assert results[0][1] == 1.0
+        assert results[0][0].label == "Jinayat"
+
+    def test_language_filter(self, index):
+        """
+        Test labels in other languages are skipped, untagged ones kept.
+        Basqa tildegi labellar ótkerilip, tilsiz labellar saqlanıwın test etiw.
+        """
+        labels = [entry.label for entry, _ in index.search("nızam", lang="en")]
+        assert labels == ["Nızam"]
+
+        assert index.search("crime", lang="kaa") == []
+
+    def test_all_tokens_required(self, index):
+        """
+        Test every query token must match.
+        Sorawdıń barlıq tokenleri sáykes keliwi kerekligin test etiw.
+        """
+        labels = [entry.label for entry, _ in index.search("urılıq jinaiat", lang="kaa")]
+        assert labels == ["Urılıq jinayatı"]
+
+    def test_unrelated_term(self, index):
+        """
+        Test distant terms do not match.
+        Alıs terminler sáykes kelmewin test etiw.
+        """
+        assert index.search("konstituciya", lang="kaa") == []
+
+    def test_label_inside_term_scored_by_coverage(self, index):
+        """
+        Test a short label inside a longer term scores its share, not 1.0.
+        Uzın termin ishindegi qısqa label 1.0 emes, óz úlesin alıwın test etiw.
+        """
+        results = dict((entry.label, score) for entry, score in
+                       index.search("jaza hám nızam", lang="kaa"))
+
+        assert 0 < results["Jaza"] < 1.0
+        assert 0 < results["Nızam"] < 1.0
+
+    def test_lookups_touch_only_candidates(self):
+        """
+        Test containment is confirmed on posting candidates, not every label.
+        Qamtıw barlıq labellarda emes, tek kandidatlarda tekseriliwin test etiw.
+        """
+        class CountingList(list):
+            reads = 0
+
+            def __getitem__(self, item):
+                CountingList.reads += 1
+                return super().__getitem__(item)
+
+            def __iter__(self):
+                raise AssertionError("full scan / tolıq qaraw")
+
+        g = Graph()
+        for i in range(2000):
+            g.add((HUQUQ[f"T{i}"], RDFS.label, Literal(f"termin{i} sóz{i}", lang="kaa")))
+        g.add((HUQUQ.Jinayat, RDFS.label, Literal("Jinayat", lang="kaa")))
+        index = LabelIndex.from_graph(g)
+        index.entries = CountingList(index.entries)
+
+        assert [e.label for e in index.contains("jinayat")] == ["Jinayat"]
+        assert [e.label for e, _ in index.search("jinayat")] == ["Jinayat"]
+        assert CountingList.reads < 20
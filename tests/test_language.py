@@ -0,0 +1,56 @@
+"""
+Tests for language utilities
+Til qurallari ushın testler
+"""
+
+from src.utils.language import LanguageUtils, get_language_utils
+
+
+class TestLanguageUtils:
+    """Test terminology lookups / Terminologiya izlewlerin test etiw"""
+
+    def test_singleton(self):
+        """
+        Test the instance is built once.
+        Misal bir ret dúziliwin test etiw.
+        """
+        assert get_language_utils() is get_language_utils()
+
+    def test_translate_from_any_language(self):
+        """
+        Test translation works from every language and script.
+        Tárjime hár tilden ha'm jazıwdan islewin test etiw.
+        """
+        utils = get_language_utils()
+
+        assert utils.translate_term("jinayat", to_lang="ru") == "Преступление"
+        assert utils.translate_term("JINAYAT") == "Crime"
+        assert utils.translate_term("Закон", from_lang="ru", to_lang="kaa") == "Nızam"
+        assert utils.translate_term("Modda", from_lang="uz", to_lang="en") == "Article"
+        assert utils.translate_term("belgisiz") == "belgisiz"
+
+    def test_find_terms(self):
+        """
+        Test whole-word term spotting in one pass.
+        Bir ótiwde pútin sóz terminlerin tabıwdı test etiw.
+        """
+        utils = get_language_utils()
+
+        found = utils.find_terms("Jinayat kodeksiniń jazaları haqqında")
+        keys = [ref[0] for _, ref in found]
+
+        assert "jinayat" in keys
+        assert "jinayat_kodeksi" in keys
+        assert "jaza" in keys
+        assert utils.find_terms("jazalaw") == []
+
+    def test_detect_language(self):
+        """
+        Test detection prefers Karakalpak for shared spellings.
+        Ortaq jazılıwlarda Qaraqalpaq tili tańlanıwın test etiw.
+        """
+        utils = LanguageUtils()
+
+        assert utils.detect_language("Statiya 12") == "kaa"
+        assert utils.detect_language("Jazo muddati") == "uz"
+        assert utils.detect_language("hello") is None
@@ -0,0 +1,160 @@
+"""
+Tests for the metrics registry and /metrics endpoint
+Metrikalar reestri ha'm /metrics endpoint ushın testler
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+from rdflib import Graph, Literal, Namespace, RDF
+
+from src.core.sparql_engine import SPARQLEngine
+from src.utils.metrics import MetricsRegistry, get_metrics_registry
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+
+
+class TestMetricsRegistry:
+    """Test registry and exposition format / Reestr ha'm shıǵarıw formatın test etiw"""
+
+    def test_counter_render(self):
+        """
+        Test labelled counters render as Prometheus samples.
+        Belgili hisablawıshlar Prometheus úlgileri retinde shıǵıwın test etiw.
+        """
+        registry = MetricsRegistry()
+        counter = registry.counter("test_requests_total", "Requests", ["route"])
+        counter.labels(route="/a").inc()
+        counter.labels(route="/a").inc(2)
+        counter.labels(route='/b"x').inc()
+
+        text = registry.render()
+
+        assert "# TYPE test_requests_total counter" in text
+        assert 'test_requests_total{route="/a"} 3' in text
+        assert 'test_requests_total{route="/b\\"x"} 1' in text
+        assert counter.total() == 4
+
+    def test_histogram_buckets(self):
+        """
+        Test histogram buckets are cumulative with +Inf, sum and count.
+        Gistogramma sebetleri jıynalǵan ekenin test etiw.
+        """
+        registry = MetricsRegistry()
+        hist = registry.histogram("test_seconds", "Latency", buckets=(0.1, 1.0))
+        hist.observe(0.05)
+        hist.observe(0.5)
+        hist.observe(5.0)
+
+        text = registry.render()
+
+        assert 'test_seconds_bucket{le="0.1"} 1' in text
+        assert 'test_seconds_bucket{le="1"} 2' in text
+        assert 'test_seconds_bucket{le="+Inf"} 3' in text
+        assert "test_seconds_count 3" in text
+        assert "test_seconds_sum 5.55" in text
+
+    def test_gauge_function(self):
+        """
+        Test gauges computed at scrape time.
+        Oqıw waqtında esaplanatuǵın ólshewishlerdi test etiw.
+        """
+        registry = MetricsRegistry()
+        items = [1, 2]
+        registry.gauge("test_items", "Items").set_function(lambda: len(items))
+        items.append(3)
+
+        assert "test_items 3" in registry.render()
+
+    def test_registration_idempotent(self):
+        """
+        Test registering the same name returns the same metric.
+        Bir attı qayta dizimge alıw sol metrikani qaytarıwın test etiw.
+        """
+        registry = MetricsRegistry()
+        first = registry.counter("test_total", "Total")
+
+        assert registry.counter("test_total", "Total") is first
+        with pytest.raises(ValueError):
+            registry.gauge("test_total", "Total")
+        with pytest.raises(ValueError):
+            first.labels(route="/x")
+
+
+class TestInstrumentation:
+    """Test components report into the shared registry / Komponentlerdi test etiw"""
+
+    def test_sparql_engine_metrics(self):
+        """
+        Test engine queries and cache lookups are counted.
+        Mexanizm sorawları ha'm kesh izlewleri sanalıwın test etiw.
+        """
+        g = Graph()
+        g.add((HUQUQ.Jinayat_1, RDF.type, HUQUQ.Jinayat))
+        engine = SPARQLEngine(g)
+        engine.clear_cache()
+        registry = get_metrics_registry()
+        queries = registry.get("huquqai_sparql_queries_total").labels(status="ok")
+        hits = registry.get("huquqai_cache_requests_total").labels(cache="sparql", result="hit")
+        queries_before, hits_before = queries.value, hits.value
+
+        query = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 1"
+        engine.execute_cached(query)
+        engine.execute_cached(query)
+        engine.clear_cache()
+
+        assert queries.value == queries_before + 1
+        assert hits.value == hits_before + 1
+
+    def test_bot_handler_middleware(self):
+        """
+        Test the bot middleware records handler latency and errors.
+        Bot middleware handler keshigiwin ha'm qáteliklerin jazıwın test etiw.
+        """
+        from src.api.bot import BOT_UPDATES, HandlerMetricsMiddleware
+
+        class FakeHandler:
+            async def callback(self):
+                pass
+
+        async def ok_handler(event, data):
+            return "done"
+
+        async def failing_handler(event, data):
+            raise RuntimeError("boom")
+
+        middleware = HandlerMetricsMiddleware()
+        data = {"handler": type("H", (), {"callback": staticmethod(FakeHandler.callback)})()}
+        ok = BOT_UPDATES.labels(handler="callback", status="ok")
+        error = BOT_UPDATES.labels(handler="callback", status="error")
+        ok_before, error_before = ok.value, error.value
+
+        assert asyncio.run(middleware(ok_handler, object(), data)) == "done"
+        with pytest.raises(RuntimeError):
+            asyncio.run(middleware(failing_handler, object(), data))
+
+        assert ok.value == ok_before + 1
+        assert error.value == error_before + 1
+
+
+def test_metrics_endpoint():
+    """
+    Test /metrics exposes per-route request metrics.
+    /metrics hár bir jol boyınsha soraw metrikaların kórsetiwin test etiw.
+    """
+    from src.api.main import app
+
+    client = TestClient(app)
+
+    assert client.get("/health").status_code == 200
+    assert client.get("/api/v1/stats").status_code == 200
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'huquqai_http_requests_total{method="GET",route="/health",status="200"}' in response.text
+    assert 'huquqai_http_request_duration_seconds_bucket{method="GET",route="/api/v1/stats"' in response.text
+    assert "huquqai_graph_triples" in response.text
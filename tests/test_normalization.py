@@ -0,0 +1,94 @@
+"""
+Tests for Karakalpak search normalization
+Qaraqalpaq izlew normalizaciyası ushın testler
+"""
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDFS
+
+from src.utils.helpers import normalize_karakalpak_text
+from src.utils.normalization import (
+    FUNCTION_NS,
+    fold_text,
+    register_sparql_functions,
+    search_key,
+    stem_token,
+)
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+
+
+class TestFolding:
+    """Test diacritic folding / Diakritik birlestiriwdi test etiw"""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Ūrlıq", "urliq"),
+        ("ǴÁREZSIZLIK", "garezsizlik"),
+        ("ha'm", "ham"),
+        ("nátiyјe", "natiyje"),
+        ("ú", "u"),
+    ])
+    def test_fold_text(self, text, expected):
+        """
+        Test variants fold to the same base letters.
+        Variantlar birdey tiykarǵı háriplerge aylanıwın test etiw.
+        """
+        assert fold_text(text) == expected
+
+    def test_helper_keeps_case(self):
+        """
+        Test the legacy helper keeps letter case.
+        Eski funkciya háripler registrin saqlawın test etiw.
+        """
+        assert normalize_karakalpak_text("Ǵárezsiz Ńókis") == "Garezsiz Nokis"
+
+
+class TestStemming:
+    """Test suffix stripping / Qosımtalardı alıwdı test etiw"""
+
+    @pytest.mark.parametrize("word,stem", [
+        ("jinayattin", "jinayat"),
+        ("jinayati", "jinayat"),
+        ("jazasi", "jaza"),
+        ("nizamlardin", "nizam"),
+        ("nizamnin", "nizam"),
+        ("statiyalar", "statiya"),
+        ("jaza", "jaza"),
+        ("kisi", "kisi"),
+    ])
+    def test_stem_token(self, word, stem):
+        """
+        Test common case, possessive and plural endings are removed.
+        Seplik, tartım ha'm kóplik jalǵawları alınıwın test etiw.
+        """
+        assert stem_token(word) == stem
+
+    def test_search_key_matches_inflections(self):
+        """
+        Test inflected query and label meet in one form.
+        Jalǵawlı soraw ha'm label bir formaǵa keliwin test etiw.
+        """
+        assert search_key("Jinayattıń") == search_key("jinayatı") == "jinayat"
+        assert search_key("Ūrlıqtıń  jazası") == "urliq jaza"
+
+
+def test_sparql_function():
+    """
+    Test hf:searchKey normalizes literals inside SPARQL filters.
+    hf:searchKey SPARQL filtrlerinde literallardı normalizaciyalawın test etiw.
+    """
+    register_sparql_functions()
+    g = Graph()
+    g.add((HUQUQ.Urliq, RDFS.label, Literal("Ūrlıq", lang="kaa")))
+    g.add((HUQUQ.Jaza, RDFS.label, Literal("Jaza", lang="kaa")))
+
+    rows = list(g.query(f"""
+        PREFIX hf: <{FUNCTION_NS}>
+        SELECT ?s WHERE {{
+            ?s <{RDFS.label}> ?label .
+            FILTER(CONTAINS(hf:searchKey(?label), "{search_key('ūrlıqtıń')}"))
+        }}
+    """))
+
+    assert [row.s for row in rows] == [HUQUQ.Urliq]
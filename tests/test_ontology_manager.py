@@ -8,7 +8,8 @@ Bu modul Qaraqalpaq huquqıy ma'limleri menen OWL ontologiya basqarıw funktsiya
 
 import pytest
 from pathlib import Path
-from rdflib import URIRef, Literal
+from rdflib import Dataset, Graph, Literal, Namespace, RDF, RDFS, URIRef
+from rdflib.graph import DATASET_DEFAULT_GRAPH_ID
 
 from src.core.ontology_manager import (
     OntologyManager,
@@ -16,6 +17,10 @@ from src.core.ontology_manager import (
     OntologyNotLoadedError,
     get_ontology_manager
 )
+from src.utils.cache import bump_knowledge_version, knowledge_version
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
 
 
 @pytest.fixture
@@ -215,6 +220,26 @@ class TestOntologyManager:
         results_fuzzy = manager.search_by_label("jınayat", lang="kaa", fuzzy=True)
         assert len(results_fuzzy) > 0
 
+    def test_label_index_follows_same_size_edits(self, manager, sample_ontology_path):
+        """
+        Test a relabelling that keeps the graph size still refreshes label search.
+        Graf ólshemin saqlaytuǵın qayta atawdan keyin label izlewi jańalanıwın test etiw.
+        """
+        manager.load_ontology(sample_ontology_path)
+        assert manager.search_by_label("jinayat", lang="kaa")
+        subject = URIRef(manager.search_by_label("jinayat", lang="kaa")[0]['uri'])
+        size = len(manager.graph)
+
+        # A SPARQL-style update: remove one label, add another, then bump
+        # SPARQL jańalawı sıyaqlı: bir labeldı óshirip, basqasın qosıw
+        label = next(manager.graph.objects(subject, RDFS.label))
+        manager.graph.remove((subject, RDFS.label, label))
+        manager.graph.add((subject, RDFS.label, Literal("Qılmıs", lang="kaa")))
+        bump_knowledge_version("label edited")
+
+        assert len(manager.graph) == size
+        assert [r['uri'] for r in manager.search_by_label("qılmıs", lang="kaa")] == [str(subject)]
+
     def test_query_sparql(self, manager, sample_ontology_path):
         """
         Test SPARQL query execution.
@@ -393,6 +418,159 @@ class TestKarakalpakTerminology:
         assert isinstance(results, list)
 
 
+class TestCodePartitions:
+    """
+    Test per-code named graphs and query routing.
+    Kodeks boyınsha atamalı graflar ha'm soraw baǵdarlawın test etiw.
+    """
+
+    @pytest.fixture
+    def partitioned(self, manager, sample_ontology_path, tmp_path):
+        """Ontology plus one file per code / Ontologiya ha'm hár kodeks ushın fayl"""
+        articles = {
+            "criminal": ("7", "Urılıq"),
+            "civil": ("7", "Shártnama"),
+        }
+        manager.load_ontology(sample_ontology_path)
+        for code, (number, title) in articles.items():
+            path = tmp_path / f"{code}.ttl"
+            path.write_text(f"""
+                @prefix huquq: <http://huquqai.org/ontology#> .
+                huquq:Statiya_{code} a huquq:Statiya ;
+                    huquq:articleNumber "{number}" ;
+                    huquq:title "{title}"@kaa ;
+                    huquq:codeType "{code}" .
+            """, encoding='utf-8')
+            manager.load_ontology(path, format="turtle", code=code)
+        return manager
+
+    def test_files_load_into_named_graphs(self, partitioned):
+        """
+        Test each code file lands in its own named graph of one Dataset.
+        Hár kodeks faylı bir Dataset-tiń óz atamalı grafına túsiwin test etiw.
+        """
+        criminal = partitioned.partitions["criminal"]
+
+        assert isinstance(partitioned.graph, Dataset)
+        assert str(criminal.identifier) == "http://huquqai.org/graph/criminal"
+        assert set(criminal.subjects()) == {HUQUQ.Statiya_criminal}
+        assert partitioned.stats["partitions"] == {"criminal": 4, "civil": 4}
+        assert partitioned.get_class("Statiya") is not None
+        assert len(partitioned.get_instances("Statiya")) == 3
+
+    def test_search_routes_to_code_graph(self, partitioned):
+        """
+        Test a code-specific search runs on that code's graph only.
+        Kodekske tán izlew tek sol kodeks grafında orınlanıwın test etiw.
+        """
+        from src.core.sparql_engine import SPARQLEngine
+
+        engine = SPARQLEngine(partitioned.graph)
+
+        assert len(engine.graph_for_code("jinayat")) == 4
+        assert engine.graph_for_code("administrative") is partitioned.graph
+        assert engine.graph_for_code(None) is partitioned.graph
+        assert [r["title"]["value"] for r in engine.search_statiya(kodeks="jinayat")] == ["Urılıq"]
+        assert [r["title"]["value"] for r in engine.search_statiya(nomer="7", kodeks="civil")] == [
+            "Shártnama"
+        ]
+        assert len(engine.search_statiya(nomer="7")) == 2
+
+    def test_graph_type_follows_configured_graphs(self, manager, sample_ontology_path,
+                                                  tmp_path, monkeypatch):
+        """
+        Test the graph is a Dataset only with named graphs configured, and how it iterates and parses.
+        Graf tek atamalı graflar sazlanǵanda Dataset bolıwın, onıń iteraciyası ha'm parse-in test etiw.
+        """
+        extra = tmp_path / "extra.ttl"
+        extra.write_text("""
+            @prefix huquq: <http://huquqai.org/ontology#> .
+            huquq:Statiya_extra a huquq:Statiya .
+        """, encoding='utf-8')
+        added = (HUQUQ.Statiya_extra, RDF.type, HUQUQ.Statiya)
+
+        manager.load_ontology(sample_ontology_path)
+        dataset = manager.graph
+        dataset.parse(str(extra), format="turtle")
+
+        assert isinstance(dataset, Dataset)
+        assert added in dataset
+        assert added in dataset.graph(DATASET_DEFAULT_GRAPH_ID)
+        assert len(next(iter(dataset))) == 4
+        assert all(len(triple) == 3 for triple in dataset.triples((None, None, None)))
+
+        monkeypatch.setattr(manager.config.sparql, "graphs", {})
+        manager.load_ontology(sample_ontology_path)
+        manager.graph.parse(str(extra), format="turtle")
+
+        assert type(manager.graph) is Graph
+        assert added in manager.graph
+        assert len(next(iter(manager.graph))) == 3
+
+    def test_unknown_code_fails(self, manager, sample_ontology_path):
+        """
+        Test a code without a configured graph is rejected.
+        Grafı sazlanbaǵan kodeks qabıl etilmewin test etiw.
+        """
+        manager.load_ontology(sample_ontology_path)
+
+        with pytest.raises(OntologyManagerError):
+            manager.load_ontology(sample_ontology_path, code="labor")
+
+
+class TestBulkAdd:
+    """
+    Test add_many and merge_graph.
+    add_many ha'm merge_graph metodların test etiw.
+    """
+
+    def test_add_many_updates_once(self, manager, sample_ontology_path, monkeypatch):
+        """
+        Test a batch is added with one statistics update and one version bump.
+        Toplam bir statistika jańalawı ha'm bir versiya ósiwi menen qosılıwın test etiw.
+        """
+        manager.load_ontology(sample_ontology_path)
+        before = manager.stats["triple_count"]
+        calls = []
+        update_statistics = manager._update_statistics
+
+        def counting() -> None:
+            calls.append(1)
+            update_statistics()
+
+        monkeypatch.setattr(manager, "_update_statistics", counting)
+        version = knowledge_version()
+        triples = [(HUQUQ[f"Statiya_{i}"], HUQUQ.articleNumber, Literal(str(i))) for i in range(25)]
+
+        added = manager.add_many(triples + triples[:5], batch_size=10)
+
+        assert added == 25
+        assert len(calls) == 1
+        assert knowledge_version() == version + 1
+        assert manager.stats["triple_count"] == before + 25
+        assert manager.add_many(triples) == 0
+
+    def test_merge_graph_into_code_graph(self, manager, sample_ontology_path):
+        """
+        Test merge_graph can target a code's named graph.
+        merge_graph kodekstiń atamalı grafına qosa alıwın test etiw.
+        """
+        manager.load_ontology(sample_ontology_path)
+        data = Graph()
+        data.add((HUQUQ.Statiya_1, HUQUQ.codeType, Literal("criminal")))
+
+        assert manager.merge_graph(data, code="jinayat") == 1
+        assert set(manager.partitions["criminal"]) == set(data)
+
+    def test_add_many_requires_loaded(self, manager):
+        """
+        Test add_many fails before an ontology is loaded.
+        Ontologiya júklenbey turıp add_many qátelik beriwin test etiw.
+        """
+        with pytest.raises(OntologyNotLoadedError):
+            manager.add_many([])
+
+
 # Integration test / Integratsiya testı
 def test_full_workflow(tmp_path):
     """
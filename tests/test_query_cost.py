@@ -0,0 +1,367 @@
+"""
+Tests for QueryCostEstimator and SPARQL admission control
+QueryCostEstimator ha'm SPARQL qabıllaw qadaǵalawı ushın testler
+"""
+
+import pytest
+from rdflib import Dataset, Graph, Literal, Namespace, RDF, RDFS, URIRef
+from rdflib.plugins.sparql import prepareQuery
+
+from src.core.config import AdmissionConfig
+from src.core.query_cost import (
+    GraphStatistics,
+    QueryCostEstimator,
+    add_limit,
+    get_graph_statistics,
+    writing_statistics,
+)
+from src.core.sparql_engine import SPARQLEngine, QueryRejectedError, QueryValidationError
+from src.utils.cache import bump_knowledge_version
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+
+PREFIXES = """
+PREFIX huquq: <http://huquqai.org/ontology#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+"""
+
+
+@pytest.fixture
+def graph():
+    """
+    Graph with 50 articles and 10 crimes.
+    50 statiya ha'm 10 jinayat bar graf.
+    """
+    g = Graph()
+    for i in range(50):
+        article = HUQUQ[f"Statiya_{i}"]
+        g.add((article, RDF.type, HUQUQ.Statiya))
+        g.add((article, HUQUQ.articleNumber, Literal(str(i))))
+        g.add((article, RDFS.label, Literal(f"Statiya {i}", lang="kaa")))
+    for i in range(10):
+        crime = HUQUQ[f"Jinayat_{i}"]
+        g.add((crime, RDF.type, HUQUQ.Jinayat))
+        g.add((crime, RDFS.label, Literal(f"Jinayat {i}", lang="kaa")))
+    return g
+
+
+@pytest.fixture
+def estimator(graph):
+    """QueryCostEstimator over the sample graph / Misal graf boyınsha bahalawshı"""
+    return QueryCostEstimator(graph)
+
+
+def estimate(estimator, query):
+    """Estimate a query string / Soraw tekstin bahalaw"""
+    return estimator.estimate(prepareQuery(PREFIXES + query).algebra)
+
+
+class TestGraphStatistics:
+    """Test graph statistics collection / Graf statistikasın jıynawdı test etiw"""
+
+    def test_counts(self, graph):
+        """
+        Test predicate counts and class extents.
+        Predikat sanları ha'm klass kólemin test etiw.
+        """
+        stats = GraphStatistics.from_graph(graph)
+
+        assert stats.triple_count == len(graph)
+        assert stats.predicate_counts[RDF.type] == 60
+        assert stats.class_extents[HUQUQ.Statiya] == 50
+        assert stats.class_extents[HUQUQ.Jinayat] == 10
+        assert stats.subject_count == 60
+
+    def test_refresh_on_change(self, graph, estimator):
+        """
+        Test statistics refresh when the graph grows.
+        Graf ósse statistikanıń jańalanıwın test etiw.
+        """
+        assert estimator.statistics.class_extents[HUQUQ.Jinayat] == 10
+
+        graph.add((HUQUQ.Jinayat_new, RDF.type, HUQUQ.Jinayat))
+
+        assert estimator.statistics.class_extents[HUQUQ.Jinayat] == 11
+
+
+    def test_refresh_on_same_size_update(self, graph, estimator):
+        """
+        Test statistics refresh after an update that keeps the graph size.
+        Graf ólshemin saqlaytuǵın jańalawdan keyin statistika jańalanıwın test etiw.
+        """
+        assert estimator.statistics.class_extents[HUQUQ.Jinayat] == 10
+
+        graph.remove((HUQUQ.Jinayat_0, RDF.type, HUQUQ.Jinayat))
+        graph.add((HUQUQ.Jinayat_0, RDF.type, HUQUQ.Statiya))
+        bump_knowledge_version("crime retyped")
+
+        assert estimator.statistics.class_extents[HUQUQ.Jinayat] == 9
+        assert estimator.statistics.class_extents[HUQUQ.Statiya] == 51
+
+    def test_add_and_remove_match_rescan(self, graph):
+        """
+        Test counting writes one triple at a time gives the rescanned statistics.
+        Jazıwlardı birim-birim esaplaw qayta sanaw menen birdey nátiyje beriwin test etiw.
+        """
+        stats = GraphStatistics.from_graph(graph)
+        removed = list(graph.triples((HUQUQ.Jinayat_0, None, None)))
+        added = [(HUQUQ.Jinayat_0, RDF.type, HUQUQ.Statiya),
+                 (HUQUQ.Statiya_0, HUQUQ.relatedCrime, HUQUQ.Jinayat_1)]
+        for triple in removed:
+            graph.remove(triple)
+            stats.remove(triple)
+        for triple in added:
+            graph.add(triple)
+            stats.add(triple)
+
+        assert stats == GraphStatistics.from_graph(graph)
+        assert stats.class_extents[HUQUQ.Jinayat] == 9
+
+    def test_writes_update_without_rescan(self, graph, estimator, monkeypatch):
+        """
+        Test writes announced through ``writing_statistics`` do not rescan the graph.
+        ``writing_statistics`` arqalı jazıwlar grafti qayta sanamawın test etiw.
+        """
+        assert estimator.statistics.class_extents[HUQUQ.Jinayat] == 10
+        scans = []
+        from_graph = GraphStatistics.from_graph.__func__
+        monkeypatch.setattr(GraphStatistics, "from_graph",
+                            classmethod(lambda cls, g: scans.append(g) or from_graph(cls, g)))
+        crime = (HUQUQ.Jinayat_10, RDF.type, HUQUQ.Jinayat)
+
+        with writing_statistics(graph, [crime]):
+            graph.add(crime)
+            graph.remove((HUQUQ.Jinayat_0, RDF.type, HUQUQ.Jinayat))
+            bump_knowledge_version("crime added")
+
+        assert estimator.statistics.class_extents[HUQUQ.Jinayat] == 11
+        assert scans == []
+
+        graph.remove((HUQUQ.Jinayat_1, RDF.type, HUQUQ.Jinayat))
+        assert estimator.statistics.class_extents[HUQUQ.Jinayat] == 9
+        assert len(scans) == 1
+
+    def test_named_graph_statistics(self, monkeypatch):
+        """
+        Test a named graph has its own statistics, updated with the union on writes.
+        Atamalı graf óz statistikasına iye bolıp, jazıwda birlespe menen jańalanıwın test etiw.
+        """
+        dataset = Dataset(default_union=True)
+        criminal = dataset.graph(URIRef("http://huquqai.org/graph/criminal"))
+        civil = dataset.graph(URIRef("http://huquqai.org/graph/civil"))
+        for i in range(30):
+            civil.add((HUQUQ[f"Statiya_{i}"], RDF.type, HUQUQ.Statiya))
+        for i in range(3):
+            criminal.add((HUQUQ[f"Statiya_{i}"], RDF.type, HUQUQ.Statiya))
+        estimator = QueryCostEstimator(dataset)
+        query = prepareQuery(PREFIXES + "SELECT ?s WHERE { ?s a huquq:Statiya }").algebra
+
+        assert estimator.estimate(query).estimated_rows == 30
+        assert estimator.estimate(query, criminal).estimated_rows == 3
+
+        new = (HUQUQ.Statiya_99, RDF.type, HUQUQ.Statiya)
+        with writing_statistics(criminal, [new, (HUQUQ.Statiya_5, RDF.type, HUQUQ.Statiya)]):
+            criminal.add(new)
+            criminal.add((HUQUQ.Statiya_5, RDF.type, HUQUQ.Statiya))
+            bump_knowledge_version("articles added")
+
+        assert get_graph_statistics(criminal) == GraphStatistics.from_graph(criminal)
+        assert get_graph_statistics(dataset) == GraphStatistics.from_graph(dataset)
+        assert estimator.estimate(query, criminal).estimated_rows == 5
+        assert estimator.estimate(query).estimated_rows == 31
+
+class TestQueryCostEstimator:
+    """Test cardinality and cost estimation / Kardinallıq ha'm baha esaplawdı test etiw"""
+
+    def test_class_extent(self, estimator):
+        """
+        Test type pattern uses the class extent.
+        Túr úlgisi klass kólemin qollanıwın test etiw.
+        """
+        cost = estimate(estimator, "SELECT ?s WHERE { ?s a huquq:Jinayat }")
+
+        assert cost.estimated_rows == pytest.approx(10)
+        assert cost.query_type == "SelectQuery"
+        assert not cost.has_limit
+        assert "No LIMIT clause" in cost.warnings
+
+    def test_joined_patterns(self, estimator):
+        """
+        Test patterns sharing a subject are not a cartesian product.
+        Ortaq subyektli úlgiler dekart kóbeymesi emesligin test etiw.
+        """
+        cost = estimate(estimator, """
+            SELECT ?s ?n WHERE { ?s a huquq:Statiya ; huquq:articleNumber ?n }
+        """)
+
+        assert cost.cartesian_products == 0
+        assert cost.estimated_rows == pytest.approx(50)
+
+    def test_cartesian_product(self, estimator):
+        """
+        Test unconnected patterns are flagged and multiplied.
+        Baylanıspaǵan úlgiler belgileniwin ha'm kóbeytiliwin test etiw.
+        """
+        cost = estimate(estimator, """
+            SELECT ?a ?b WHERE { ?a a huquq:Statiya . ?b a huquq:Jinayat }
+        """)
+
+        assert cost.cartesian_products == 1
+        assert cost.estimated_rows == pytest.approx(500)
+
+    def test_regex_filter(self, estimator):
+        """
+        Test REGEX filters are counted and penalised.
+        REGEX filtrleri sanalıwın ha'm bahası artıwın test etiw.
+        """
+        plain = estimate(estimator, "SELECT ?s ?l WHERE { ?s rdfs:label ?l }")
+        regex = estimate(estimator, """
+            SELECT ?s ?l WHERE { ?s rdfs:label ?l FILTER(REGEX(?l, "urı", "i")) }
+        """)
+
+        assert regex.regex_filters == 1
+        assert regex.estimated_rows < plain.estimated_rows
+        assert regex.estimated_cost > plain.estimated_cost
+
+    def test_limit_caps_rows_and_cost(self, estimator):
+        """
+        Test LIMIT caps rows and, without ORDER BY, work.
+        LIMIT qatarlardı ha'm ORDER BY bolmasa jumıstı sheklewin test etiw.
+        """
+        unbounded = estimate(estimator, "SELECT * WHERE { ?s ?p ?o }")
+        limited = estimate(estimator, "SELECT * WHERE { ?s ?p ?o } LIMIT 5")
+        ordered = estimate(estimator, "SELECT * WHERE { ?s ?p ?o } ORDER BY ?o LIMIT 5")
+
+        assert limited.has_limit and limited.limit == 5
+        assert limited.estimated_rows == 5
+        assert limited.estimated_cost < unbounded.estimated_cost
+        assert ordered.estimated_cost > unbounded.estimated_cost
+
+    def test_plan(self, estimator):
+        """
+        Test the operator plan lists each node.
+        Operator jobası hár túyindi kórsetiwin test etiw.
+        """
+        cost = estimate(estimator, "SELECT ?s WHERE { ?s a huquq:Jinayat } LIMIT 3")
+        plan = "\n".join(cost.plan)
+
+        assert "Slice" in plan
+        assert "BGP" in plan
+        assert cost.to_dict()['limit'] == 3
+
+    def test_add_limit(self):
+        """
+        Test LIMIT rewriting keeps the query parseable.
+        LIMIT qosıw sorawdı talqılanatuǵın etip qaldırıwın test etiw.
+        """
+        query = add_limit(PREFIXES + "SELECT ?s WHERE { ?s ?p ?o } ORDER BY ?s", 10)
+        algebra = prepareQuery(query).algebra
+
+        assert algebra.p.name == "Slice"
+        assert algebra.p.length == 10
+
+
+class TestAdmissionControl:
+    """Test SPARQLEngine admission control / SPARQLEngine qabıllaw qadaǵalawın test etiw"""
+
+    @pytest.fixture
+    def engine(self, graph):
+        """Engine with a small budget / Kishi shekli mexanizm"""
+        eng = SPARQLEngine(graph)
+        eng.admission = AdmissionConfig(max_cost=2000, max_unbounded_rows=100, auto_limit=20)
+        return eng
+
+    def test_cheap_query_admitted(self, engine):
+        """
+        Test cheap queries run unchanged.
+        Arzan sorawlar ózgerissiz orınlanıwın test etiw.
+        """
+        results = engine.select(PREFIXES + "SELECT ?s WHERE { ?s a huquq:Statiya }")
+
+        assert len(results) == 50
+        assert engine.stats['auto_limited_queries'] == 0
+
+    def test_unbounded_select_auto_limited(self, engine):
+        """
+        Test large SELECT without LIMIT is auto-limited.
+        LIMIT joq úlken SELECT avtomat túrde sheklenewin test etiw.
+        """
+        results = engine.select("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+
+        assert len(results) == 20
+        assert engine.stats['auto_limited_queries'] == 1
+
+    def test_expensive_query_rejected(self, engine):
+        """
+        Test queries over budget are rejected with their cost.
+        Shekten asqan sorawlar bahası menen biykarlanıwın test etiw.
+        """
+        query = PREFIXES + """
+            SELECT (COUNT(*) AS ?n) WHERE {
+                ?a ?p1 ?x . ?b ?p2 ?y
+                FILTER(REGEX(STR(?x), "never"))
+            }
+        """
+
+        with pytest.raises(QueryRejectedError) as exc_info:
+            engine.select(query)
+
+        assert isinstance(exc_info.value, QueryValidationError)
+        assert exc_info.value.cost.cartesian_products == 1
+        assert engine.stats['rejected_queries'] == 1
+
+    def test_named_graph_costed_from_its_counts(self):
+        """
+        Test a query on a code's named graph is admitted from that graph's counts.
+        Kodekstiń atamalı grafına soraw sol graf sanları boyınsha qabıllanıwın test etiw.
+        """
+        dataset = Dataset(default_union=True)
+        criminal = dataset.graph(URIRef("http://huquqai.org/graph/criminal"))
+        civil = dataset.graph(URIRef("http://huquqai.org/graph/civil"))
+        for i in range(200):
+            civil.add((HUQUQ[f"Statiya_{i}"], RDF.type, HUQUQ.Statiya))
+        for i in range(5):
+            criminal.add((HUQUQ[f"Statiya_{i}"], RDF.type, HUQUQ.Statiya))
+        engine = SPARQLEngine(dataset)
+        engine.admission = AdmissionConfig(max_cost=2000, max_unbounded_rows=100, auto_limit=20)
+        query = PREFIXES + "SELECT ?s WHERE { ?s a huquq:Statiya }"
+
+        assert len(engine.select(query, graph=criminal)) == 5
+        assert len(engine.select(query)) == 20
+        assert engine.stats['auto_limited_queries'] == 1
+
+    def test_engine_templates_not_limited(self, graph, engine):
+        """
+        Test the engine's own templates skip admission while user SPARQL does not.
+        Mexanizmniń óz úlgileri qabıllawdı ótkerip jiberiwin test etiw.
+        """
+        for i in range(150):
+            graph.add((HUQUQ[f"Jaza_{i}"], RDF.type, HUQUQ.Jaza))
+            graph.add((HUQUQ[f"Jaza_{i}"], RDFS.label, Literal(f"Jaza {i}", lang="kaa")))
+        engine.admission = AdmissionConfig(max_cost=2000, max_unbounded_rows=5, auto_limit=3)
+
+        assert len(engine.get_jaza_range(jaza_turi="jaza")) == 150
+        assert len(engine.select(PREFIXES + "SELECT ?j WHERE { ?j a huquq:Jaza }")) == 3
+        assert engine.stats['auto_limited_queries'] == 1
+
+    def test_admission_disabled(self, engine):
+        """
+        Test admission control can be switched off.
+        Qabıllaw qadaǵalawın óshiriw múmkinligin test etiw.
+        """
+        engine.admission = AdmissionConfig(enabled=False, max_cost=1)
+
+        results = engine.select("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+
+        assert len(results) == len(engine.graph)
+
+    def test_explain(self, engine):
+        """
+        Test explain returns an estimate without executing.
+        Explain orınlamay baha qaytarıwın test etiw.
+        """
+        cost = engine.explain("SELECT ?s ?p ?o WHERE { ?s ?p ?o }")
+
+        assert cost.estimated_rows == len(engine.graph)
+        assert engine.stats['total_queries'] == 0
@@ -0,0 +1,263 @@
+"""
+Tests for per-template query statistics and the slow-query log
+Úlgi boyınsha soraw statistikası ha'm áste sorawlar jurnalı ushın testler
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from rdflib import Graph, Literal, Namespace, RDF, RDFS
+
+from src.api.admin import router as admin_router
+from src.core.query_stats import (
+    LatencyHistogram,
+    QueryStatsCollector,
+    fingerprint_query,
+    get_query_stats,
+)
+from src.core.sparql_engine import SPARQLEngine
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+
+
+@pytest.fixture
+def query_stats():
+    """Reset the process-wide collector / Process jıynawshısın tazalaw"""
+    stats = get_query_stats()
+    stats.reset()
+    threshold = stats.slow_threshold
+    yield stats
+    stats.slow_threshold = threshold
+    stats.reset()
+
+
+@pytest.fixture
+def engine(query_stats):
+    """Engine over a small graph / Kishi graf boyınsha mexanizm"""
+    g = Graph()
+    for i in range(5):
+        crime = HUQUQ[f"Jinayat_{i}"]
+        g.add((crime, RDF.type, HUQUQ.Jinayat))
+        g.add((crime, RDFS.label, Literal(f"Jinayat {i}", lang="kaa")))
+    eng = SPARQLEngine(g)
+    yield eng
+    eng.clear_cache()
+
+
+class TestFingerprint:
+    """Test query fingerprinting / Soraw izin test etiw"""
+
+    def test_literals_normalized(self):
+        """
+        Test queries differing only in literals share a fingerprint.
+        Tek literallar menen parıqlanatuǵın sorawlar bir izge iye ekenin test etiw.
+        """
+        fid1, template, params = fingerprint_query(
+            'SELECT ?s WHERE { ?s ?p "urılıq" } LIMIT 10'
+        )
+        fid2, _, _ = fingerprint_query(
+            'SELECT ?s\n  WHERE { ?s ?p "adam óltiriw" }  # comment\n LIMIT 5'
+        )
+
+        assert fid1 == fid2
+        assert template == 'SELECT ?s WHERE { ?s ?p ? } LIMIT ?'
+        assert params == ['"urılıq"', '10']
+
+    def test_iris_kept(self):
+        """
+        Test IRIs distinguish templates.
+        IRI-ler úlgilerdi ayıratuǵının test etiw.
+        """
+        fid1, _, _ = fingerprint_query("SELECT ?s WHERE { ?s a <http://x.org/A#1> }")
+        fid2, _, _ = fingerprint_query("SELECT ?s WHERE { ?s a <http://x.org/B#2> }")
+
+        assert fid1 != fid2
+
+
+    def test_values_block_collapsed(self):
+        """
+        Test queries differing only in their VALUES rows share a fingerprint.
+        Tek VALUES qatarları menen parıqlanatuǵın sorawlar bir izge iye ekenin test etiw.
+        """
+        query = "SELECT ?s ?label WHERE {{ {values} ?s <http://x.org/label> ?label }}"
+        fid1, template, _ = fingerprint_query(query.format(
+            values="VALUES ?s { <http://x.org/A#1> <http://x.org/A#2> }"))
+        fid2, _, _ = fingerprint_query(query.format(
+            values="values ?s {\n <http://x.org/A#7> }"))
+        fid3, _, _ = fingerprint_query(query.format(
+            values='VALUES (?s ?label) { (<http://x.org/A#1> "a") (<http://x.org/A#2> "b") }'))
+
+        assert fid1 == fid2
+        assert fid3 != fid1
+        assert template == "SELECT ?s ?label WHERE { VALUES ?s { ... } ?s <http://x.org/label> ?label }"
+
+class TestLatencyHistogram:
+    """Test histogram percentiles / Gistogramma procentillerin test etiw"""
+
+    def test_percentiles(self):
+        """
+        Test percentiles follow the observed distribution.
+        Procentiller baqlanǵan bólistiriwge sáykes ekenin test etiw.
+        """
+        hist = LatencyHistogram()
+        for _ in range(90):
+            hist.observe(0.004)
+        for _ in range(10):
+            hist.observe(2.0)
+
+        summary = hist.to_dict()
+
+        assert summary['count'] == 100
+        assert summary['p50'] <= 0.005
+        assert 1.0 <= summary['p95'] <= 2.0
+        assert summary['max'] == 2.0
+
+    def test_empty(self):
+        """
+        Test empty histogram reports zeros.
+        Bos gistogramma nol qaytarıwın test etiw.
+        """
+        assert LatencyHistogram().percentile(99) == 0.0
+
+
+class TestQueryStatsCollector:
+    """Test the collector / Jıynawshını test etiw"""
+
+    def test_slow_query_log(self):
+        """
+        Test slow queries are captured with plan and bindings.
+        Áste sorawlar jobası ha'm baylanısları menen jazılıwın test etiw.
+        """
+        collector = QueryStatsCollector(slow_threshold=0.5, slow_log_size=2)
+
+        collector.record('SELECT ?s WHERE { ?s ?p "a" }', 0.1, rows=3)
+        collector.record('SELECT ?s WHERE { ?s ?p "b" }', 0.9, rows=1, plan=lambda: ["BGP"])
+
+        slow = collector.slow_queries()
+        assert len(slow) == 1
+        assert slow[0]['plan'] == ["BGP"]
+        assert slow[0]['bindings'] == ['"b"']
+
+        template = collector.templates()[0]
+        assert template['executions'] == 2
+        assert template['total_rows'] == 4
+
+    def test_slow_log_bounded(self):
+        """
+        Test the slow-query log keeps only the newest entries.
+        Jurnal tek eń jańa jazıwlardı saqlawın test etiw.
+        """
+        collector = QueryStatsCollector(slow_threshold=0.0, slow_log_size=2)
+        for i in range(5):
+            collector.record(f"SELECT ?s WHERE {{ ?s ?p {i} }}", 0.01)
+
+        slow = collector.slow_queries()
+        assert len(slow) == 2
+        assert slow[0]['query'].endswith("4 }")
+
+    def test_cache_hit_ratio(self):
+        """
+        Test cache hits count towards the template ratio only.
+        Kesh tabısları tek úlgi úlesine esaplanıwın test etiw.
+        """
+        collector = QueryStatsCollector()
+        collector.record("SELECT * WHERE { ?s ?p ?o }", 0.02, rows=10)
+        collector.record("SELECT * WHERE { ?s ?p ?o }", 0.0, cached=True)
+
+        template = collector.templates()[0]
+        assert template['cache_hit_ratio'] == 0.5
+        assert template['latency']['count'] == 1
+
+
+class TestEngineIntegration:
+    """Test SPARQLEngine records template statistics / Mexanizm statistikasın test etiw"""
+
+    def test_get_statistics_templates(self, engine):
+        """
+        Test get_statistics exposes template summaries.
+        get_statistics úlgi juwmaqların kórsetiwin test etiw.
+        """
+        engine.search_by_term_kaa("jinayat")
+        engine.search_by_term_kaa("urılıq")
+
+        stats = engine.get_statistics()
+
+        assert len(stats['templates']) == 1
+        assert stats['templates'][0]['executions'] == 2
+        assert 'p99' in stats['templates'][0]['latency']
+
+    def test_slow_query_captures_plan(self, engine, query_stats):
+        """
+        Test slow queries include the cost plan.
+        Áste sorawlar baha jobasın qamtıwın test etiw.
+        """
+        query_stats.slow_threshold = 0.0
+
+        engine.select("SELECT ?s WHERE { ?s ?p ?o } LIMIT 2")
+
+        slow = engine.get_statistics()['slow_queries']
+        assert slow
+        assert any("Slice" in line for line in slow[0]['plan'])
+
+    def test_cache_hits_recorded(self, engine):
+        """
+        Test execute_cached hits are counted.
+        execute_cached tabısları sanalıwın test etiw.
+        """
+        query = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 3"
+        engine.execute_cached(query)
+        engine.execute_cached(query)
+
+        stats = engine.get_statistics()
+        assert stats['cached_queries'] == 1
+        assert stats['templates'][0]['cache_hit_ratio'] == 0.5
+
+
+def test_admin_routes(engine, query_stats, monkeypatch):
+    """
+    Test admin routes expose templates and slow queries.
+    Administrator jolları úlgiler ha'm áste sorawlardı kórsetiwin test etiw.
+    """
+    monkeypatch.setenv("HUQUQAI_ADMIN_API_KEY", "secret")
+    query_stats.slow_threshold = 0.0
+    engine.select("SELECT ?s WHERE { ?s ?p ?o } LIMIT 1")
+
+    app = FastAPI()
+    app.include_router(admin_router, prefix="/api/v1/admin")
+    client = TestClient(app, headers={"X-API-Key": "secret"})
+
+    templates = client.get("/api/v1/admin/queries/templates", params={"sort_by": "p95"}).json()
+    assert templates['count'] == 1
+
+    slow = client.get("/api/v1/admin/queries/slow").json()
+    assert slow['count'] == 1
+    assert slow['queries'][0]['query'].startswith("SELECT")
+
+    assert client.delete("/api/v1/admin/queries/stats").json() == {"status": "reset"}
+    assert query_stats.templates() == []
+
+
+def test_admin_routes_require_key(query_stats, monkeypatch):
+    """
+    Test admin routes are unmounted by default and refuse requests without the key.
+    Administrator jolları áhmiyetli ornatılmawın ha'm kiltsiz sorawlardı qaytarıwın test etiw.
+    """
+    from src.api.main import create_app
+    from src.core.config import get_config
+
+    monkeypatch.delenv("HUQUQAI_ADMIN_API_KEY", raising=False)
+    assert TestClient(create_app()).get("/api/v1/admin/queries/slow").status_code == 404
+
+    app = FastAPI()
+    app.include_router(admin_router, prefix="/api/v1/admin")
+    client = TestClient(app)
+    assert client.delete("/api/v1/admin/queries/stats").status_code == 503
+
+    monkeypatch.setenv("HUQUQAI_ADMIN_API_KEY", "secret")
+    assert client.get("/api/v1/admin/queries/slow").status_code == 401
+    assert client.get("/api/v1/admin/traces",
+                      headers={"X-API-Key": "wrong"}).status_code == 401
+    assert client.delete("/api/v1/admin/cache/query",
+                         headers={"X-API-Key": "wrong"}).status_code == 401
+    assert get_config().api.admin.enabled is False
@@ -0,0 +1,139 @@
+"""
+Tests for single-flight request coalescing
+Birdey sorawlardı biriktiriw ushın testler
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.base import QueryResult
+from src.models.legal_entities import Query
+from src.services.query_service import QueryService
+from src.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight behaviour / SingleFlight qásiyetleri"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """
+        Test concurrent callers with the same key run the function once.
+        Bir gilt penen parallel shaqırıwlar funkciyanı bir ret orınlawın test etiw.
+        """
+        flights = SingleFlight("test_share")
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        results = await asyncio.gather(*(flights.do("k", work, 21) for _ in range(5)))
+
+        assert calls == [21]
+        assert [r for r, _ in results] == [42] * 5
+        assert [shared for _, shared in results].count(False) == 1
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """
+        Test different keys are not coalesced.
+        Hár túrli giltler biriktirilmewin test etiw.
+        """
+        flights = SingleFlight("test_keys")
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0)
+            return value
+
+        await asyncio.gather(flights.do("a", work, 1), flights.do("b", work, 2))
+
+        assert sorted(calls) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_run_again(self):
+        """
+        Test finished calls are not remembered.
+        Tamamlanǵan shaqırıwlar yadta saqlanbawın test etiw.
+        """
+        flights = SingleFlight("test_sequential")
+        calls = []
+
+        async def work():
+            calls.append(1)
+            return len(calls)
+
+        assert (await flights.do("k", work))[0] == 1
+        assert (await flights.do("k", work))[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller(self):
+        """
+        Test an error is raised to all waiting callers.
+        Qátelik barlıq kútip turǵan shaqırıwshılarǵa jetiwin test etiw.
+        """
+        flights = SingleFlight("test_error")
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flights.do("k", work), flights.do("k", work), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert len(flights) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """
+        Test cancelling one waiter leaves the shared run intact.
+        Bir kútiwshini biykarlaw ortaq orınlawǵa tásir etpewin test etiw.
+        """
+        flights = SingleFlight("test_cancel")
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        first = asyncio.ensure_future(flights.do("k", work))
+        second = asyncio.ensure_future(flights.do("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second)[0] == "done"
+
+
+@pytest.mark.asyncio
+async def test_query_service_coalesces_identical_questions(monkeypatch):
+    """
+    Test identical concurrent questions reach the endpoint once.
+    Birdey parallel sorawlar endpoint-ke bir ret jetiwin test etiw.
+    """
+    service = QueryService()
+    service.answer_cache.clear()
+    calls = []
+
+    async def fake_execute(query, is_update=False):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return QueryResult(success=True, data=[{"article": "a1", "number": "1", "title": "t"}])
+
+    monkeypatch.setattr(service.sparql_service, "execute", fake_execute)
+
+    answers = await asyncio.gather(*(
+        service.execute(Query(id=f"q{i}", question="Paraxorlıq jazası qanday?"))
+        for i in range(4)
+    ))
+    service.answer_cache.clear()
+
+    keywords = service._extract_keywords("Paraxorlıq jazası qanday?")
+    assert len(calls) == len(keywords)
+    assert [a.query_id for a in answers] == ["q0", "q1", "q2", "q3"]
+    assert len({a.answer for a in answers}) == 1
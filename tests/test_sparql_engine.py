@@ -13,9 +13,12 @@ from rdflib import Graph, Namespace, RDF, RDFS, Literal, URIRef
 from src.core.sparql_engine import (
     SPARQLEngine,
     SPARQLEngineError,
-    QueryValidationError
+    QueryValidationError,
+    QueryTimeoutError,
+    QueryCancelledError
 )
 from src.core.ontology_manager import OntologyManager
+from src.core.query_deadline import QueryDeadline
 
 
 @pytest.fixture
@@ -673,6 +676,52 @@ class TestKarakalpakLegalQueries:
         assert isinstance(ak_articles, list)
 
 
+class TestQueryDeadline:
+    """
+    Test in-process query deadlines and cancellation.
+    Jergilikli soraw waqıt shegi ha'm biykarlawdı test etiw.
+    """
+
+    # Cartesian product with REGEX over every literal / Barlıq literallar boyınsha REGEX
+    RUNAWAY_QUERY = """
+        SELECT ?a ?b ?c WHERE {
+            ?a ?p1 ?x . ?b ?p2 ?y . ?c ?p3 ?z .
+            FILTER(REGEX(STR(?x), "^will-never-match$", "i"))
+        }
+    """
+
+    def test_runaway_query_times_out(self, engine):
+        """
+        Test that an expensive query is aborted at its deadline.
+        Qımbat soraw waqıt shegi ótkende toqtatılıwın test etiw.
+        """
+        with pytest.raises(QueryTimeoutError) as exc_info:
+            engine.select(self.RUNAWAY_QUERY, timeout=0.05)
+
+        assert exc_info.value.timeout == 0.05
+        assert exc_info.value.elapsed < 5.0
+        assert engine.stats['timed_out_queries'] == 1
+
+    def test_cancelled_deadline(self, engine):
+        """
+        Test cooperative cancellation through a caller-owned deadline.
+        Shaqırıwshı belgisi arqalı biykarlawdı test etiw.
+        """
+        deadline = QueryDeadline(timeout=None)
+        deadline.cancel()
+
+        with pytest.raises(QueryCancelledError):
+            engine.select(self.RUNAWAY_QUERY, deadline=deadline)
+
+    def test_fast_query_within_deadline(self, engine):
+        """
+        Test that normal queries are unaffected by the deadline.
+        Ádettegi sorawlarǵa waqıt shegi tásir etpewin test etiw.
+        """
+        results = engine.search_by_term_kaa("urılıq", fuzzy=True, timeout=5.0)
+        assert len(results) > 0
+
+
 # Integration test / Integratsiya testı
 def test_full_sparql_workflow(tmp_path):
     """
@@ -0,0 +1,195 @@
+"""
+Tests for the persistent SQLite triple store
+Turaqlı SQLite triple saqlaǵısh ushın testler
+"""
+
+import sqlite3
+from itertools import product
+from pathlib import Path
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF, URIRef
+
+from src.core.ontology_manager import OntologyManager, OntologyManagerError
+from src.core.sqlite_store import SQLiteStore, decode_term, encode_term
+
+
+KNOWLEDGE_FILE = Path(__file__).parent.parent / "data" / "knowledge" / "criminal_code.ttl"
+KK = Namespace("http://karakalpak.law/ontology#")
+
+
+def _open(path: Path, read_only: bool = False) -> Graph:
+    graph = Graph(store=SQLiteStore(read_only=read_only))
+    graph.open(str(path), create=not read_only)
+    return graph
+
+
+@pytest.fixture
+def graphs(tmp_path):
+    """The knowledge base in Memory and in SQLite / Bilimler bazası Memory ha'm SQLite-ta"""
+    memory = Graph()
+    memory.parse(str(KNOWLEDGE_FILE), format="turtle")
+    persistent = _open(tmp_path / "kb.sqlite")
+    with persistent.store.bulk():
+        persistent.parse(str(KNOWLEDGE_FILE), format="turtle")
+    yield memory, persistent
+    persistent.close()
+
+
+class TestSQLiteStore:
+    """SQLiteStore behaves like the Memory store / SQLiteStore Memory sıyaqlı isleydi"""
+
+    def test_term_round_trip(self):
+        """
+        Test every term kind survives encoding.
+        Hár túrli termin kodlawdan keyin saqlanıwın test etiw.
+        """
+        terms = [
+            KK.Statiya_1,
+            Literal("tekst", lang="kaa"),
+            Literal(5),
+            Literal(""),
+        ]
+        for term in terms:
+            decoded = decode_term(*encode_term(term))
+            assert decoded == term
+            assert type(decoded) is type(term)
+
+    def test_patterns_match_memory(self, graphs):
+        """
+        Test every triple pattern returns the same triples as Memory.
+        Hár bir triple úlgisi Memory menen birdey nátiyje qaytarıwın test etiw.
+        """
+        memory, persistent = graphs
+        s, p, o = next(iter(memory.triples((None, KK.nómiri, None))))
+
+        assert len(persistent) == len(memory)
+        for pattern in product((None, s), (None, p), (None, o)):
+            assert set(persistent.triples(pattern)) == set(memory.triples(pattern))
+        assert list(persistent.triples((KK.missing, None, None))) == []
+
+    def test_sparql_matches_memory(self, graphs):
+        """
+        Test a SPARQL query gives the same rows on both stores.
+        SPARQL sorawı eki saqlaǵıshta birdey qatarlar beriwin test etiw.
+        """
+        memory, persistent = graphs
+        query = """
+            PREFIX kk: <http://karakalpak.law/ontology#>
+            SELECT ?n ?t WHERE { ?s a kk:Statiya ; kk:nómiri ?n ; kk:sárelaw ?t }
+            ORDER BY ?n
+        """
+
+        assert list(persistent.query(query)) == list(memory.query(query))
+
+    def test_remove_and_rollback(self, graphs):
+        """
+        Test removal, and that a failed bulk load rolls back.
+        Óshiriwdi ha'm sátsiz bulk júklew artqa qaytarılıwın test etiw.
+        """
+        _, persistent = graphs
+        before = len(persistent)
+
+        persistent.remove((None, KK.nómiri, None))
+        assert list(persistent.triples((None, KK.nómiri, None))) == []
+
+        with pytest.raises(RuntimeError):
+            with persistent.store.bulk():
+                persistent.add((KK.Statiya_X, RDF.type, KK.Statiya))
+                raise RuntimeError("abort")
+        assert (KK.Statiya_X, RDF.type, KK.Statiya) not in persistent
+        assert len(persistent) < before
+
+    def test_rollback_forgets_term_ids(self, tmp_path):
+        """
+        Test terms cached in a rolled-back transaction are not reused.
+        Artqa qaytarılǵan tranzakciyada keshlengen terminler qayta qollanılmawın test etiw.
+        """
+        graph = _open(tmp_path / "rollback.sqlite")
+        undone = (URIRef("urn:a"), URIRef("urn:b"), Literal("c"))
+        kept = (URIRef("urn:x"), URIRef("urn:y"), Literal("z"))
+
+        with pytest.raises(RuntimeError):
+            with graph.store.bulk():
+                graph.add(undone)
+                raise RuntimeError("abort")
+        graph.add(kept)
+        graph.add(undone)
+
+        assert set(graph) == {undone, kept}
+        graph.close()
+
+    def test_reopen_read_only(self, graphs, tmp_path):
+        """
+        Test the data and prefixes survive a reopen, and read-only refuses writes.
+        Ma'limler ha'm prefiksler qayta ashıwda saqlanıwın, tek oqıw jazıwdı qabıl etpewin test etiw.
+        """
+        memory, persistent = graphs
+        persistent.bind("kk", KK)
+        persistent.close()
+
+        reader = _open(tmp_path / "kb.sqlite", read_only=True)
+        try:
+            assert len(reader) == len(memory)
+            assert set(reader) == set(memory)
+            assert reader.store.namespace("kk") == URIRef(str(KK))
+            with pytest.raises(sqlite3.OperationalError):
+                reader.add((KK.Statiya_X, RDF.type, KK.Statiya))
+        finally:
+            reader.close()
+
+    def test_missing_read_only_file(self, tmp_path):
+        """
+        Test a read-only store will not create a missing file.
+        Tek oqıw saqlaǵıshı joq fayldı jaratpawın test etiw.
+        """
+        graph = Graph(store=SQLiteStore(read_only=True))
+
+        assert graph.open(str(tmp_path / "missing.sqlite"), create=False) != 1
+        assert not (tmp_path / "missing.sqlite").exists()
+
+
+class TestOntologyManagerStore:
+    """OntologyManager on a persistent store / Turaqlı saqlaǵıshtaǵı OntologyManager"""
+
+    @pytest.fixture
+    def configure(self, monkeypatch, tmp_path):
+        """Point the ontology config at an SQLite file / Konfiguraciyanı SQLite faylına baǵdarlaw"""
+        def apply(read_only: bool = False):
+            manager = OntologyManager()
+            settings = manager.config.ontology
+            monkeypatch.setattr(settings, "store", "SQLite")
+            monkeypatch.setattr(settings, "store_path", str(tmp_path / "kb.sqlite"))
+            monkeypatch.setattr(settings, "store_read_only", read_only)
+            return manager
+        return apply
+
+    def test_second_load_skips_parse(self, configure, monkeypatch):
+        """
+        Test a second load reuses the store instead of parsing again.
+        Ekinshi júklew qayta parse etpey saqlaǵıshtı qollanıwın test etiw.
+        """
+        first = configure()
+        first.load_ontology(str(KNOWLEDGE_FILE), format="turtle")
+        count = len(first.graph)
+        first.graph.close()
+
+        second = configure(read_only=True)
+        monkeypatch.setattr(Graph, "parse", lambda *args, **kwargs: pytest.fail("parsed"))
+        second.load_ontology(str(KNOWLEDGE_FILE), format="turtle")
+
+        assert len(second.graph) == count
+        assert second.stats["triple_count"] == count
+        second.graph.close()
+
+    def test_read_only_without_ingest_fails(self, configure, tmp_path):
+        """
+        Test a read-only store that was never ingested is an error.
+        Hesh júklenbegen tek oqıw saqlaǵıshı qáte bolıwın test etiw.
+        """
+        writer = configure()
+        writer.graph = writer._open_graph()
+        writer.graph.close()
+
+        with pytest.raises(OntologyManagerError):
+            configure(read_only=True).load_ontology(str(KNOWLEDGE_FILE), format="turtle")
@@ -0,0 +1,215 @@
+"""
+Tests for streaming N-Triples / N-Quads import
+N-Triples / N-Quads aǵım menen import etiw ushın testler
+"""
+
+import gzip
+from pathlib import Path
+
+import pytest
+from rdflib import BNode, Dataset, Graph, Literal, Namespace, URIRef
+
+from src.core.ontology_manager import OntologyManager, OntologyManagerError
+from src.core.stream_import import import_file, stream_format
+
+
+ONTOLOGY_FILE = Path(__file__).parent.parent / "data" / "ontologies" / "legal_ontology.owl"
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+CRIMINAL_GRAPH = URIRef("http://huquqai.org/graph/criminal")
+
+
+def _ntriples(count: int) -> str:
+    return "".join(
+        f'<{HUQUQ}Statiya_{i}> <{HUQUQ}articleNumber> "{i}" .\n' for i in range(count)
+    )
+
+
+@pytest.fixture
+def dump(tmp_path):
+    """N-Triples file with comments and bad lines / Kommentariy ha'm qáte qatarlı fayl"""
+    path = tmp_path / "dump.nt"
+    path.write_bytes(
+        b"# Jinayat kodeksi\n"
+        + _ntriples(5).encode("utf-8")
+        + b"<http://huquqai.org/ontology#Statiya_9> not a predicate .\n"
+        + b"\n"
+        + b'_:owner <http://huquqai.org/ontology#title> "Ur\xc4\xb1l\xc4\xb1q"@kaa .\n'
+        + b"_:owner <http://huquqai.org/ontology#ofArticle> <http://huquqai.org/ontology#Statiya_1> .\n"
+        + b'<http://huquqai.org/ontology#Statiya_8> <http://huquqai.org/ontology#title> "\xff" .\n'
+    )
+    return path
+
+
+class TestStreamImport:
+    """Line-by-line import into a graph / Grafqa qatarma-qatar import"""
+
+    def test_import_matches_parse(self, tmp_path):
+        """
+        Test a clean file imports the same triples as Graph.parse.
+        Taza fayl Graph.parse penen birdey triple-lar beriwin test etiw.
+        """
+        path = tmp_path / "clean.nt"
+        path.write_text(_ntriples(30), encoding="utf-8")
+        graph = Graph()
+
+        report = import_file(path, graph, batch_size=7)
+
+        assert set(graph) == set(Graph().parse(str(path), format="nt"))
+        assert (report.statements, report.added, report.batches) == (30, 30, 5)
+        assert report.error_count == 0
+
+    def test_bad_lines_are_reported(self, dump):
+        """
+        Test bad lines are skipped and listed with their line numbers.
+        Qáte qatarlar ótkerip jiberilip, qatar nomeri menen jazılıwın test etiw.
+        """
+        graph = Graph()
+
+        report = import_file(dump, graph)
+
+        assert report.lines == 11
+        assert report.statements == len(graph) == 7
+        assert report.error_count == 2
+        assert [error.line for error in report.errors] == [7, 11]
+        assert "2 bad lines" in report.summary()
+        owner = graph.value(predicate=HUQUQ.title, object=Literal("Urılıq", lang="kaa"))
+        assert isinstance(owner, BNode)
+        assert graph.value(owner, HUQUQ.ofArticle) == HUQUQ.Statiya_1
+
+    def test_error_samples_are_capped(self, tmp_path):
+        """
+        Test only the first bad lines are kept, while all are counted.
+        Tek birinshi qáte qatarlar saqlanıp, barlıǵı sanalıwın test etiw.
+        """
+        path = tmp_path / "bad.nt"
+        path.write_text("garbage .\n" * 20, encoding="utf-8")
+
+        report = import_file(path, Graph(), max_error_samples=3)
+
+        assert report.error_count == 20
+        assert len(report.errors) == 3
+        assert "17 more" in report.summary()
+
+    def test_progress_after_each_batch(self, tmp_path):
+        """
+        Test progress is reported after every batch, gzipped input included.
+        Barıs hár toplamnan keyin xabarlanıwın test etiw, gzip fayl menen.
+        """
+        path = tmp_path / "dump.nt.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            f.write(_ntriples(25))
+        seen = []
+
+        report = import_file(path, Graph(), batch_size=10,
+                             progress=lambda r: seen.append(r.statements))
+
+        assert seen == [10, 20, 25]
+        assert report.format == "nt"
+        assert report.throughput > 0
+
+    def test_quads_go_to_named_graphs(self, tmp_path):
+        """
+        Test N-Quads statements land in the named graph of their fourth term.
+        N-Quads tastıyıqları tórtinshi termin grafına túsiwin test etiw.
+        """
+        path = tmp_path / "dump.nq"
+        path.write_text(
+            f'<{HUQUQ}Statiya_1> <{HUQUQ}codeType> "criminal" <{CRIMINAL_GRAPH}> .\n'
+            f'<{HUQUQ}Statiya_2> <{HUQUQ}codeType> "civil" .\n',
+            encoding="utf-8"
+        )
+        dataset = Dataset(default_union=True)
+
+        report = import_file(path, dataset)
+
+        assert report.added == 2
+        assert len(dataset.graph(CRIMINAL_GRAPH)) == 1
+        assert (HUQUQ.Statiya_2, HUQUQ.codeType, Literal("civil")) in dataset
+
+    def test_named_quads_need_named_graphs(self, tmp_path):
+        """
+        Test a plain Graph skips and reports statements naming a graph unless asked to merge.
+        Ápiwayı Graph graf atı bar tastıyıqlardı ótkerip jiberip xabarlawın test etiw.
+        """
+        path = tmp_path / "dump.nq"
+        path.write_text(
+            f'<{HUQUQ}Statiya_1> <{HUQUQ}codeType> "criminal" <{CRIMINAL_GRAPH}> .\n'
+            f'<{HUQUQ}Statiya_2> <{HUQUQ}codeType> "civil" .\n',
+            encoding="utf-8"
+        )
+        graph = Graph()
+
+        report = import_file(path, graph)
+
+        assert report.added == len(graph) == 1
+        assert [error.line for error in report.errors] == [1]
+        assert "Named graph" in report.errors[0].message
+
+        merged = Graph()
+        assert import_file(path, merged, merge_graphs=True).added == len(merged) == 2
+
+    def test_rejects_other_formats(self):
+        """
+        Test non line-based files are rejected.
+        Qatarlı emes fayllar qabıl etilmewin test etiw.
+        """
+        assert stream_format("dump.nq.gz") == "nquads"
+        with pytest.raises(ValueError):
+            stream_format("criminal_code.ttl")
+
+
+class TestManagerImport:
+    """OntologyManager.import_stream / OntologyManager.import_stream"""
+
+    @pytest.fixture
+    def manager(self):
+        mgr = OntologyManager()
+        mgr.clear()
+        mgr.load_ontology(ONTOLOGY_FILE)
+        yield mgr
+        mgr.clear()
+
+    def test_import_into_code_graph(self, manager, dump):
+        """
+        Test a dump streams into a code's graph and updates statistics.
+        Fayl kodeks grafına júklenip, statistika jańalanıwın test etiw.
+        """
+        before = manager.stats["triple_count"]
+
+        report = manager.import_stream(dump, code="jinayat", batch_size=3)
+
+        assert report.added == 7
+        assert len(manager.partitions["criminal"]) == 7
+        assert manager.stats["triple_count"] == before + 7
+
+    def test_named_quads_without_named_graphs(self, manager, tmp_path, monkeypatch):
+        """
+        Test a single-graph knowledge base reports named quads instead of merging them.
+        Bir grafli bilimler bazası atamalı quad-lardı qospay xabarlawın test etiw.
+        """
+        monkeypatch.setattr(manager.config.sparql, "graphs", {})
+        manager.load_ontology(ONTOLOGY_FILE)
+        path = tmp_path / "dump.nq"
+        path.write_text(
+            f'<{HUQUQ}Statiya_1> <{HUQUQ}codeType> "criminal" <{CRIMINAL_GRAPH}> .\n',
+            encoding="utf-8"
+        )
+        before = manager.stats["triple_count"]
+
+        report = manager.import_stream(path)
+
+        assert not isinstance(manager.graph, Dataset)
+        assert (report.added, report.error_count) == (0, 1)
+        assert manager.stats["triple_count"] == before
+
+    def test_rejects_turtle(self, manager, tmp_path):
+        """
+        Test a Turtle file is refused with a bilingual error.
+        Turtle faylı eki tilli qátelik penen qabıl etilmewin test etiw.
+        """
+        path = tmp_path / "criminal_code.ttl"
+        path.write_text("", encoding="utf-8")
+
+        with pytest.raises(OntologyManagerError) as error:
+            manager.import_stream(path)
+        assert "N-Quads" in error.value.message_kaa
@@ -0,0 +1,148 @@
+"""
+Tests for request tracing
+Soraw izlew ushın testler
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.base import QueryResult
+from src.models.legal_entities import Query
+from src.services.query_service import QueryService
+from src.utils.tracing import Span, Tracer, get_tracer, span, traced
+
+
+@pytest.fixture
+def tracer():
+    """Process tracer with an empty buffer / Bos buferli tracer"""
+    tracer = get_tracer()
+    tracer.clear()
+    yield tracer
+    tracer.clear()
+
+
+def span_names(node):
+    """Flatten a span tree into names / Span aǵashın atlar listine aylandırıw"""
+    names = [node['name']]
+    for child in node['children']:
+        names.extend(span_names(child))
+    return names
+
+
+def test_nested_spans(tracer):
+    """
+    Test child spans nest under the root and the trace is stored.
+    Bala span-lar túbir astına kiriwin ha'm iz saqlanıwın test etiw.
+    """
+    with span("root", request="r1"):
+        with span("child.a"):
+            pass
+        with span("child.b") as child:
+            child.set_attribute("rows", 3)
+
+    trace = tracer.traces()[0]
+
+    assert trace['name'] == "root"
+    assert trace['span_count'] == 3
+    children = trace['root']['children']
+    assert [c['name'] for c in children] == ["child.a", "child.b"]
+    assert children[1]['attributes'] == {"rows": 3}
+
+
+def test_async_propagation(tracer):
+    """
+    Test spans opened in gathered tasks keep their parent.
+    gather tapsırmalarındaǵı span-lar ata-anasın saqlawın test etiw.
+    """
+    @traced("fetch")
+    async def fetch(i):
+        await asyncio.sleep(0)
+        return i
+
+    async def run():
+        with span("gather"):
+            return await asyncio.gather(*(fetch(i) for i in range(3)))
+
+    assert asyncio.run(run()) == [0, 1, 2]
+
+    trace = tracer.traces()[0]
+    assert span_names(trace['root']) == ["gather", "fetch", "fetch", "fetch"]
+
+
+def test_error_status(tracer):
+    """
+    Test exceptions mark the span as failed and propagate.
+    Qátelikler span-dı sátsiz dep belgilewin test etiw.
+    """
+    with pytest.raises(ValueError):
+        with span("failing"):
+            raise ValueError("bad input")
+
+    trace = tracer.traces()[0]
+    assert trace['status'] == "error"
+    assert "bad input" in trace['root']['error']
+
+
+def test_ring_buffer():
+    """
+    Test only the newest traces are kept.
+    Tek eń jańa izler saqlanıwın test etiw.
+    """
+    local = Tracer(buffer_size=2)
+    for i in range(4):
+        local.finish(Span(name=f"t{i}", trace_id=f"id{i}", span_id=f"s{i}"))
+
+    assert [t['name'] for t in local.traces()] == ["t3", "t2"]
+    assert local.get_trace("id0") is None
+
+
+@pytest.mark.asyncio
+async def test_query_service_stages(tracer, monkeypatch):
+    """
+    Test QueryService records a span per pipeline stage.
+    QueryService hár basqısh ushın span jazıwın test etiw.
+    """
+    service = QueryService()
+
+    async def fake_execute(query, is_update=False):
+        return QueryResult(success=True, data=[{"article": "a1", "number": "1", "title": "t"}])
+
+    monkeypatch.setattr(service.sparql_service, "execute", fake_execute)
+
+    await service.execute(Query(question="Jinayat urılıq haqqında", language="kaa"))
+
+    names = span_names(tracer.traces()[0]['root'])
+    assert names[0] == "query_service.execute"
+    for stage in ("query_service.extract_keywords", "query_service.search_knowledge_base",
+                  "sparql_service.search_articles", "query_service.dedup",
+                  "query_service.generate_answer"):
+        assert stage in names
+
+
+def test_api_trace_header_and_admin_route(tracer, monkeypatch):
+    """
+    Test requests get an X-Trace-Id and the trace is served by the admin API.
+    Sorawlar X-Trace-Id alıwın ha'm iz admin API arqalı beriliwin test etiw.
+    """
+    from src.api import routes
+    from src.api.main import create_app
+    from src.core.config import get_config
+
+    async def fake_execute(query, is_update=False):
+        return QueryResult(success=True, data=[])
+
+    monkeypatch.setattr(routes.query_service.sparql_service, "execute", fake_execute)
+    monkeypatch.setattr(get_config().api.admin, "enabled", True)
+    monkeypatch.setenv("HUQUQAI_ADMIN_API_KEY", "secret")
+    client = TestClient(create_app(), headers={"X-API-Key": "secret"})
+
+    response = client.post("/api/v1/query", json={"question": "Jinayat nedir?"})
+    trace_id = response.headers["x-trace-id"]
+
+    trace = client.get(f"/api/v1/admin/traces/{trace_id}").json()
+    assert trace['name'] == "POST /api/v1/query"
+    assert "query_service.execute" in span_names(trace['root'])
+
+    assert client.get("/api/v1/admin/traces/unknown").status_code == 404
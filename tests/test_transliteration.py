@@ -0,0 +1,104 @@
+"""
+Tests for multi-script search
+Kóp jazıwlı izlew ushın testler
+"""
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDFS
+
+from src.core.label_index import LabelIndex
+from src.utils.language import get_language_utils
+from src.utils.normalization import search_key
+from src.utils.transliteration import detect_script_language, has_cyrillic, to_latin
+
+
+HUQUQ = Namespace("http://huquqai.org/ontology#")
+
+
+class TestTransliteration:
+    """Test Cyrillic to Latin transliteration / Kirillden latınǵa ótkeriwdi test etiw"""
+
+    @pytest.mark.parametrize("cyrillic,latin", [
+        ("Урлық", "Urlıq"),
+        ("Жинаяттың аўыр түри", "Jinayattıń awır túri"),
+        ("Шахар", "Shaxar"),
+        ("Nızam", "Nızam"),
+    ])
+    def test_to_latin(self, cyrillic, latin):
+        """
+        Test Karakalpak Cyrillic maps to the Latin alphabet.
+        Qaraqalpaq kirill jazıwı latın álipbesine ótiwin test etiw.
+        """
+        assert to_latin(cyrillic) == latin
+
+    def test_search_key_meets_across_scripts(self):
+        """
+        Test Cyrillic and Latin spellings share a search key.
+        Kirill ha'm latın jazılıwları bir izlew giltine iye ekenin test etiw.
+        """
+        assert search_key("Урлықтың") == search_key("Ūrlıq") == "urliq"
+        assert has_cyrillic("жаза") and not has_cyrillic("jaza")
+
+    @pytest.mark.parametrize("text,lang", [
+        ("урлықтың жазасы", "kaa"),
+        ("Jinayattıń túri", "kaa"),
+        ("кража", "ru"),
+        ("ўзбек тили", "uz"),
+        ("o'g'irlik", "uz"),
+        ("theft", None),
+    ])
+    def test_detect_script_language(self, text, lang):
+        """
+        Test language detection from script-specific letters.
+        Jazıwǵa tán háripler boyınsha tildi anıqlawdı test etiw.
+        """
+        assert detect_script_language(text) == lang
+
+    def test_detect_language_by_term(self):
+        """
+        Test plain terms are detected through the terminology.
+        Ápiwayı terminler terminologiya arqalı anıqlanıwın test etiw.
+        """
+        utils = get_language_utils()
+
+        assert utils.detect_language("Jinayat haqqında") == "kaa"
+        assert utils.detect_language("Jinoyat kodeksi") == "uz"
+
+
+class TestMultiScriptIndex:
+    """Test the label index across scripts / Jazıwlar arası label indeksin test etiw"""
+
+    @pytest.fixture
+    def index(self):
+        """Index with configured translations / Sazlanǵan tárjimeler menen indeks"""
+        g = Graph()
+        g.add((HUQUQ.Jinayat, RDFS.label, Literal("Jinayat", lang="kaa")))
+        g.add((HUQUQ.Urliq, RDFS.label, Literal("Ūrlıq", lang="kaa")))
+        g.add((HUQUQ.Statiya_1, HUQUQ.title, Literal("Adam óltiriw", lang="kaa")))
+        return LabelIndex.from_graph(
+            g,
+            predicates=(RDFS.label, HUQUQ.title),
+            synonyms=get_language_utils().term_synonyms()
+        )
+
+    def test_cyrillic_query(self, index):
+        """
+        Test a Cyrillic Karakalpak query finds the Latin label.
+        Kirill Qaraqalpaq sorawı latın labeldı tabıwın test etiw.
+        """
+        assert [e.uri for e in index.contains("урлық", lang="kaa")] == [str(HUQUQ.Urliq)]
+
+    def test_russian_translation(self, index):
+        """
+        Test a Russian term resolves through the stored translation.
+        Rus termini saqlanǵan tárjime arqalı tabılıwın test etiw.
+        """
+        assert [e.uri for e in index.contains("Преступление", lang="kaa")] == [str(HUQUQ.Jinayat)]
+
+    def test_titles_indexed(self, index):
+        """
+        Test article titles are searchable in either script.
+        Statiya atamaları eki jazıwda da izleniwin test etiw.
+        """
+        results = index.search("адам өлтириў", lang="kaa")
+        assert results[0][0].uri == str(HUQUQ.Statiya_1)